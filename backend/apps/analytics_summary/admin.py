@@ -3,7 +3,10 @@ from .models import (
     FloorAnalyticsSummary,
     MentorAnalyticsSummary,
     GlobalAnalyticsSummary,
-    AnalyticsComparisonLog
+    AnalyticsComparisonLog,
+    SubmissionIndex,
+    AnalyticsDelta,
+    StudentProgressSummary
 )
 
 
@@ -96,3 +99,27 @@ class AnalyticsComparisonLogAdmin(admin.ModelAdmin):
     
     def has_add_permission(self, request):
         return False  # Logs are created automatically
+
+
+@admin.register(SubmissionIndex)
+class SubmissionIndexAdmin(admin.ModelAdmin):
+    list_display = ['model_type', 'source_id', 'user', 'mentor', 'status', 'sort_at', 'reviewed_at']
+    list_filter = ['pillar', 'model_type', 'status', 'campus', 'floor']
+    search_fields = ['user__username', 'title']
+    readonly_fields = [field.name for field in SubmissionIndex._meta.fields]
+
+
+@admin.register(AnalyticsDelta)
+class AnalyticsDeltaAdmin(admin.ModelAdmin):
+    list_display = ['entity_type', 'entity_key', 'field', 'delta', 'created_at']
+    list_filter = ['entity_type', 'field']
+    search_fields = ['entity_key']
+    readonly_fields = ['entity_type', 'entity_key', 'field', 'delta', 'created_at']
+
+
+@admin.register(StudentProgressSummary)
+class StudentProgressSummaryAdmin(admin.ModelAdmin):
+    list_display = ['user', 'campus', 'floor', 'mentor', 'overall_progress', 'risk_status', 'last_activity', 'last_updated']
+    list_filter = ['risk_status', 'campus', 'floor']
+    search_fields = ['user__username', 'user__first_name', 'user__last_name']
+    readonly_fields = [field.name for field in StudentProgressSummary._meta.fields]
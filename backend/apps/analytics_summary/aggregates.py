@@ -0,0 +1,319 @@
+"""
+Grouped Submission Aggregates
+
+Per-student submission counts for every cross-pillar model in one
+GROUP BY query per model, plus the pillar progress rules used by the admin
+student detail view. Summary recomputation folds these per-student rows
+into floor/mentor/global totals, so the query count does not grow with the
+number of students or floors.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from apps.profiles.models import UserProfile
+from apps.scd.models import LeetCodeProfile
+from .submission_index import SOURCES
+
+PENDING_STATUSES = ['draft', 'submitted', 'under_review', 'pending']
+
+CFC_TYPES = ['hackathon', 'bmc', 'internship', 'genai']
+IIPC_TYPES = ['linkedin', 'linkedin_connection']
+
+PILLARS = ['CFC', 'CLT', 'SRI', 'IIPC', 'SCD']
+
+# A LeetCode profile with this many solves completes SCD
+SCD_MIN_SOLVED = 10
+
+# Students with a submission in this window count as active
+ACTIVE_WINDOW_DAYS = 30
+
+
+def student_submission_counts(user_ids):
+    """
+    {user_id: {model_type: {total, approved, pending, rejected, last}}}
+    for the given users (a list or a values('user_id') subquery)
+    """
+    counts = {}
+    for model_type, (_, model, _) in SOURCES.items():
+        rows = (
+            model.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .values('user_id')
+            .annotate(
+                total=Count('id'),
+                approved=Count('id', filter=Q(status='approved')),
+                pending=Count('id', filter=Q(status__in=PENDING_STATUSES)),
+                rejected=Count('id', filter=Q(status='rejected')),
+                last=Max('created_at'),
+            )
+        )
+        for row in rows:
+            counts.setdefault(row.pop('user_id'), {})[model_type] = row
+    return counts
+
+
+def scd_completed_users(user_ids):
+    """Users with a LeetCode profile of at least SCD_MIN_SOLVED problems"""
+    return set(
+        LeetCodeProfile.objects.filter(user_id__in=user_ids, total_solved__gte=SCD_MIN_SOLVED)
+        .values_list('user_id', flat=True)
+        .distinct()
+    )
+
+
+def pillar_progress(model_counts, scd_completed):
+    """
+    Pillar percentages (0-100) and overall average for one student
+
+    CFC: 4 tasks (hackathon, BMC, internship, GenAI)
+    CLT: 1 approved certificate
+    IIPC: 2 tasks (LinkedIn post + connections)
+    SCD: LeetCode profile with 10+ problems
+    SRI: not implemented yet
+    """
+    def approved(model_types):
+        return sum(model_counts.get(t, {}).get('approved', 0) for t in model_types)
+
+    return approved_progress(approved(CFC_TYPES), approved(['clt']), approved(IIPC_TYPES), scd_completed)
+
+
+def approved_progress(cfc_approved, clt_approved, iipc_approved, scd_completed):
+    """`pillar_progress` from approved counts already summed per pillar"""
+    pillars = {
+        'CFC': min(100, int((cfc_approved / 4) * 100)),
+        'CLT': min(100, clt_approved * 100),
+        'SRI': 0,
+        'IIPC': min(100, int((iipc_approved / 2) * 100)),
+        'SCD': 100 if scd_completed else 0,
+    }
+    overall = int(sum(pillars.values()) / len(pillars))
+    return pillars, overall
+
+
+def submission_totals(model_counts):
+    """Sum total/approved/pending/rejected across a student's models"""
+    totals = {'total': 0, 'approved': 0, 'pending': 0, 'rejected': 0}
+    for row in model_counts.values():
+        for key in totals:
+            totals[key] += row[key]
+    return totals
+
+
+def global_submission_totals(day):
+    """
+    Submission totals across every user, plus those created and reviewed
+    on `day` - one aggregate query per model
+    """
+    totals = {
+        'total': 0, 'pending': 0, 'approved': 0, 'rejected': 0,
+        'created_today': 0, 'reviewed_today': 0,
+    }
+    for _, model, _ in SOURCES.values():
+        row = model.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status__in=PENDING_STATUSES)),
+            approved=Count('id', filter=Q(status='approved')),
+            rejected=Count('id', filter=Q(status='rejected')),
+            created_today=Count('id', filter=Q(created_at__date=day)),
+            reviewed_today=Count('id', filter=Q(
+                status__in=['approved', 'rejected'], reviewed_at__date=day
+            )),
+        )
+        for key in totals:
+            totals[key] += row[key]
+    return totals
+
+
+def last_submission(model_counts):
+    return max((row['last'] for row in model_counts.values() if row['last']), default=None)
+
+
+def floor_values(floors):
+    """
+    Live FloorAnalyticsSummary columns for the given (campus, floor) pairs
+
+    A fixed set of grouped queries (profiles, one per submission model,
+    LeetCode) folded per floor - independent of the number of floors or
+    students. Used by recompute_analytics and its validator.
+    """
+    floors = set(floors)
+    profiles = UserProfile.objects.filter(
+        campus__in={campus for campus, _ in floors},
+        floor__in={floor for _, floor in floors},
+    )
+    students = [
+        row for row in profiles.filter(role='STUDENT')
+        .values_list('user_id', 'campus', 'floor', 'assigned_mentor_id')
+        if (row[1], row[2]) in floors
+    ]
+    mentors = [
+        row for row in profiles.filter(role='MENTOR').values_list('user_id', 'campus', 'floor')
+        if (row[1], row[2]) in floors
+    ]
+    # Superset of the floors' students (campus x floor); extra rows are ignored
+    student_ids = profiles.filter(role='STUDENT').values('user_id')
+    counts = student_submission_counts(student_ids)
+    scd_completed = scd_completed_users(student_ids)
+    mentors_with_students = set(
+        UserProfile.objects.filter(
+            role='STUDENT', campus__isnull=False, floor__isnull=False,
+            assigned_mentor_id__in=[user_id for user_id, _, _ in mentors],
+        ).values_list('assigned_mentor_id', flat=True).distinct()
+    )
+    active_since = timezone.now() - timedelta(days=ACTIVE_WINDOW_DAYS)
+
+    totals = {
+        key: {
+            'total_students': 0, 'active_students': 0, 'assigned_students': 0,
+            'total_mentors': 0, 'active_mentors': 0,
+            'total_submissions': 0, 'pending_reviews': 0,
+            'approved_submissions': 0, 'rejected_submissions': 0,
+            'progress': dict.fromkeys(PILLARS, 0), 'overall': 0,
+        }
+        for key in floors
+    }
+    for user_id, campus, floor, mentor_id in students:
+        floor_totals = totals[(campus, floor)]
+        model_counts = counts.get(user_id, {})
+        submissions = submission_totals(model_counts)
+        last = last_submission(model_counts)
+        pillars, overall = pillar_progress(model_counts, user_id in scd_completed)
+
+        floor_totals['total_students'] += 1
+        floor_totals['assigned_students'] += bool(mentor_id)
+        floor_totals['active_students'] += bool(last and last >= active_since)
+        floor_totals['total_submissions'] += submissions['total']
+        floor_totals['pending_reviews'] += submissions['pending']
+        floor_totals['approved_submissions'] += submissions['approved']
+        floor_totals['rejected_submissions'] += submissions['rejected']
+        for pillar, value in pillars.items():
+            floor_totals['progress'][pillar] += value
+        floor_totals['overall'] += overall
+
+    for user_id, campus, floor in mentors:
+        totals[(campus, floor)]['total_mentors'] += 1
+        totals[(campus, floor)]['active_mentors'] += user_id in mentors_with_students
+
+    values = {}
+    for key, floor_totals in totals.items():
+        count = floor_totals.pop('total_students')
+        progress = floor_totals.pop('progress')
+        overall = floor_totals.pop('overall')
+        values[key] = {
+            'total_students': count,
+            'unassigned_students': count - floor_totals['assigned_students'],
+            **floor_totals,
+            # Pillar progress: average of per-student percentages
+            **{
+                f'{pillar.lower()}_progress': round(progress[pillar] / count, 2) if count else 0.0
+                for pillar in PILLARS
+            },
+            'avg_completion': round(overall / count, 2) if count else 0.0,
+        }
+    return values
+
+
+def floor_headcounts(campus, floors):
+    """{floor: {role: profiles}} for one campus - a single grouped query"""
+    counts = {floor: {} for floor in floors}
+    rows = (
+        UserProfile.objects.filter(campus=campus, floor__in=floors)
+        .order_by()
+        .values('floor', 'role')
+        .annotate(count=Count('id'))
+    )
+    for row in rows:
+        counts[row['floor']][row['role']] = row['count']
+    return counts
+
+
+def floor_submission_stats(campus, floors):
+    """
+    {floor: {total, pending, approved, rejected}} for students on one campus
+
+    One query per submission model, joined to the submitter's profile and
+    grouped by floor.
+    """
+    stats = {floor: {'total': 0, 'pending': 0, 'approved': 0, 'rejected': 0} for floor in floors}
+    for _, model, _ in SOURCES.values():
+        rows = (
+            model.objects.filter(
+                user__profile__role='STUDENT',
+                user__profile__campus=campus,
+                user__profile__floor__in=floors,
+            )
+            .order_by()
+            .values('user__profile__floor')
+            .annotate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(status__in=PENDING_STATUSES)),
+                approved=Count('id', filter=Q(status='approved')),
+                rejected=Count('id', filter=Q(status='rejected')),
+            )
+        )
+        for row in rows:
+            floor_stats = stats[row.pop('user__profile__floor')]
+            for key, value in row.items():
+                floor_stats[key] += value
+    return stats
+
+
+def mentor_values(mentor_ids):
+    """Live MentorAnalyticsSummary counters for the given mentors"""
+    assigned = UserProfile.objects.filter(role='STUDENT', assigned_mentor_id__in=mentor_ids)
+    student_mentors = dict(assigned.values_list('user_id', 'assigned_mentor_id'))
+    counts = student_submission_counts(assigned.values('user_id'))
+
+    reviews = {
+        mentor_id: {'students': 0, 'pending': 0, 'approved': 0, 'rejected': 0}
+        for mentor_id in mentor_ids
+    }
+    for user_id, mentor_id in student_mentors.items():
+        submissions = submission_totals(counts.get(user_id, {}))
+        reviews[mentor_id]['students'] += 1
+        for key in ('pending', 'approved', 'rejected'):
+            reviews[mentor_id][key] += submissions[key]
+
+    values = {}
+    for mentor_id, mentor_reviews in reviews.items():
+        reviewed = mentor_reviews['approved'] + mentor_reviews['rejected']
+        values[mentor_id] = {
+            'assigned_students_count': mentor_reviews['students'],
+            'pending_reviews_count': mentor_reviews['pending'],
+            'total_reviews_completed': reviewed,
+            'approval_rate': round(mentor_reviews['approved'] / reviewed * 100, 2) if reviewed else 0.0,
+        }
+    return values
+
+
+def active_user_count():
+    """Distinct users with a submission in any cross-pillar model"""
+    user_ids = None
+    for _, model, _ in SOURCES.values():
+        users = model.objects.order_by().values('user_id')
+        user_ids = users if user_ids is None else user_ids.union(users)
+    return user_ids.count()
+
+
+def global_values(day):
+    """Live GlobalAnalyticsSummary columns for `day`"""
+    submissions = global_submission_totals(day)
+    return {
+        'total_students': UserProfile.objects.filter(role='STUDENT').count(),
+        'total_mentors': UserProfile.objects.filter(role='MENTOR').count(),
+        'total_submissions': submissions['total'],
+        'approved_submissions': submissions['approved'],
+        'rejected_submissions': submissions['rejected'],
+        'active_users': active_user_count(),
+        'new_students_today': UserProfile.objects.filter(
+            role='STUDENT', user__date_joined__date=day
+        ).count(),
+        'new_submissions_today': submissions['created_today'],
+        'reviews_completed_today': submissions['reviewed_today'],
+        'pending_reviews_count': submissions['pending'],
+        'campuses_active': UserProfile.objects.values('campus').distinct().count(),
+        'floors_active': UserProfile.objects.values('campus', 'floor').distinct().count(),
+    }
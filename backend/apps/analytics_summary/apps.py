@@ -5,3 +5,6 @@ class AnalyticsSummaryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.analytics_summary'
     verbose_name = 'Analytics Summary'
+
+    def ready(self):
+        import apps.analytics_summary.signals
@@ -0,0 +1,54 @@
+"""
+Versioned Cache Keys
+
+Dashboards cache whole responses under keys that embed version counters
+(e.g. 'submissions', 'profiles'). Signals bump a counter when its source
+data changes, so every cached response built from the old data is skipped
+at once without tracking or deleting individual keys; the old entries just
+expire with their TTL.
+
+Counters live in the default cache. A counter that was evicted restarts
+from the current time in milliseconds, which cannot collide with a version
+an older cached response was stored under. With a per-process cache
+(LocMemCache) each worker keeps its own counters, so a bump is only seen by
+the worker that made it; callers that cache for long pick a short TTL
+unless `shared()`.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+KEY_PREFIX = 'cache_version'
+
+
+def _initial():
+    return int(time.time() * 1000)
+
+
+def get(name):
+    return cache.get_or_set(f'{KEY_PREFIX}:{name}', _initial, timeout=None)
+
+
+def bump(name):
+    key = f'{KEY_PREFIX}:{name}'
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Missing (or a cache backend without storage)
+        version = _initial()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def shared():
+    """Whether bumps reach every worker (a cache server rather than process memory)"""
+    backend = settings.CACHES['default']['BACKEND']
+    return not backend.endswith(('.LocMemCache', '.DummyCache'))
+
+
+def key(prefix, *names):
+    """Cache key for `prefix` at the current version of every counter in `names`"""
+    versions = '.'.join(f'{name}{get(name)}' for name in names)
+    return f'{prefix}:{versions}'
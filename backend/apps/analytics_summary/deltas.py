@@ -0,0 +1,342 @@
+"""
+Incremental Summary Maintenance
+
+With USE_ANALYTICS_DELTAS on, signals turn each change into counter deltas
+on the summary rows it affects and append them to AnalyticsDelta:
+
+    submission created / deleted     +/-1 total and status bucket
+    submission status change         -1 old bucket, +1 new bucket
+    mentor reassignment, floor move,  the student's whole contribution moves
+    role change                      from the old floor/mentor to the new one
+
+`compact` folds pending deltas into Floor/Mentor/Global summaries with
+F() updates. Only counters are maintained this way; averages, progress and
+activity columns still come from `recompute_analytics`, which also discards
+the deltas it covered. Writes that bypass signals (QuerySet.update, raw
+SQL) are repaired by the next full recompute.
+"""
+
+from collections import defaultdict
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Max, Sum
+from django.utils import timezone
+
+from apps.profiles.models import UserProfile
+from . import aggregates
+from .models import AnalyticsDelta, FloorAnalyticsSummary, GlobalAnalyticsSummary, MentorAnalyticsSummary
+
+FLOOR = AnalyticsDelta.ENTITY_FLOOR
+MENTOR = AnalyticsDelta.ENTITY_MENTOR
+GLOBAL = AnalyticsDelta.ENTITY_GLOBAL
+
+# status bucket -> summary column
+FLOOR_BUCKET_FIELDS = {
+    'pending': 'pending_reviews',
+    'approved': 'approved_submissions',
+    'rejected': 'rejected_submissions',
+}
+MENTOR_BUCKET_FIELDS = {
+    'pending': 'pending_reviews_count',
+    'approved': 'total_reviews_completed',
+    'rejected': 'total_reviews_completed',
+}
+GLOBAL_BUCKET_FIELDS = {
+    'pending': 'pending_reviews_count',
+    'approved': 'approved_submissions',
+    'rejected': 'rejected_submissions',
+}
+
+# Global columns carried forward day to day vs. reset every day
+GLOBAL_CUMULATIVE_FIELDS = [
+    'total_students', 'total_mentors', 'total_submissions',
+    'pending_reviews_count', 'approved_submissions', 'rejected_submissions',
+]
+GLOBAL_DAILY_FIELDS = ['new_students_today', 'new_submissions_today', 'reviews_completed_today']
+GLOBAL_CARRIED_FIELDS = GLOBAL_CUMULATIVE_FIELDS + [
+    'active_users', 'avg_system_completion', 'campuses_active', 'floors_active', 'avg_review_time_hours',
+]
+
+COMPACT_BATCH = 5000
+
+User = get_user_model()
+
+
+def enabled():
+    return getattr(settings, 'USE_ANALYTICS_DELTAS', False)
+
+
+def status_bucket(status):
+    if status in aggregates.PENDING_STATUSES:
+        return 'pending'
+    if status in ('approved', 'rejected'):
+        return status
+    return None
+
+
+def floor_key(campus, floor):
+    return f'{campus}-{floor}'
+
+
+def _global_key():
+    return timezone.now().date().isoformat()
+
+
+class DeltaBuffer:
+    """Collects deltas for one event; opposite deltas cancel before writing"""
+
+    def __init__(self):
+        self.deltas = defaultdict(int)
+
+    def add(self, entity_type, entity_key, field, delta):
+        self.deltas[(entity_type, str(entity_key), field)] += delta
+
+    def flush(self):
+        rows = [
+            AnalyticsDelta(entity_type=entity_type, entity_key=entity_key, field=field, delta=delta)
+            for (entity_type, entity_key, field), delta in self.deltas.items() if delta
+        ]
+        AnalyticsDelta.objects.bulk_create(rows)
+        self.deltas.clear()
+        return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def profile_state(profile):
+    """The profile columns a summary row depends on"""
+    if profile is None:
+        return None
+    return (profile.role, profile.campus, profile.floor, profile.assigned_mentor_id)
+
+
+def submission_state(submission):
+    """The submission columns a summary row depends on"""
+    return (submission.status, submission.created_at, submission.reviewed_at)
+
+
+def _submission_contribution(buffer, profile, state, sign):
+    status, created_at, reviewed_at = state
+    bucket = status_bucket(status)
+    buffer.add(GLOBAL, _global_key(), 'total_submissions', sign)
+    if bucket in GLOBAL_BUCKET_FIELDS:
+        buffer.add(GLOBAL, _global_key(), GLOBAL_BUCKET_FIELDS[bucket], sign)
+    # Daily activity belongs to the day it happened
+    if created_at:
+        buffer.add(GLOBAL, created_at.date().isoformat(), 'new_submissions_today', sign)
+    if bucket in ('approved', 'rejected') and reviewed_at:
+        buffer.add(GLOBAL, reviewed_at.date().isoformat(), 'reviews_completed_today', sign)
+
+    if profile is None or profile[0] != 'STUDENT':
+        return
+    _, campus, floor, mentor_id = profile
+    if campus and floor is not None:
+        buffer.add(FLOOR, floor_key(campus, floor), 'total_submissions', sign)
+        if bucket:
+            buffer.add(FLOOR, floor_key(campus, floor), FLOOR_BUCKET_FIELDS[bucket], sign)
+    if mentor_id and bucket:
+        buffer.add(MENTOR, mentor_id, MENTOR_BUCKET_FIELDS[bucket], sign)
+
+
+def record_submission(user_id, old_state, new_state):
+    """
+    Deltas for one submission row; old_state None means created,
+    new_state None means deleted
+    """
+    if old_state is not None and new_state is not None and (
+        status_bucket(old_state[0]), old_state[1:]
+    ) == (status_bucket(new_state[0]), new_state[1:]):
+        return 0
+
+    profile = profile_state(UserProfile.objects.filter(user_id=user_id).first())
+
+    buffer = DeltaBuffer()
+    if old_state is not None:
+        _submission_contribution(buffer, profile, old_state, -1)
+    if new_state is not None:
+        _submission_contribution(buffer, profile, new_state, 1)
+    return buffer.flush()
+
+
+def _profile_contribution(buffer, state, totals, joined, sign):
+    role, campus, floor, mentor_id = state
+    if role == 'MENTOR':
+        buffer.add(GLOBAL, _global_key(), 'total_mentors', sign)
+        if campus and floor is not None:
+            buffer.add(FLOOR, floor_key(campus, floor), 'total_mentors', sign)
+        return
+    if role != 'STUDENT':
+        return
+
+    buffer.add(GLOBAL, _global_key(), 'total_students', sign)
+    if joined:
+        buffer.add(GLOBAL, joined.date().isoformat(), 'new_students_today', sign)
+    if campus and floor is not None:
+        key = floor_key(campus, floor)
+        buffer.add(FLOOR, key, 'total_students', sign)
+        buffer.add(FLOOR, key, 'assigned_students' if mentor_id else 'unassigned_students', sign)
+        buffer.add(FLOOR, key, 'total_submissions', sign * totals['total'])
+        for bucket, field in FLOOR_BUCKET_FIELDS.items():
+            buffer.add(FLOOR, key, field, sign * totals[bucket])
+    if mentor_id:
+        buffer.add(MENTOR, mentor_id, 'assigned_students_count', sign)
+        buffer.add(MENTOR, mentor_id, 'pending_reviews_count', sign * totals['pending'])
+        buffer.add(MENTOR, mentor_id, 'total_reviews_completed', sign * (totals['approved'] + totals['rejected']))
+
+
+def record_profile(user_id, old_state, new_state):
+    """
+    Move a profile's contribution from old_state to new_state
+    (old_state None means the profile was just created)
+    """
+    if old_state == new_state:
+        return 0
+
+    if old_state is None:
+        totals = {'total': 0, 'approved': 0, 'pending': 0, 'rejected': 0}
+    else:
+        counts = aggregates.student_submission_counts([user_id]).get(user_id, {})
+        totals = aggregates.submission_totals(counts)
+
+    joined = None
+    if old_state is None or old_state[0] != new_state[0]:
+        joined = User.objects.filter(id=user_id).values_list('date_joined', flat=True).first()
+
+    buffer = DeltaBuffer()
+    if old_state is not None:
+        _profile_contribution(buffer, old_state, totals, joined, -1)
+    _profile_contribution(buffer, new_state, totals, joined, 1)
+    return buffer.flush()
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def _increments(fields, now):
+    updates = {field: F(field) + delta for field, delta in fields.items()}
+    updates['last_updated'] = now
+    return updates
+
+
+def _apply_floor(key, fields, now):
+    campus, _, floor = key.rpartition('-')
+    summaries = FloorAnalyticsSummary.objects.filter(campus=campus, floor=int(floor))
+    if summaries.update(**_increments(fields, now)):
+        return True
+    # Floors are seeded by a full recompute; a floor missing after that was
+    # empty at the time, so its counters start from zero
+    if not FloorAnalyticsSummary.objects.exists():
+        return False
+    FloorAnalyticsSummary.objects.create(campus=campus, floor=int(floor), **fields)
+    return True
+
+
+def _apply_mentor(key, fields, now):
+    summaries = MentorAnalyticsSummary.objects.filter(mentor_id=int(key))
+    if summaries.update(**_increments(fields, now)):
+        return True
+    if not MentorAnalyticsSummary.objects.exists() \
+            or not UserProfile.objects.filter(user_id=int(key), role='MENTOR').exists():
+        return False
+    MentorAnalyticsSummary.objects.create(mentor_id=int(key), **fields)
+    return True
+
+
+def _apply_global(key, fields, now):
+    day = date.fromisoformat(key)
+    cumulative = {f: d for f, d in fields.items() if f in GLOBAL_CUMULATIVE_FIELDS}
+    daily = {f: d for f, d in fields.items() if f in GLOBAL_DAILY_FIELDS}
+
+    # Running totals are always logged against today; seed today's row from
+    # the last snapshot. Activity on past days only touches existing rows.
+    if cumulative and not GlobalAnalyticsSummary.objects.filter(date=day).exists():
+        previous = GlobalAnalyticsSummary.objects.filter(date__lt=day).order_by('-date').first()
+        if previous is None:
+            return False
+        GlobalAnalyticsSummary.objects.create(
+            date=day, **{field: getattr(previous, field) for field in GLOBAL_CARRIED_FIELDS}
+        )
+
+    if cumulative:
+        GlobalAnalyticsSummary.objects.filter(date__gte=day).update(**_increments(cumulative, now))
+    if daily:
+        GlobalAnalyticsSummary.objects.filter(date=day).update(**_increments(daily, now))
+    return True
+
+
+APPLY = {
+    FLOOR: _apply_floor,
+    MENTOR: _apply_mentor,
+    GLOBAL: _apply_global,
+}
+
+
+def _refresh_workload(mentor_ids):
+    summaries = list(MentorAnalyticsSummary.objects.filter(mentor_id__in=mentor_ids))
+    for summary in summaries:
+        summary.workload_status = summary.compute_workload_status()
+    MentorAnalyticsSummary.objects.bulk_update(summaries, ['workload_status'])
+
+
+def compact_batch(batch_size=COMPACT_BATCH):
+    """
+    Fold up to batch_size pending deltas into the summaries in one
+    transaction. SKIP LOCKED lets concurrent compactors take disjoint
+    batches; claimed rows are deleted in the same transaction.
+    """
+    with transaction.atomic():
+        ids = list(
+            AnalyticsDelta.objects.select_for_update(skip_locked=True)
+            .order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return {'deltas': 0, 'rows': 0, 'unseeded': 0}
+
+        grouped = defaultdict(dict)
+        sums = (
+            AnalyticsDelta.objects.filter(id__in=ids)
+            .values('entity_type', 'entity_key', 'field')
+            .annotate(total=Sum('delta'))
+        )
+        for row in sums:
+            if row['total']:
+                grouped[(row['entity_type'], row['entity_key'])][row['field']] = row['total']
+
+        now = timezone.now()
+        applied = unseeded = 0
+        for (entity_type, entity_key), fields in grouped.items():
+            if APPLY[entity_type](entity_key, fields, now):
+                applied += 1
+            else:
+                unseeded += 1
+        _refresh_workload([int(key) for entity_type, key in grouped if entity_type == MENTOR])
+
+        AnalyticsDelta.objects.filter(id__in=ids).delete()
+    return {'deltas': len(ids), 'rows': applied, 'unseeded': unseeded}
+
+
+def compact(batch_size=COMPACT_BATCH):
+    """Compact until the log is empty; returns totals across batches"""
+    totals = {'deltas': 0, 'rows': 0, 'unseeded': 0}
+    while True:
+        result = compact_batch(batch_size)
+        for key in totals:
+            totals[key] += result[key]
+        if result['deltas'] < batch_size:
+            return totals
+
+
+def watermark():
+    """Newest delta id; a full recompute discards deltas up to it"""
+    return AnalyticsDelta.objects.aggregate(last=Max('id'))['last'] or 0
+
+
+def discard(up_to, entity_types):
+    deleted, _ = AnalyticsDelta.objects.filter(id__lte=up_to, entity_type__in=entity_types).delete()
+    return deleted
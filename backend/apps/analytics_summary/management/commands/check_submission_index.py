@@ -0,0 +1,58 @@
+"""
+Management Command: check_submission_index
+
+Verifies SubmissionIndex against the submission tables and reports rows
+that are missing, orphaned or stale (status, timestamps, owner, mentor,
+campus/floor drifted). Exits non-zero on drift so it can gate a cron job.
+
+Usage:
+    python manage.py check_submission_index
+    python manage.py check_submission_index --fix
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics_summary import submission_index
+
+
+class Command(BaseCommand):
+    help = 'Check the SubmissionIndex table for drift from its source models'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Rebuild missing/stale rows and delete orphans',
+        )
+        parser.add_argument(
+            '--model-types',
+            type=str,
+            help=f'Comma-separated model types ({", ".join(submission_index.SOURCES)})',
+        )
+
+    def handle(self, *args, **options):
+        model_types = None
+        if options.get('model_types'):
+            model_types = [t.strip() for t in options['model_types'].split(',') if t.strip()]
+
+        report = submission_index.check_consistency(model_types, fix=options['fix'])
+
+        drifted = 0
+        for model_type, problems in report.items():
+            counts = {kind: len(ids) for kind, ids in problems.items()}
+            drifted += sum(counts.values())
+            line = f'  {model_type}: ' + ', '.join(f'{count} {kind}' for kind, count in counts.items())
+            if any(counts.values()):
+                self.stdout.write(self.style.WARNING(line))
+                for kind, ids in problems.items():
+                    if ids:
+                        self.stdout.write(f'      {kind}: {ids[:20]}{" ..." if len(ids) > 20 else ""}')
+            else:
+                self.stdout.write(line)
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('Submission index is consistent'))
+        elif options['fix']:
+            self.stdout.write(self.style.SUCCESS(f'Repaired {drifted} index row(s)'))
+        else:
+            raise CommandError(f'{drifted} index row(s) out of sync; re-run with --fix')
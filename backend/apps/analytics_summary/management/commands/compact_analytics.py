@@ -0,0 +1,56 @@
+"""
+Management Command: compact_analytics
+
+Folds pending AnalyticsDelta rows (logged when USE_ANALYTICS_DELTAS=True)
+into the floor, mentor and global summaries. Run it every minute from cron,
+or as a long-running worker with --loop. Deltas for summary rows that were
+never seeded are dropped; run `recompute_analytics` once to seed them.
+
+Usage:
+    python manage.py compact_analytics
+    python manage.py compact_analytics --loop --interval 30
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.analytics_summary import deltas
+
+
+class Command(BaseCommand):
+    help = 'Fold pending analytics deltas into the summary tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep compacting every --interval seconds',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=30,
+            help='Seconds between passes with --loop (default 30)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=deltas.COMPACT_BATCH,
+            help=f'Deltas folded per transaction (default {deltas.COMPACT_BATCH})',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            result = deltas.compact(options['batch_size'])
+            if result['deltas'] or not options['loop']:
+                self.stdout.write(
+                    f"Compacted {result['deltas']} deltas into {result['rows']} summary rows"
+                )
+            if result['unseeded']:
+                self.stdout.write(self.style.WARNING(
+                    f"  {result['unseeded']} summary rows missing; run recompute_analytics to seed them"
+                ))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
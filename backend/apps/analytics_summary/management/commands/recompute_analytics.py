@@ -7,6 +7,7 @@ This command can be run manually or via cron job.
 Usage:
     python manage.py recompute_analytics
     python manage.py recompute_analytics --validate  # Compare with live data
+    python manage.py recompute_analytics --validate-only --sample 20 --time-budget 30
     python manage.py recompute_analytics --floors-only
     python manage.py recompute_analytics --mentors-only
 
@@ -17,6 +18,7 @@ This command:
 - Compares cached vs live data when --validate flag is used
 """
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import Count, Avg, Q, F
@@ -29,13 +31,23 @@ from apps.analytics_summary.models import (
     FloorAnalyticsSummary,
     MentorAnalyticsSummary,
     GlobalAnalyticsSummary,
-    AnalyticsComparisonLog
+    AnalyticsComparisonLog,
+    AnalyticsDelta
 )
+from apps.analytics_summary import aggregates, deltas, validation
 from apps.profiles.models import UserProfile
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+FLOOR_SUMMARY_FIELDS = [
+    'total_students', 'active_students', 'assigned_students', 'unassigned_students',
+    'total_mentors', 'active_mentors',
+    'total_submissions', 'pending_reviews', 'approved_submissions', 'rejected_submissions',
+    'clt_progress', 'cfc_progress', 'sri_progress', 'iipc_progress', 'scd_progress',
+    'avg_completion', 'computation_time_ms', 'last_updated',
+]
+
 
 class Command(BaseCommand):
     help = 'Recompute analytics summaries for floors, mentors, and global stats'
@@ -61,6 +73,27 @@ class Command(BaseCommand):
             action='store_true',
             help='Compare cached results with live queries',
         )
+        parser.add_argument(
+            '--validate-only',
+            action='store_true',
+            help='Compare the stored summaries with live queries without recomputing',
+        )
+        parser.add_argument(
+            '--sample',
+            type=int,
+            help='Validate at most this many random floors and mentors',
+        )
+        parser.add_argument(
+            '--time-budget',
+            type=float,
+            help='Stop validating after this many seconds',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=validation.FLOAT_TOLERANCE,
+            help=f'Allowed difference for percentage columns (default {validation.FLOAT_TOLERANCE})',
+        )
         parser.add_argument(
             '--verbose',
             action='store_true',
@@ -78,20 +111,35 @@ class Command(BaseCommand):
 
         try:
             # Determine what to recompute
-            recompute_all = not (options['floors_only'] or options['mentors_only'] or options['global_only'])
+            entity_types = [
+                entity_type for entity_type, option in [
+                    (AnalyticsDelta.ENTITY_FLOOR, 'floors_only'),
+                    (AnalyticsDelta.ENTITY_MENTOR, 'mentors_only'),
+                    (AnalyticsDelta.ENTITY_GLOBAL, 'global_only'),
+                ]
+                if options[option]
+            ] or validation.ENTITY_TYPES
             
-            if recompute_all or options['floors_only']:
-                self.recompute_floor_analytics()
-            
-            if recompute_all or options['mentors_only']:
-                self.recompute_mentor_analytics()
-            
-            if recompute_all or options['global_only']:
-                self.recompute_global_analytics()
+            if not options['validate_only']:
+                # Deltas logged before this point are covered by the recompute
+                delta_watermark = deltas.watermark()
+                
+                if AnalyticsDelta.ENTITY_FLOOR in entity_types:
+                    self.recompute_floor_analytics()
+                
+                if AnalyticsDelta.ENTITY_MENTOR in entity_types:
+                    self.recompute_mentor_analytics()
+                
+                if AnalyticsDelta.ENTITY_GLOBAL in entity_types:
+                    self.recompute_global_analytics()
+                
+                discarded = deltas.discard(delta_watermark, entity_types)
+                if discarded:
+                    self.stdout.write(f'\n  Discarded {discarded} pending analytics deltas')
             
             # Validation
-            if options['validate']:
-                self.validate_analytics()
+            if options['validate'] or options['validate_only']:
+                self.validate_analytics(entity_types, options)
             
             elapsed = time.time() - start_time
             self.stdout.write('')
@@ -104,91 +152,76 @@ class Command(BaseCommand):
             raise
 
     def recompute_floor_analytics(self):
-        """Recompute analytics for all campus+floor combinations"""
+        """
+        Recompute analytics for all campus+floor combinations
+        
+        Every column comes from a fixed set of grouped queries (profiles,
+        one per submission model, LeetCode) folded per (campus, floor), then
+        written with one bulk_create/bulk_update - independent of the number
+        of floors or students.
+        """
         self.stdout.write(self.style.WARNING('\n[1/3] FLOOR ANALYTICS'))
         self.stdout.write('-' * 70)
         
-        # Get all unique campus+floor combinations
-        floors = UserProfile.objects.values('campus', 'floor').distinct()
+        start_time = time.time()
+        
+        # Get all campus+floor combinations
+        floors = list(
+            UserProfile.objects.exclude(campus__isnull=True).exclude(campus='')
+            .exclude(floor__isnull=True)
+            .order_by().values_list('campus', 'floor').distinct()
+        )
         
-        total_floors = floors.count()
+        total_floors = len(floors)
         if total_floors == 0:
             self.stdout.write(self.style.WARNING('  No floors found.'))
             return
         
         self.stdout.write(f'  Processing {total_floors} floors...')
         
-        for idx, floor_data in enumerate(floors, 1):
-            campus = floor_data['campus']
-            floor = floor_data['floor']
-            
-            if not campus or not floor:
-                continue
-            
-            start_time = time.time()
-            
-            with transaction.atomic():
-                summary, created = FloorAnalyticsSummary.objects.get_or_create(
-                    campus=campus,
-                    floor=floor
-                )
-                
-                # Get all students on this floor
-                students = UserProfile.objects.filter(
-                    campus=campus,
-                    floor=floor,
-                    role='STUDENT'
-                ).select_related('user')
-                
-                # Get all mentors on this floor
-                mentors = UserProfile.objects.filter(
-                    campus=campus,
-                    floor=floor,
-                    role='MENTOR'
-                ).select_related('user')
-                
-                # Student metrics
-                summary.total_students = students.count()
-                summary.assigned_students = students.filter(assigned_mentor__isnull=False).count()
-                summary.unassigned_students = summary.total_students - summary.assigned_students
-                summary.active_students = summary.total_students  # TODO: Define "active"
-                
-                # Mentor metrics
-                summary.total_mentors = mentors.count()
-                summary.active_mentors = summary.total_mentors  # TODO: Define "active"
-                
-                # Submission metrics (aggregate across all pillars)
-                # TODO: When pillar submissions are unified, use actual data
-                # For now, use placeholder logic
-                summary.total_submissions = 0
-                summary.pending_reviews = 0
-                summary.approved_submissions = 0
-                summary.rejected_submissions = 0
-                
-                # Pillar progress (placeholder - will be accurate once data is available)
-                summary.clt_progress = 0.0
-                summary.cfc_progress = 0.0
-                summary.sri_progress = 0.0
-                summary.iipc_progress = 0.0
-                summary.scd_progress = 0.0
-                
-                # Average completion
-                summary.avg_completion = 0.0
-                
-                # Track computation time
-                computation_time = int((time.time() - start_time) * 1000)
-                summary.computation_time_ms = computation_time
-                
-                summary.save()
+        values = aggregates.floor_values(floors)
+        
+        existing = {
+            (summary.campus, summary.floor): summary
+            for summary in FloorAnalyticsSummary.objects.all()
+        }
+        new_summaries = [
+            FloorAnalyticsSummary(campus=campus, floor=floor)
+            for campus, floor in floors if (campus, floor) not in existing
+        ]
+        summaries = list(existing.values()) + new_summaries
+        
+        computation_time = int((time.time() - start_time) * 1000)
+        now = timezone.now()
+        for summary in summaries:
+            floor_values = values.get((summary.campus, summary.floor))
+            if floor_values is None:
+                continue  # floor no longer has anyone on it; keep its last snapshot
+            for field, value in floor_values.items():
+                setattr(summary, field, value)
             
-            if self.verbose:
+            # Track computation time (whole batch)
+            summary.computation_time_ms = computation_time
+            summary.last_updated = now
+        
+        with transaction.atomic():
+            FloorAnalyticsSummary.objects.bulk_create(new_summaries)
+            FloorAnalyticsSummary.objects.bulk_update(
+                [s for key, s in existing.items() if key in values],
+                FLOOR_SUMMARY_FIELDS,
+            )
+        
+        if self.verbose:
+            for idx, summary in enumerate(sorted(summaries, key=lambda s: (s.campus, s.floor)), 1):
                 self.stdout.write(
-                    f'  [{idx}/{total_floors}] {campus} Floor {floor}: '
-                    f'{summary.total_students} students, {summary.total_mentors} mentors '
-                    f'({computation_time}ms)'
+                    f'  [{idx}/{len(summaries)}] {summary.campus} Floor {summary.floor}: '
+                    f'{summary.total_students} students, {summary.total_mentors} mentors, '
+                    f'{summary.total_submissions} submissions ({summary.avg_completion}% avg)'
                 )
         
-        self.stdout.write(self.style.SUCCESS(f'  ✓ Processed {total_floors} floors'))
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✓ Processed {total_floors} floors ({computation_time}ms)'
+        ))
 
     def recompute_mentor_analytics(self):
         """Recompute analytics for all mentors"""
@@ -207,23 +240,17 @@ class Command(BaseCommand):
         
         self.stdout.write(f'  Processing {total_mentors} mentors...')
         
+        values = aggregates.mentor_values([mentor.id for mentor in mentors])
+        
         for idx, mentor in enumerate(mentors, 1):
             with transaction.atomic():
                 summary, created = MentorAnalyticsSummary.objects.get_or_create(
                     mentor=mentor
                 )
                 
-                # Assigned students
-                assigned_students = UserProfile.objects.filter(
-                    assigned_mentor=mentor,
-                    role='STUDENT'
-                )
-                summary.assigned_students_count = assigned_students.count()
-                
-                # Review metrics (placeholder - will be accurate with actual submission data)
-                summary.pending_reviews_count = 0
-                summary.total_reviews_completed = 0
-                summary.approval_rate = 0.0
+                # Assigned students and review metrics
+                for field, value in values[mentor.id].items():
+                    setattr(summary, field, value)
                 summary.avg_review_time_hours = 0.0
                 
                 # Student progress
@@ -260,24 +287,12 @@ class Command(BaseCommand):
                 date=today
             )
             
-            # Global counts
-            summary.total_students = UserProfile.objects.filter(role='STUDENT').count()
-            summary.total_mentors = UserProfile.objects.filter(role='MENTOR').count()
-            
-            # TODO: Aggregate actual submission data when available
-            summary.total_submissions = 0
-            summary.new_students_today = 0
-            summary.new_submissions_today = 0
-            summary.reviews_completed_today = 0
+            for field, value in aggregates.global_values(today).items():
+                setattr(summary, field, value)
             
-            # System health
+            # Not tracked yet
             summary.avg_system_completion = 0.0
-            summary.campuses_active = UserProfile.objects.values('campus').distinct().count()
-            summary.floors_active = UserProfile.objects.values('campus', 'floor').distinct().count()
-            
-            # Performance
             summary.avg_review_time_hours = 0.0
-            summary.pending_reviews_count = 0
             
             summary.save()
         
@@ -295,12 +310,35 @@ class Command(BaseCommand):
         )
         self.stdout.write(self.style.SUCCESS('  ✓ Global analytics updated'))
 
-    def validate_analytics(self):
+    def validate_analytics(self, entity_types, options):
         """Compare cached analytics with live queries"""
         self.stdout.write(self.style.WARNING('\nVALIDATION'))
         self.stdout.write('-' * 70)
         self.stdout.write('  Comparing cached vs live data...')
         
-        # TODO: Implement detailed validation logic
-        # For now, just log that validation was requested
-        self.stdout.write(self.style.SUCCESS('  ✓ Validation complete (detailed comparison not yet implemented)'))
+        report = validation.validate(
+            entity_types,
+            sample=options['sample'],
+            time_budget=options['time_budget'],
+            tolerance=options['tolerance'],
+        )
+        
+        for entity_type, counts in report['by_type'].items():
+            line = f"  {entity_type}: {counts['mismatched']}/{counts['checked']} mismatched"
+            if counts['fields']:
+                line += ' (' + ', '.join(f'{field}: {n}' for field, n in sorted(counts['fields'].items())) + ')'
+            self.stdout.write(self.style.WARNING(line) if counts['mismatched'] else line)
+        
+        if report['truncated']:
+            self.stdout.write(self.style.WARNING('  Time budget spent; remaining summaries were skipped'))
+        if report['pending_deltas']:
+            self.stdout.write(f"  {report['pending_deltas']} analytics deltas not yet compacted")
+        
+        message = (
+            f"  Drift rate {report['drift_rate']:.1%} "
+            f"({report['mismatched']}/{report['checked']}, {report['elapsed_ms']}ms)"
+        )
+        if report['drift_rate'] > settings.ANALYTICS_DRIFT_THRESHOLD:
+            self.stdout.write(self.style.ERROR(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'  ✓ Validation complete. {message.strip()}'))
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('analytics_summary', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pillar', models.CharField(choices=[('clt', 'CLT'), ('cfc', 'CFC'), ('iipc', 'IIPC')], max_length=10)),
+                ('model_type', models.CharField(max_length=30)),
+                ('source_id', models.BigIntegerField()),
+                ('campus', models.CharField(blank=True, max_length=10, null=True)),
+                ('floor', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(max_length=20)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('sort_at', models.DateTimeField()),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+                ('mentor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='mentored_submission_index', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_index', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Submission Index Entry',
+                'verbose_name_plural': 'Submission Index',
+                'db_table': 'analytics_submission_index',
+                'ordering': ['-sort_at'],
+                'indexes': [models.Index(fields=['mentor', 'status', '-sort_at'], name='subidx_mentor_status'), models.Index(fields=['mentor', 'pillar', '-sort_at'], name='subidx_mentor_pillar'), models.Index(fields=['campus', 'floor', 'status'], name='subidx_floor_status'), models.Index(fields=['user', 'pillar', 'status'], name='subidx_user_pillar'), models.Index(fields=['user', '-sort_at'], name='subidx_user_sort'), models.Index(fields=['status', 'reviewed_at'], name='subidx_status_reviewed')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='submissionindex',
+            constraint=models.UniqueConstraint(fields=('model_type', 'source_id'), name='submission_index_source_unique'),
+        ),
+    ]
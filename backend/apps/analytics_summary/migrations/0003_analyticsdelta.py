@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics_summary', '0002_submissionindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('floor', 'Floor'), ('mentor', 'Mentor'), ('global', 'Global')], max_length=20)),
+                ('entity_key', models.CharField(max_length=100)),
+                ('field', models.CharField(max_length=50)),
+                ('delta', models.IntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Analytics Delta',
+                'verbose_name_plural': 'Analytics Deltas',
+                'db_table': 'analytics_delta_log',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['entity_type', 'entity_key'], name='analytics_d_entity__286497_idx')],
+            },
+        ),
+    ]
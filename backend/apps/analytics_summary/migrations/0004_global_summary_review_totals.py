@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics_summary', '0003_analyticsdelta'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='globalanalyticssummary',
+            name='active_users',
+            field=models.IntegerField(default=0, help_text='Users with at least one submission'),
+        ),
+        migrations.AddField(
+            model_name='globalanalyticssummary',
+            name='approved_submissions',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='globalanalyticssummary',
+            name='rejected_submissions',
+            field=models.IntegerField(default=0),
+        ),
+    ]
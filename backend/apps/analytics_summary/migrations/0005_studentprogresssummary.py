@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:17
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('analytics_summary', '0004_global_summary_review_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentProgressSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('campus', models.CharField(blank=True, max_length=10, null=True)),
+                ('floor', models.IntegerField(blank=True, null=True)),
+                ('pillar_counts', models.JSONField(default=dict)),
+                ('total_submissions', models.IntegerField(default=0)),
+                ('approved_submissions', models.IntegerField(default=0)),
+                ('pending_submissions', models.IntegerField(default=0)),
+                ('rejected_submissions', models.IntegerField(default=0)),
+                ('clt_progress', models.IntegerField(default=0)),
+                ('cfc_progress', models.IntegerField(default=0)),
+                ('sri_progress', models.IntegerField(default=0)),
+                ('iipc_progress', models.IntegerField(default=0)),
+                ('scd_progress', models.IntegerField(default=0)),
+                ('overall_progress', models.IntegerField(default=0)),
+                ('last_activity', models.DateTimeField(blank=True, null=True)),
+                ('risk_status', models.CharField(choices=[('on_track', 'On Track'), ('at_risk', 'At Risk'), ('behind', 'Behind')], default='behind', max_length=20)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('mentor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='mentored_progress_summaries', to=settings.AUTH_USER_MODEL)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='progress_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Student Progress Summary',
+                'verbose_name_plural': 'Student Progress Summaries',
+                'db_table': 'analytics_student_progress',
+                'indexes': [models.Index(fields=['campus', 'floor', 'risk_status'], name='progress_floor_risk'), models.Index(fields=['mentor', 'risk_status'], name='progress_mentor_risk'), models.Index(fields=['overall_progress'], name='progress_overall')],
+            },
+        ),
+    ]
@@ -172,6 +172,9 @@ class GlobalAnalyticsSummary(models.Model):
     total_students = models.IntegerField(default=0)
     total_mentors = models.IntegerField(default=0)
     total_submissions = models.IntegerField(default=0)
+    approved_submissions = models.IntegerField(default=0)
+    rejected_submissions = models.IntegerField(default=0)
+    active_users = models.IntegerField(default=0, help_text="Users with at least one submission")
     
     # Daily Activity
     new_students_today = models.IntegerField(default=0)
@@ -242,3 +245,203 @@ class AnalyticsComparisonLog(models.Model):
     def __str__(self):
         status = "✓ Match" if self.matches else "✗ Mismatch"
         return f"{status} - {self.entity_type.title()} {self.entity_id}"
+
+
+class SubmissionIndex(models.Model):
+    """
+    One row per submission across the cross-pillar models (CLT, Hackathon,
+    BMC, Internship, GenAI, LinkedIn post, LinkedIn connections).
+    
+    Kept in sync by signals in apps/analytics_summary/signals.py so mentor,
+    floor and admin views can read every pillar with one indexed query.
+    Rebuild with `backfill_submission_index`, verify with
+    `check_submission_index`.
+    """
+    
+    PILLAR_CHOICES = [
+        ('clt', 'CLT'),
+        ('cfc', 'CFC'),
+        ('iipc', 'IIPC'),
+    ]
+    
+    # Source row
+    pillar = models.CharField(max_length=10, choices=PILLAR_CHOICES)
+    model_type = models.CharField(max_length=30)  # hackathon, bmc, internship, genai, clt, linkedin, linkedin_connection
+    source_id = models.BigIntegerField()
+    
+    # Ownership (denormalized from the student's profile)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='submission_index')
+    mentor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='mentored_submission_index'
+    )
+    campus = models.CharField(max_length=10, null=True, blank=True)
+    floor = models.IntegerField(null=True, blank=True)
+    
+    # Review state
+    status = models.CharField(max_length=20)
+    title = models.CharField(max_length=255, blank=True)
+    
+    # Timestamps (sort_at = submitted_at, falling back to created_at)
+    created_at = models.DateTimeField()
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    sort_at = models.DateTimeField()
+    
+    # Metadata
+    indexed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'analytics_submission_index'
+        constraints = [
+            models.UniqueConstraint(fields=['model_type', 'source_id'], name='submission_index_source_unique'),
+        ]
+        indexes = [
+            # Mentor review queues and dashboards
+            models.Index(fields=['mentor', 'status', '-sort_at'], name='subidx_mentor_status'),
+            models.Index(fields=['mentor', 'pillar', '-sort_at'], name='subidx_mentor_pillar'),
+            # Floor/campus rollups
+            models.Index(fields=['campus', 'floor', 'status'], name='subidx_floor_status'),
+            # Per-student history and monthly reports
+            models.Index(fields=['user', 'pillar', 'status'], name='subidx_user_pillar'),
+            models.Index(fields=['user', '-sort_at'], name='subidx_user_sort'),
+            # Reviews completed per day
+            models.Index(fields=['status', 'reviewed_at'], name='subidx_status_reviewed'),
+        ]
+        verbose_name = 'Submission Index Entry'
+        verbose_name_plural = 'Submission Index'
+        ordering = ['-sort_at']
+    
+    def __str__(self):
+        return f"{self.model_type} #{self.source_id} - {self.status}"
+
+
+class AnalyticsDelta(models.Model):
+    """
+    Pending counter change for one summary row.
+    
+    Written by signals when USE_ANALYTICS_DELTAS is on (submission created,
+    status changed or deleted; mentor reassigned; student moved floor or
+    role) and folded into the summary tables by `compact_analytics`.
+    A full `recompute_analytics` run discards the deltas it covered.
+    """
+    
+    ENTITY_FLOOR = 'floor'
+    ENTITY_MENTOR = 'mentor'
+    ENTITY_GLOBAL = 'global'
+    
+    entity_type = models.CharField(max_length=20, choices=[
+        (ENTITY_FLOOR, 'Floor'),
+        (ENTITY_MENTOR, 'Mentor'),
+        (ENTITY_GLOBAL, 'Global'),
+    ])
+    entity_key = models.CharField(max_length=100)  # "TECH-1", mentor ID, or ISO date
+    field = models.CharField(max_length=50)  # summary column, e.g. pending_reviews
+    delta = models.IntegerField()
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'analytics_delta_log'
+        indexes = [
+            models.Index(fields=['entity_type', 'entity_key']),
+        ]
+        verbose_name = 'Analytics Delta'
+        verbose_name_plural = 'Analytics Deltas'
+        ordering = ['id']
+    
+    def __str__(self):
+        return f"{self.entity_type} {self.entity_key}: {self.field} {self.delta:+d}"
+
+
+class StudentProgressSummary(models.Model):
+    """
+    Pillar progress and submission counts for one student.
+    
+    Kept current by signals whenever one of the student's submissions or
+    LeetCode profiles changes (submission saves adjust the counts, other
+    changes rebuild the row from the submission models), so floor and mentor
+    listings read progress with a join instead of per-student counting.
+    Rebuild everything with `backfill_student_progress`.
+    """
+    
+    RISK_ON_TRACK = 'on_track'
+    RISK_AT_RISK = 'at_risk'
+    RISK_BEHIND = 'behind'
+    RISK_CHOICES = [
+        (RISK_ON_TRACK, 'On Track'),
+        (RISK_AT_RISK, 'At Risk'),
+        (RISK_BEHIND, 'Behind'),
+    ]
+    
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='progress_summary')
+    
+    # Placement (denormalized from the student's profile)
+    campus = models.CharField(max_length=10, null=True, blank=True)
+    floor = models.IntegerField(null=True, blank=True)
+    mentor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='mentored_progress_summaries'
+    )
+    
+    # {"cfc": {"submitted": 3, "approved": 1, "pending": 2, "rejected": 0}, ...}
+    pillar_counts = models.JSONField(default=dict)
+    
+    # Submission totals across pillars
+    total_submissions = models.IntegerField(default=0)
+    approved_submissions = models.IntegerField(default=0)
+    pending_submissions = models.IntegerField(default=0)
+    rejected_submissions = models.IntegerField(default=0)
+    
+    # Pillar Progress (0-100 percentages)
+    clt_progress = models.IntegerField(default=0)
+    cfc_progress = models.IntegerField(default=0)
+    sri_progress = models.IntegerField(default=0)
+    iipc_progress = models.IntegerField(default=0)
+    scd_progress = models.IntegerField(default=0)
+    overall_progress = models.IntegerField(default=0)
+    
+    last_activity = models.DateTimeField(null=True, blank=True)
+    risk_status = models.CharField(max_length=20, choices=RISK_CHOICES, default=RISK_BEHIND)
+    
+    # Metadata
+    last_updated = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'analytics_student_progress'
+        indexes = [
+            models.Index(fields=['campus', 'floor', 'risk_status'], name='progress_floor_risk'),
+            models.Index(fields=['mentor', 'risk_status'], name='progress_mentor_risk'),
+            models.Index(fields=['overall_progress'], name='progress_overall'),
+        ]
+        verbose_name = 'Student Progress Summary'
+        verbose_name_plural = 'Student Progress Summaries'
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.overall_progress}% ({self.risk_status})"
+    
+    @property
+    def pillars(self):
+        """Pillar percentages keyed like AdminStudentDetailView's pillar_details"""
+        return {
+            'CFC': self.cfc_progress,
+            'CLT': self.clt_progress,
+            'SRI': self.sri_progress,
+            'IIPC': self.iipc_progress,
+            'SCD': self.scd_progress,
+        }
+    
+    @property
+    def submission_stats(self):
+        return {
+            'total': self.total_submissions,
+            'approved': self.approved_submissions,
+            'pending': self.pending_submissions,
+            'rejected': self.rejected_submissions,
+        }
@@ -0,0 +1,85 @@
+"""
+Summary Read Path
+
+Dashboards read columns from a summary row through `SummaryReader`. When
+the row is missing or older than ANALYTICS_SUMMARY_MAX_AGE each field
+falls back to its live computation, so a stale floor never serves old
+numbers. `meta()` reports where the values came from and how old they are;
+views include it in the response as `analytics`.
+"""
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def max_age():
+    return getattr(settings, 'ANALYTICS_SUMMARY_MAX_AGE', 600)
+
+
+def enabled():
+    return getattr(settings, 'USE_ANALYTICS_SUMMARY', False)
+
+
+class LazyValue:
+    """Call `compute` once, on first use - shares one live query across fields"""
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.done = False
+        self.value = None
+
+    def __call__(self):
+        if not self.done:
+            self.value = self.compute()
+            self.done = True
+        return self.value
+
+
+class SummaryReader:
+    """Read fields from a summary row, falling back to live values per field"""
+
+    def __init__(self, summary, now=None):
+        self.summary = summary
+        self.age = None
+        if summary is not None:
+            self.age = int(((now or timezone.now()) - summary.last_updated).total_seconds())
+        self.fresh = summary is not None and self.age <= max_age()
+        self.live_fields = []
+
+    def get(self, field, live, column=None):
+        """
+        Summary value or live() when the row is unusable; `column` names the
+        summary column (default: same as field) or builds the value from the row
+        """
+        if self.fresh:
+            if callable(column):
+                return column(self.summary)
+            return getattr(self.summary, column or field)
+        self.live_fields.append(field)
+        return live()
+
+    def meta(self):
+        return {
+            'source': 'summary' if self.fresh else 'live',
+            'last_updated': self.summary.last_updated.isoformat() if self.summary else None,
+            'age_seconds': self.age,
+            'stale': self.summary is not None and not self.fresh,
+            'live_fields': self.live_fields,
+        }
+
+
+def combined_meta(readers):
+    """One freshness block for a response built from several summary rows"""
+    metas = [reader.meta() for reader in readers]
+    if not metas:
+        return {'source': 'live', 'last_updated': None, 'age_seconds': None, 'stale': False, 'live_fields': []}
+    sources = {meta['source'] for meta in metas}
+    ages = [meta['age_seconds'] for meta in metas if meta['age_seconds'] is not None]
+    updated = [meta['last_updated'] for meta in metas if meta['last_updated']]
+    return {
+        'source': sources.pop() if len(sources) == 1 else 'mixed',
+        'last_updated': min(updated) if updated else None,
+        'age_seconds': max(ages) if ages else None,
+        'stale': any(meta['stale'] for meta in metas),
+        'live_fields': sorted({field for meta in metas for field in meta['live_fields']}),
+    }
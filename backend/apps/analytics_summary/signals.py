@@ -0,0 +1,131 @@
+"""
+Keep SubmissionIndex, StudentProgressSummary, the analytics delta log and
+the dashboard cache versions in step with the submission models and profiles
+
+SubmissionIndex rows are only written while USE_SUBMISSION_INDEX is on.
+Submission saves adjust the student's progress counts from the old and new
+status (saves that keep the status bucket write nothing there); profile
+saves that leave role, campus, floor and mentor unchanged skip the owner
+refresh. Handlers run in whatever transaction the save is in - with
+autocommit each write commits on its own, so a failure part way leaves the
+derived rows behind. That drift, and writes that bypass signals
+(QuerySet.update, raw SQL), are caught by `check_submission_index --fix`,
+`backfill_student_progress` and the next full `recompute_analytics`.
+"""
+
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.profiles.models import UserProfile
+from apps.scd.models import LeetCodeProfile
+from . import cache_versions, deltas, student_progress, submission_index
+
+
+def _sync_on_save(sender, instance, created, raw=False, **kwargs):
+    """Index row, progress counts and analytics deltas for a saved submission"""
+    previous = None if created else instance._analytics_state
+    instance._analytics_state = deltas.submission_state(instance)
+    if raw:
+        return  # loaddata: rebuild with backfill_submission_index / backfill_student_progress
+    if submission_index.enabled():
+        submission_index.index_submission(instance)
+    if not created and previous is None:
+        # Loaded with deferred fields: the old status is unknown
+        student_progress.refresh([instance.user_id])
+        return
+    student_progress.record_submission(
+        instance.user_id, submission_index.MODEL_TYPES[sender], previous, instance._analytics_state,
+    )
+    if deltas.enabled():
+        deltas.record_submission(instance.user_id, previous, instance._analytics_state)
+
+
+def _deleted_with_user(sender, origin):
+    # Cascades from deleting the student take their progress row with them
+    return origin is not None and not (
+        isinstance(origin, sender) or getattr(origin, 'model', None) is sender
+    )
+
+
+def _remove_on_delete(sender, instance, origin=None, **kwargs):
+    if submission_index.enabled():
+        submission_index.remove_submission(instance)
+    if not _deleted_with_user(sender, origin):
+        student_progress.refresh([instance.user_id])
+
+
+SUBMISSION_STATE_FIELDS = ['status', 'created_at', 'reviewed_at']
+PROFILE_STATE_FIELDS = ['role', 'campus', 'floor', 'assigned_mentor_id']
+
+
+def _loaded(instance, fields):
+    # Deferred fields stay deferred; those instances just skip deltas
+    return all(field in instance.__dict__ for field in fields)
+
+
+def _remember_submission_state(sender, instance, **kwargs):
+    instance._analytics_state = (
+        deltas.submission_state(instance) if _loaded(instance, SUBMISSION_STATE_FIELDS) else None
+    )
+
+
+def _submission_delta_on_delete(sender, instance, **kwargs):
+    if deltas.enabled():
+        deltas.record_submission(instance.user_id, deltas.submission_state(instance), None)
+
+
+def _bump_submissions_version(sender, raw=False, **kwargs):
+    if not raw:
+        cache_versions.bump('submissions')
+
+
+for _model in submission_index.MODEL_TYPES:
+    post_save.connect(_sync_on_save, sender=_model, dispatch_uid=f'submission_sync_save_{_model.__name__}')
+    post_delete.connect(_remove_on_delete, sender=_model, dispatch_uid=f'submission_index_delete_{_model.__name__}')
+    post_init.connect(_remember_submission_state, sender=_model, dispatch_uid=f'analytics_delta_init_{_model.__name__}')
+    post_delete.connect(_submission_delta_on_delete, sender=_model, dispatch_uid=f'analytics_delta_delete_{_model.__name__}')
+    post_save.connect(_bump_submissions_version, sender=_model, dispatch_uid=f'submissions_version_save_{_model.__name__}')
+    post_delete.connect(_bump_submissions_version, sender=_model, dispatch_uid=f'submissions_version_delete_{_model.__name__}')
+
+
+@receiver(post_save, sender=LeetCodeProfile)
+@receiver(post_delete, sender=LeetCodeProfile)
+def refresh_scd_progress(sender, instance, raw=False, origin=None, **kwargs):
+    """Solved counts decide SCD completion"""
+    if not raw and not _deleted_with_user(sender, origin):
+        student_progress.refresh([instance.user_id])
+
+
+
+@receiver(post_init, sender=UserProfile)
+def remember_profile_state(sender, instance, **kwargs):
+    instance._analytics_state = (
+        deltas.profile_state(instance) if _loaded(instance, PROFILE_STATE_FIELDS) else None
+    )
+
+
+@receiver(post_save, sender=UserProfile)
+def sync_profile_rows(sender, instance, created, raw=False, **kwargs):
+    """
+    Mentor reassignment, floor moves and role changes update the student's
+    index and progress rows and move summary counters
+    """
+    previous = None if created else instance._analytics_state
+    instance._analytics_state = deltas.profile_state(instance)
+    if raw or previous == instance._analytics_state:
+        return
+    if not created:
+        # previous is None when the profile was loaded with deferred fields
+        if submission_index.enabled():
+            submission_index.refresh_profile(instance)
+        student_progress.refresh_profile(instance)
+    if deltas.enabled() and (created or previous is not None):
+        deltas.record_profile(instance.user_id, previous, instance._analytics_state)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def bump_profiles_version(sender, raw=False, **kwargs):
+    """Role, campus and floor changes move the admin headcounts"""
+    if not raw:
+        cache_versions.bump('profiles')
@@ -0,0 +1,221 @@
+"""
+Student Progress Sync
+
+Builds StudentProgressSummary rows from the grouped submission aggregates.
+Submission saves move the counts on the student's row with
+`record_submission` (one read and one write, nothing when the status bucket
+is unchanged); deletes and LeetCode profile changes `refresh` the row from
+the aggregates. `progress_for` serves listings, computing rows that are not
+stored yet in bulk instead of per student.
+"""
+
+from django.db import transaction
+
+from apps.profiles.models import UserProfile
+from . import aggregates, deltas
+from .models import StudentProgressSummary
+
+# model type -> pillar, for per-pillar counts
+MODEL_PILLARS = {
+    'hackathon': 'cfc',
+    'bmc': 'cfc',
+    'internship': 'cfc',
+    'genai': 'cfc',
+    'clt': 'clt',
+    'linkedin': 'iipc',
+    'linkedin_connection': 'iipc',
+}
+
+# Overall progress thresholds (AdminStudentDetailView status)
+ON_TRACK_PROGRESS = 80
+AT_RISK_PROGRESS = 50
+
+UPDATE_FIELDS = [
+    'campus', 'floor', 'mentor', 'pillar_counts',
+    'total_submissions', 'approved_submissions', 'pending_submissions', 'rejected_submissions',
+    'clt_progress', 'cfc_progress', 'sri_progress', 'iipc_progress', 'scd_progress',
+    'overall_progress', 'last_activity', 'risk_status', 'last_updated',
+]
+
+# Columns `record_submission` changes
+COUNT_FIELDS = [
+    'pillar_counts',
+    'total_submissions', 'approved_submissions', 'pending_submissions', 'rejected_submissions',
+    'clt_progress', 'cfc_progress', 'sri_progress', 'iipc_progress', 'scd_progress',
+    'overall_progress', 'last_activity', 'risk_status', 'last_updated',
+]
+
+CHUNK_SIZE = 500
+
+
+def risk_status(overall):
+    if overall >= ON_TRACK_PROGRESS:
+        return StudentProgressSummary.RISK_ON_TRACK
+    if overall >= AT_RISK_PROGRESS:
+        return StudentProgressSummary.RISK_AT_RISK
+    return StudentProgressSummary.RISK_BEHIND
+
+
+def build_row(user_id, profile, model_counts, scd_completed):
+    """Unsaved StudentProgressSummary for one student"""
+    pillar_counts = {
+        pillar: {'submitted': 0, 'approved': 0, 'pending': 0, 'rejected': 0}
+        for pillar in ['cfc', 'clt', 'sri', 'iipc', 'scd']
+    }
+    for model_type, row in model_counts.items():
+        counts = pillar_counts[MODEL_PILLARS[model_type]]
+        counts['submitted'] += row['total']
+        for key in ('approved', 'pending', 'rejected'):
+            counts[key] += row[key]
+
+    totals = aggregates.submission_totals(model_counts)
+    pillars, overall = aggregates.pillar_progress(model_counts, scd_completed)
+    return StudentProgressSummary(
+        user_id=user_id,
+        campus=profile.campus if profile else None,
+        floor=profile.floor if profile else None,
+        mentor_id=profile.assigned_mentor_id if profile else None,
+        pillar_counts=pillar_counts,
+        total_submissions=totals['total'],
+        approved_submissions=totals['approved'],
+        pending_submissions=totals['pending'],
+        rejected_submissions=totals['rejected'],
+        **{f'{pillar.lower()}_progress': value for pillar, value in pillars.items()},
+        overall_progress=overall,
+        last_activity=aggregates.last_submission(model_counts),
+        risk_status=risk_status(overall),
+    )
+
+
+def build_rows(user_ids, profiles=None):
+    """
+    Rows for many students from a fixed number of grouped queries
+    profiles: {user_id: UserProfile} when the caller already has them
+    """
+    user_ids = list(user_ids)
+    if profiles is None:
+        profiles = {p.user_id: p for p in UserProfile.objects.filter(user_id__in=user_ids)}
+    counts = aggregates.student_submission_counts(user_ids)
+    scd_completed = aggregates.scd_completed_users(user_ids)
+    return [
+        build_row(user_id, profiles.get(user_id), counts.get(user_id, {}), user_id in scd_completed)
+        for user_id in user_ids
+    ]
+
+
+def _upsert(rows):
+    StudentProgressSummary.objects.bulk_create(
+        rows,
+        batch_size=CHUNK_SIZE,
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=UPDATE_FIELDS,
+    )
+
+
+def refresh(user_ids):
+    """Rebuild and store the rows for these students"""
+    rows = build_rows(user_ids)
+    _upsert(rows)
+    return rows
+
+
+def _count_moved(previous, current):
+    # created_at decides last_activity; anything else only matters through the bucket
+    return (
+        previous is None
+        or deltas.status_bucket(previous[0]) != deltas.status_bucket(current[0])
+        or previous[1] != current[1]
+    )
+
+
+def record_submission(user_id, model_type, previous, current):
+    """
+    Move one saved submission's counts on the student's row
+
+    previous/current are `deltas.submission_state` tuples; previous is None
+    for a new submission. Students without a row yet, and edits that move
+    created_at, get a full `refresh` instead.
+    """
+    if not _count_moved(previous, current):
+        return None
+    if previous is not None and previous[1] != current[1]:
+        return refresh([user_id])[0]
+
+    with transaction.atomic():
+        row = StudentProgressSummary.objects.select_for_update().filter(user_id=user_id).first()
+        if row is None:
+            return refresh([user_id])[0]
+
+        counts = row.pillar_counts[MODEL_PILLARS[model_type]]
+        for state, sign in ((previous, -1), (current, 1)):
+            if state is None:
+                continue
+            bucket = deltas.status_bucket(state[0])
+            counts['submitted'] += sign
+            row.total_submissions += sign
+            if bucket:
+                counts[bucket] += sign
+                setattr(row, f'{bucket}_submissions', getattr(row, f'{bucket}_submissions') + sign)
+
+        pillars, overall = aggregates.approved_progress(
+            row.pillar_counts['cfc']['approved'],
+            row.pillar_counts['clt']['approved'],
+            row.pillar_counts['iipc']['approved'],
+            row.scd_progress == 100,
+        )
+        for pillar, value in pillars.items():
+            setattr(row, f'{pillar.lower()}_progress', value)
+        row.overall_progress = overall
+        row.risk_status = risk_status(overall)
+        if current[1] and (row.last_activity is None or current[1] > row.last_activity):
+            row.last_activity = current[1]
+        row.save(update_fields=COUNT_FIELDS)
+    return row
+
+
+def refresh_profile(profile):
+    """Copy a student's mentor/campus/floor onto their row, creating it for new students"""
+    updated = StudentProgressSummary.objects.filter(user_id=profile.user_id).update(
+        campus=profile.campus, floor=profile.floor, mentor_id=profile.assigned_mentor_id,
+    )
+    if not updated and profile.role == 'STUDENT':
+        refresh([profile.user_id])
+    return updated
+
+
+def progress_for(profiles):
+    """
+    {user_id: StudentProgressSummary} for student profiles
+
+    Select the profiles with select_related('user__progress_summary') so
+    stored rows come with the listing query; missing rows are computed in
+    one batch (not saved - `backfill_student_progress` stores them).
+    """
+    progress, missing = {}, {}
+    for profile in profiles:
+        try:
+            progress[profile.user_id] = profile.user.progress_summary
+        except StudentProgressSummary.DoesNotExist:
+            missing[profile.user_id] = profile
+    if missing:
+        for row in build_rows(missing, profiles=missing):
+            progress[row.user_id] = row
+    return progress
+
+
+def backfill(chunk_size=CHUNK_SIZE):
+    """(Re)build rows for every student; returns the number written"""
+    written = 0
+    last_id = 0
+    while True:
+        user_ids = list(
+            UserProfile.objects.filter(role='STUDENT', user_id__gt=last_id)
+            .order_by('user_id').values_list('user_id', flat=True)[:chunk_size]
+        )
+        if not user_ids:
+            return written
+        with transaction.atomic():
+            refresh(user_ids)
+        written += len(user_ids)
+        last_id = user_ids[-1]
@@ -0,0 +1,201 @@
+"""
+Submission Index Sync
+
+Builds SubmissionIndex rows from the seven cross-pillar submission models.
+While USE_SUBMISSION_INDEX is on, signals call `index_submission` /
+`remove_submission` for single rows; `backfill` and `check_consistency`
+work a model at a time in chunks (run the backfill when turning it on).
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from apps.cfc.models import HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission
+from apps.clt.models import CLTSubmission
+from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
+from apps.profiles.models import UserProfile
+from .models import SubmissionIndex
+
+
+# model type -> (pillar, model, title)
+SOURCES = {
+    'hackathon': ('cfc', HackathonSubmission, lambda sub: sub.hackathon_name),
+    'bmc': ('cfc', BMCVideoSubmission, lambda sub: 'Business Model Canvas Video'),
+    'internship': ('cfc', InternshipSubmission, lambda sub: f"Internship at {sub.company}"),
+    'genai': ('cfc', GenAIProjectSubmission, lambda sub: 'GenAI Project'),
+    'clt': ('clt', CLTSubmission, lambda sub: sub.title),
+    'linkedin': ('iipc', LinkedInPostVerification, lambda sub: 'LinkedIn Post Verification'),
+    'linkedin_connection': ('iipc', LinkedInConnectionVerification, lambda sub: 'LinkedIn Connections Verification'),
+}
+
+MODEL_TYPES = {model: model_type for model_type, (_, model, _) in SOURCES.items()}
+
+# Columns copied from the source row; checked by check_consistency
+SYNCED_FIELDS = ['user_id', 'status', 'created_at', 'submitted_at', 'reviewed_at']
+
+UPDATE_FIELDS = [
+    'pillar', 'user', 'mentor', 'campus', 'floor', 'status', 'title',
+    'created_at', 'submitted_at', 'reviewed_at', 'sort_at', 'indexed_at',
+]
+
+CHUNK_SIZE = 1000
+
+
+def enabled():
+    return getattr(settings, 'USE_SUBMISSION_INDEX', False)
+
+
+def _profile_fields(profile):
+    if profile is None:
+        return {'mentor_id': None, 'campus': None, 'floor': None}
+    return {
+        'mentor_id': profile.assigned_mentor_id,
+        'campus': profile.campus,
+        'floor': profile.floor,
+    }
+
+
+def build_entry(model_type, sub, profile):
+    """Unsaved SubmissionIndex row for a submission"""
+    pillar, _, title = SOURCES[model_type]
+    return SubmissionIndex(
+        pillar=pillar,
+        model_type=model_type,
+        source_id=sub.id,
+        user_id=sub.user_id,
+        status=sub.status,
+        title=(title(sub) or '')[:255],
+        created_at=sub.created_at,
+        submitted_at=sub.submitted_at,
+        reviewed_at=sub.reviewed_at,
+        sort_at=sub.submitted_at or sub.created_at,
+        **_profile_fields(profile),
+    )
+
+
+def _upsert(entries):
+    SubmissionIndex.objects.bulk_create(
+        entries,
+        batch_size=CHUNK_SIZE,
+        update_conflicts=True,
+        unique_fields=['model_type', 'source_id'],
+        update_fields=UPDATE_FIELDS,
+    )
+
+
+def index_submission(instance):
+    """Insert or refresh the index row for one submission"""
+    model_type = MODEL_TYPES[type(instance)]
+    profile = UserProfile.objects.filter(user_id=instance.user_id).first()
+    _upsert([build_entry(model_type, instance, profile)])
+
+
+def remove_submission(instance):
+    SubmissionIndex.objects.filter(
+        model_type=MODEL_TYPES[type(instance)], source_id=instance.id
+    ).delete()
+
+
+def refresh_profile(profile):
+    """Copy a student's mentor/campus/floor onto their index rows"""
+    return SubmissionIndex.objects.filter(user_id=profile.user_id).update(**_profile_fields(profile))
+
+
+def _index_rows(model_type, ids):
+    _, model, _ = SOURCES[model_type]
+    subs = model.objects.filter(id__in=ids).select_related('user__profile').order_by()
+    return [
+        build_entry(model_type, sub, getattr(sub.user, 'profile', None))
+        for sub in subs
+    ]
+
+
+def backfill(model_types=None, chunk_size=CHUNK_SIZE):
+    """
+    (Re)build index rows for every submission of the given model types
+    and drop rows whose source no longer exists. Returns counts per type.
+    """
+    results = {}
+    for model_type in model_types or SOURCES:
+        _, model, _ = SOURCES[model_type]
+        indexed = 0
+        last_id = 0
+        while True:
+            ids = list(
+                model.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                entries = _index_rows(model_type, ids)
+                _upsert(entries)
+            indexed += len(entries)
+            last_id = ids[-1]
+
+        removed, _ = SubmissionIndex.objects.filter(model_type=model_type).exclude(
+            source_id__in=model.objects.values('id')
+        ).delete()
+        results[model_type] = {'indexed': indexed, 'removed': removed}
+    return results
+
+
+def check_consistency(model_types=None, fix=False, chunk_size=CHUNK_SIZE):
+    """
+    Compare index rows against their sources, chunked by source id
+
+    Reports rows missing from the index, orphaned index rows and rows whose
+    synced columns (user, status, timestamps) or denormalized mentor/campus/
+    floor drifted. With fix=True the affected rows are rebuilt or deleted.
+    """
+    report = {}
+    for model_type in model_types or SOURCES:
+        _, model, _ = SOURCES[model_type]
+        missing, stale = [], []
+        last_id = 0
+        while True:
+            source_rows = {
+                row['id']: row
+                for row in model.objects.filter(id__gt=last_id).order_by('id').values(
+                    'id', *SYNCED_FIELDS,
+                    mentor_id=F('user__profile__assigned_mentor_id'),
+                    campus=F('user__profile__campus'),
+                    floor=F('user__profile__floor'),
+                )[:chunk_size]
+            }
+            if not source_rows:
+                break
+            ids = list(source_rows)
+            index_rows = {
+                row['source_id']: row
+                for row in SubmissionIndex.objects.filter(
+                    model_type=model_type, source_id__in=ids
+                ).values('source_id', *SYNCED_FIELDS, 'mentor_id', 'campus', 'floor')
+            }
+            for source_id, source in source_rows.items():
+                entry = index_rows.get(source_id)
+                if entry is None:
+                    missing.append(source_id)
+                elif any(entry[field] != source[field] for field in
+                         SYNCED_FIELDS + ['mentor_id', 'campus', 'floor']):
+                    stale.append(source_id)
+            last_id = ids[-1]
+
+        orphaned = list(
+            SubmissionIndex.objects.filter(model_type=model_type)
+            .exclude(source_id__in=model.objects.values('id'))
+            .values_list('source_id', flat=True)
+        )
+
+        if fix:
+            with transaction.atomic():
+                for start in range(0, len(missing) + len(stale), chunk_size):
+                    _upsert(_index_rows(model_type, (missing + stale)[start:start + chunk_size]))
+                SubmissionIndex.objects.filter(model_type=model_type, source_id__in=orphaned).delete()
+
+        report[model_type] = {
+            'missing': missing,
+            'orphaned': orphaned,
+            'stale': stale,
+        }
+    return report
@@ -0,0 +1,435 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.cfc.models import HackathonSubmission
+from apps.clt.models import CLTSubmission
+from apps.iipc.models import LinkedInConnectionVerification
+from apps.scd.models import LeetCodeProfile
+from . import deltas, student_progress, submission_index, validation
+from .models import (
+    AnalyticsComparisonLog, AnalyticsDelta, FloorAnalyticsSummary, GlobalAnalyticsSummary, MentorAnalyticsSummary,
+    StudentProgressSummary, SubmissionIndex,
+)
+
+
+@override_settings(USE_SUBMISSION_INDEX=True)
+class SubmissionIndexTests(TestCase):
+    """SubmissionIndex signals, backfill and consistency checks"""
+
+    def setUp(self):
+        self.mentor = User.objects.create(username='mentor')
+        self.mentor.profile.role = 'MENTOR'
+        self.mentor.profile.save()
+
+        self.student = User.objects.create(username='student')
+        profile = self.student.profile
+        profile.assigned_mentor = self.mentor
+        profile.campus = 'TECH'
+        profile.floor = 2
+        profile.save()
+
+    def _clt(self, **kwargs):
+        return CLTSubmission.objects.create(
+            user=self.student, title='Course', description='Course',
+            platform='Coursera', completion_date=date.today(), **kwargs
+        )
+
+    def test_signals_keep_rows_in_sync(self):
+        sub = self._clt(status='submitted')
+        entry = SubmissionIndex.objects.get(model_type='clt', source_id=sub.id)
+        self.assertEqual(
+            (entry.pillar, entry.mentor_id, entry.campus, entry.floor, entry.status, entry.title),
+            ('clt', self.mentor.id, 'TECH', 2, 'submitted', 'Course'),
+        )
+        self.assertEqual(entry.sort_at, sub.created_at)
+
+        sub.status = 'approved'
+        sub.save()
+        self.assertEqual(SubmissionIndex.objects.get(source_id=sub.id).status, 'approved')
+
+        # Reassigning the student moves their rows to the new mentor
+        other = User.objects.create(username='other-mentor')
+        self.student.profile.assigned_mentor = other
+        self.student.profile.save()
+        self.assertEqual(SubmissionIndex.objects.get(source_id=sub.id).mentor_id, other.id)
+
+        sub.delete()
+        self.assertFalse(SubmissionIndex.objects.exists())
+
+    def test_checker_finds_and_fixes_drift(self):
+        sub = self._clt(status='submitted')
+        connection = LinkedInConnectionVerification.objects.create(
+            user=self.student, total_connections=300
+        )
+
+        # Writes that bypass signals
+        CLTSubmission.objects.filter(id=sub.id).update(status='approved')
+        SubmissionIndex.objects.filter(model_type='linkedin_connection').delete()
+        SubmissionIndex.objects.create(
+            pillar='cfc', model_type='hackathon', source_id=999, user=self.student,
+            status='draft', created_at=sub.created_at, sort_at=sub.created_at,
+        )
+
+        report = submission_index.check_consistency()
+        self.assertEqual(report['clt']['stale'], [sub.id])
+        self.assertEqual(report['linkedin_connection']['missing'], [connection.id])
+        self.assertEqual(report['hackathon']['orphaned'], [999])
+
+        submission_index.check_consistency(fix=True)
+        report = submission_index.check_consistency()
+        self.assertFalse(any(ids for problems in report.values() for ids in problems.values()))
+        self.assertEqual(SubmissionIndex.objects.get(model_type='clt').status, 'approved')
+
+    def test_backfill_rebuilds_index(self):
+        for _ in range(5):
+            self._clt(status='submitted')
+        SubmissionIndex.objects.all().delete()
+
+        results = submission_index.backfill(chunk_size=2)
+        self.assertEqual(results['clt'], {'indexed': 5, 'removed': 0})
+        self.assertEqual(SubmissionIndex.objects.filter(mentor=self.mentor).count(), 5)
+
+        out = StringIO()
+        call_command('check_submission_index', stdout=out)
+        self.assertIn('consistent', out.getvalue())
+
+    def test_dashboard_reads_index(self):
+        self._clt(status='approved')
+        HackathonSubmission.objects.create(
+            user=self.student, hackathon_name='Hack', mode='online',
+            registration_date=date.today(), participation_date=date.today(), status='submitted',
+        )
+        client = APIClient()
+        client.force_authenticate(self.mentor)
+
+        indexed = client.get('/api/mentor/dashboard/').data
+        with override_settings(USE_SUBMISSION_INDEX=False):
+            live = client.get('/api/mentor/dashboard/').data
+
+        self.assertEqual(indexed['stats'], live['stats'])
+        self.assertEqual(
+            [item['id'] for item in indexed['recent_submissions']],
+            [item['id'] for item in live['recent_submissions']],
+        )
+
+    @override_settings(USE_SUBMISSION_INDEX=False)
+    def test_disabled_index_is_not_written(self):
+        sub = self._clt(status='submitted')
+        sub.status = 'approved'
+        sub.save()
+        self.assertFalse(SubmissionIndex.objects.exists())
+
+    def test_unchanged_profile_save_writes_nothing(self):
+        profile = self.student.profile
+        profile.github_id = 'student-gh'
+        with self.assertNumQueries(1):
+            profile.save()
+
+
+class SummaryTestCase(TestCase):
+    """Students and mentors placed on campus floors"""
+
+    def _student(self, username, campus, floor, mentor=None):
+        student = User.objects.create(username=username)
+        profile = student.profile
+        profile.campus, profile.floor, profile.assigned_mentor = campus, floor, mentor
+        profile.save()
+        return student
+
+    def _mentor(self, username, campus, floor):
+        mentor = User.objects.create(username=username)
+        profile = mentor.profile
+        profile.role, profile.campus, profile.floor = 'MENTOR', campus, floor
+        profile.save()
+        return mentor
+
+
+class RecomputeFloorAnalyticsTests(SummaryTestCase):
+    """recompute_analytics --floors-only"""
+
+    def _recompute(self):
+        call_command('recompute_analytics', '--floors-only', stdout=StringIO())
+
+    def test_columns_are_computed(self):
+        mentor = self._mentor('mentor', 'TECH', 1)
+        self._mentor('idle-mentor', 'TECH', 1)
+        alice = self._student('alice', 'TECH', 1, mentor)
+        self._student('bob', 'TECH', 1)
+        self._student('carol', 'ARTS', 2)
+
+        CLTSubmission.objects.create(
+            user=alice, title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status='approved',
+        )
+        HackathonSubmission.objects.create(
+            user=alice, hackathon_name='Hack', mode='online', registration_date=date.today(),
+            participation_date=date.today(), status='submitted',
+        )
+        LeetCodeProfile.objects.create(user=alice, leetcode_username='alice', total_solved=25)
+
+        self._recompute()
+
+        tech = FloorAnalyticsSummary.objects.get(campus='TECH', floor=1)
+        self.assertEqual(
+            (tech.total_students, tech.assigned_students, tech.unassigned_students, tech.active_students),
+            (2, 1, 1, 1),
+        )
+        self.assertEqual((tech.total_mentors, tech.active_mentors), (2, 1))
+        self.assertEqual(
+            (tech.total_submissions, tech.pending_reviews, tech.approved_submissions, tech.rejected_submissions),
+            (2, 1, 1, 0),
+        )
+        # alice: CLT 100, SCD 100 -> overall 40; bob: 0
+        self.assertEqual((tech.clt_progress, tech.scd_progress, tech.cfc_progress), (50.0, 50.0, 0.0))
+        self.assertEqual(tech.avg_completion, 20.0)
+
+        arts = FloorAnalyticsSummary.objects.get(campus='ARTS', floor=2)
+        self.assertEqual((arts.total_students, arts.total_submissions), (1, 0))
+
+    def test_query_count_is_independent_of_floors(self):
+        for floor in (1, 2):
+            self._student(f'student{floor}', 'TECH', floor)
+        self._recompute()
+
+        def recompute_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self._recompute()
+            return len(queries)
+
+        baseline = recompute_queries()
+        for floor in (3, 4):
+            self._student(f'student{floor}', 'TECH', floor)
+            self._student(f'arts{floor}', 'ARTS', floor)
+        self._recompute()  # creates the new summary rows
+        self.assertEqual(recompute_queries(), baseline)
+
+
+@override_settings(USE_ANALYTICS_DELTAS=True)
+class AnalyticsDeltaTests(SummaryTestCase):
+    """Delta log + compact_analytics against a full recompute"""
+
+    FLOOR_COUNTERS = [
+        'total_students', 'assigned_students', 'unassigned_students', 'total_mentors',
+        'total_submissions', 'pending_reviews', 'approved_submissions', 'rejected_submissions',
+    ]
+    MENTOR_COUNTERS = ['assigned_students_count', 'pending_reviews_count', 'total_reviews_completed']
+    GLOBAL_COUNTERS = deltas.GLOBAL_CUMULATIVE_FIELDS + deltas.GLOBAL_DAILY_FIELDS
+
+    def _clt(self, user, status):
+        return CLTSubmission.objects.create(
+            user=user, title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status=status,
+        )
+
+    def _counters(self):
+        return (
+            {(s.campus, s.floor): [getattr(s, f) for f in self.FLOOR_COUNTERS]
+             for s in FloorAnalyticsSummary.objects.all()},
+            {s.mentor_id: [getattr(s, f) for f in self.MENTOR_COUNTERS]
+             for s in MentorAnalyticsSummary.objects.all()},
+            {s.date: [getattr(s, f) for f in self.GLOBAL_COUNTERS]
+             for s in GlobalAnalyticsSummary.objects.all()},
+        )
+
+    def test_compacted_deltas_match_full_recompute(self):
+        first = self._mentor('first', 'TECH', 1)
+        second = self._mentor('second', 'TECH', 2)
+        alice = self._student('alice', 'TECH', 1, first)
+        bob = self._student('bob', 'TECH', 1)
+        self._clt(alice, 'submitted')
+        call_command('recompute_analytics', stdout=StringIO())
+        self.assertFalse(AnalyticsDelta.objects.exists())
+
+        # Create, review, delete, reassign, move floors, add a student
+        sub = self._clt(alice, 'submitted')
+        sub.status, sub.reviewed_at = 'approved', timezone.now()
+        sub.save()
+        self._clt(bob, 'rejected').delete()
+        self._clt(bob, 'submitted')
+        alice.profile.assigned_mentor = second
+        alice.profile.save()
+        bob.profile.floor, bob.profile.assigned_mentor = 2, first
+        bob.profile.save()
+        self._student('carol', 'ARTS', 3)
+        self.assertTrue(AnalyticsDelta.objects.exists())
+
+        result = deltas.compact()
+        self.assertEqual(result['unseeded'], 0)
+        self.assertFalse(AnalyticsDelta.objects.exists())
+        incremental = self._counters()
+
+        tech1 = FloorAnalyticsSummary.objects.get(campus='TECH', floor=1)
+        self.assertEqual(
+            [tech1.total_students, tech1.total_submissions, tech1.approved_submissions],
+            [1, 2, 1],
+        )
+
+        call_command('recompute_analytics', stdout=StringIO())
+        self.assertEqual(incremental, self._counters())
+
+    def test_unchanged_saves_log_nothing(self):
+        alice = self._student('alice', 'TECH', 1)
+        sub = self._clt(alice, 'submitted')
+        AnalyticsDelta.objects.all().delete()
+
+        sub.status = 'under_review'  # same pending bucket
+        sub.save()
+        alice.profile.leetcode_id = 'alice'
+        alice.profile.save()
+        self.assertFalse(AnalyticsDelta.objects.exists())
+
+    @override_settings(USE_ANALYTICS_DELTAS=False)
+    def test_disabled_by_default(self):
+        self._clt(self._student('alice', 'TECH', 1), 'submitted')
+        self.assertFalse(AnalyticsDelta.objects.exists())
+
+    def test_unseeded_summaries_are_dropped(self):
+        self._clt(self._student('alice', 'TECH', 1), 'submitted')
+        result = deltas.compact()
+        self.assertGreater(result['unseeded'], 0)
+        self.assertFalse(FloorAnalyticsSummary.objects.exists())
+        self.assertFalse(AnalyticsDelta.objects.exists())
+
+
+class ValidateAnalyticsTests(SummaryTestCase):
+    """recompute_analytics --validate / validation.validate"""
+
+    def setUp(self):
+        mentor = self._mentor('mentor', 'TECH', 1)
+        for index in range(3):
+            student = self._student(f'student{index}', 'TECH', index + 1, mentor)
+            CLTSubmission.objects.create(
+                user=student, title='Course', description='Course', platform='Coursera',
+                completion_date=date.today(), status='approved',
+            )
+        call_command('recompute_analytics', stdout=StringIO())
+
+    def test_fresh_summaries_match(self):
+        report = validation.validate()
+        self.assertEqual(report['mismatched'], 0)
+        self.assertEqual(report['by_type']['floor']['checked'], 3)
+        self.assertEqual(report['checked'], AnalyticsComparisonLog.objects.count())
+        self.assertTrue(AnalyticsComparisonLog.objects.filter(matches=True).exists())
+
+    def test_drift_is_logged_per_field(self):
+        FloorAnalyticsSummary.objects.filter(campus='TECH', floor=2).update(
+            approved_submissions=5, clt_progress=100.3,
+        )
+        # Within the float tolerance
+        FloorAnalyticsSummary.objects.filter(campus='TECH', floor=3).update(clt_progress=100.2)
+
+        report = validation.validate(['floor'])
+        self.assertEqual((report['checked'], report['mismatched']), (3, 1))
+        self.assertAlmostEqual(report['drift_rate'], 1 / 3)
+
+        log = AnalyticsComparisonLog.objects.get(matches=False)
+        self.assertEqual(log.entity_id, 'TECH-2')
+        self.assertEqual(set(log.discrepancies), {'approved_submissions'})
+        self.assertEqual(log.discrepancies['approved_submissions'], {'cached': 5, 'live': 1, 'diff': 4})
+        self.assertEqual(validation.drift_rate()['mismatched'], 1)
+
+    def test_sample_and_time_budget(self):
+        report = validation.validate(['floor'], sample=2)
+        self.assertEqual(report['checked'], 2)
+
+        report = validation.validate(['floor'], time_budget=0.000001, chunk_size=1)
+        self.assertTrue(report['truncated'])
+        self.assertLess(report['checked'], 3)
+
+    def test_validate_only_command(self):
+        out = StringIO()
+        call_command('recompute_analytics', '--validate-only', '--mentors-only', stdout=out)
+        self.assertIn('Drift rate 0.0%', out.getvalue())
+        self.assertEqual(
+            set(AnalyticsComparisonLog.objects.values_list('entity_type', flat=True)), {'mentor'}
+        )
+
+
+class StudentProgressSummaryTests(SummaryTestCase):
+    """StudentProgressSummary signals and backfill"""
+
+    def test_signals_keep_row_current(self):
+        mentor = self._mentor('mentor', 'TECH', 1)
+        student = self._student('alice', 'TECH', 1, mentor)
+        sub = CLTSubmission.objects.create(
+            user=student, title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status='submitted',
+        )
+        row = StudentProgressSummary.objects.get(user=student)
+        self.assertEqual((row.pending_submissions, row.clt_progress, row.mentor_id), (1, 0, mentor.id))
+        self.assertEqual(row.pillar_counts['clt'], {'submitted': 1, 'approved': 0, 'pending': 1, 'rejected': 0})
+
+        sub.status = 'approved'
+        sub.save()
+        LeetCodeProfile.objects.create(user=student, leetcode_username='alice', total_solved=30)
+        row.refresh_from_db()
+        self.assertEqual((row.clt_progress, row.scd_progress, row.overall_progress), (100, 100, 40))
+        self.assertEqual(row.risk_status, StudentProgressSummary.RISK_BEHIND)
+
+        student.profile.floor = 3
+        student.profile.save()
+        row.refresh_from_db()
+        self.assertEqual(row.floor, 3)
+
+        sub.delete()
+        row.refresh_from_db()
+        self.assertEqual((row.total_submissions, row.clt_progress), (0, 0))
+
+        student.delete()
+        self.assertFalse(StudentProgressSummary.objects.exists())
+
+    def test_submission_saves_adjust_counts_in_place(self):
+        student = self._student('alice', 'TECH', 1)
+        subs = [
+            CLTSubmission.objects.create(
+                user=student, title=f'Course {i}', description='Course', platform='Coursera',
+                completion_date=date.today(), status='submitted',
+            )
+            for i in range(2)
+        ]
+        HackathonSubmission.objects.create(
+            user=student, hackathon_name='Hack', mode='online',
+            registration_date=date.today(), participation_date=date.today(), status='approved',
+        )
+
+        subs[0].description = 'Edited'
+        with CaptureQueriesContext(connection) as queries:
+            subs[0].save()
+        self.assertFalse(any('analytics_student_progress' in q['sql'] for q in queries.captured_queries))
+
+        subs[0].status = 'approved'
+        subs[0].save()
+        subs[1].status = 'rejected'
+        subs[1].save()
+
+        row = StudentProgressSummary.objects.get(user=student)
+        rebuilt = student_progress.build_rows([student.id])[0]
+        for field in student_progress.COUNT_FIELDS:
+            if field != 'last_updated':
+                self.assertEqual(getattr(row, field), getattr(rebuilt, field), field)
+        self.assertEqual((row.clt_progress, row.cfc_progress), (100, 25))
+
+    def test_backfill_and_progress_for_missing_rows(self):
+        students = [self._student(f'student{i}', 'TECH', 1) for i in range(3)]
+        CLTSubmission.objects.create(
+            user=students[0], title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status='approved',
+        )
+        StudentProgressSummary.objects.all().delete()
+
+        from apps.profiles.models import UserProfile
+        profiles = UserProfile.objects.filter(role='STUDENT').select_related('user__progress_summary')
+        progress = student_progress.progress_for(profiles)
+        self.assertEqual(progress[students[0].id].clt_progress, 100)
+        self.assertFalse(StudentProgressSummary.objects.exists())  # reads never write
+
+        call_command('backfill_student_progress', stdout=StringIO())
+        self.assertEqual(StudentProgressSummary.objects.count(), 3)
@@ -0,0 +1,155 @@
+"""
+Summary Drift Validation
+
+Compares stored summaries with live values computed by the same aggregate
+functions `recompute_analytics` uses, and records one AnalyticsComparisonLog
+row per summary checked. Floors and mentors are validated in chunks, so a
+time budget can stop a run between chunks on large deployments; a random
+sample keeps regular checks cheap.
+
+The share of mismatching rows (drift rate) over a recent window is exposed
+through `drift_rate` and the /health/ endpoint.
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from . import aggregates
+from .models import AnalyticsComparisonLog, AnalyticsDelta, FloorAnalyticsSummary, GlobalAnalyticsSummary, MentorAnalyticsSummary
+
+ENTITY_TYPES = ['floor', 'mentor', 'global']
+
+# Allowed absolute difference for float columns (percentage points);
+# counters must match exactly
+FLOAT_TOLERANCE = 0.5
+
+CHUNK_SIZE = 50
+
+DRIFT_WINDOW = timedelta(hours=24)
+
+
+def _floor_rows(summaries):
+    live = aggregates.floor_values([(s.campus, s.floor) for s in summaries])
+    return [(f'{s.campus}-{s.floor}', s, live[(s.campus, s.floor)]) for s in summaries]
+
+
+def _mentor_rows(summaries):
+    live = aggregates.mentor_values([s.mentor_id for s in summaries])
+    return [(str(s.mentor_id), s, live[s.mentor_id]) for s in summaries]
+
+
+def _global_rows(summaries):
+    return [(s.date.isoformat(), s, aggregates.global_values(s.date)) for s in summaries]
+
+
+def _sample(queryset, sample):
+    if sample is None:
+        return list(queryset)
+    ids = list(queryset.values_list('id', flat=True))
+    return list(queryset.filter(id__in=random.sample(ids, min(sample, len(ids)))))
+
+
+def _summaries(entity_type, sample):
+    if entity_type == 'floor':
+        return _sample(FloorAnalyticsSummary.objects.order_by('campus', 'floor'), sample)
+    if entity_type == 'mentor':
+        return _sample(MentorAnalyticsSummary.objects.order_by('mentor_id'), sample)
+    # Daily columns only have a live equivalent for today
+    return list(GlobalAnalyticsSummary.objects.filter(date=timezone.now().date()))
+
+
+LIVE_ROWS = {
+    'floor': _floor_rows,
+    'mentor': _mentor_rows,
+    'global': _global_rows,
+}
+
+
+def compare(cached, live, tolerance=FLOAT_TOLERANCE):
+    """{field: {cached, live, diff}} for live fields outside the tolerance"""
+    discrepancies = {}
+    for field, live_value in live.items():
+        cached_value = cached[field]
+        allowed = tolerance if isinstance(live_value, float) else 0
+        if abs(cached_value - live_value) > allowed:
+            discrepancies[field] = {
+                'cached': cached_value,
+                'live': live_value,
+                'diff': round(cached_value - live_value, 2),
+            }
+    return discrepancies
+
+
+def validate(entity_types=ENTITY_TYPES, sample=None, time_budget=None,
+             tolerance=FLOAT_TOLERANCE, chunk_size=CHUNK_SIZE):
+    """
+    Check summaries against live values and log every comparison
+
+    sample: check at most this many floors and mentors (random), or all
+    time_budget: seconds; remaining chunks are skipped once it is spent
+
+    Returns {checked, mismatched, drift_rate, by_type, truncated,
+    pending_deltas, elapsed_ms}.
+    """
+    started = time.monotonic()
+    deadline = started + time_budget if time_budget else None
+    report = {'checked': 0, 'mismatched': 0, 'by_type': {}, 'truncated': False}
+    logs = []
+
+    for entity_type in entity_types:
+        summaries = _summaries(entity_type, sample)
+        counts = report['by_type'][entity_type] = {'checked': 0, 'mismatched': 0, 'fields': {}}
+
+        for start in range(0, len(summaries), chunk_size):
+            if deadline and time.monotonic() >= deadline:
+                report['truncated'] = True
+                break
+            chunk = summaries[start:start + chunk_size]
+            chunk_started = time.monotonic()
+            rows = LIVE_ROWS[entity_type](chunk)
+            duration_ms = int((time.monotonic() - chunk_started) * 1000 / len(chunk))
+
+            for entity_id, summary, live in rows:
+                cached = {field: getattr(summary, field) for field in live}
+                discrepancies = compare(cached, live, tolerance)
+                logs.append(AnalyticsComparisonLog(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    live_value=live,
+                    cached_value=cached,
+                    matches=not discrepancies,
+                    discrepancies=discrepancies or None,
+                    check_duration_ms=duration_ms,
+                ))
+                counts['checked'] += 1
+                if discrepancies:
+                    counts['mismatched'] += 1
+                    for field in discrepancies:
+                        counts['fields'][field] = counts['fields'].get(field, 0) + 1
+
+        report['checked'] += counts['checked']
+        report['mismatched'] += counts['mismatched']
+
+    AnalyticsComparisonLog.objects.bulk_create(logs, batch_size=500)
+
+    report['drift_rate'] = report['mismatched'] / report['checked'] if report['checked'] else 0.0
+    # Uncompacted deltas show up as drift until compact_analytics runs
+    report['pending_deltas'] = AnalyticsDelta.objects.count()
+    report['elapsed_ms'] = int((time.monotonic() - started) * 1000)
+    return report
+
+
+def drift_rate(window=DRIFT_WINDOW):
+    """Share of mismatching comparisons logged within `window`"""
+    counts = AnalyticsComparisonLog.objects.filter(
+        checked_at__gte=timezone.now() - window
+    ).aggregate(
+        checked=Count('id'),
+        mismatched=Count('id', filter=Q(matches=False)),
+    )
+    counts['drift_rate'] = counts['mismatched'] / counts['checked'] if counts['checked'] else 0.0
+    return counts
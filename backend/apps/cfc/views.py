@@ -8,6 +8,7 @@ import re
 import requests
 from datetime import date
 
+from apps import http_client
 from .models import (
     HackathonRegistration,
     HackathonSubmission,
@@ -146,7 +147,7 @@ class HackathonSubmissionViewSet(viewsets.ModelViewSet):
         try:
             # Fetch repository info from GitHub API
             api_url = f'https://api.github.com/repos/{owner}/{repo}'
-            response = requests.get(api_url, timeout=10)
+            response = http_client.get('github', api_url, timeout=10)
             
             if response.status_code == 404:
                 return {
@@ -168,12 +169,12 @@ class HackathonSubmissionViewSet(viewsets.ModelViewSet):
             
             # Check if repository has README
             readme_url = f'https://api.github.com/repos/{owner}/{repo}/readme'
-            readme_response = requests.get(readme_url, timeout=10)
+            readme_response = http_client.get('github', readme_url, timeout=10)
             has_readme = readme_response.status_code == 200
             
             # Get commit count
             commits_url = f'https://api.github.com/repos/{owner}/{repo}/commits'
-            commits_response = requests.get(commits_url, params={'per_page': 1}, timeout=10)
+            commits_response = http_client.get('github', commits_url, params={'per_page': 1}, timeout=10)
             commit_count = 0
             if commits_response.status_code == 200:
                 # Get commit count from Link header if available
@@ -289,7 +290,7 @@ class BMCVideoSubmissionViewSet(viewsets.ModelViewSet):
         """Get YouTube video duration using oEmbed API and page scraping"""
         try:
             # Try to get duration from YouTube page
-            response = requests.get(f'https://www.youtube.com/watch?v={video_id}', timeout=10)
+            response = http_client.get('youtube', f'https://www.youtube.com/watch?v={video_id}', timeout=10)
             if response.status_code == 200:
                 # Extract lengthSeconds from YouTube page
                 duration_match = re.search(r'"lengthSeconds":"(\d+)"', response.text)
@@ -512,7 +513,7 @@ class GenAIProjectSubmissionViewSet(viewsets.ModelViewSet):
         try:
             # Fetch repository info from GitHub API
             api_url = f'https://api.github.com/repos/{owner}/{repo}'
-            response = requests.get(api_url, timeout=10)
+            response = http_client.get('github', api_url, timeout=10)
             
             if response.status_code == 404:
                 return {
@@ -534,12 +535,12 @@ class GenAIProjectSubmissionViewSet(viewsets.ModelViewSet):
             
             # Check if repository has README
             readme_url = f'https://api.github.com/repos/{owner}/{repo}/readme'
-            readme_response = requests.get(readme_url, timeout=10)
+            readme_response = http_client.get('github', readme_url, timeout=10)
             has_readme = readme_response.status_code == 200
             
             # Get commit count
             commits_url = f'https://api.github.com/repos/{owner}/{repo}/commits'
-            commits_response = requests.get(commits_url, params={'per_page': 1}, timeout=10)
+            commits_response = http_client.get('github', commits_url, params={'per_page': 1}, timeout=10)
             commit_count = 0
             if commits_response.status_code == 200:
                 # Get commit count from Link header if available
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Notification, Message, MessageThread
+from .models import Notification, Message, MessageThread, MonthlyReportRollup, MonthlyReportSnapshot
 
 
 @admin.register(Notification)
@@ -35,3 +35,21 @@ class MessageThreadAdmin(admin.ModelAdmin):
     search_fields = ['participant1__username', 'participant2__username']
     readonly_fields = ['created_at', 'updated_at']
     list_per_page = 50
+
+
+@admin.register(MonthlyReportRollup)
+class MonthlyReportRollupAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'year', 'month', 'computed_at']
+    list_filter = ['year', 'month']
+    search_fields = ['user__username']
+    readonly_fields = ['computed_at']
+    list_per_page = 50
+
+
+@admin.register(MonthlyReportSnapshot)
+class MonthlyReportSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'year', 'month', 'mentor', 'campus', 'floor', 'generated_at']
+    list_filter = ['year', 'month', 'campus', 'floor']
+    search_fields = ['user__username', 'mentor__username']
+    readonly_fields = ['generated_at']
+    list_per_page = 50
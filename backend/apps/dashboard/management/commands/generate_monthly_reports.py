@@ -0,0 +1,81 @@
+"""
+Management Command: generate_monthly_reports
+
+Stores immutable monthly report snapshots for every student of a mentor,
+a floor, a campus or the whole cohort, and optionally exports them.
+Students that already have a snapshot for the month are left untouched,
+so the command is safe to re-run (e.g. from a month-end cron job).
+
+Usage:
+    python manage.py generate_monthly_reports                  # last month, everyone
+    python manage.py generate_monthly_reports --year 2025 --month 3 --mentor 12
+    python manage.py generate_monthly_reports --campus TECH --floor 2 --export csv --output floor2.csv
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.dashboard import monthly_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Generate monthly report snapshots for a mentor, floor or campus'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help='Report year (default: last month)')
+        parser.add_argument('--month', type=int, help='Report month 1-12 (default: last month)')
+        parser.add_argument('--mentor', type=int, help='Only students assigned to this mentor (user id)')
+        parser.add_argument('--campus', type=str, choices=['TECH', 'ARTS'], help='Only students on this campus')
+        parser.add_argument('--floor', type=int, help='Only students on this floor')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=monthly_snapshots.CHUNK_SIZE,
+            help='Students processed per batch',
+        )
+        parser.add_argument('--export', choices=['csv', 'json'], help='Write the snapshots after generating')
+        parser.add_argument('--output', type=str, help='Export file (default: stdout)')
+
+    def handle(self, *args, **options):
+        year, month = options['year'], options['month']
+        if (year is None) != (month is None):
+            raise CommandError('--year and --month go together')
+        if year is None:
+            first_of_month = timezone.localdate().replace(day=1)
+            last_month = first_of_month - timedelta(days=1)
+            year, month = last_month.year, last_month.month
+        if not 1 <= month <= 12:
+            raise CommandError('--month must be between 1 and 12')
+
+        scope = {'mentor_id': options['mentor'], 'campus': options['campus'], 'floor': options['floor']}
+        start_time = time.time()
+        try:
+            result = monthly_snapshots.generate(year, month, chunk_size=options['chunk_size'], **scope)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        # Keep stdout clean for the export itself
+        log = self.stderr if options['export'] and not options['output'] else self.stdout
+        log.write(self.style.SUCCESS(
+            f"{year}-{month:02d}: {result['created']} snapshots created, "
+            f"{result['existing']} already existed ({(time.time() - start_time) * 1000:.0f}ms)"
+        ))
+
+        if options['export']:
+            queryset = monthly_snapshots.snapshots(year, month, **scope)
+            if options['export'] == 'csv':
+                pieces = monthly_snapshots.stream_csv(queryset, options['chunk_size'])
+            else:
+                pieces = monthly_snapshots.stream_json(queryset, year, month, options['chunk_size'])
+
+            if options['output']:
+                with open(options['output'], 'w', newline='') as output:
+                    for piece in pieces:
+                        output.write(piece)
+                log.write(f"Exported to {options['output']}")
+            else:
+                for piece in pieces:
+                    self.stdout.write(piece, ending='')
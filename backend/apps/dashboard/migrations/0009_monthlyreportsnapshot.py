@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('dashboard', '0008_monthlyreportrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyReportSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('campus', models.CharField(blank=True, max_length=10, null=True)),
+                ('floor', models.IntegerField(blank=True, null=True)),
+                ('report', models.JSONField(help_text='MonthlyReportView payload for the month')),
+                ('generated_at', models.DateTimeField(auto_now_add=True)),
+                ('mentor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='mentored_report_snapshots', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_report_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['year', 'month', 'mentor'], name='dashboard_m_year_84df4b_idx'), models.Index(fields=['year', 'month', 'campus', 'floor'], name='dashboard_m_year_e0d746_idx')],
+                'unique_together': {('user', 'year', 'month')},
+            },
+        ),
+    ]
@@ -270,3 +270,58 @@ class MessageThread(models.Model):
         else:
             self.unread_count_p2 = 0
         self.save()
+
+
+class MonthlyReportRollup(models.Model):
+    """
+    Materialized per-student submission counts for one finished month
+
+    Filled on first read of a past month's report (see monthly_rollup.py)
+    and deleted by signals when a submission created in that month changes,
+    so historical reports never re-scan the submission tables.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='monthly_report_rollups')
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    counts = models.JSONField(default=dict, help_text="{source: {total, completed, pending}} for the month")
+    computed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ('user', 'year', 'month')
+        indexes = [
+            models.Index(fields=['year', 'month']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.year}-{self.month:02d}"
+
+
+class MonthlyReportSnapshot(models.Model):
+    """
+    Immutable monthly report for one student, generated in batches per
+    mentor or floor after the month has ended (see monthly_snapshots.py)
+
+    The roster fields record the student's mentor and floor at generation
+    time; snapshots are never rewritten. Exports pick snapshots by the
+    current roster, not by these fields.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='monthly_report_snapshots')
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    mentor = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name='mentored_report_snapshots'
+    )
+    campus = models.CharField(max_length=10, null=True, blank=True)
+    floor = models.IntegerField(null=True, blank=True)
+    report = models.JSONField(help_text="MonthlyReportView payload for the month")
+    generated_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ('user', 'year', 'month')
+        indexes = [
+            models.Index(fields=['year', 'month', 'mentor']),
+            models.Index(fields=['year', 'month', 'campus', 'floor']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.year}-{self.month:02d} snapshot"
@@ -5,15 +5,7 @@ from rest_framework import status
 from datetime import datetime
 import traceback
 
-from apps.clt.models import CLTSubmission
-try:
-    from apps.sri.models import SocialActivitySubmission
-    HAS_SRI_MODELS = True
-except ImportError:
-    HAS_SRI_MODELS = False
-from apps.cfc.models import HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission
-from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
-from apps.scd.models import LeetCodeProfile
+from . import monthly_rollup
 
 
 # Monthly task requirements
@@ -26,6 +18,89 @@ MONTHLY_REQUIREMENTS = {
 }
 
 
+def _target_status(completed, target):
+    return 'completed' if completed >= target else 'in-progress' if completed > 0 else 'not-started'
+
+
+def _percentage(completed, target):
+    return min(100, round((completed / target) * 100)) if target > 0 else 0
+
+
+def _pillar_stats(pillar, total, completed, pending):
+    target = MONTHLY_REQUIREMENTS[pillar]
+    return {
+        'total': total,
+        'completed': completed,
+        'pending': pending,
+        'monthly_target': target,
+        'percentage': _percentage(completed, target),
+        'status': _target_status(completed, target),
+    }
+
+
+def _breakdown(counts, sources):
+    return {
+        source: {'total': counts[source]['total'], 'completed': counts[source]['completed']}
+        for source in sources
+    }
+
+
+def build_report(counts, year, month):
+    """Monthly report payload from monthly_rollup counts for one student"""
+    clt_stats = _pillar_stats('clt', **counts['clt'])
+    
+    # SRI has no target yet (and no models on some deployments)
+    sri = counts.get('sri', {'total': 0, 'completed': 0, 'pending': 0})
+    sri_stats = _pillar_stats('sri', **sri)
+    sri_stats.update({'percentage': 0, 'status': 'not-applicable'})
+    
+    cfc_sources = ['hackathons', 'bmc_videos', 'internships', 'genai_projects']
+    cfc_total = sum(counts[source]['total'] for source in cfc_sources)
+    cfc_completed = sum(counts[source]['completed'] for source in cfc_sources)
+    cfc_stats = _pillar_stats('cfc', cfc_total, cfc_completed, cfc_total - cfc_completed)
+    cfc_stats['breakdown'] = _breakdown(counts, cfc_sources)
+    
+    iipc_sources = ['posts', 'connections']
+    iipc_total = sum(counts[source]['total'] for source in iipc_sources)
+    iipc_completed = sum(counts[source]['completed'] for source in iipc_sources)
+    iipc_stats = _pillar_stats('iipc', iipc_total, iipc_completed, iipc_total - iipc_completed)
+    iipc_stats['breakdown'] = _breakdown(counts, iipc_sources)
+    
+    scd = counts['scd']
+    scd_stats = _pillar_stats('scd', scd['total'], scd['completed'], scd['pending'])
+    scd_stats['total_problems_solved'] = scd['solved']
+    
+    # Calculate overall progress
+    total_monthly_target = sum(MONTHLY_REQUIREMENTS.values())
+    total_completed_towards_target = sum([
+        min(clt_stats['completed'], MONTHLY_REQUIREMENTS['clt']),
+        min(sri_stats['completed'], MONTHLY_REQUIREMENTS['sri']),
+        min(cfc_stats['completed'], MONTHLY_REQUIREMENTS['cfc']),
+        min(iipc_stats['completed'], MONTHLY_REQUIREMENTS['iipc']),
+        min(scd_stats['completed'], MONTHLY_REQUIREMENTS['scd'])
+    ])
+    overall_percentage = round((total_completed_towards_target / total_monthly_target * 100)) if total_monthly_target > 0 else 0
+    
+    return {
+        'month': month,
+        'year': year,
+        'month_name': datetime(year, month, 1).strftime('%B'),
+        'overall': {
+            'completed': total_completed_towards_target,
+            'monthly_target': total_monthly_target,
+            'percentage': overall_percentage,
+            'status': _target_status(total_completed_towards_target, total_monthly_target),
+        },
+        'pillars': {
+            'clt': clt_stats,
+            'sri': sri_stats,
+            'cfc': cfc_stats,
+            'iipc': iipc_stats,
+            'scd': scd_stats,
+        }
+    }
+
+
 class MonthlyReportView(APIView):
     """
     Get monthly report for a specific month and year
@@ -60,199 +135,8 @@ class MonthlyReportView(APIView):
                 month = now.month
                 year = now.year
             
-            # Create start and end dates for the month
-            start_date = datetime(year, month, 1)
-            if month == 12:
-                end_date = datetime(year + 1, 1, 1)
-            else:
-                end_date = datetime(year, month + 1, 1)
-            
-            # CLT Stats for the month
-            clt_submissions = CLTSubmission.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            clt_completed = clt_submissions.filter(status='approved').count()
-            clt_stats = {
-                'total': clt_submissions.count(),
-                'completed': clt_completed,
-                'pending': clt_submissions.filter(status__in=['draft', 'submitted', 'under_review']).count(),
-                'monthly_target': MONTHLY_REQUIREMENTS['clt'],
-                'percentage': min(100, round((clt_completed / MONTHLY_REQUIREMENTS['clt']) * 100)) if MONTHLY_REQUIREMENTS['clt'] > 0 else 0,
-                'status': 'completed' if clt_completed >= MONTHLY_REQUIREMENTS['clt'] else 'in-progress' if clt_completed > 0 else 'not-started',
-            }
-            
-            # SRI Stats for the month
-            if HAS_SRI_MODELS:
-                sri_submissions = SocialActivitySubmission.objects.filter(
-                    user=user,
-                    created_at__gte=start_date,
-                    created_at__lt=end_date
-                )
-                sri_completed = sri_submissions.filter(status='approved').count()
-                sri_stats = {
-                    'total': sri_submissions.count(),
-                    'completed': sri_completed,
-                    'pending': sri_submissions.filter(status__in=['draft', 'submitted', 'under_review']).count(),
-                    'monthly_target': MONTHLY_REQUIREMENTS['sri'],
-                    'percentage': 0,
-                    'status': 'not-applicable',
-                }
-            else:
-                sri_stats = {
-                    'total': 0,
-                    'completed': 0,
-                    'pending': 0,
-                    'monthly_target': MONTHLY_REQUIREMENTS['sri'],
-                    'percentage': 0,
-                    'status': 'not-applicable',
-                }
-            
-            # CFC Stats for the month
-            hackathons = HackathonSubmission.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            bmc_videos = BMCVideoSubmission.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            internships = InternshipSubmission.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            genai_projects = GenAIProjectSubmission.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            
-            cfc_total = hackathons.count() + bmc_videos.count() + internships.count() + genai_projects.count()
-            cfc_completed = (
-                hackathons.filter(status='approved').count() +
-                bmc_videos.filter(status='approved').count() +
-                internships.filter(status='approved').count() +
-                genai_projects.filter(status='approved').count()
-            )
-            
-            cfc_stats = {
-                'total': cfc_total,
-                'completed': cfc_completed,
-                'pending': cfc_total - cfc_completed,
-                'monthly_target': MONTHLY_REQUIREMENTS['cfc'],
-                'percentage': min(100, round((cfc_completed / MONTHLY_REQUIREMENTS['cfc']) * 100)) if MONTHLY_REQUIREMENTS['cfc'] > 0 else 0,
-                'status': 'completed' if cfc_completed >= MONTHLY_REQUIREMENTS['cfc'] else 'in-progress' if cfc_completed > 0 else 'not-started',
-                'breakdown': {
-                    'hackathons': {
-                        'total': hackathons.count(),
-                        'completed': hackathons.filter(status='approved').count(),
-                    },
-                    'bmc_videos': {
-                        'total': bmc_videos.count(),
-                        'completed': bmc_videos.filter(status='approved').count(),
-                    },
-                    'internships': {
-                        'total': internships.count(),
-                        'completed': internships.filter(status='approved').count(),
-                    },
-                    'genai_projects': {
-                        'total': genai_projects.count(),
-                        'completed': genai_projects.filter(status='approved').count(),
-                    },
-                }
-            }
-            
-            # IIPC Stats for the month
-            linkedin_posts = LinkedInPostVerification.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            linkedin_connections = LinkedInConnectionVerification.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            
-            iipc_total = linkedin_posts.count() + linkedin_connections.count()
-            iipc_completed = (
-                linkedin_posts.filter(status='approved').count() +
-                linkedin_connections.filter(status='approved').count()
-            )
-            
-            iipc_stats = {
-                'total': iipc_total,
-                'completed': iipc_completed,
-                'pending': iipc_total - iipc_completed,
-                'monthly_target': MONTHLY_REQUIREMENTS['iipc'],
-                'percentage': min(100, round((iipc_completed / MONTHLY_REQUIREMENTS['iipc']) * 100)) if MONTHLY_REQUIREMENTS['iipc'] > 0 else 0,
-                'status': 'completed' if iipc_completed >= MONTHLY_REQUIREMENTS['iipc'] else 'in-progress' if iipc_completed > 0 else 'not-started',
-                'breakdown': {
-                    'posts': {
-                        'total': linkedin_posts.count(),
-                        'completed': linkedin_posts.filter(status='approved').count(),
-                    },
-                    'connections': {
-                        'total': linkedin_connections.count(),
-                        'completed': linkedin_connections.filter(status='approved').count(),
-                    },
-                }
-            }
-            
-            # SCD Stats for the month
-            leetcode_profiles = LeetCodeProfile.objects.filter(
-                user=user,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            )
-            scd_completed = leetcode_profiles.filter(
-                status='approved',
-                total_solved__gte=10
-            ).count()
-            
-            scd_stats = {
-                'total': leetcode_profiles.count(),
-                'completed': scd_completed,
-                'pending': leetcode_profiles.filter(status__in=['draft', 'pending']).count(),
-                'monthly_target': MONTHLY_REQUIREMENTS['scd'],
-                'percentage': min(100, round((scd_completed / MONTHLY_REQUIREMENTS['scd']) * 100)) if MONTHLY_REQUIREMENTS['scd'] > 0 else 0,
-                'status': 'completed' if scd_completed >= MONTHLY_REQUIREMENTS['scd'] else 'in-progress' if scd_completed > 0 else 'not-started',
-                'total_problems_solved': sum(p.total_solved or 0 for p in leetcode_profiles),
-            }
-            
-            # Calculate overall progress
-            total_monthly_target = sum(MONTHLY_REQUIREMENTS.values())
-            total_completed_towards_target = sum([
-                min(clt_stats['completed'], MONTHLY_REQUIREMENTS['clt']),
-                min(sri_stats['completed'], MONTHLY_REQUIREMENTS['sri']),
-                min(cfc_stats['completed'], MONTHLY_REQUIREMENTS['cfc']),
-                min(iipc_stats['completed'], MONTHLY_REQUIREMENTS['iipc']),
-                min(scd_stats['completed'], MONTHLY_REQUIREMENTS['scd'])
-            ])
-            overall_percentage = round((total_completed_towards_target / total_monthly_target * 100)) if total_monthly_target > 0 else 0
-            
-            data = {
-                'month': month,
-                'year': year,
-                'month_name': datetime(year, month, 1).strftime('%B'),
-                'overall': {
-                    'completed': total_completed_towards_target,
-                    'monthly_target': total_monthly_target,
-                    'percentage': overall_percentage,
-                    'status': 'completed' if total_completed_towards_target >= total_monthly_target else 'in-progress' if total_completed_towards_target > 0 else 'not-started',
-                },
-                'pillars': {
-                    'clt': clt_stats,
-                    'sri': sri_stats,
-                    'cfc': cfc_stats,
-                    'iipc': iipc_stats,
-                    'scd': scd_stats,
-                }
-            }
+            counts = monthly_rollup.month_counts([user.id], year, month)[user.id]
+            data = build_report(counts, year, month)
             
             return Response(data)
             
@@ -276,29 +160,7 @@ class AvailableMonthsView(APIView):
             user = request.user
             
             # Get all months where user has any activity
-            months_set = set()
-            
-            # Check CLT submissions
-            clt_dates = CLTSubmission.objects.filter(user=user).values_list('created_at', flat=True)
-            for date in clt_dates:
-                months_set.add((date.year, date.month))
-            
-            # Check CFC submissions
-            for model in [HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission]:
-                dates = model.objects.filter(user=user).values_list('created_at', flat=True)
-                for date in dates:
-                    months_set.add((date.year, date.month))
-            
-            # Check IIPC submissions
-            for model in [LinkedInPostVerification, LinkedInConnectionVerification]:
-                dates = model.objects.filter(user=user).values_list('created_at', flat=True)
-                for date in dates:
-                    months_set.add((date.year, date.month))
-            
-            # Check SCD submissions
-            scd_dates = LeetCodeProfile.objects.filter(user=user).values_list('created_at', flat=True)
-            for date in scd_dates:
-                months_set.add((date.year, date.month))
+            months_set = monthly_rollup.active_months(user)
             
             # Always include current month
             now = datetime.now()
@@ -0,0 +1,149 @@
+"""
+Monthly Report Counts
+
+Per-student submission counts for one calendar month, computed with one
+conditional aggregate per submission model (grouped by student, so a
+whole floor costs the same number of queries as one student).
+
+Finished months are materialized in MonthlyReportRollup: the first report
+for a past month stores its counts, later reports read them back. Signals
+call `invalidate` when a submission created in a past month changes (a
+late review, a deletion), so a stored month is never out of date. The
+current month is always counted live.
+"""
+
+from datetime import datetime
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.cfc.models import BMCVideoSubmission, GenAIProjectSubmission, HackathonSubmission, InternshipSubmission
+from apps.clt.models import CLTSubmission
+from apps.iipc.models import LinkedInConnectionVerification, LinkedInPostVerification
+from apps.scd.models import LeetCodeProfile
+from .models import MonthlyReportRollup
+
+try:
+    from apps.sri.models import SocialActivitySubmission
+except ImportError:
+    SocialActivitySubmission = None
+
+REVIEW_PENDING = ['draft', 'submitted', 'under_review']
+
+# A LeetCode profile with this many solves completes the SCD target
+SCD_MIN_SOLVED = 10
+
+# source -> (model, completed filter, pending statuses or None)
+SOURCES = {
+    'clt': (CLTSubmission, Q(status='approved'), REVIEW_PENDING),
+    'hackathons': (HackathonSubmission, Q(status='approved'), None),
+    'bmc_videos': (BMCVideoSubmission, Q(status='approved'), None),
+    'internships': (InternshipSubmission, Q(status='approved'), None),
+    'genai_projects': (GenAIProjectSubmission, Q(status='approved'), None),
+    'posts': (LinkedInPostVerification, Q(status='approved'), None),
+    'connections': (LinkedInConnectionVerification, Q(status='approved'), None),
+    'scd': (LeetCodeProfile, Q(status='approved', total_solved__gte=SCD_MIN_SOLVED), ['draft', 'pending']),
+}
+if SocialActivitySubmission is not None:
+    SOURCES['sri'] = (SocialActivitySubmission, Q(status='approved'), REVIEW_PENDING)
+
+ROLLUP_MODELS = [model for model, _, _ in SOURCES.values()]
+
+
+def month_bounds(year, month):
+    """[start, end) of a calendar month as aware datetimes"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return timezone.make_aware(start), timezone.make_aware(end)
+
+
+def is_finished(year, month):
+    now = timezone.localtime()
+    return (year, month) < (now.year, now.month)
+
+
+def empty_counts():
+    counts = {}
+    for source, (_, _, pending) in SOURCES.items():
+        counts[source] = {'total': 0, 'completed': 0}
+        if pending is not None:
+            counts[source]['pending'] = 0
+    counts['scd']['solved'] = 0
+    return counts
+
+
+def count_month(user_ids, year, month):
+    """{user_id: counts} for submissions created in the month - one query per model"""
+    start, end = month_bounds(year, month)
+    counts = {user_id: empty_counts() for user_id in user_ids}
+    for source, (model, completed, pending) in SOURCES.items():
+        aggregates = {'total': Count('id'), 'completed': Count('id', filter=completed)}
+        if pending is not None:
+            aggregates['pending'] = Count('id', filter=Q(status__in=pending))
+        if source == 'scd':
+            aggregates['solved'] = Sum('total_solved')
+        rows = (
+            model.objects.filter(user_id__in=user_ids, created_at__gte=start, created_at__lt=end)
+            .order_by()
+            .values('user_id')
+            .annotate(**aggregates)
+        )
+        for row in rows:
+            user_counts = counts[row.pop('user_id')][source]
+            user_counts.update({key: value or 0 for key, value in row.items()})
+    return counts
+
+
+def month_counts(user_ids, year, month):
+    """
+    {user_id: counts} for the month, served from MonthlyReportRollup for
+    finished months; missing rollups are computed in one batch and stored
+    """
+    user_ids = list(user_ids)
+    if not is_finished(year, month):
+        return count_month(user_ids, year, month)
+
+    counts = dict(
+        MonthlyReportRollup.objects.filter(user_id__in=user_ids, year=year, month=month)
+        .values_list('user_id', 'counts')
+    )
+    missing = [user_id for user_id in user_ids if user_id not in counts]
+    if missing:
+        computed = count_month(missing, year, month)
+        MonthlyReportRollup.objects.bulk_create(
+            [
+                MonthlyReportRollup(user_id=user_id, year=year, month=month, counts=user_counts)
+                for user_id, user_counts in computed.items()
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        counts.update(computed)
+    return counts
+
+
+def invalidate(user_id, created_at):
+    """Drop the stored month a changed submission belongs to"""
+    if created_at is None:
+        return
+    created_at = timezone.localtime(created_at)
+    if is_finished(created_at.year, created_at.month):
+        MonthlyReportRollup.objects.filter(
+            user_id=user_id, year=created_at.year, month=created_at.month
+        ).delete()
+
+
+def active_months(user):
+    """(year, month) pairs with any submission - one UNION of per-model month buckets"""
+    months = None
+    for model in ROLLUP_MODELS:
+        buckets = (
+            model.objects.filter(user=user)
+            .order_by()
+            .annotate(bucket=TruncMonth('created_at'))
+            .values_list('bucket')
+            .distinct()
+        )
+        months = buckets if months is None else months.union(buckets)
+    return {(bucket.year, bucket.month) for (bucket,) in months}
@@ -0,0 +1,163 @@
+"""
+Monthly Report Snapshots
+
+Generates MonthlyReportSnapshot rows for every student of a mentor or a
+floor once a month has ended, and streams them out as CSV or JSON.
+
+Students are processed in keyset-paginated chunks of CHUNK_SIZE: each
+chunk costs one query per submission model (monthly_rollup.month_counts)
+plus one bulk insert, and exports iterate the snapshot table with a
+server-side cursor, so memory stays bounded by the chunk size whether the
+roster is one mentor's 20 students or a 2000-student campus.
+
+Snapshots are immutable: generation only fills in students that have no
+snapshot for the month yet. Generation and export both select students by
+the current roster, so a student snapshotted by an earlier run (e.g. the
+all-students cron) and reassigned since still shows up in the new mentor's
+or floor's export; the mentor/campus/floor columns keep the values stored
+at snapshot time.
+"""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.profiles.models import UserProfile
+from . import monthly_rollup
+from .models import MonthlyReportSnapshot
+from .monthly_report import build_report
+
+CHUNK_SIZE = 500
+
+PILLARS = ['clt', 'sri', 'cfc', 'iipc', 'scd']
+
+CSV_COLUMNS = [
+    'student_id', 'username', 'name', 'email', 'campus', 'floor', 'mentor_id',
+    'year', 'month', 'overall_completed', 'overall_target', 'overall_percentage', 'overall_status',
+    *[f'{pillar}_{field}' for pillar in PILLARS for field in ('total', 'completed', 'pending', 'percentage', 'status')],
+    'scd_total_problems_solved', 'generated_at',
+]
+
+
+def roster(mentor_id=None, campus=None, floor=None):
+    """Student profiles of a mentor, a floor, a campus, or everyone"""
+    profiles = UserProfile.objects.filter(role='STUDENT')
+    if mentor_id is not None:
+        profiles = profiles.filter(assigned_mentor_id=mentor_id)
+    if campus is not None:
+        profiles = profiles.filter(campus=campus)
+    if floor is not None:
+        profiles = profiles.filter(floor=floor)
+    return profiles
+
+
+def snapshots(year, month, mentor_id=None, campus=None, floor=None):
+    """Stored snapshots for the month of the students `generate` covers for this roster"""
+    return MonthlyReportSnapshot.objects.filter(
+        year=year, month=month,
+        user_id__in=roster(mentor_id, campus, floor).values('user_id'),
+    )
+
+
+def generate(year, month, mentor_id=None, campus=None, floor=None, chunk_size=CHUNK_SIZE):
+    """
+    Snapshot every roster student without one for the month
+
+    Returns {'created': n, 'existing': n}. Only finished months can be
+    snapshotted; raises ValueError otherwise.
+    """
+    if not monthly_rollup.is_finished(year, month):
+        raise ValueError('Monthly reports can only be generated for finished months')
+
+    created = existing = 0
+    profiles = roster(mentor_id, campus, floor).select_related('user').order_by('user_id')
+    last_id = 0
+    while True:
+        chunk = list(profiles.filter(user_id__gt=last_id)[:chunk_size])
+        if not chunk:
+            return {'created': created, 'existing': existing}
+        last_id = chunk[-1].user_id
+
+        done = set(
+            MonthlyReportSnapshot.objects.filter(
+                year=year, month=month, user_id__in=[profile.user_id for profile in chunk]
+            ).values_list('user_id', flat=True)
+        )
+        pending = [profile for profile in chunk if profile.user_id not in done]
+        existing += len(done)
+        if not pending:
+            continue
+
+        counts = monthly_rollup.month_counts([profile.user_id for profile in pending], year, month)
+        MonthlyReportSnapshot.objects.bulk_create(
+            [
+                MonthlyReportSnapshot(
+                    user_id=profile.user_id,
+                    year=year,
+                    month=month,
+                    mentor_id=profile.assigned_mentor_id,
+                    campus=profile.campus,
+                    floor=profile.floor,
+                    report={
+                        'student': {
+                            'id': profile.user_id,
+                            'username': profile.user.username,
+                            'name': f"{profile.user.first_name} {profile.user.last_name}".strip(),
+                            'email': profile.user.email,
+                        },
+                        **build_report(counts[profile.user_id], year, month),
+                    },
+                )
+                for profile in pending
+            ],
+            ignore_conflicts=True,
+        )
+        created += len(pending)
+
+
+def _csv_row(snapshot):
+    report = snapshot.report
+    row = [
+        snapshot.user_id, report['student']['username'], report['student']['name'], report['student']['email'],
+        snapshot.campus, snapshot.floor, snapshot.mentor_id, snapshot.year, snapshot.month,
+        report['overall']['completed'], report['overall']['monthly_target'],
+        report['overall']['percentage'], report['overall']['status'],
+    ]
+    for pillar in PILLARS:
+        stats = report['pillars'][pillar]
+        row += [stats['total'], stats['completed'], stats['pending'], stats['percentage'], stats['status']]
+    row += [report['pillars']['scd']['total_problems_solved'], snapshot.generated_at.isoformat()]
+    return row
+
+
+class _Echo:
+    """File-like object whose write() returns the line for streaming"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset, chunk_size=CHUNK_SIZE):
+    """CSV lines (header first) for the snapshots, one row in memory at a time"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for snapshot in queryset.order_by('user_id').iterator(chunk_size=chunk_size):
+        yield writer.writerow(_csv_row(snapshot))
+
+
+def stream_json(queryset, year, month, chunk_size=CHUNK_SIZE):
+    """A JSON document {year, month, reports: [...]} in pieces"""
+    yield f'{{"year": {year}, "month": {month}, "reports": ['
+    separator = ''
+    for snapshot in queryset.order_by('user_id').iterator(chunk_size=chunk_size):
+        report = {
+            **snapshot.report,
+            'campus': snapshot.campus,
+            'floor': snapshot.floor,
+            'mentor_id': snapshot.mentor_id,
+            'generated_at': snapshot.generated_at,
+        }
+        yield separator + json.dumps(report, cls=DjangoJSONEncoder)
+        separator = ', '
+    yield ']}'
@@ -0,0 +1,101 @@
+"""
+Invalidate cached student dashboards and stored monthly reports
+
+DashboardStatsView caches each student's stats under a per-user cache
+version. Any save or delete of that student's submissions (students
+submitting, mentors reviewing), LeetCode profile or profile bumps the
+version, as does a change to the name or email shown in `student_info` -
+the student's own, or their mentor's for every student of that mentor. The
+next poll recomputes while unchanged dashboards are served from the cache
+for DASHBOARD_STATS_CACHE_TTL. Without a shared cache (LocMemCache) other
+workers never see the bump, so they keep their copy for the shorter
+DASHBOARD_STATS_LOCAL_CACHE_TTL instead.
+
+The same changes drop the MonthlyReportRollup of the month the submission
+was created in, when that month is already finished.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.analytics_summary import cache_versions
+from apps.cfc.models import BMCVideoSubmission, GenAIProjectSubmission, HackathonSubmission, InternshipSubmission
+from apps.clt.models import CLTSubmission
+from apps.iipc.models import LinkedInConnectionVerification, LinkedInPostVerification
+from apps.profiles.models import UserProfile
+from apps.scd.models import LeetCodeProfile
+from . import monthly_rollup
+
+try:
+    from apps.sri.models import SocialActivitySubmission
+except ImportError:
+    SocialActivitySubmission = None
+
+User = get_user_model()
+
+
+def stats_version(user_id):
+    return f'dashboard_stats_{user_id}'
+
+
+def _bump_owner(sender, instance, raw=False, **kwargs):
+    if not raw:
+        cache_versions.bump(stats_version(instance.user_id))
+
+
+DASHBOARD_MODELS = [
+    CLTSubmission,
+    HackathonSubmission,
+    BMCVideoSubmission,
+    InternshipSubmission,
+    GenAIProjectSubmission,
+    LinkedInPostVerification,
+    LinkedInConnectionVerification,
+    LeetCodeProfile,
+    UserProfile,
+]
+if SocialActivitySubmission is not None:
+    DASHBOARD_MODELS.append(SocialActivitySubmission)
+
+for _model in DASHBOARD_MODELS:
+    post_save.connect(_bump_owner, sender=_model, dispatch_uid=f'dashboard_stats_save_{_model.__name__}')
+    post_delete.connect(_bump_owner, sender=_model, dispatch_uid=f'dashboard_stats_delete_{_model.__name__}')
+
+
+# User columns shown in student_info (the student's and their mentor's name)
+STUDENT_INFO_FIELDS = ['username', 'first_name', 'last_name', 'email']
+
+
+def _student_info_state(user):
+    # Deferred fields stay deferred; those saves bump unconditionally
+    if not all(field in user.__dict__ for field in STUDENT_INFO_FIELDS):
+        return None
+    return tuple(getattr(user, field) for field in STUDENT_INFO_FIELDS)
+
+
+@receiver(post_init, sender=User)
+def remember_student_info(sender, instance, **kwargs):
+    instance._dashboard_info = _student_info_state(instance)
+
+
+@receiver(post_save, sender=User)
+def bump_on_name_change(sender, instance, created, raw=False, **kwargs):
+    """A user's name or email changed: their dashboard and their students' dashboards"""
+    previous = instance._dashboard_info
+    instance._dashboard_info = _student_info_state(instance)
+    if raw or created or (previous is not None and previous == instance._dashboard_info):
+        return
+    cache_versions.bump(stats_version(instance.id))
+    for student_id in UserProfile.objects.filter(assigned_mentor=instance).values_list('user_id', flat=True):
+        cache_versions.bump(stats_version(student_id))
+
+
+def _invalidate_month(sender, instance, raw=False, **kwargs):
+    if not raw:
+        monthly_rollup.invalidate(instance.user_id, instance.created_at)
+
+
+for _model in monthly_rollup.ROLLUP_MODELS:
+    post_save.connect(_invalidate_month, sender=_model, dispatch_uid=f'monthly_rollup_save_{_model.__name__}')
+    post_delete.connect(_invalidate_month, sender=_model, dispatch_uid=f'monthly_rollup_delete_{_model.__name__}')
@@ -0,0 +1,200 @@
+import json
+from datetime import date, datetime
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.clt.models import CLTSubmission
+from apps.iipc.models import LinkedInPostVerification
+from apps.scd.models import LeetCodeProfile
+from .models import MonthlyReportRollup, MonthlyReportSnapshot
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'dashboard-tests'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class DashboardStatsCacheTests(TestCase):
+    """Student dashboard stats cached per user version"""
+
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create(username='alice')
+        self.other = User.objects.create(username='bob')
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def get_stats(self):
+        return self.client.get('/api/dashboard/stats/').data
+
+    def submit(self, user, status='submitted'):
+        return CLTSubmission.objects.create(
+            user=user, title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status=status,
+        )
+
+    def test_repeat_polls_are_served_from_cache(self):
+        self.get_stats()
+        with CaptureQueriesContext(connection) as queries:
+            self.get_stats()
+        self.assertEqual(len(queries), 0)
+
+    def test_own_submission_and_review_invalidate(self):
+        self.assertEqual(self.get_stats()['pillars']['clt']['total'], 0)
+
+        submission = self.submit(self.student)
+        self.assertEqual(self.get_stats()['pillars']['clt']['pending'], 1)
+
+        submission.status = 'approved'
+        submission.save()
+        self.assertEqual(self.get_stats()['pillars']['clt']['completed'], 1)
+
+        LeetCodeProfile.objects.create(user=self.student, leetcode_username='alice', total_solved=15, status='approved')
+        self.assertEqual(self.get_stats()['pillars']['scd']['completed'], 1)
+
+    def test_name_changes_invalidate(self):
+        mentor = User.objects.create(username='mentor')
+        self.student.profile.assigned_mentor = mentor
+        self.student.profile.save()
+        self.assertEqual(self.get_stats()['student_info']['name'], 'alice')
+
+        self.student.first_name = 'Alice'
+        self.student.save()
+        self.assertEqual(self.get_stats()['student_info']['name'], 'Alice')
+
+        mentor.first_name = 'Maria'
+        mentor.save()
+        self.assertEqual(self.get_stats()['student_info']['mentor_name'], 'Maria')
+
+        # Logins only touch last_login
+        self.student.last_login = timezone.now()
+        self.student.save(update_fields=['last_login'])
+        with CaptureQueriesContext(connection) as queries:
+            self.get_stats()
+        self.assertEqual(len(queries), 0)
+
+    def test_per_process_cache_uses_the_local_ttl(self):
+        with override_settings(DASHBOARD_STATS_CACHE_TTL=3600, DASHBOARD_STATS_LOCAL_CACHE_TTL=0):
+            self.get_stats()
+            with CaptureQueriesContext(connection) as queries:
+                self.get_stats()
+        self.assertGreater(len(queries), 0)
+
+    def test_other_users_changes_keep_cache(self):
+        self.get_stats()
+        self.submit(self.other)
+        with CaptureQueriesContext(connection) as queries:
+            self.get_stats()
+        self.assertEqual(len(queries), 0)
+
+
+class MonthlyReportTests(TestCase):
+    """Monthly reports from conditional aggregates and stored rollups"""
+
+    def setUp(self):
+        self.student = User.objects.create(username='alice')
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+        self.submission = CLTSubmission.objects.create(
+            user=self.student, title='Course', description='Course', platform='Coursera',
+            completion_date=date.today(), status='submitted',
+        )
+        CLTSubmission.objects.filter(id=self.submission.id).update(
+            created_at=timezone.make_aware(datetime(2025, 3, 10))
+        )
+        LinkedInPostVerification.objects.create(
+            user=self.student, post_url='https://linkedin.com/p/1', post_date=date.today(),
+            character_count=100, hashtag_count=3, status='approved',
+        )
+        LeetCodeProfile.objects.create(user=self.student, leetcode_username='alice', total_solved=14, status='approved')
+
+    def report(self, **params):
+        return self.client.get('/api/dashboard/monthly-report/', params).data
+
+    def test_current_month(self):
+        pillars = self.report()['pillars']
+        self.assertEqual(pillars['clt']['total'], 0)
+        self.assertEqual(pillars['iipc']['breakdown']['posts'], {'total': 1, 'completed': 1})
+        self.assertEqual((pillars['iipc']['pending'], pillars['iipc']['status']), (0, 'in-progress'))
+        self.assertEqual((pillars['scd']['completed'], pillars['scd']['total_problems_solved']), (1, 14))
+        self.assertFalse(MonthlyReportRollup.objects.exists())
+
+    def test_past_month_served_from_rollup(self):
+        report = self.report(month=3, year=2025)
+        self.assertEqual(report['pillars']['clt']['pending'], 1)
+        self.assertEqual(report['overall']['status'], 'not-started')
+        self.assertTrue(MonthlyReportRollup.objects.filter(user=self.student, year=2025, month=3).exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.report(month=3, year=2025), report)
+        self.assertEqual(len(queries), 1)
+
+        # A late review drops the stored month
+        self.submission.refresh_from_db()
+        self.submission.status = 'approved'
+        self.submission.save()
+        self.assertFalse(MonthlyReportRollup.objects.exists())
+        report = self.report(month=3, year=2025)
+        self.assertEqual(report['pillars']['clt']['status'], 'completed')
+
+    def test_available_months(self):
+        months = self.client.get('/api/dashboard/available-months/').data['months']
+        now = timezone.now()
+        self.assertEqual(
+            [(item['year'], item['month']) for item in months],
+            [(now.year, now.month), (2025, 3)],
+        )
+
+
+class MonthlyReportSnapshotTests(TestCase):
+    """generate_monthly_reports over a floor in bounded chunks"""
+
+    def setUp(self):
+        for index in range(5):
+            student = User.objects.create(username=f'student{index}')
+            student.profile.campus, student.profile.floor = 'TECH', 1 + index % 2
+            student.profile.save()
+            CLTSubmission.objects.create(
+                user=student, title='Course', description='Course', platform='Coursera',
+                completion_date=date.today(), status='approved',
+            )
+        CLTSubmission.objects.update(created_at=timezone.make_aware(datetime(2025, 3, 10)))
+
+    def test_floor_snapshots_in_chunks(self):
+        out = StringIO()
+        call_command(
+            'generate_monthly_reports', '--year', '2025', '--month', '3', '--campus', 'TECH', '--floor', '1',
+            '--chunk-size', '2', '--export', 'json', stdout=out, stderr=StringIO(),
+        )
+        data = json.loads(out.getvalue())
+        self.assertEqual([report['student']['username'] for report in data['reports']], ['student0', 'student2', 'student4'])
+        self.assertEqual(data['reports'][0]['pillars']['clt']['completed'], 1)
+
+        # Re-running only adds students without a snapshot
+        out = StringIO()
+        call_command('generate_monthly_reports', '--year', '2025', '--month', '3', stdout=out)
+        self.assertIn('2 snapshots created, 3 already existed', out.getvalue())
+        self.assertEqual(MonthlyReportSnapshot.objects.count(), 5)
+
+    def test_export_follows_the_current_roster(self):
+        mentor = User.objects.create(username='mentor')
+        call_command('generate_monthly_reports', '--year', '2025', '--month', '3', stdout=StringIO())
+
+        # Reassigned after the all-students run
+        moved = User.objects.get(username='student3').profile
+        moved.assigned_mentor = mentor
+        moved.save()
+
+        out = StringIO()
+        call_command(
+            'generate_monthly_reports', '--year', '2025', '--month', '3', '--mentor', str(mentor.id),
+            '--export', 'json', stdout=out, stderr=StringIO(),
+        )
+        data = json.loads(out.getvalue())
+        self.assertEqual([report['student']['username'] for report in data['reports']], ['student3'])
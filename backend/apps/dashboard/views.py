@@ -2,6 +2,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from django.conf import settings
 from django.db.models import Count, Q
 from django.core.cache import cache
 from datetime import datetime
@@ -18,6 +19,8 @@ except ImportError:
 from apps.cfc.models import HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission
 from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
 from apps.scd.models import LeetCodeProfile
+from apps.analytics_summary import cache_versions
+from .signals import stats_version
 
 
 class DashboardStatsView(APIView):
@@ -29,9 +32,10 @@ class DashboardStatsView(APIView):
     def get(self, request):
         try:
             user = request.user
-            cache_key = f'dashboard_stats_{user.id}'
+            # Versioned per user: submissions, reviews and profile changes start a new key
+            cache_key = cache_versions.key('dashboard_stats', stats_version(user.id))
             
-            # Check cache first (5 minutes)
+            # Check cache first
             cached_data = cache.get(cache_key)
             if cached_data:
                 return Response(cached_data)
@@ -193,8 +197,12 @@ class DashboardStatsView(APIView):
                 'notifications': notifications,
             }
             
-            # Cache for 5 minutes
-            cache.set(cache_key, data, 300)
+            # Other workers only see version bumps through a shared cache
+            ttl = (
+                settings.DASHBOARD_STATS_CACHE_TTL if cache_versions.shared()
+                else settings.DASHBOARD_STATS_LOCAL_CACHE_TTL
+            )
+            cache.set(cache_key, data, ttl)
             
             return Response(data)
             
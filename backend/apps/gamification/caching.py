@@ -0,0 +1,77 @@
+"""
+Gamification Caches
+
+`current_season()` keeps the active Season in process memory (one memo per
+thread). The memo is tied to the 'gamification' cache version, which
+signals bump whenever a season, episode or title is saved or deleted, and
+is reloaded on every call while caching is off (the dummy cache never
+returns a stored version). Versions only reach other processes through a
+shared cache (Redis): with LocMemCache each worker keeps its own versions,
+so a bump in one worker is invisible to the rest. The memo therefore also
+expires after GAMIFICATION_SEASON_MEMO_TTL seconds, which bounds how long
+another worker can serve a season that was just ended or replaced.
+
+The student overview is cached per student under `overview_key`. Its
+versions are bumped by signals for per-row writes (scores, wallets,
+streaks, episode progress, leaderboard rows, titles) and by `bump_season`
+after the bulk writes that skip signals (finalization, leaderboard
+rebuilds, streak sync, progress fan-out). The same caveat applies: without
+a shared cache, other workers serve their copy until
+GAMIFICATION_OVERVIEW_CACHE_TTL runs out.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from apps.analytics_summary import cache_versions
+from .models import Season
+
+GAMIFICATION_VERSION = 'gamification'
+
+_current = threading.local()
+
+
+def season_version(season_id):
+    return f'gamification_season_{season_id}'
+
+
+def student_version(user_id):
+    return f'gamification_student_{user_id}'
+
+
+def current_season():
+    """The active season (or None), reloaded after a version bump or the memo TTL"""
+    version = cache_versions.get(GAMIFICATION_VERSION)
+    ttl = getattr(settings, 'GAMIFICATION_SEASON_MEMO_TTL', 60)
+    if (
+        getattr(_current, 'version', None) != version
+        or time.monotonic() - getattr(_current, 'loaded_at', 0) >= ttl
+    ):
+        _current.season = Season.objects.filter(is_active=True).first()
+        _current.version = version
+        _current.loaded_at = time.monotonic()
+    return _current.season
+
+
+def invalidate():
+    """Seasons, episodes or titles changed"""
+    _current.version = None
+    cache_versions.bump(GAMIFICATION_VERSION)
+
+
+def bump_season(season_id):
+    """Many students' rows in the season changed at once"""
+    cache_versions.bump(season_version(season_id))
+
+
+def bump_student(user_id):
+    cache_versions.bump(student_version(user_id))
+
+
+def overview_key(user_id, season_id):
+    return cache_versions.key(
+        'gamification_overview',
+        GAMIFICATION_VERSION, season_version(season_id), student_version(user_id),
+    )
@@ -0,0 +1,287 @@
+"""
+Concurrent LeetCode streak sync
+Bounded worker pool for the daily streak cron. Workers only talk to LeetCode;
+all database reads/writes happen on the calling thread, in bulk.
+"""
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.contrib.auth import get_user_model
+
+from apps import http_client
+from . import caching
+from .models import SCDStreak
+from .services import LeetCodeSyncService
+
+User = get_user_model()
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    Allows `capacity` requests in a burst, refilled at `rate` tokens/second
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1, rate))
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a token is available; returns seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class ConcurrentStreakSync:
+    """
+    Sync SCD streaks for every student with a thread pool
+
+    - one keep-alive 'leetcode_sync' session shared by all workers and by
+      concurrent runs (OUTBOUND_HTTP['UPSTREAMS']['leetcode_sync']: pool of
+      LEETCODE_SYNC_POOL_MAXSIZE, no adapter-level retries so every attempt
+      passes the limiter)
+    - shared TokenBucket so the whole run stays under `rate` requests/second
+    - retries 429/5xx/network errors with jittered exponential backoff,
+      honouring Retry-After when LeetCode sends it
+    - batch_size > 1 fetches that many students per request with aliased
+      matchedUser queries
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, workers=8, rate=None, burst=None, max_retries=3,
+                 backoff_base=1.0, backoff_cap=30.0, timeout=None, url=None,
+                 batch_size=1):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.limiter = TokenBucket(rate or workers, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.url = url or LeetCodeSyncService.GRAPHQL_URL
+
+        # Reused, never replaced: re-registering would close the pool of a
+        # sync that is still running
+        self.session = http_client.get_session('leetcode_sync')
+        self.timeout = timeout or self.session.config['TIMEOUT']
+
+    def _backoff(self, attempt, response=None):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_cap)
+        # Full jitter: uniform(0, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def _request(self, query, variables):
+        """
+        POST one GraphQL request through the limiter with retries
+        Returns (data, failure_cause); data is the response's `data` dict
+        """
+        cause = None
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            response = None
+            try:
+                response = self.session.post(
+                    self.url,
+                    json={'query': query, 'variables': variables},
+                    timeout=self.timeout
+                )
+            except requests.exceptions.Timeout:
+                cause = 'timeout'
+            except requests.exceptions.RequestException:
+                cause = 'connection_error'
+            else:
+                if response.status_code == 200:
+                    try:
+                        payload = response.json()
+                    except ValueError:
+                        return None, 'invalid_response'
+                    data = (payload.get('data') or {}) if isinstance(payload, dict) else None
+                    if not isinstance(data, dict):
+                        return None, 'invalid_response'
+                    return data, None
+
+                cause = 'rate_limited' if response.status_code == 429 else f'http_{response.status_code}'
+                if response.status_code not in self.RETRY_STATUSES:
+                    break
+
+            if attempt < self.max_retries:
+                time.sleep(self._backoff(attempt, response))
+
+        return None, cause
+
+    @staticmethod
+    def _calendar_result(user_data):
+        if not user_data:
+            return None, 'user_not_found'
+        if not isinstance(user_data, dict):
+            return None, 'invalid_response'
+        calendar_data = user_data.get('userCalendar') or {}
+        if not isinstance(calendar_data, dict):
+            return None, 'invalid_response'
+        return calendar_data, None
+
+    def fetch(self, username):
+        """
+        Fetch userCalendar for one username
+        Returns (calendar_data, failure_cause, latency_seconds); cause is None on success
+        """
+        started = time.monotonic()
+        try:
+            data, cause = self._request(
+                LeetCodeSyncService.STREAK_QUERY, {'username': username}
+            )
+            if cause:
+                return None, cause, time.monotonic() - started
+
+            calendar_data, cause = self._calendar_result(data.get('matchedUser'))
+        except Exception:
+            # One bad reply fails this user, not the whole run
+            logger.exception('LeetCode streak fetch failed for %s', username)
+            calendar_data, cause = None, 'unexpected_error'
+        return calendar_data, cause, time.monotonic() - started
+
+    def fetch_batch(self, usernames):
+        """
+        Fetch several users in one aliased request (u0: matchedUser ... u1: ...)
+        Returns a list of fetch() results aligned with `usernames`
+        """
+        started = time.monotonic()
+        try:
+            query, variables = LeetCodeSyncService.build_streak_batch_query(usernames)
+            data, cause = self._request(query, variables)
+            latency = time.monotonic() - started
+
+            if cause:
+                return [(None, cause, latency)] * len(usernames)
+            return [
+                self._calendar_result(data.get(f'u{index}')) + (latency,)
+                for index in range(len(usernames))
+            ]
+        except Exception:
+            # One bad reply fails this batch, not the whole run
+            logger.exception('LeetCode streak batch fetch failed for %s', ', '.join(usernames))
+            return [(None, 'unexpected_error', time.monotonic() - started)] * len(usernames)
+
+    def run(self, season, students=None):
+        """
+        Sync every student (or the given queryset) for `season`
+        Returns the same keys as LeetCodeSyncService.sync_all_students plus
+        requests and students per second, request latency percentiles and
+        failures grouped by cause
+        """
+        if students is None:
+            students = User.objects.filter(profile__role='STUDENT')
+        students = list(students.select_related('profile'))
+
+        results = {
+            'success': 0,
+            'failed': 0,
+            'errors': [],
+            'failures_by_cause': Counter(),
+        }
+
+        jobs = []
+        for student in students:
+            username = LeetCodeSyncService.get_leetcode_username(student.profile)
+            if username:
+                jobs.append((student, username))
+            else:
+                results['failed'] += 1
+                results['failures_by_cause']['no_username'] += 1
+                results['errors'].append(f"{student.username}: No LeetCode username set")
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            if self.batch_size > 1:
+                chunks = [
+                    [username for _, username in jobs[i:i + self.batch_size]]
+                    for i in range(0, len(jobs), self.batch_size)
+                ]
+                fetched = [result for batch in pool.map(self.fetch_batch, chunks) for result in batch]
+                requests_sent = len(chunks)
+            else:
+                fetched = list(pool.map(lambda job: self.fetch(job[1]), jobs))
+                requests_sent = len(jobs)
+        elapsed = time.monotonic() - started
+
+        existing = {
+            streak.student_id: streak
+            for streak in SCDStreak.objects.filter(
+                season=season,
+                student_id__in=[student.id for student, _ in jobs]
+            )
+        }
+        to_create = []
+        to_update = []
+        for (student, username), (calendar_data, cause, _) in zip(jobs, fetched):
+            if cause:
+                results['failed'] += 1
+                results['failures_by_cause'][cause] += 1
+                results['errors'].append(f"{student.username}: {cause}")
+                continue
+
+            streak = existing.get(student.id)
+            if streak is None:
+                streak = SCDStreak(student=student, season=season, leetcode_username=username)
+                to_create.append(streak)
+            else:
+                to_update.append(streak)
+            LeetCodeSyncService.apply_calendar(streak, calendar_data)
+            results['success'] += 1
+
+        SCDStreak.objects.bulk_create(to_create, batch_size=500)
+        SCDStreak.objects.bulk_update(
+            to_update,
+            ['current_streak', 'longest_streak', 'total_days_active',
+             'season_streak_days', 'last_synced_at'],
+            batch_size=500
+        )
+        caching.bump_season(season.id)
+
+        latencies = sorted(latency for _, _, latency in fetched)
+        results.update({
+            'failures_by_cause': dict(results['failures_by_cause']),
+            'elapsed_seconds': round(elapsed, 3),
+            'requests_per_second': round(requests_sent / elapsed, 2) if elapsed else 0,
+            'students_per_second': round(len(jobs) / elapsed, 2) if elapsed else 0,
+            'latency_p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+            'latency_p95_ms': round(_percentile(latencies, 95) * 1000, 1),
+        })
+        return results
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
@@ -0,0 +1,119 @@
+"""
+Management Command: benchmark_season_creation
+
+Measures how long creating a season takes (4 episodes plus the
+EpisodeProgress fan-out) for growing cohorts. Every run happens inside a
+transaction that is rolled back, so the database is left unchanged.
+
+Usage:
+    python manage.py benchmark_season_creation
+    python manage.py benchmark_season_creation --sizes 100 500 2000 --chunk-size 500
+    python manage.py benchmark_season_creation --per-row     # also time one INSERT per row
+"""
+
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.gamification.models import Episode, EpisodeProgress, Season
+from apps.gamification.services import EpisodeService
+from apps.profiles.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Benchmark season creation (episode progress fan-out) against cohort size'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[100, 500, 1000, 2000],
+            help='Cohort sizes (students) to benchmark',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EpisodeService.PROGRESS_CHUNK_SIZE,
+            help='EpisodeProgress rows per bulk insert',
+        )
+        parser.add_argument(
+            '--per-row',
+            action='store_true',
+            help='Also time the previous one-create-per-row fan-out',
+        )
+
+    def handle(self, *args, **options):
+        EpisodeService.PROGRESS_CHUNK_SIZE = options['chunk_size']
+
+        header = f"{'students':>9} {'rows':>7} {'bulk (ms)':>10} {'lazy (ms)':>10}"
+        if options['per_row']:
+            header += f" {'per-row (ms)':>13}"
+        self.stdout.write(header)
+
+        for size in options['sizes']:
+            line = f'{size:>9}'
+            rows, elapsed = self._run(size, self._create_season)
+            line += f' {rows:>7} {elapsed:>10.0f}'
+            with override_settings(GAMIFICATION_LAZY_EPISODE_PROGRESS=True):
+                _, elapsed = self._run(size, self._create_season)
+            line += f' {elapsed:>10.0f}'
+            if options['per_row']:
+                _, elapsed = self._run(size, self._create_season_per_row)
+                line += f' {elapsed:>13.0f}'
+            self.stdout.write(line)
+
+        self.stdout.write(self.style.SUCCESS('Done (all changes rolled back)'))
+
+    def _run(self, size, create):
+        """Create `size` students and a season in a rolled-back transaction"""
+        with transaction.atomic():
+            self._create_students(size)
+            started = time.perf_counter()
+            season = create()
+            elapsed = (time.perf_counter() - started) * 1000
+            rows = EpisodeProgress.objects.filter(episode__season=season).count()
+            transaction.set_rollback(True)
+        return rows, elapsed
+
+    def _create_students(self, size):
+        users = User.objects.bulk_create([
+            User(username=f'benchmark-student-{index}') for index in range(size)
+        ])
+        if not users or users[0].pk is None:
+            users = list(User.objects.filter(username__startswith='benchmark-student-'))
+        UserProfile.objects.bulk_create([UserProfile(user=user, role='STUDENT') for user in users])
+
+    def _next_season(self):
+        number = (Season.objects.aggregate(number=Max('season_number'))['number'] or 0) + 1
+        start = timezone.now().date() + timedelta(days=365 * number)
+        return {
+            'name': f'Benchmark Season {number}',
+            'season_number': number,
+            'start_date': start,
+            'end_date': start + timedelta(days=30),
+            'is_active': False,
+        }
+
+    def _create_season(self):
+        return Season.objects.create(**self._next_season())
+
+    def _create_season_per_row(self):
+        """Season with the previous fan-out: one EpisodeProgress INSERT per student and episode"""
+        with override_settings(GAMIFICATION_LAZY_EPISODE_PROGRESS=True):
+            season = Season.objects.create(**self._next_season())
+        student_ids = list(User.objects.filter(profile__role='STUDENT').values_list('id', flat=True))
+        for episode in Episode.objects.filter(season=season):
+            for student_id in student_ids:
+                EpisodeProgress.objects.create(
+                    student_id=student_id,
+                    episode=episode,
+                    status=EpisodeService.initial_status(episode),
+                )
+        return season
@@ -0,0 +1,60 @@
+"""
+Management command to finalize a season for all eligible students
+Run at season end: python manage.py finalize_season
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.gamification.models import Season
+from apps.gamification.services import SeasonScoringService
+
+
+class Command(BaseCommand):
+    help = 'Finalize season scores, legacy totals and vault credits in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--season-id',
+            type=int,
+            help='Specific season ID to finalize (defaults to current active season)',
+        )
+        parser.add_argument(
+            '--student-ids',
+            type=str,
+            help='Comma-separated student IDs to finalize (defaults to all eligible students)',
+        )
+
+    def handle(self, *args, **options):
+        season_id = options.get('season_id')
+
+        if season_id:
+            try:
+                season = Season.objects.get(id=season_id)
+            except Season.DoesNotExist:
+                self.stdout.write(self.style.ERROR(f'Season {season_id} not found'))
+                return
+        else:
+            season = Season.objects.filter(
+                is_active=True,
+                start_date__lte=timezone.now().date(),
+                end_date__gte=timezone.now().date()
+            ).first()
+
+        if not season:
+            self.stdout.write(self.style.ERROR('No active season found'))
+            return
+
+        student_ids = None
+        if options.get('student_ids'):
+            student_ids = [int(sid) for sid in options['student_ids'].split(',') if sid.strip()]
+
+        self.stdout.write(f'Finalizing {season.name}...')
+
+        results = SeasonScoringService.finalize_season_bulk(season, student_ids=student_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Finalization completed!\n'
+            f'Finalized: {results["finalized"]}\n'
+            f'Already finalized: {results["already_finalized"]}\n'
+            f'Ascension bonuses: {results["ascension_bonuses"]}\n'
+            f'Vault credits awarded: {results["credits_awarded"]}'
+        ))
@@ -1,6 +1,7 @@
 """
 Management command to sync LeetCode streaks for all students
 Run daily via cron: python manage.py sync_leetcode_streaks
+Concurrent mode:    python manage.py sync_leetcode_streaks --workers 8 --rate 5 --batch-size 20
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
@@ -17,6 +18,23 @@ class Command(BaseCommand):
             type=int,
             help='Specific season ID to sync (defaults to current active season)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Concurrent LeetCode requests (1 = serial sync)',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            help='Max LeetCode requests per second across all workers (defaults to --workers)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1,
+            help='Students fetched per LeetCode request using aliased queries',
+        )
 
     def handle(self, *args, **options):
         season_id = options.get('season_id')
@@ -40,7 +58,12 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Starting LeetCode sync for {season.name}...')
         
-        results = LeetCodeSyncService.sync_all_students(season)
+        results = LeetCodeSyncService.sync_all_students(
+            season,
+            workers=options['workers'],
+            rate=options.get('rate'),
+            batch_size=options['batch_size']
+        )
         
         self.stdout.write(self.style.SUCCESS(
             f'Sync completed!\n'
@@ -48,6 +71,17 @@ class Command(BaseCommand):
             f'Failed: {results["failed"]}'
         ))
         
+        if 'elapsed_seconds' in results:
+            self.stdout.write(
+                f'Elapsed: {results["elapsed_seconds"]}s '
+                f'({results["requests_per_second"]} req/s, '
+                f'{results["students_per_second"]} students/s)\n'
+                f'Latency p50: {results["latency_p50_ms"]}ms, '
+                f'p95: {results["latency_p95_ms"]}ms'
+            )
+            for cause, count in sorted(results['failures_by_cause'].items()):
+                self.stdout.write(f'  {cause}: {count}')
+        
         if results['errors']:
             self.stdout.write(self.style.WARNING('Errors:'))
             for error in results['errors'][:10]:  # Show first 10 errors
@@ -59,7 +59,7 @@ class Command(BaseCommand):
 
         try:
             # Import here to avoid circular imports
-            from apps.gamification.models import Season, Episode
+            from apps.gamification.models import Season
             
             today = timezone.now().date()
             
@@ -71,7 +71,7 @@ class Command(BaseCommand):
             
             # Create next season if requested
             if create_next:
-                self.create_next_season(Season, Episode, today)
+                self.create_next_season(Season, today)
             
             self.stdout.write('')
             self.stdout.write(self.style.SUCCESS('✓ UPDATE COMPLETE'))
@@ -135,7 +135,7 @@ class Command(BaseCommand):
         
         return count
 
-    def create_next_season(self, Season, Episode, today):
+    def create_next_season(self, Season, today):
         """Create next season if none exists"""
         # Get latest season
         latest_season = Season.objects.order_by('-season_number').first()
@@ -165,19 +165,8 @@ class Command(BaseCommand):
                 is_active=False
             )
             
-            # Create 4 episodes (1 week each)
-            for i in range(1, 5):
-                episode_start = next_start + timedelta(days=(i-1) * 7)
-                episode_end = episode_start + timedelta(days=6)
-                
-                Episode.objects.create(
-                    season=new_season,
-                    episode_number=i,
-                    name=f'Episode {i}',
-                    start_date=episode_start,
-                    end_date=episode_end
-                )
-            
+            # The Season post_save signal creates the 4 weekly episodes and
+            # fans EpisodeProgress out to every student in bulk
             self.stdout.write(
                 self.style.SUCCESS(
                     f'✓ Created: {new_season.name} ({next_start} to {next_end})'
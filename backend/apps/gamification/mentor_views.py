@@ -9,7 +9,8 @@ from rest_framework import status
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 
-from .models import Season, Episode, EpisodeProgress
+from . import caching
+from .models import Episode, EpisodeProgress, SeasonScore
 from .services import EpisodeService, SeasonScoringService
 from .serializers import EpisodeProgressSerializer, SeasonScoreSerializer
 
@@ -88,11 +89,14 @@ def student_progress_detail(request, student_id):
         )
     
     student = get_object_or_404(User, id=student_id)
-    current_season = Season.objects.filter(is_active=True).first()
+    current_season = caching.current_season()
     
     if not current_season:
         return Response({'error': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
     
+    # Lazy mode: students who never opened the app get their default rows
+    EpisodeService.ensure_progress(student, current_season)
+    
     # Get all episode progress for current season
     episode_progress = EpisodeProgress.objects.filter(
         student=student,
@@ -140,7 +144,7 @@ def finalize_student_season(request, student_id):
         )
     
     student = get_object_or_404(User, id=student_id)
-    current_season = Season.objects.filter(is_active=True).first()
+    current_season = caching.current_season()
     
     if not current_season:
         return Response({'error': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -248,6 +249,11 @@ class VaultWallet(models.Model):
     """
     Redeemable currency earned ONLY after full Season completion
     Spending does NOT reduce Legacy Score
+    
+    VaultTransaction rows are the append-only ledger; the balance columns
+    are running totals changed only by single UPDATEs with F() expressions
+    (a spend only applies while the balance covers it), so concurrent
+    earns and redemptions never overwrite each other.
     """
     student = models.OneToOneField(User, on_delete=models.CASCADE, related_name='vault_wallet')
     available_credits = models.PositiveIntegerField(default=0)
@@ -260,36 +266,43 @@ class VaultWallet(models.Model):
     def __str__(self):
         return f"{self.student.username} - Credits: {self.available_credits}"
 
+    BALANCE_FIELDS = ['available_credits', 'total_earned', 'total_spent', 'updated_at']
+
     def add_credits(self, amount, reason=""):
         """Add vault credits"""
-        self.available_credits += amount
-        self.total_earned += amount
-        self.save()
-        
-        # Log transaction
-        VaultTransaction.objects.create(
-            wallet=self,
-            transaction_type='earn',
-            amount=amount,
-            reason=reason
-        )
-
-    def spend_credits(self, amount, reason=""):
-        """Spend vault credits"""
-        if self.available_credits >= amount:
-            self.available_credits -= amount
-            self.total_spent += amount
-            self.save()
-            
+        with transaction.atomic():
+            VaultWallet.objects.filter(pk=self.pk).update(
+                available_credits=F('available_credits') + amount,
+                total_earned=F('total_earned') + amount,
+                updated_at=timezone.now(),
+            )
             # Log transaction
             VaultTransaction.objects.create(
                 wallet=self,
-                transaction_type='spend',
+                transaction_type='earn',
                 amount=amount,
                 reason=reason
             )
-            return True
-        return False
+        self.refresh_from_db(fields=self.BALANCE_FIELDS)
+
+    def spend_credits(self, amount, reason=""):
+        """Spend vault credits; False (nothing written) when the balance is too low"""
+        with transaction.atomic():
+            spent = VaultWallet.objects.filter(pk=self.pk, available_credits__gte=amount).update(
+                available_credits=F('available_credits') - amount,
+                total_spent=F('total_spent') + amount,
+                updated_at=timezone.now(),
+            )
+            if spent:
+                # Log transaction
+                VaultTransaction.objects.create(
+                    wallet=self,
+                    transaction_type='spend',
+                    amount=amount,
+                    reason=reason
+                )
+        self.refresh_from_db(fields=self.BALANCE_FIELDS)
+        return bool(spent)
 
 
 class VaultTransaction(models.Model):
@@ -350,23 +363,25 @@ class SCDStreak(models.Model):
         Full uninterrupted streak = 100 points
         Partial breaks = reduced points
         """
+        self.streak_score = self.compute_streak_score()
+        self.save()
+        return self.streak_score
+
+    def compute_streak_score(self):
+        """Streak score for the current season_streak_days, without saving"""
         season_days = (self.season.end_date - self.season.start_date).days + 1
         
         if self.season_streak_days >= season_days - 2:  # Allow 2 day buffer
-            self.streak_score = 100
+            return 100
         elif self.season_streak_days >= season_days * 0.8:
-            self.streak_score = 80
+            return 80
         elif self.season_streak_days >= season_days * 0.6:
-            self.streak_score = 60
+            return 60
         elif self.season_streak_days >= season_days * 0.4:
-            self.streak_score = 40
+            return 40
         elif self.season_streak_days >= season_days * 0.2:
-            self.streak_score = 20
-        else:
-            self.streak_score = 0
-        
-        self.save()
-        return self.streak_score
+            return 20
+        return 0
 
 
 class LeaderboardEntry(models.Model):
@@ -1,10 +1,28 @@
 """
 Progress Notification Service
 Calculates batch averages and generates motivational notifications
+
+A student's progress is their season completion: the share of the 11
+required episode tasks they have completed. Batch statistics come from a
+per-season distribution - the sorted completion of every student, those
+without progress rows yet (lazy episode progress) counting as 0% - built
+with one grouped query plus a count and cached for
+GAMIFICATION_BATCH_STATS_TTL seconds (and until the season's cache version
+is bumped). A student's percentile is a binary search into that array;
+only their own completion is read live.
 """
+from bisect import bisect_left
+from functools import reduce
+from operator import add
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, Q, Sum, Value, When
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, Q
-from .models import EpisodeProgress, Season
+from django.utils import timezone
+from apps.analytics_summary import cache_versions
+from . import caching
+from .models import EpisodeProgress
 import random
 
 User = get_user_model()
@@ -53,24 +71,79 @@ class ProgressNotificationService:
         ]
     }
     
+    # Required tasks per episode (EpisodeProgress.check_episode_completion)
+    EPISODE_TASKS = {
+        1: ['clt_completed', 'scd_streak_active'],
+        2: ['cfc_task1_completed', 'iipc_task1_completed', 'scd_streak_active'],
+        3: ['cfc_task2_completed', 'iipc_task2_completed', 'scd_streak_active'],
+        4: ['cfc_task3_completed', 'sri_completed', 'scd_streak_active'],
+    }
+    TOTAL_TASKS = sum(len(tasks) for tasks in EPISODE_TASKS.values())
+    
+    # Completion thresholds for the performer counts
+    HIGH_PERFORMER = 75
+    MODERATE_PERFORMER = 40
+    
+    @classmethod
+    def _completion_by_student(cls, season, student=None):
+        """{student_id: season completion %} from one grouped query"""
+        tasks_done = reduce(add, [
+            Case(
+                When(Q(episode__episode_number=number, **{task: True}), then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            for number, tasks in cls.EPISODE_TASKS.items()
+            for task in tasks
+        ])
+        progress = EpisodeProgress.objects.filter(episode__season=season)
+        if student is not None:
+            progress = progress.filter(student=student)
+        rows = progress.order_by().values('student_id').annotate(done=Sum(tasks_done))
+        return {row['student_id']: row['done'] * 100 / cls.TOTAL_TASKS for row in rows}
+    
+    @classmethod
+    def get_distribution(cls, season):
+        """
+        Sorted completion of every student in the season (cached)
+        Returns {'completions': [...ascending], 'average': float, 'computed_at': datetime}
+        """
+        cache_key = cache_versions.key(
+            f'gamification_batch_stats_{season.id}',
+            caching.GAMIFICATION_VERSION, caching.season_version(season.id),
+        )
+        distribution = cache.get(cache_key)
+        if distribution is None:
+            completions = list(cls._completion_by_student(season).values())
+            # Students without rows (not opened the app in lazy mode) have done nothing yet
+            without_rows = User.objects.filter(profile__role='STUDENT').exclude(
+                id__in=EpisodeProgress.objects.filter(episode__season=season).values('student_id')
+            ).count()
+            completions = sorted(completions + [0.0] * without_rows)
+            distribution = {
+                'completions': completions,
+                'average': sum(completions) / len(completions) if completions else 0,
+                'computed_at': timezone.now(),
+            }
+            cache.set(cache_key, distribution, settings.GAMIFICATION_BATCH_STATS_TTL)
+        return distribution
+    
     @classmethod
-    def get_batch_statistics(cls, season=None):
+    def get_batch_statistics(cls, season=None, distribution=None):
         """
         Calculate batch-wide statistics for current season
         Returns total students, average progress, and distribution
         """
         if not season:
-            season = Season.objects.filter(is_active=True).first()
+            season = caching.current_season()
         
         if not season:
             return None
         
-        # Get all students who have episode progress
-        students_with_progress = User.objects.filter(
-            episode_progress__episode__season=season
-        ).distinct()
-        
-        total_students = students_with_progress.count()
+        if distribution is None:
+            distribution = cls.get_distribution(season)
+        completions = distribution['completions']
+        total_students = len(completions)
         
         if total_students == 0:
             return {
@@ -79,39 +152,22 @@ class ProgressNotificationService:
                 'season_name': season.name if season else None,
             }
         
-        # Calculate average progress across all students
-        avg_data = EpisodeProgress.objects.filter(
-            episode__season=season,
-            status__in=['unlocked', 'in_progress', 'completed']
-        ).aggregate(
-            avg_completion=Avg('completion_percentage')
-        )
-        
-        # Count students in different progress ranges
-        high_performers = EpisodeProgress.objects.filter(
-            episode__season=season,
-            completion_percentage__gte=75
-        ).values('student').distinct().count()
-        
-        moderate_performers = EpisodeProgress.objects.filter(
-            episode__season=season,
-            completion_percentage__gte=40,
-            completion_percentage__lt=75
-        ).values('student').distinct().count()
-        
-        low_performers = EpisodeProgress.objects.filter(
-            episode__season=season,
-            completion_percentage__lt=40
-        ).values('student').distinct().count()
+        # Count students in different progress ranges (binary search on the sorted array)
+        below_moderate = bisect_left(completions, cls.MODERATE_PERFORMER)
+        below_high = bisect_left(completions, cls.HIGH_PERFORMER)
+        high_performers = total_students - below_high
+        moderate_performers = below_high - below_moderate
+        low_performers = below_moderate
         
         return {
             'total_students': total_students,
-            'average_progress': round(avg_data['avg_completion'] or 0, 1),
+            'average_progress': round(distribution['average'], 1),
             'high_performers': high_performers,
             'moderate_performers': moderate_performers,
             'low_performers': low_performers,
             'season_name': season.name,
             'season_id': season.id,
+            'computed_at': distribution['computed_at'],
         }
     
     @classmethod
@@ -121,28 +177,20 @@ class ProgressNotificationService:
         Returns comparison data and motivational message
         """
         if not season:
-            season = Season.objects.filter(is_active=True).first()
+            season = caching.current_season()
         
         if not season:
             return None
         
         # Get batch statistics
-        batch_stats = cls.get_batch_statistics(season)
+        distribution = cls.get_distribution(season)
+        batch_stats = cls.get_batch_statistics(season, distribution)
         
         if not batch_stats or batch_stats['total_students'] == 0:
             return None
         
-        # Get student's current episode progress
-        try:
-            current_progress = EpisodeProgress.objects.filter(
-                student=student,
-                episode__season=season,
-                status__in=['unlocked', 'in_progress', 'completed']
-            ).latest('episode__episode_number')
-            
-            student_progress = current_progress.completion_percentage
-        except EpisodeProgress.DoesNotExist:
-            student_progress = 0
+        # Get student's season completion (live, only their own rows)
+        student_progress = cls._completion_by_student(season, student).get(student.id, 0)
         
         batch_average = batch_stats['average_progress']
         difference = student_progress - batch_average
@@ -165,10 +213,7 @@ class ProgressNotificationService:
         message = random.choice(cls.MOTIVATIONAL_MESSAGES[category])
         
         # Calculate percentile rank
-        students_below = EpisodeProgress.objects.filter(
-            episode__season=season,
-            completion_percentage__lt=student_progress
-        ).values('student').distinct().count()
+        students_below = bisect_left(distribution['completions'], student_progress)
         
         percentile = 0
         if batch_stats['total_students'] > 0:
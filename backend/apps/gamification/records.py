@@ -0,0 +1,144 @@
+"""
+Gamification Record Accessors
+
+Read paths get a student's SeasonScore, LegacyScore, VaultWallet and
+SCDStreak through these accessors instead of get_or_create. A missing row
+comes back as an unsaved instance with the model defaults, so reads never
+INSERT or take write locks; rows are persisted by the write paths
+(season finalization, credit allocation, streak sync, title redemption),
+which already get_or_create or bulk_create them on first use.
+
+`load` fetches every gamification row the student dashboard shows - both
+one-to-one records plus the season's score, streak, leaderboard entry,
+percentile bracket and the equipped title - in a single query.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import FilteredRelation, Q
+
+from .models import LegacyScore, SCDStreak, SeasonScore, VaultWallet
+
+User = get_user_model()
+
+# FilteredRelation alias -> reverse relation, joined for one season
+SEASON_RELATIONS = {
+    'current_season_score': 'season_scores',
+    'current_scd_streak': 'scd_streaks',
+    'current_leaderboard_entry': 'leaderboard_entries',
+    'current_percentile': 'percentile_brackets',
+}
+
+
+def _leetcode_username(student):
+    from .services import LeetCodeSyncService
+
+    try:
+        profile = student.profile
+    except ObjectDoesNotExist:
+        return ''
+    return LeetCodeSyncService.get_leetcode_username(profile) or ''
+
+
+def default_season_score(student, season):
+    return SeasonScore(student=student, season=season)
+
+
+def default_legacy_score(student):
+    return LegacyScore(student=student)
+
+
+def default_vault_wallet(student):
+    return VaultWallet(student=student)
+
+
+def default_scd_streak(student, season):
+    return SCDStreak(student=student, season=season, leetcode_username=_leetcode_username(student))
+
+
+def season_score(student, season):
+    """Stored SeasonScore or an unsaved default"""
+    return (
+        SeasonScore.objects.filter(student=student, season=season).first()
+        or default_season_score(student, season)
+    )
+
+
+def legacy_score(student):
+    """Stored LegacyScore or an unsaved default"""
+    return LegacyScore.objects.filter(student=student).first() or default_legacy_score(student)
+
+
+def vault_wallet(student):
+    """Stored VaultWallet or an unsaved default"""
+    return VaultWallet.objects.filter(student=student).first() or default_vault_wallet(student)
+
+
+def scd_streak(student, season):
+    """Stored SCDStreak or an unsaved default"""
+    return (
+        SCDStreak.objects.filter(student=student, season=season).first()
+        or default_scd_streak(student, season)
+    )
+
+
+def _related(row, name):
+    """The select_related object, or None when the join found no row"""
+    try:
+        # Empty FilteredRelation joins leave the attribute unset
+        return getattr(row, name, None)
+    except ObjectDoesNotExist:
+        return None
+
+
+def load(student, season=None):
+    """
+    All of a student's dashboard gamification rows from one query
+
+    Returns {'season_score', 'legacy_score', 'vault_wallet', 'scd_streak',
+    'leaderboard_entry', 'percentile', 'equipped_title'}. The four score
+    records are always instances (unsaved defaults when missing); the
+    season-scoped entries are None without a season, and the leaderboard
+    entry, percentile bracket and equipped UserTitle are None when absent.
+    """
+    relations = {
+        'equipped_title': FilteredRelation('titles', condition=Q(titles__is_equipped=True)),
+    }
+    if season is not None:
+        relations.update({
+            alias: FilteredRelation(relation, condition=Q(**{f'{relation}__season': season}))
+            for alias, relation in SEASON_RELATIONS.items()
+        })
+
+    row = (
+        User.objects.filter(pk=student.pk)
+        .annotate(**relations)
+        .select_related('profile', 'legacy_score', 'vault_wallet', 'equipped_title__title', *relations)
+        .first()
+    )
+
+    # Serializers read student.username and season.name: reuse the loaded objects
+    for name in ('legacy_score', 'vault_wallet', 'current_season_score', 'current_scd_streak'):
+        related = _related(row, name)
+        if related is not None:
+            related.student = row
+            if name.startswith('current_'):
+                related.season = season
+
+    records = {
+        'season_score': None,
+        'legacy_score': _related(row, 'legacy_score') or default_legacy_score(student),
+        'vault_wallet': _related(row, 'vault_wallet') or default_vault_wallet(student),
+        'scd_streak': None,
+        'leaderboard_entry': None,
+        'percentile': None,
+        'equipped_title': _related(row, 'equipped_title'),
+    }
+    if season is not None:
+        records.update({
+            'season_score': _related(row, 'current_season_score') or default_season_score(student, season),
+            'scd_streak': _related(row, 'current_scd_streak') or default_scd_streak(row, season),
+            'leaderboard_entry': _related(row, 'current_leaderboard_entry'),
+            'percentile': _related(row, 'current_percentile'),
+        })
+    return records
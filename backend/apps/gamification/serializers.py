@@ -111,6 +111,9 @@ class VaultWalletSerializer(serializers.ModelSerializer):
                   'total_spent', 'recent_transactions', 'created_at', 'updated_at']
     
     def get_recent_transactions(self, obj):
+        if obj.pk is None:
+            # Unsaved default wallet (no credits yet)
+            return []
         transactions = obj.transactions.all()[:10]
         return VaultTransactionSerializer(transactions, many=True).data
 
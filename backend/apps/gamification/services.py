@@ -2,12 +2,18 @@
 Service layer for Gamification System
 Handles scoring, episode progression, season finalization
 """
-from django.db import transaction
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Value, When, Window
+from django.db.models.functions import Rank, RowNumber
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from . import caching
 from .models import (
     Season, Episode, EpisodeProgress, SeasonScore, LegacyScore,
-    VaultWallet, SCDStreak, LeaderboardEntry, PercentileBracket
+    VaultWallet, VaultTransaction, SCDStreak, LeaderboardEntry, PercentileBracket
 )
 
 User = get_user_model()
@@ -16,12 +22,71 @@ User = get_user_model()
 class EpisodeService:
     """Handle episode progression and task completion"""
     
+    # EpisodeProgress rows inserted per bulk_create
+    PROGRESS_CHUNK_SIZE = 1000
+    
+    @staticmethod
+    def initial_status(episode):
+        """Only Episode 1 starts unlocked"""
+        return 'unlocked' if episode.episode_number == 1 else 'locked'
+    
+    @staticmethod
+    def lazy_progress():
+        """Create progress rows on a student's first access instead of per season"""
+        return getattr(settings, 'GAMIFICATION_LAZY_EPISODE_PROGRESS', False)
+    
+    @staticmethod
+    def create_progress_for_students(episode, student_ids=None, chunk_size=None):
+        """
+        EpisodeProgress for every student (or `student_ids`) in an episode
+        
+        Chunked bulk_create; rows that already exist are left untouched.
+        Returns the number of students processed.
+        """
+        chunk_size = chunk_size or EpisodeService.PROGRESS_CHUNK_SIZE
+        if student_ids is None:
+            student_ids = User.objects.filter(profile__role='STUDENT').order_by('id').values_list('id', flat=True)
+            student_ids = student_ids.iterator(chunk_size=chunk_size)
+        status = EpisodeService.initial_status(episode)
+        
+        processed = 0
+        chunk = []
+        for student_id in student_ids:
+            chunk.append(EpisodeProgress(student_id=student_id, episode=episode, status=status))
+            if len(chunk) == chunk_size:
+                EpisodeProgress.objects.bulk_create(chunk, ignore_conflicts=True)
+                processed += len(chunk)
+                chunk = []
+        if chunk:
+            EpisodeProgress.objects.bulk_create(chunk, ignore_conflicts=True)
+            processed += len(chunk)
+        caching.bump_season(episode.season_id)
+        return processed
+    
+    @staticmethod
+    def ensure_progress(student, season):
+        """Create a student's missing progress rows for the season (lazy mode)"""
+        if not season or not EpisodeService.lazy_progress():
+            return
+        episodes = list(season.episodes.all())
+        existing = set(
+            EpisodeProgress.objects.filter(student=student, episode__season=season)
+            .values_list('episode_id', flat=True)
+        )
+        missing = [
+            EpisodeProgress(student=student, episode=episode, status=EpisodeService.initial_status(episode))
+            for episode in episodes if episode.id not in existing
+        ]
+        if missing:
+            EpisodeProgress.objects.bulk_create(missing, ignore_conflicts=True)
+    
     @staticmethod
     def mark_task_completed(student, episode, task_type):
         """
         Mark a specific task as completed in an episode
         Called by mentor approval
         """
+        EpisodeService.ensure_progress(student, episode.season)
         progress, created = EpisodeProgress.objects.get_or_create(
             student=student,
             episode=episode
@@ -58,15 +123,20 @@ class EpisodeService:
         return False, "Task marked complete"
     
     @staticmethod
-    def get_current_episode(student, season):
-        """Get the current active episode for student"""
+    def get_current_progress(student, season):
+        """Progress row (with its episode) of the student's current episode"""
+        EpisodeService.ensure_progress(student, season)
         # Find first non-completed episode
-        progress = EpisodeProgress.objects.filter(
+        return EpisodeProgress.objects.filter(
             student=student,
             episode__season=season,
             status__in=['unlocked', 'in_progress']
-        ).order_by('episode__episode_number').first()
-        
+        ).select_related('episode').order_by('episode__episode_number').first()
+    
+    @staticmethod
+    def get_current_episode(student, season):
+        """Get the current active episode for student"""
+        progress = EpisodeService.get_current_progress(student, season)
         return progress.episode if progress else None
     
     @staticmethod
@@ -137,25 +207,69 @@ class SeasonScoringService:
         
         return season_score, f"Season finalized! Score: {season_score.total_score}, Ascension: +{ascension_bonus}, Credits: {vault_credits}"
     
+    # Pillar -> (points per approved submission, pillar cap)
+    PILLAR_SCORING = {
+        'clt': (100, 100),
+        'iipc': (100, 200),
+        'cfc': (200, 800),
+    }
+    
+    @staticmethod
+    def _pillar_models(pillar):
+        """Submission models that count towards a pillar score"""
+        from apps.clt.models import CLTSubmission
+        from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
+        from apps.cfc.models import (
+            HackathonSubmission, BMCVideoSubmission,
+            GenAIProjectSubmission, InternshipSubmission
+        )
+        
+        return {
+            'clt': [CLTSubmission],
+            'iipc': [LinkedInPostVerification, LinkedInConnectionVerification],
+            'cfc': [
+                BMCVideoSubmission, GenAIProjectSubmission,
+                HackathonSubmission, InternshipSubmission
+            ],
+        }[pillar]
+    
+    @staticmethod
+    def _approved_counts(pillar, season, students):
+        """
+        Approved in-season submissions per user for a pillar
+        One grouped query per pillar model; `students` may be a list of ids
+        or a queryset of ids (used as a subquery)
+        
+        In season means created on a day from start_date through end_date
+        (inclusive). Comparing the datetime to the bare dates instead would
+        stop at midnight at the start of end_date and drop the last day.
+        """
+        counts = defaultdict(int)
+        for model in SeasonScoringService._pillar_models(pillar):
+            rows = model.objects.filter(
+                user_id__in=students,
+                status='approved',
+                created_at__date__gte=season.start_date,
+                created_at__date__lte=season.end_date
+            ).values('user_id').annotate(approved=Count('id'))
+            
+            for row in rows:
+                counts[row['user_id']] += row['approved']
+        return counts
+    
+    @staticmethod
+    def _pillar_score(pillar, approved_count):
+        points, cap = SeasonScoringService.PILLAR_SCORING[pillar]
+        return min(approved_count * points, cap)
+    
     @staticmethod
     def _calculate_clt_score(student, season):
         """
         CLT: 100 points
         AI Certification (course completion + recommendation)
         """
-        # Check for CLT submission in this season
-        from apps.clt.models import CLTSubmission
-        
-        approved_submissions = CLTSubmission.objects.filter(
-            user=student,
-            status='approved',
-            created_at__gte=season.start_date,
-            created_at__lte=season.end_date
-        ).count()
-        
-        if approved_submissions >= 1:
-            return 100
-        return 0
+        counts = SeasonScoringService._approved_counts('clt', season, [student.id])
+        return SeasonScoringService._pillar_score('clt', counts[student.id])
     
     @staticmethod
     def _calculate_iipc_score(student, season):
@@ -164,22 +278,8 @@ class SeasonScoringService:
         - LinkedIn Connect (100 points)
         - LinkedIn Post/Article (100 points)
         """
-        from apps.iipc.models import IIPCSubmission
-        
-        score = 0
-        
-        # Check for IIPC submissions
-        submissions = IIPCSubmission.objects.filter(
-            user=student,
-            status='approved',
-            created_at__gte=season.start_date,
-            created_at__lte=season.end_date
-        )
-        
-        # Simple scoring: 100 points per approved submission (max 2)
-        score = min(submissions.count() * 100, 200)
-        
-        return score
+        counts = SeasonScoringService._approved_counts('iipc', season, [student.id])
+        return SeasonScoringService._pillar_score('iipc', counts[student.id])
     
     @staticmethod
     def _calculate_scd_score(student, season):
@@ -200,23 +300,10 @@ class SeasonScoringService:
         - BMC Video (200)
         - GenAI Project (200)
         - Hackathon Participation (200)
-        - Patent/Journal (200)
+        - Internship (200)
         """
-        from apps.cfc.models import CFCSubmission
-        
-        score = 0
-        
-        submissions = CFCSubmission.objects.filter(
-            user=student,
-            status='approved',
-            created_at__gte=season.start_date,
-            created_at__lte=season.end_date
-        )
-        
-        # Award 200 points per submission, max 800
-        score = min(submissions.count() * 200, 800)
-        
-        return score
+        counts = SeasonScoringService._approved_counts('cfc', season, [student.id])
+        return SeasonScoringService._pillar_score('cfc', counts[student.id])
     
     @staticmethod
     def _calculate_outcome_score(student, season):
@@ -229,55 +316,260 @@ class SeasonScoringService:
         return 0
     
     @staticmethod
+    @transaction.atomic
+    def finalize_season_bulk(season, student_ids=None):
+        """
+        Finalize the season for every eligible student in one pass
+        
+        Same rules as finalize_season, but pillar scores come from grouped
+        aggregate queries, SeasonScore/LegacyScore rows are upserted in bulk,
+        Vault credits are applied with one set-based UPDATE per credit amount,
+        and the leaderboard is rebuilt once at the end.
+        
+        Returns a summary dict.
+        """
+        # Students with all 4 episodes completed
+        eligible = EpisodeProgress.objects.filter(
+            episode__season=season,
+            status='completed'
+        )
+        if student_ids is not None:
+            eligible = eligible.filter(student_id__in=student_ids)
+        eligible = eligible.values('student_id').annotate(
+            completed=Count('id')
+        ).filter(completed=4).values('student_id')
+        
+        already_finalized = set(
+            SeasonScore.objects.filter(
+                season=season,
+                season_completed=True,
+                student_id__in=eligible
+            ).values_list('student_id', flat=True)
+        )
+        to_finalize = [
+            row['student_id'] for row in eligible
+            if row['student_id'] not in already_finalized
+        ]
+        
+        summary = {
+            'finalized': len(to_finalize),
+            'already_finalized': len(already_finalized),
+            'credits_awarded': 0,
+            'ascension_bonuses': 0,
+        }
+        if not to_finalize:
+            return summary
+        
+        # Pillar scores: one grouped query per pillar model
+        pillar_counts = {
+            pillar: SeasonScoringService._approved_counts(pillar, season, to_finalize)
+            for pillar in SeasonScoringService.PILLAR_SCORING
+        }
+        
+        streaks = list(
+            SCDStreak.objects.filter(season=season, student_id__in=to_finalize).select_related('season')
+        )
+        for streak in streaks:
+            streak.streak_score = streak.compute_streak_score()
+        SCDStreak.objects.bulk_update(streaks, ['streak_score'], batch_size=500)
+        scd_scores = {streak.student_id: streak.streak_score for streak in streaks}
+        
+        now = timezone.now()
+        season_scores = []
+        for student_id in to_finalize:
+            score = SeasonScore(
+                student_id=student_id,
+                season=season,
+                clt_score=SeasonScoringService._pillar_score('clt', pillar_counts['clt'][student_id]),
+                iipc_score=SeasonScoringService._pillar_score('iipc', pillar_counts['iipc'][student_id]),
+                scd_score=scd_scores.get(student_id, 0),
+                cfc_score=SeasonScoringService._pillar_score('cfc', pillar_counts['cfc'][student_id]),
+                outcome_score=0,
+                season_completed=True,
+                completed_at=now,
+            )
+            score.total_score = (
+                score.clt_score + score.iipc_score + score.scd_score +
+                score.cfc_score + score.outcome_score
+            )
+            season_scores.append(score)
+        
+        SeasonScore.objects.bulk_create(
+            season_scores,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['student', 'season'],
+            update_fields=[
+                'clt_score', 'iipc_score', 'scd_score', 'cfc_score', 'outcome_score',
+                'total_score', 'season_completed', 'completed_at', 'updated_at'
+            ],
+        )
+        
+        # Legacy totals: same Ascension Bonus rule as LegacyScore.add_season_score
+        legacy_by_student = {
+            legacy.student_id: legacy
+            for legacy in LegacyScore.objects.filter(student_id__in=to_finalize)
+        }
+        legacy_rows = []
+        for score in season_scores:
+            legacy = legacy_by_student.get(score.student_id) or LegacyScore(student_id=score.student_id)
+            current = score.total_score
+            bonus = 5 if legacy.last_season_score > 0 and current > legacy.last_season_score else 0
+            
+            legacy.ascension_bonus_total += bonus
+            legacy.total_legacy_points += current + bonus
+            legacy.seasons_completed += 1
+            legacy.highest_season_score = max(legacy.highest_season_score, current)
+            legacy.last_season_score = current
+            legacy_rows.append(legacy)
+            summary['ascension_bonuses'] += 1 if bonus else 0
+        
+        new_legacy = [legacy for legacy in legacy_rows if legacy.pk is None]
+        existing_legacy = [legacy for legacy in legacy_rows if legacy.pk is not None]
+        for legacy in existing_legacy:
+            legacy.updated_at = now
+        
+        LegacyScore.objects.bulk_create(new_legacy, batch_size=500)
+        LegacyScore.objects.bulk_update(
+            existing_legacy,
+            [
+                'total_legacy_points', 'ascension_bonus_total', 'seasons_completed',
+                'highest_season_score', 'last_season_score', 'updated_at'
+            ],
+            batch_size=500,
+        )
+        
+        # Vault credits (1 credit per 10 points)
+        summary['credits_awarded'] = VaultService.credit_students(
+            {score.student_id: score.total_score // 10 for score in season_scores},
+            f"Season {season.season_number} completion",
+            now=now,
+        )
+        
+        # Single leaderboard rebuild for the whole batch
+        SeasonScoringService._update_leaderboard(season)
+        
+        return summary
+    
+    @staticmethod
+    def _percentile_bracket(percentile_value):
+        """Map a rank percentage (1-100) to a PercentileBracket choice"""
+        if percentile_value <= 10:
+            return 'top_10'
+        elif percentile_value <= 25:
+            return 'top_25'
+        elif percentile_value <= 50:
+            return 'top_50'
+        return 'below_50'
+    
+    @staticmethod
+    @transaction.atomic
     def _update_leaderboard(season):
         """
         Update Champions Podium - Top 3 only
         Calculate percentile brackets for others
-        """
-        # Get all completed season scores
-        completed_scores = SeasonScore.objects.filter(
-            season=season,
-            season_completed=True
-        ).order_by('-total_score')
         
-        # Clear existing leaderboard
-        LeaderboardEntry.objects.filter(season=season).delete()
-        PercentileBracket.objects.filter(season=season).delete()
+        Ranks every completed score in a single windowed query, then diffs the
+        result against the stored podium/brackets so only rows whose position
+        actually changed are written.
+        """
+        ranked_scores = list(
+            SeasonScore.objects.filter(
+                season=season,
+                season_completed=True
+            ).annotate(
+                score_rank=Window(
+                    expression=Rank(),
+                    order_by=F('total_score').desc()
+                ),
+                position=Window(
+                    expression=RowNumber(),
+                    order_by=[F('total_score').desc(), F('completed_at').asc(), F('id').asc()]
+                ),
+            ).values('student_id', 'total_score', 'score_rank', 'position')
+        )
+        total_count = len(ranked_scores)
+        
+        # Desired state: podium keyed by rank, brackets keyed by student
+        podium = {}
+        brackets = {}
+        for row in ranked_scores:
+            if row['position'] <= 3:
+                podium[row['position']] = row
+            else:
+                # Tied scores share a rank, so they always land in the same bracket
+                percentile_value = (row['score_rank'] / total_count) * 100
+                brackets[row['student_id']] = (
+                    SeasonScoringService._percentile_bracket(percentile_value),
+                    row['total_score'],
+                )
         
-        # Create top 3 leaderboard
-        for idx, score in enumerate(completed_scores[:3], start=1):
-            rank_title = 'Season Champion' if idx == 1 else 'Elite Runner'
-            LeaderboardEntry.objects.create(
+        # Podium: at most 3 rows, rewrite only the ranks that moved
+        existing_podium = {
+            entry.rank: entry
+            for entry in LeaderboardEntry.objects.filter(season=season)
+        }
+        stale_ranks = [
+            rank for rank, entry in existing_podium.items()
+            if rank not in podium
+            or entry.student_id != podium[rank]['student_id']
+            or entry.season_score != podium[rank]['total_score']
+        ]
+        if stale_ranks:
+            LeaderboardEntry.objects.filter(season=season, rank__in=stale_ranks).delete()
+        LeaderboardEntry.objects.bulk_create([
+            LeaderboardEntry(
                 season=season,
-                student=score.student,
-                rank=idx,
-                season_score=score.total_score,
-                rank_title=rank_title
+                student_id=row['student_id'],
+                rank=rank,
+                season_score=row['total_score'],
+                rank_title='Season Champion' if rank == 1 else 'Elite Runner'
             )
-        
-        # Calculate percentiles for others
-        total_count = completed_scores.count()
-        if total_count > 3:
-            for score in completed_scores[3:]:
-                # Calculate percentile
-                rank_position = list(completed_scores.values_list('id', flat=True)).index(score.id) + 1
-                percentile_value = (rank_position / total_count) * 100
-                
-                if percentile_value <= 10:
-                    percentile = 'top_10'
-                elif percentile_value <= 25:
-                    percentile = 'top_25'
-                elif percentile_value <= 50:
-                    percentile = 'top_50'
-                else:
-                    percentile = 'below_50'
-                
-                PercentileBracket.objects.create(
-                    student=score.student,
+            for rank, row in podium.items()
+            if rank not in existing_podium or rank in stale_ranks
+        ])
+        
+        # Percentile brackets: insert new, update moved, drop students no longer bracketed
+        existing_brackets = {
+            bracket.student_id: bracket
+            for bracket in PercentileBracket.objects.filter(season=season)
+        }
+        to_create = []
+        to_update = []
+        for student_id, (percentile, season_score) in brackets.items():
+            bracket = existing_brackets.get(student_id)
+            if bracket is None:
+                to_create.append(PercentileBracket(
+                    student_id=student_id,
                     season=season,
                     percentile=percentile,
-                    season_score=score.total_score
-                )
+                    season_score=season_score
+                ))
+            elif bracket.percentile != percentile or bracket.season_score != season_score:
+                bracket.percentile = percentile
+                bracket.season_score = season_score
+                to_update.append(bracket)
+        removed = [
+            bracket.id for student_id, bracket in existing_brackets.items()
+            if student_id not in brackets
+        ]
+        
+        if removed:
+            PercentileBracket.objects.filter(id__in=removed).delete()
+        PercentileBracket.objects.bulk_create(to_create, batch_size=500)
+        PercentileBracket.objects.bulk_update(
+            to_update, ['percentile', 'season_score'], batch_size=500
+        )
+        # Bulk writes skip the per-student overview signals
+        caching.bump_season(season.id)
+        
+        return {
+            'ranked': total_count,
+            'podium_changed': len(stale_ranks) + len(podium.keys() - existing_podium.keys()),
+            'brackets_created': len(to_create),
+            'brackets_updated': len(to_update),
+            'brackets_removed': len(removed),
+        }
 
 
 class LeetCodeSyncService:
@@ -286,18 +578,73 @@ class LeetCodeSyncService:
     Should be called by daily cron job
     """
     
+    GRAPHQL_URL = "https://leetcode.com/graphql"
+    
+    # matchedUser selection shared by the single and the batched streak query,
+    # so both read the same (current, rolling) userCalendar
+    STREAK_FIELDS = """
+            submitStats {
+                acSubmissionNum {
+                    difficulty
+                    count
+                }
+            }
+            profile {
+                ranking
+            }
+            userCalendar {
+                streak
+                totalActiveDays
+            }
+    """
+    
+    STREAK_QUERY = """
+    query userProfile($username: String!) {
+        matchedUser(username: $username) {%s}
+    }
+    """ % STREAK_FIELDS
+    
+    @staticmethod
+    def build_streak_batch_query(usernames):
+        """Aliased STREAK_QUERY for several users: (query, variables) with u0, u1, ..."""
+        declarations = [f'$u{index}: String!' for index in range(len(usernames))]
+        selections = [
+            f'u{index}: matchedUser(username: $u{index}) {{{LeetCodeSyncService.STREAK_FIELDS}}}'
+            for index in range(len(usernames))
+        ]
+        query = 'query userProfilesBatch(%s) {\n%s\n}' % (', '.join(declarations), '\n'.join(selections))
+        return query, {f'u{index}': username for index, username in enumerate(usernames)}
+    
+    @staticmethod
+    def get_leetcode_username(profile):
+        """LeetCode handle stored on a UserProfile"""
+        return getattr(profile, 'leetcode_username', None) or profile.leetcode_id
+    
+    @staticmethod
+    def apply_calendar(streak, calendar_data):
+        """Copy userCalendar data onto an SCDStreak (does not save)"""
+        current_streak = calendar_data.get('streak', 0)
+        
+        streak.current_streak = current_streak
+        if current_streak > streak.longest_streak:
+            streak.longest_streak = current_streak
+        
+        streak.total_days_active = calendar_data.get('totalActiveDays', 0)
+        streak.season_streak_days += 1  # Increment season days
+        streak.last_synced_at = timezone.now()
+    
     @staticmethod
     def sync_student_streak(student, season):
         """
         Sync LeetCode streak for a student
         Uses LeetCode GraphQL API
         """
-        import requests
+        from apps import http_client
         
         # Get student's LeetCode username
         try:
             profile = student.profile
-            leetcode_username = getattr(profile, 'leetcode_username', None)
+            leetcode_username = LeetCodeSyncService.get_leetcode_username(profile)
             if not leetcode_username:
                 return None, "No LeetCode username set"
         except:
@@ -310,33 +657,12 @@ class LeetCodeSyncService:
             defaults={'leetcode_username': leetcode_username}
         )
         
-        # Call LeetCode GraphQL API
-        url = "https://leetcode.com/graphql"
-        query = """
-        query userProfile($username: String!) {
-            matchedUser(username: $username) {
-                submitStats {
-                    acSubmissionNum {
-                        difficulty
-                        count
-                    }
-                }
-                profile {
-                    ranking
-                }
-                userCalendar {
-                    streak
-                    totalActiveDays
-                }
-            }
-        }
-        """
-        
         try:
-            response = requests.post(
-                url,
+            response = http_client.post(
+                'leetcode',
+                LeetCodeSyncService.GRAPHQL_URL,
                 json={
-                    'query': query,
+                    'query': LeetCodeSyncService.STREAK_QUERY,
                     'variables': {'username': leetcode_username}
                 },
                 timeout=10
@@ -347,18 +673,7 @@ class LeetCodeSyncService:
                 user_data = data.get('data', {}).get('matchedUser', {})
                 
                 if user_data:
-                    calendar_data = user_data.get('userCalendar', {})
-                    current_streak = calendar_data.get('streak', 0)
-                    total_active = calendar_data.get('totalActiveDays', 0)
-                    
-                    # Update streak record
-                    streak.current_streak = current_streak
-                    if current_streak > streak.longest_streak:
-                        streak.longest_streak = current_streak
-                    
-                    streak.total_days_active = total_active
-                    streak.season_streak_days += 1  # Increment season days
-                    streak.last_synced_at = timezone.now()
+                    LeetCodeSyncService.apply_calendar(streak, user_data.get('userCalendar') or {})
                     streak.save()
                     
                     return streak, "Streak synced successfully"
@@ -369,9 +684,21 @@ class LeetCodeSyncService:
             return None, f"Sync failed: {str(e)}"
     
     @staticmethod
-    def sync_all_students(season):
-        """Sync all students for a season - called by cron"""
-        students = User.objects.filter(profile__role='STUDENT')
+    def sync_all_students(season, workers=1, rate=None, batch_size=1):
+        """
+        Sync all students for a season - called by cron
+        
+        With workers > 1 or batch_size > 1 the LeetCode calls run on a
+        bounded thread pool sharing a token-bucket rate limiter, optionally
+        batching several students per request (see leetcode_sync.py)
+        """
+        if workers > 1 or batch_size > 1:
+            from .leetcode_sync import ConcurrentStreakSync
+            
+            sync = ConcurrentStreakSync(workers=workers, rate=rate, batch_size=batch_size)
+            return sync.run(season)
+        
+        students = User.objects.filter(profile__role='STUDENT').select_related('profile')
         results = {
             'success': 0,
             'failed': 0,
@@ -389,6 +716,66 @@ class LeetCodeSyncService:
         return results
 
 
+class VaultService:
+    """Set-based Vault credit payouts"""
+    
+    @staticmethod
+    @transaction.atomic
+    def credit_students(credits_by_student, reason, now=None):
+        """
+        Credit many wallets at once: {student_id: credits}
+        
+        Creates missing wallets, raises every balance in a single UPDATE
+        (one CASE over the distinct amounts) and appends the matching
+        'earn' transactions with bulk_create. Zero amounts are skipped, so
+        they neither create wallets nor log empty transactions. Returns the
+        credits awarded. Bulk writes skip the wallet signals - callers
+        paying out a season bump its cache version (finalize_season_bulk
+        does via the leaderboard rebuild).
+        """
+        credits_by_student = {
+            student_id: credits for student_id, credits in credits_by_student.items() if credits
+        }
+        if not credits_by_student:
+            return 0
+        now = now or timezone.now()
+        student_ids = list(credits_by_student)
+        
+        VaultWallet.objects.bulk_create(
+            [VaultWallet(student_id=student_id) for student_id in student_ids],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        
+        students_by_credits = defaultdict(list)
+        for student_id, credits in credits_by_student.items():
+            students_by_credits[credits].append(student_id)
+        amount = Case(
+            *[When(student_id__in=students, then=Value(credits))
+              for credits, students in students_by_credits.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        VaultWallet.objects.filter(student_id__in=student_ids).update(
+            available_credits=F('available_credits') + amount,
+            total_earned=F('total_earned') + amount,
+            updated_at=now,
+        )
+        
+        wallet_ids = VaultWallet.objects.filter(student_id__in=student_ids).values_list('student_id', 'id')
+        VaultTransaction.objects.bulk_create([
+            VaultTransaction(
+                wallet_id=wallet_id,
+                transaction_type='earn',
+                amount=credits_by_student[student_id],
+                reason=reason
+            )
+            for student_id, wallet_id in wallet_ids
+        ], batch_size=500)
+        
+        return sum(credits_by_student.values())
+
+
 class TitleService:
     """Handle title redemption"""
     
@@ -408,16 +795,20 @@ class TitleService:
         if wallet.available_credits < title.vault_credit_cost:
             return False, "Insufficient Vault Credits"
         
-        # Deduct credits
-        if wallet.spend_credits(title.vault_credit_cost, f"Redeemed title: {title.name}"):
-            # Create user title
-            user_title = UserTitle.objects.create(
-                student=student,
-                title=title
-            )
-            return True, f"Title '{title.name}' redeemed successfully!"
-        
-        return False, "Transaction failed"
+        # Deduct credits and grant the title together: the spend only applies
+        # if the balance still covers it, and a concurrent redemption of the
+        # same title rolls this one back on the unique (student, title)
+        try:
+            with transaction.atomic():
+                if not wallet.spend_credits(title.vault_credit_cost, f"Redeemed title: {title.name}"):
+                    return False, "Insufficient Vault Credits"
+                UserTitle.objects.create(
+                    student=student,
+                    title=title
+                )
+        except IntegrityError:
+            return False, "Title already owned"
+        return True, f"Title '{title.name}' redeemed successfully!"
     
     @staticmethod
     def equip_title(student, title):
@@ -1,17 +1,14 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.contrib.auth import get_user_model
-from .models import LegacyScore, VaultWallet, Season, Episode, EpisodeProgress
+from . import caching
+from .models import (
+    Season, Episode, EpisodeProgress, SeasonScore, LegacyScore, VaultWallet,
+    VaultTransaction, SCDStreak, LeaderboardEntry, PercentileBracket, Title, UserTitle
+)
 
-User = get_user_model()
-
-
-@receiver(post_save, sender=User)
-def create_gamification_records(sender, instance, created, **kwargs):
-    """Create LegacyScore and VaultWallet for new users"""
-    if created:
-        LegacyScore.objects.get_or_create(student=instance)
-        VaultWallet.objects.get_or_create(student=instance)
+# LegacyScore and VaultWallet are no longer created with each user: reads
+# use the unsaved defaults from records.py and the write paths create the
+# rows the first time they award points or credits.
 
 
 @receiver(post_save, sender=Season)
@@ -44,21 +41,38 @@ def create_episodes_for_season(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Episode)
 def initialize_student_episode_progress(sender, instance, created, **kwargs):
     """Create EpisodeProgress for all students when new episode is created"""
-    if created and instance.episode_number == 1:
-        # Only Episode 1 starts unlocked
-        students = User.objects.filter(profile__role='STUDENT')
-        for student in students:
-            EpisodeProgress.objects.create(
-                student=student,
-                episode=instance,
-                status='unlocked'
-            )
-    elif created:
-        # Episodes 2-4 start locked
-        students = User.objects.filter(profile__role='STUDENT')
-        for student in students:
-            EpisodeProgress.objects.create(
-                student=student,
-                episode=instance,
-                status='locked'
-            )
+    from .services import EpisodeService
+    
+    # Episode 1 starts unlocked, Episodes 2-4 locked (chunked bulk inserts).
+    # In lazy mode rows are created on each student's first access instead.
+    if created and not EpisodeService.lazy_progress():
+        EpisodeService.create_progress_for_students(instance)
+
+
+def _invalidate_seasons(sender, raw=False, **kwargs):
+    if not raw:
+        caching.invalidate()
+
+
+def _bump_student(sender, instance, raw=False, **kwargs):
+    if not raw:
+        caching.bump_student(instance.student_id)
+
+
+@receiver(post_save, sender=VaultTransaction)
+def _bump_wallet_owner(sender, instance, raw=False, **kwargs):
+    # Balances change through F() updates, which skip VaultWallet signals
+    if not raw:
+        caching.bump_student(instance.wallet.student_id)
+
+
+# Seasons, episodes and titles change the current season and every overview;
+# per-student rows only change their owner's cached overview
+for _model in (Season, Episode, Title):
+    post_save.connect(_invalidate_seasons, sender=_model, dispatch_uid=f'gamification_save_{_model.__name__}')
+    post_delete.connect(_invalidate_seasons, sender=_model, dispatch_uid=f'gamification_delete_{_model.__name__}')
+
+for _model in (EpisodeProgress, SeasonScore, LegacyScore, VaultWallet, SCDStreak,
+               LeaderboardEntry, PercentileBracket, UserTitle):
+    post_save.connect(_bump_student, sender=_model, dispatch_uid=f'gamification_overview_save_{_model.__name__}')
+    post_delete.connect(_bump_student, sender=_model, dispatch_uid=f'gamification_overview_delete_{_model.__name__}')
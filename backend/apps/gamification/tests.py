@@ -0,0 +1,676 @@
+import json
+import threading
+import time
+from datetime import date, timedelta
+from io import StringIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.clt.models import CLTSubmission
+from .models import (
+    Season, EpisodeProgress, SeasonScore, LegacyScore, VaultWallet,
+    SCDStreak, LeaderboardEntry, PercentileBracket, Title, UserTitle, VaultTransaction
+)
+from . import caching, records
+from .leetcode_sync import ConcurrentStreakSync, TokenBucket
+from .progress_notifications import ProgressNotificationService
+from .services import (
+    EpisodeService, LeetCodeSyncService, SeasonScoringService, TitleService, VaultService
+)
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'gamification-tests'}}
+
+
+class LeaderboardUpdateTests(TestCase):
+    """SeasonScoringService._update_leaderboard"""
+
+    def setUp(self):
+        self.season = Season.objects.create(
+            name='Season 1',
+            season_number=1,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+        )
+
+    def _complete(self, username, total):
+        student = User.objects.create(username=username)
+        return SeasonScore.objects.create(
+            student=student,
+            season=self.season,
+            total_score=total,
+            season_completed=True,
+            completed_at=timezone.now(),
+        )
+
+    def test_podium_and_brackets(self):
+        for i in range(20):
+            self._complete(f'student{i}', 1000 - i * 10)
+
+        SeasonScoringService._update_leaderboard(self.season)
+
+        podium = list(
+            LeaderboardEntry.objects.filter(season=self.season)
+            .order_by('rank').values_list('student__username', 'rank_title')
+        )
+        self.assertEqual(podium, [
+            ('student0', 'Season Champion'),
+            ('student1', 'Elite Runner'),
+            ('student2', 'Elite Runner'),
+        ])
+        brackets = dict(
+            PercentileBracket.objects.filter(season=self.season)
+            .values_list('student__username', 'percentile')
+        )
+        self.assertEqual(len(brackets), 17)
+        self.assertEqual(brackets['student3'], 'top_25')
+        self.assertEqual(brackets['student9'], 'top_50')
+        self.assertEqual(brackets['student19'], 'below_50')
+
+    def test_tied_scores_share_bracket(self):
+        for i in range(4):
+            self._complete(f'top{i}', 900)
+        for i in range(6):
+            self._complete(f'tied{i}', 500)
+
+        SeasonScoringService._update_leaderboard(self.season)
+
+        percentiles = set(
+            PercentileBracket.objects.filter(season=self.season, season_score=500)
+            .values_list('percentile', flat=True)
+        )
+        self.assertEqual(percentiles, {'top_50'})
+
+    def test_incremental_update_only_touches_changed_rows(self):
+        for i in range(10):
+            self._complete(f'student{i}', 500 + i)
+        SeasonScoringService._update_leaderboard(self.season)
+
+        summary = SeasonScoringService._update_leaderboard(self.season)
+        self.assertEqual(summary['podium_changed'], 0)
+        self.assertEqual(summary['brackets_created'], 0)
+        self.assertEqual(summary['brackets_updated'], 0)
+        self.assertEqual(summary['brackets_removed'], 0)
+
+        # A new champion pushes the old #3 out of the podium into a bracket
+        self._complete('newcomer', 1400)
+        summary = SeasonScoringService._update_leaderboard(self.season)
+        self.assertEqual(summary['podium_changed'], 3)
+        self.assertEqual(summary['brackets_created'], 1)
+        self.assertEqual(
+            LeaderboardEntry.objects.get(season=self.season, rank=1).student.username,
+            'newcomer'
+        )
+        self.assertFalse(
+            PercentileBracket.objects.filter(
+                season=self.season, student__username='newcomer'
+            ).exists()
+        )
+
+
+class EpisodeProgressFanOutTests(TestCase):
+    """EpisodeProgress rows for a new season"""
+
+    def setUp(self):
+        self.students = [User.objects.create(username=f'student{i}') for i in range(7)]
+        self.today = timezone.now().date()
+
+    def _create_season(self, number=1):
+        return Season.objects.create(
+            name=f'Season {number}', season_number=number,
+            start_date=self.today, end_date=self.today + timedelta(days=30),
+        )
+
+    def test_bulk_fan_out(self):
+        EpisodeService.PROGRESS_CHUNK_SIZE, chunk_size = 3, EpisodeService.PROGRESS_CHUNK_SIZE
+        try:
+            # Per episode: 1 insert + 1 student id read + 3 progress chunks
+            with self.assertNumQueries(1 + 4 * 5):
+                season = self._create_season()
+        finally:
+            EpisodeService.PROGRESS_CHUNK_SIZE = chunk_size
+
+        statuses = EpisodeProgress.objects.filter(episode__season=season).values_list(
+            'episode__episode_number', 'status'
+        )
+        self.assertEqual(len(statuses), 28)
+        self.assertEqual({number for number, status in statuses if status == 'unlocked'}, {1})
+
+        # Existing rows are kept
+        EpisodeProgress.objects.filter(student=self.students[0]).update(status='completed')
+        EpisodeService.create_progress_for_students(season.episodes.get(episode_number=2))
+        self.assertEqual(EpisodeProgress.objects.filter(status='completed').count(), 4)
+
+    @override_settings(GAMIFICATION_LAZY_EPISODE_PROGRESS=True)
+    def test_lazy_progress_on_first_access(self):
+        season = self._create_season()
+        self.assertFalse(EpisodeProgress.objects.exists())
+
+        current = EpisodeService.get_current_episode(self.students[0], season)
+        self.assertEqual(current.episode_number, 1)
+        self.assertEqual(EpisodeProgress.objects.filter(student=self.students[0]).count(), 4)
+        self.assertEqual(EpisodeProgress.objects.count(), 4)
+
+    def test_update_seasons_creates_next_season(self):
+        self._create_season()
+        call_command('update_seasons', '--create-next', stdout=StringIO())
+        season = Season.objects.get(season_number=2)
+        self.assertEqual(season.episodes.count(), 4)
+        self.assertEqual(EpisodeProgress.objects.filter(episode__season=season).count(), 28)
+
+    def test_benchmark_rolls_back(self):
+        out = StringIO()
+        call_command('benchmark_season_creation', '--sizes', '5', '--per-row', stdout=out)
+        self.assertIn('48', out.getvalue())  # 12 students x 4 episodes
+        self.assertEqual(Season.objects.count(), 0)
+        self.assertEqual(User.objects.count(), 7)
+
+
+class GamificationRecordsTests(TestCase):
+    """Read-only accessors for the per-student gamification rows"""
+
+    def setUp(self):
+        self.student = User.objects.create(username='student')
+        today = timezone.now().date()
+        self.season = Season.objects.create(
+            name='Season 1', season_number=1, is_active=True,
+            start_date=today, end_date=today + timedelta(days=30),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def test_new_users_get_no_rows(self):
+        self.assertFalse(LegacyScore.objects.exists())
+        self.assertFalse(VaultWallet.objects.exists())
+
+    def test_load_defaults_in_one_query(self):
+        with self.assertNumQueries(1):
+            loaded = records.load(self.student, self.season)
+
+        for name in ('season_score', 'legacy_score', 'vault_wallet', 'scd_streak'):
+            self.assertIsNone(loaded[name].pk, name)
+        self.assertEqual(loaded['season_score'].season, self.season)
+        self.assertIsNone(loaded['leaderboard_entry'])
+        self.assertIsNone(loaded['percentile'])
+        self.assertIsNone(loaded['equipped_title'])
+
+    def test_load_stored_rows(self):
+        other = Season.objects.create(
+            name='Season 2', season_number=2,
+            start_date=self.season.end_date + timedelta(days=1),
+            end_date=self.season.end_date + timedelta(days=31),
+        )
+        SeasonScore.objects.create(student=self.student, season=other, total_score=10)
+        score = SeasonScore.objects.create(student=self.student, season=self.season, total_score=700)
+        VaultWallet.objects.create(student=self.student).add_credits(70, 'Season 1 completion')
+        title = Title.objects.create(name='Runner', description='', vault_credit_cost=10)
+        UserTitle.objects.create(student=self.student, title=title, is_equipped=True)
+
+        with self.assertNumQueries(1):
+            loaded = records.load(self.student, self.season)
+            self.assertEqual(loaded['equipped_title'].title.name, 'Runner')
+
+        self.assertEqual(loaded['season_score'].pk, score.pk)
+        self.assertEqual(loaded['vault_wallet'].available_credits, 70)
+        self.assertIsNone(loaded['legacy_score'].pk)
+
+    def test_student_overview_does_not_write(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/gamification/dashboard/student_overview/')
+
+        self.assertEqual(response.status_code, 200)
+        writes = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].split(' ', 1)[0] in ('INSERT', 'UPDATE', 'DELETE')
+        ]
+        self.assertEqual(writes, [])
+        self.assertEqual(response.data['vault_wallet']['available_credits'], 0)
+        self.assertEqual(response.data['vault_wallet']['recent_transactions'], [])
+        self.assertEqual(response.data['season_score']['total_score'], 0)
+        self.assertEqual(response.data['leaderboard_position'], 'Not Ranked')
+        for model in (SeasonScore, LegacyScore, VaultWallet, SCDStreak):
+            self.assertFalse(model.objects.exists(), model.__name__)
+
+    def test_first_write_persists(self):
+        self.client.get('/api/gamification/vault-wallets/my_wallet/')
+        self.assertFalse(VaultWallet.objects.exists())
+
+        EpisodeProgress.objects.filter(student=self.student).update(status='completed')
+        SeasonScoringService.finalize_season(self.student, self.season)
+
+        self.assertTrue(LegacyScore.objects.filter(student=self.student).exists())
+        response = self.client.get('/api/gamification/vault-wallets/my_wallet/')
+        self.assertIsNotNone(response.data['id'])
+        self.assertEqual(len(response.data['recent_transactions']), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class StudentOverviewCacheTests(TestCase):
+    """Current season memo and the versioned student overview cache"""
+
+    url = '/api/gamification/dashboard/student_overview/'
+
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create(username='student')
+        today = timezone.now().date()
+        self.season = Season.objects.create(
+            name='Season 1', season_number=1, is_active=True,
+            start_date=today, end_date=today + timedelta(days=30),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def test_current_season_reloads_after_change(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(caching.current_season(), self.season)
+            self.assertEqual(caching.current_season(), self.season)
+
+        self.season.is_active = False
+        self.season.save()
+        self.assertIsNone(caching.current_season())
+
+    def test_current_season_memo_expires_without_a_bump(self):
+        caching.current_season()
+        # Another worker's change: no version bump reaches this process
+        Season.objects.filter(pk=self.season.pk).update(is_active=False)
+        self.assertEqual(caching.current_season(), self.season)
+
+        with override_settings(GAMIFICATION_SEASON_MEMO_TTL=0):
+            self.assertIsNone(caching.current_season())
+
+    def test_overview_queries_and_cache(self):
+        VaultWallet.objects.create(student=self.student).add_credits(30, 'Bonus')
+        SeasonScore.objects.create(student=self.student, season=self.season, total_score=300)
+
+        # Season, current progress, gamification rows, wallet transactions
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['current_episode']['episode_number'], 1)
+        self.assertEqual(response.data['season_score']['season_name'], 'Season 1')
+        self.assertEqual(response.data['vault_wallet']['available_credits'], 30)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).data, response.data)
+
+        score = SeasonScore.objects.get(student=self.student)
+        score.total_score = 450
+        score.save()
+        self.assertEqual(self.client.get(self.url).data['season_score']['total_score'], 450)
+
+    def test_bulk_leaderboard_rebuild_invalidates(self):
+        self.assertEqual(self.client.get(self.url).data['leaderboard_position'], 'Not Ranked')
+
+        # Rows written without signals, then the bulk rebuild bumps the season
+        SeasonScore.objects.bulk_create([SeasonScore(
+            student=self.student, season=self.season, total_score=900,
+            season_completed=True, completed_at=timezone.now(),
+        )])
+        self.assertEqual(self.client.get(self.url).data['leaderboard_position'], 'Not Ranked')
+        SeasonScoringService._update_leaderboard(self.season)
+        self.assertEqual(
+            self.client.get(self.url).data['leaderboard_position'], 'Rank 1 - Season Champion'
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BatchStatisticsTests(TestCase):
+    """Cached per-season completion distribution"""
+
+    def setUp(self):
+        cache.clear()
+        self.students = [User.objects.create(username=f'student{i}') for i in range(4)]
+        today = timezone.now().date()
+        self.season = Season.objects.create(
+            name='Season 1', season_number=1, is_active=True,
+            start_date=today, end_date=today + timedelta(days=30),
+        )
+        progress = EpisodeProgress.objects.filter(episode__season=self.season)
+        tasks = ProgressNotificationService.EPISODE_TASKS
+        # 2/11 tasks (the extra SRI flag is not required in episode 1)
+        progress.filter(student=self.students[0], episode__episode_number=1).update(
+            clt_completed=True, scd_streak_active=True, sri_completed=True,
+        )
+        # 5/11 and 11/11
+        for number in (1, 2):
+            progress.filter(student=self.students[1], episode__episode_number=number).update(
+                **{task: True for task in tasks[number]}
+            )
+        for number, episode_tasks in tasks.items():
+            progress.filter(student=self.students[2], episode__episode_number=number).update(
+                **{task: True for task in episode_tasks}
+            )
+
+    def test_batch_statistics(self):
+        stats = ProgressNotificationService.get_batch_statistics(self.season)
+        self.assertEqual(stats['total_students'], 4)
+        self.assertEqual(stats['average_progress'], 40.9)
+        self.assertEqual(
+            (stats['high_performers'], stats['moderate_performers'], stats['low_performers']), (1, 1, 2)
+        )
+
+    def test_comparison_reads_only_the_students_rows(self):
+        ProgressNotificationService.get_batch_statistics(self.season)
+
+        with self.assertNumQueries(1):
+            comparison = ProgressNotificationService.get_student_comparison(self.students[1], self.season)
+        self.assertEqual(comparison['student_progress'], 45.5)
+        self.assertEqual(comparison['percentile_rank'], 50.0)
+        self.assertEqual(comparison['category'], 'on_track')
+
+        # The student's own progress is live; the distribution is reused until it expires
+        EpisodeProgress.objects.filter(student=self.students[3], episode__episode_number=1).update(
+            clt_completed=True, scd_streak_active=True,
+        )
+        comparison = ProgressNotificationService.get_student_comparison(self.students[3], self.season)
+        self.assertEqual(comparison['student_progress'], 18.2)
+        self.assertEqual(comparison['percentile_rank'], 25.0)
+
+    @override_settings(GAMIFICATION_LAZY_EPISODE_PROGRESS=True)
+    def test_students_without_rows_count(self):
+        newcomer = User.objects.create(username='newcomer')
+        self.assertFalse(EpisodeProgress.objects.filter(student=newcomer).exists())
+
+        stats = ProgressNotificationService.get_batch_statistics(self.season)
+        self.assertEqual(stats['total_students'], 5)
+        self.assertEqual(stats['low_performers'], 3)
+
+        mentor = User.objects.create(username='mentor')
+        mentor.profile.role = 'MENTOR'
+        mentor.profile.save()
+        client = APIClient()
+        client.force_authenticate(mentor)
+        response = client.get(f'/api/gamification/mentor/student-progress/{newcomer.id}/')
+        self.assertEqual(len(response.data['episode_progress']), 4)
+        self.assertEqual(response.data['episode_progress'][0]['status'], 'unlocked')
+
+    def test_my_comparison_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.students[2])
+        response = client.get('/api/gamification/progress-notifications/my_comparison/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['percentile_rank'], 75.0)
+        self.assertEqual(response.data['category'], 'ahead')
+
+
+class VaultLedgerTests(TestCase):
+    """Vault balances change through F() updates; transactions are the ledger"""
+
+    def setUp(self):
+        self.students = [User.objects.create(username=f'student{i}') for i in range(3)]
+        self.wallet = VaultWallet.objects.create(student=self.students[0])
+
+    def test_stale_instances_do_not_lose_updates(self):
+        other = VaultWallet.objects.get(pk=self.wallet.pk)
+        self.wallet.add_credits(30, 'Season 1 completion')
+        other.add_credits(20, 'Bonus')
+        self.assertEqual(other.available_credits, 50)
+
+        # Both copies still think they hold enough for a 40 credit spend
+        self.assertTrue(self.wallet.spend_credits(40, 'Title'))
+        self.assertFalse(other.spend_credits(40, 'Title'))
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(
+            (self.wallet.available_credits, self.wallet.total_earned, self.wallet.total_spent), (10, 50, 40)
+        )
+        self.assertEqual(
+            list(self.wallet.transactions.order_by('id').values_list('transaction_type', 'amount')),
+            [('earn', 30), ('earn', 20), ('spend', 40)],
+        )
+
+    def test_redeem_title(self):
+        title = Title.objects.create(name='Runner', description='', vault_credit_cost=25)
+        self.assertEqual(TitleService.redeem_title(self.students[0], title)[0], False)
+
+        self.wallet.add_credits(60)
+        self.assertTrue(TitleService.redeem_title(self.students[0], title)[0])
+        self.assertEqual(TitleService.redeem_title(self.students[0], title), (False, 'Title already owned'))
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.available_credits, 35)
+
+    def test_credit_students_is_set_based(self):
+        self.wallet.add_credits(5)
+        zero = User.objects.create(username='no-points')
+        credits = {self.students[0].id: 10, self.students[1].id: 10, self.students[2].id: 7, zero.id: 0}
+
+        # Wallet inserts, one UPDATE, wallet ids, transaction inserts (+ savepoint)
+        with self.assertNumQueries(6):
+            awarded = VaultService.credit_students(credits, 'Season 1 completion')
+
+        self.assertEqual(awarded, 27)
+        self.assertEqual(
+            dict(VaultWallet.objects.values_list('student_id', 'available_credits')),
+            {self.students[0].id: 15, self.students[1].id: 10, self.students[2].id: 7},
+        )
+        self.assertEqual(VaultTransaction.objects.filter(reason='Season 1 completion').count(), 3)
+
+    def test_credit_students_skips_zero_amounts(self):
+        awarded = VaultService.credit_students({self.students[0].id: 0, self.students[1].id: 0}, 'Nothing')
+        self.assertEqual(awarded, 0)
+        self.assertFalse(VaultTransaction.objects.filter(reason='Nothing').exists())
+        self.assertFalse(VaultWallet.objects.filter(student=self.students[1]).exists())
+
+
+class FinalizeSeasonBulkTests(TestCase):
+    """SeasonScoringService.finalize_season_bulk"""
+
+    def setUp(self):
+        today = timezone.now().date()
+        self.students = [User.objects.create(username=f'student{i}') for i in range(5)]
+        self.season = Season.objects.create(
+            name='Season 1',
+            season_number=1,
+            start_date=today,
+            end_date=today,
+        )
+        # First four students complete every episode
+        EpisodeProgress.objects.filter(
+            student__in=self.students[:4]
+        ).update(status='completed')
+        for student in self.students[:2]:
+            CLTSubmission.objects.create(
+                user=student,
+                title='Course',
+                description='Course',
+                platform='Coursera',
+                completion_date=today,
+                status='approved',
+            )
+
+    def test_finalizes_eligible_students_once(self):
+        summary = SeasonScoringService.finalize_season_bulk(self.season)
+
+        self.assertEqual(summary['finalized'], 4)
+        scores = dict(
+            SeasonScore.objects.filter(season=self.season, season_completed=True)
+            .values_list('student__username', 'total_score')
+        )
+        self.assertEqual(scores, {
+            'student0': 100, 'student1': 100, 'student2': 0, 'student3': 0,
+        })
+        self.assertEqual(
+            LegacyScore.objects.get(student=self.students[0]).total_legacy_points, 100
+        )
+        self.assertEqual(
+            VaultWallet.objects.get(student=self.students[0]).available_credits, 10
+        )
+        self.assertEqual(LeaderboardEntry.objects.filter(season=self.season).count(), 3)
+        self.assertEqual(PercentileBracket.objects.filter(season=self.season).count(), 1)
+
+        # Re-running is a no-op
+        summary = SeasonScoringService.finalize_season_bulk(self.season)
+        self.assertEqual(summary['finalized'], 0)
+        self.assertEqual(summary['already_finalized'], 4)
+        self.assertEqual(
+            VaultWallet.objects.get(student=self.students[0]).available_credits, 10
+        )
+
+    def test_restricts_to_student_ids(self):
+        summary = SeasonScoringService.finalize_season_bulk(
+            self.season, student_ids=[self.students[0].id, self.students[4].id]
+        )
+        self.assertEqual(summary['finalized'], 1)
+
+    def test_matches_single_student_finalize(self):
+        SeasonScoringService.finalize_season(self.students[1], self.season)
+        SeasonScoringService.finalize_season_bulk(self.season)
+
+        single = SeasonScore.objects.get(student=self.students[1], season=self.season)
+        bulk = SeasonScore.objects.get(student=self.students[0], season=self.season)
+        self.assertEqual(single.total_score, bulk.total_score)
+
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+    """Local LeetCode stand-in: rate-limits the first call per username"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        variables = body['variables']
+        server = self.server
+
+        # Single-user queries use $username, batched ones alias $u0, $u1, ...
+        if 'username' in variables:
+            aliases = {'matchedUser': variables['username']}
+        else:
+            aliases = {key: value for key, value in variables.items() if key.startswith('u')}
+
+        with server.lock:
+            server.request_times.append(time.monotonic())
+            server.queries.append(body['query'])
+            first_call = not server.seen.issuperset(aliases.values())
+            server.seen.update(aliases.values())
+
+        if first_call and any(name.startswith('throttled') for name in aliases.values()):
+            payload, status_code = {'errors': ['slow down']}, 429
+        elif list(aliases.values()) == ['garbled']:
+            payload, status_code = ['not', 'an', 'object'], 200
+        else:
+            calendar = {'userCalendar': {'streak': 7, 'totalActiveDays': 30}}
+            payload = {'data': {
+                alias: None if name == 'ghost' else 'garbled' if name == 'garbled' else calendar
+                for alias, name in aliases.items()
+            }}
+            status_code = 200
+
+        data = json.dumps(payload).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConcurrentStreakSyncTests(TestCase):
+    """ConcurrentStreakSync against a local stub GraphQL server"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubGraphQLHandler)
+        self.server.lock = threading.Lock()
+        self.server.request_times = []
+        self.server.queries = []
+        self.server.seen = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/graphql'
+
+        today = timezone.now().date()
+        self.season = Season.objects.create(
+            name='Season 1', season_number=1, start_date=today, end_date=today
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _student(self, username, leetcode_id):
+        student = User.objects.create(username=username)
+        student.profile.leetcode_id = leetcode_id
+        student.profile.save()
+        return student
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+    def test_run_syncs_retries_and_reports(self):
+        for i in range(6):
+            self._student(f'student{i}', f'coder{i}')
+        self._student('slowpoke', 'throttled1')
+        self._student('missing', 'ghost')
+        self._student('nohandle', None)
+
+        sync = ConcurrentStreakSync(
+            workers=4, rate=40, burst=4, backoff_base=0.01, url=self.url
+        )
+        results = sync.run(self.season)
+
+        self.assertEqual(results['success'], 7)
+        self.assertEqual(results['failed'], 2)
+        self.assertEqual(results['failures_by_cause'], {'no_username': 1, 'user_not_found': 1})
+        self.assertGreater(results['latency_p95_ms'], 0)
+        self.assertEqual(
+            SCDStreak.objects.filter(season=self.season, current_streak=7).count(), 7
+        )
+
+        # 9 requests (8 users + one 429 retry) at 40/s with a burst of 4
+        times = self.server.request_times
+        self.assertEqual(len(times), 9)
+        self.assertGreaterEqual(times[-1] - times[0], (9 - 4) / 40 * 0.9)
+
+    def test_batched_run_uses_aliased_queries(self):
+        for i in range(9):
+            self._student(f'student{i}', f'coder{i}')
+        self._student('slowpoke', 'throttled1')
+        self._student('missing', 'ghost')
+
+        sync = ConcurrentStreakSync(
+            workers=2, rate=100, burst=10, backoff_base=0.01, url=self.url, batch_size=5
+        )
+        results = sync.run(self.season)
+
+        self.assertEqual(results['success'], 10)
+        self.assertEqual(results['failures_by_cause'], {'user_not_found': 1})
+        # 3 batches of up to 5 users, plus one retry for the throttled batch
+        self.assertEqual(len(self.server.request_times), 4)
+
+        # Same calendar selection as the single-user query
+        calendar = 'userCalendar {'
+        self.assertIn(calendar, LeetCodeSyncService.STREAK_QUERY)
+        self.assertTrue(all(query.count(calendar) == query.count('matchedUser') for query in self.server.queries))
+        self.assertNotIn('userCalendar(', ''.join(self.server.queries))
+
+    def test_malformed_replies_only_fail_their_users(self):
+        for i in range(3):
+            self._student(f'student{i}', f'coder{i}')
+        self._student('garbled', 'garbled')
+
+        for batch_size in (1, 2):
+            results = ConcurrentStreakSync(workers=2, url=self.url, batch_size=batch_size).run(self.season)
+            self.assertEqual(results['success'], 3)
+            self.assertEqual(results['failures_by_cause'], {'invalid_response': 1})
+        self.assertEqual(SCDStreak.objects.filter(season=self.season).count(), 3)
+        self.assertLessEqual(results['requests_per_second'], results['students_per_second'])
+
+    def test_runs_share_one_session(self):
+        first = ConcurrentStreakSync(workers=2, url=self.url)
+        second = ConcurrentStreakSync(workers=4, url=self.url)
+        self.assertIs(first.session, second.session)
+
+        # Starting another sync must not close the pool of one in progress
+        self._student('student0', 'coder0')
+        self.assertEqual(first.run(self.season)['success'], 1)
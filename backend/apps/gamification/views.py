@@ -2,6 +2,8 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
@@ -17,6 +19,7 @@ from .serializers import (
     UserTitleSerializer, PercentileBracketSerializer, StudentDashboardSerializer
 )
 from .services import EpisodeService, TitleService, LeetCodeSyncService
+from . import caching, records
 from .progress_notifications import ProgressNotificationService
 
 
@@ -68,6 +71,8 @@ class EpisodeProgressViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
+        if EpisodeService.lazy_progress():
+            EpisodeService.ensure_progress(self.request.user, caching.current_season())
         return EpisodeProgress.objects.filter(student=self.request.user)
     
     def perform_create(self, serializer):
@@ -76,23 +81,16 @@ class EpisodeProgressViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current episode progress"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
-        current_episode = EpisodeService.get_current_episode(request.user, current_season)
-        if not current_episode:
+        progress = EpisodeService.get_current_progress(request.user, current_season)
+        if not progress:
             return Response({'detail': 'No active episode'}, status=status.HTTP_404_NOT_FOUND)
         
-        progress = EpisodeProgress.objects.filter(
-            student=request.user,
-            episode=current_episode
-        ).first()
-        
-        if progress:
-            serializer = self.get_serializer(progress)
-            return Response(serializer.data)
-        return Response({'detail': 'Progress not found'}, status=status.HTTP_404_NOT_FOUND)
+        serializer = self.get_serializer(progress)
+        return Response(serializer.data)
 
 
 class SeasonScoreViewSet(viewsets.ReadOnlyModelViewSet):
@@ -108,14 +106,11 @@ class SeasonScoreViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current season score"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
-        score, created = SeasonScore.objects.get_or_create(
-            student=request.user,
-            season=current_season
-        )
+        score = records.season_score(request.user, current_season)
         
         serializer = self.get_serializer(score)
         return Response(serializer.data)
@@ -134,7 +129,7 @@ class LegacyScoreViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def my_score(self, request):
         """Get authenticated user's legacy score"""
-        score, created = LegacyScore.objects.get_or_create(student=request.user)
+        score = records.legacy_score(request.user)
         serializer = self.get_serializer(score)
         return Response(serializer.data)
 
@@ -152,7 +147,7 @@ class VaultWalletViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def my_wallet(self, request):
         """Get authenticated user's wallet"""
-        wallet, created = VaultWallet.objects.get_or_create(student=request.user)
+        wallet = records.vault_wallet(request.user)
         serializer = self.get_serializer(wallet)
         return Response(serializer.data)
 
@@ -170,14 +165,11 @@ class SCDStreakViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current season streak"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
-        streak, created = SCDStreak.objects.get_or_create(
-            student=request.user,
-            season=current_season
-        )
+        streak = records.scd_streak(request.user, current_season)
         
         serializer = self.get_serializer(streak)
         return Response(serializer.data)
@@ -185,7 +177,7 @@ class SCDStreakViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['post'])
     def sync(self, request):
         """Manually trigger streak sync"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -217,7 +209,7 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def current_season(self, request):
         """Get current season's top 3 (for students)"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -228,7 +220,7 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def full_leaderboard(self, request):
         """Get full leaderboard (for mentors and floor wings)"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -253,7 +245,7 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def my_position(self, request):
         """Get user's position (rank or percentile)"""
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -360,37 +352,24 @@ class DashboardViewSet(viewsets.ViewSet):
         user = request.user
         
         # Get current season
-        current_season = Season.objects.filter(is_active=True).first()
+        current_season = caching.current_season()
         if not current_season:
             return Response({'detail': 'No active season'}, status=status.HTTP_404_NOT_FOUND)
         
-        # Get current episode
-        current_episode = EpisodeService.get_current_episode(user, current_season)
+        # Versioned per student and season: scoring, progress and season changes start a new key
+        cache_key = caching.overview_key(user.id, current_season.id)
+        cached_data = cache.get(cache_key)
+        if cached_data:
+            return Response(cached_data)
         
-        # Get progress
-        episode_progress = None
-        if current_episode:
-            episode_progress = EpisodeProgress.objects.filter(
-                student=user,
-                episode=current_episode
-            ).first()
+        # Get current episode and its progress
+        episode_progress = EpisodeService.get_current_progress(user, current_season)
+        current_episode = episode_progress.episode if episode_progress else None
         
-        # Get scores
-        season_score, _ = SeasonScore.objects.get_or_create(student=user, season=current_season)
-        legacy_score, _ = LegacyScore.objects.get_or_create(student=user)
-        vault_wallet, _ = VaultWallet.objects.get_or_create(student=user)
-        scd_streak, _ = SCDStreak.objects.get_or_create(student=user, season=current_season)
-        
-        # Get leaderboard position
-        leaderboard_entry = LeaderboardEntry.objects.filter(
-            season=current_season,
-            student=user
-        ).first()
-        
-        percentile = PercentileBracket.objects.filter(
-            season=current_season,
-            student=user
-        ).first()
+        # Get scores, leaderboard rows and title in one query (unsaved defaults, no writes)
+        student_records = records.load(user, current_season)
+        leaderboard_entry = student_records['leaderboard_entry']
+        percentile = student_records['percentile']
         
         leaderboard_position = "Not Ranked"
         if leaderboard_entry:
@@ -399,7 +378,7 @@ class DashboardViewSet(viewsets.ViewSet):
             leaderboard_position = percentile.get_percentile_display()
         
         # Get equipped title
-        equipped_title_obj = UserTitle.objects.filter(student=user, is_equipped=True).first()
+        equipped_title_obj = student_records['equipped_title']
         equipped_title = equipped_title_obj.title.name if equipped_title_obj else None
         
         # Compile dashboard data
@@ -407,15 +386,17 @@ class DashboardViewSet(viewsets.ViewSet):
             'current_season': SeasonSerializer(current_season).data,
             'current_episode': EpisodeSerializer(current_episode).data if current_episode else None,
             'episode_progress': EpisodeProgressSerializer(episode_progress).data if episode_progress else None,
-            'season_score': SeasonScoreSerializer(season_score).data,
-            'legacy_score': LegacyScoreSerializer(legacy_score).data,
-            'vault_wallet': VaultWalletSerializer(vault_wallet).data,
-            'scd_streak': SCDStreakSerializer(scd_streak).data,
+            'season_score': SeasonScoreSerializer(student_records['season_score']).data,
+            'legacy_score': LegacyScoreSerializer(student_records['legacy_score']).data,
+            'vault_wallet': VaultWalletSerializer(student_records['vault_wallet']).data,
+            'scd_streak': SCDStreakSerializer(student_records['scd_streak']).data,
             'leaderboard_position': leaderboard_position,
             'percentile': PercentileBracketSerializer(percentile).data if percentile else None,
             'equipped_title': equipped_title,
         }
         
+        cache.set(cache_key, dashboard_data, settings.GAMIFICATION_OVERVIEW_CACHE_TTL)
+        
         return Response(dashboard_data)
 
 
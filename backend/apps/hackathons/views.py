@@ -2,7 +2,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-import requests
+from apps import http_client
 from datetime import datetime
 from bs4 import BeautifulSoup
 
@@ -76,7 +76,8 @@ class HackathonListView(APIView):
         hackathons = []
         try:
             # Scrape Devpost's public hackathons page
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://devpost.com/hackathons',
                 params={'status[]': 'open'},
                 timeout=10,
@@ -129,7 +130,8 @@ class HackathonListView(APIView):
         hackathons = []
         try:
             # MLH Events page
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://mlh.io/seasons/2026/events',
                 timeout=10,
                 headers={
@@ -189,7 +191,8 @@ class HackathonListView(APIView):
         hackathons = []
         try:
             # Devfolio public API
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://api.devfolio.co/api/search/hackathons',
                 params={'status': 'UPCOMING'},
                 timeout=10,
@@ -75,6 +75,20 @@ def health_check(request):
             'message': 'Caching not enabled'
         }
     
+    # Analytics summary drift (from recompute_analytics --validate logs)
+    if settings.USE_ANALYTICS_SUMMARY:
+        from apps.analytics_summary.validation import drift_rate
+        drift = drift_rate()
+        drifted = drift['drift_rate'] > settings.ANALYTICS_DRIFT_THRESHOLD
+        if drifted and health_status['status'] == 'healthy':
+            health_status['status'] = 'degraded'
+        health_status['checks']['analytics_summary'] = {
+            'status': 'degraded' if drifted else 'up',
+            'drift_rate': round(drift['drift_rate'], 4),
+            'checked_24h': drift['checked'],
+            'mismatched_24h': drift['mismatched'],
+        }
+
     # Response time
     response_time_ms = int((time.time() - start_time) * 1000)
     health_status['response_time_ms'] = response_time_ms
@@ -145,3 +159,19 @@ def liveness_check(request):
         'alive': True,
         'timestamp': timezone.now().isoformat()
     })
+
+
+def upstream_metrics(request):
+    """
+    Outbound HTTP metrics endpoint: /health/upstreams/
+    
+    Per third-party upstream (leetcode, github, youtube, hackathons, linkedin):
+    request/error counts, connection reuse ratio and latency histogram
+    since process start. See apps/http_client.py.
+    """
+    from apps import http_client
+    
+    return JsonResponse({
+        'upstreams': http_client.metrics(),
+        'timestamp': timezone.now().isoformat()
+    })
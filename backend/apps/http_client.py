@@ -0,0 +1,183 @@
+"""
+Outbound HTTP Client
+
+Shared keep-alive sessions for every third-party integration (LeetCode,
+GitHub, YouTube, Devpost/MLH, LinkedIn). One session per upstream keeps
+TCP+TLS connections alive between calls instead of handshaking on every
+module-level requests.get/post.
+
+Usage:
+    from apps import http_client
+
+    response = http_client.get('github', f'https://api.github.com/repos/{owner}/{repo}')
+    response = http_client.post('leetcode', url, json=payload)
+
+    http_client.metrics()   # per-upstream requests, reuse ratio, latency histogram
+
+Configuration (settings.OUTBOUND_HTTP):
+    POOL_CONNECTIONS - host pools kept per upstream
+    POOL_MAXSIZE     - keep-alive connections per host
+    TIMEOUT          - default (connect, read) timeout in seconds
+    MAX_RETRIES      - retries for connection errors and 429/5xx responses
+    BACKOFF_FACTOR   - urllib3 exponential backoff factor
+    UPSTREAMS        - per-upstream overrides of the keys above
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+DEFAULTS = {
+    'POOL_CONNECTIONS': 10,
+    'POOL_MAXSIZE': 10,
+    'TIMEOUT': (5, 10),
+    'MAX_RETRIES': 2,
+    'BACKOFF_FACTOR': 0.5,
+    'RETRY_STATUSES': (429, 500, 502, 503, 504),
+    # Idempotent methods only; upstreams whose POSTs are reads opt in
+    'RETRY_METHODS': ('HEAD', 'GET', 'OPTIONS'),
+}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def get_config(upstream):
+    """Effective client settings for an upstream"""
+    configured = getattr(settings, 'OUTBOUND_HTTP', {})
+    config = dict(DEFAULTS)
+    config.update({key: value for key, value in configured.items() if key != 'UPSTREAMS'})
+    config.update(configured.get('UPSTREAMS', {}).get(upstream, {}))
+    return config
+
+
+class UpstreamMetrics:
+    """Thread-safe counters for one upstream"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_total_ms = 0.0
+
+    def record(self, elapsed_ms, failed=False):
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.errors += 1
+            self.latency_total_ms += elapsed_ms
+            self.latency_buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+
+class UpstreamSession(requests.Session):
+    """
+    requests.Session with pooled keep-alive connections, a default timeout,
+    a urllib3 retry policy and per-upstream metrics
+    """
+
+    def __init__(self, upstream):
+        super().__init__()
+        self.upstream = upstream
+        self.config = get_config(upstream)
+        self.metrics = UpstreamMetrics()
+
+        retry = Retry(
+            total=self.config['MAX_RETRIES'],
+            backoff_factor=self.config['BACKOFF_FACTOR'],
+            status_forcelist=self.config['RETRY_STATUSES'],
+            allowed_methods=frozenset(self.config['RETRY_METHODS']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=self.config['POOL_CONNECTIONS'],
+            pool_maxsize=self.config['POOL_MAXSIZE'],
+            max_retries=retry,
+        )
+        self.mount('https://', self.adapter)
+        self.mount('http://', self.adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.config['TIMEOUT'])
+        started = time.monotonic()
+        failed = True
+        try:
+            response = super().request(method, url, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.metrics.record((time.monotonic() - started) * 1000, failed=failed)
+
+    def connection_stats(self):
+        """Requests served vs. connections opened by the live host pools"""
+        container = self.adapter.poolmanager.pools
+        pools = [container[key] for key in container.keys() if key in container]
+        return {
+            'pool_requests': sum(pool.num_requests for pool in pools),
+            'connections_opened': sum(pool.num_connections for pool in pools),
+        }
+
+
+def get_session(upstream):
+    """Shared session for an upstream (created on first use)"""
+    session = _sessions.get(upstream)
+    if session is None:
+        with _lock:
+            session = _sessions.get(upstream)
+            if session is None:
+                session = _sessions[upstream] = UpstreamSession(upstream)
+    return session
+
+
+def request(upstream, method, url, **kwargs):
+    return get_session(upstream).request(method, url, **kwargs)
+
+
+def get(upstream, url, **kwargs):
+    return request(upstream, 'GET', url, **kwargs)
+
+
+def post(upstream, url, **kwargs):
+    return request(upstream, 'POST', url, **kwargs)
+
+
+def metrics():
+    """Per-upstream request counts, connection reuse ratio and latency histogram"""
+    snapshot = {}
+    for upstream, session in list(_sessions.items()):
+        stats = session.metrics
+        connections = session.connection_stats()
+        pool_requests = connections['pool_requests']
+        reused = max(pool_requests - connections['connections_opened'], 0)
+
+        buckets = {f'le_{bound}ms': count for bound, count in zip(LATENCY_BUCKETS_MS, stats.latency_buckets)}
+        buckets['le_inf'] = stats.latency_buckets[-1]
+
+        snapshot[upstream] = {
+            'requests': stats.requests,
+            'errors': stats.errors,
+            'connections_opened': connections['connections_opened'],
+            'reuse_ratio': round(reused / pool_requests, 3) if pool_requests else 0.0,
+            'avg_latency_ms': round(stats.latency_total_ms / stats.requests, 1) if stats.requests else 0.0,
+            'latency_histogram': buckets,
+        }
+    return snapshot
+
+
+def close_all():
+    """Close every pooled connection (tests, worker shutdown)"""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -3,9 +3,10 @@ LinkedIn OAuth Integration Service
 Handles LinkedIn Sign In and profile data fetching
 """
 import os
-import requests
 from urllib.parse import urlencode
 
+from apps import http_client
+
 
 class LinkedInOAuthService:
     """Service for LinkedIn OAuth 2.0 authentication"""
@@ -64,7 +65,8 @@ class LinkedInOAuthService:
             'client_secret': self.client_secret,
         }
         
-        response = requests.post(
+        response = http_client.post(
+            'linkedin',
             self.ACCESS_TOKEN_URL,
             data=data,
             headers={'Content-Type': 'application/x-www-form-urlencoded'}
@@ -87,7 +89,7 @@ class LinkedInOAuthService:
             'Authorization': f'Bearer {access_token}',
         }
         
-        response = requests.get(self.PROFILE_URL, headers=headers)
+        response = http_client.get('linkedin', self.PROFILE_URL, headers=headers)
         response.raise_for_status()
         
         profile_data = response.json()
@@ -3,8 +3,15 @@ Mentor-specific views for reviewing student submissions across all pillars
 This file consolidates mentor review APIs for: CFC, CLT, SRI, IIPC, SCD
 """
 
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db.models import Q, Count, Case, When, Value, IntegerField
+from django.db.models import Q, F, Count, Max, Case, When, Value, IntegerField, CharField
+from django.db.models.functions import Cast, Coalesce, Concat, NullIf
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -25,11 +32,210 @@ from apps.iipc.serializers import LinkedInPostVerificationSerializer
 from apps.scd.models import LeetCodeProfile
 from apps.scd.serializers import LeetCodeProfileSerializer
 from apps.dashboard.models import Notification, Message, MessageThread
+from apps.analytics_summary.models import SubmissionIndex
 from apps.dashboard.notifications_serializers import (
     NotificationSerializer, MessageSerializer, MessageThreadSerializer, MessageCreateSerializer
 )
 
 
+# Submission sources shown in the mentor dashboard feed:
+# (pillar, model type, model, title expression)
+FEED_SOURCES = [
+    ('cfc', 'hackathon', HackathonSubmission, F('hackathon_name')),
+    ('cfc', 'bmc', BMCVideoSubmission, Value('BMC Video Submission')),
+    ('cfc', 'internship', InternshipSubmission, Concat(Value('Internship at '), F('company'))),
+    ('cfc', 'genai', GenAIProjectSubmission, Value('GenAI Project')),
+    ('clt', 'clt', CLTSubmission, F('title')),
+    ('iipc', 'linkedin', LinkedInPostVerification, Value('LinkedIn Post')),
+]
+
+FEED_COLUMNS = [
+    'feed_id', 'feed_pillar', 'feed_model_type', 'feed_title', 'feed_status',
+    'feed_user_id', 'feed_username', 'feed_first_name', 'feed_last_name', 'feed_email',
+    'feed_sort_at', 'feed_created_at',
+]
+
+
+def recent_submission_feed(user_ids, limit=20):
+    """
+    Latest submissions across FEED_SOURCES for the given users
+    Builds one UNION ALL query ordered by submitted_at (or created_at) and
+    limited in the database; `user_ids` may be a list or a values() subquery
+    """
+    branches = []
+    for pillar, model_type, model, title in FEED_SOURCES:
+        branches.append(
+            model.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .annotate(
+                feed_id=F('id'),
+                feed_pillar=Value(pillar, output_field=CharField()),
+                feed_model_type=Value(model_type, output_field=CharField()),
+                feed_title=Cast(title, output_field=CharField()),
+                feed_status=F('status'),
+                feed_user_id=F('user_id'),
+                feed_username=F('user__username'),
+                feed_first_name=F('user__first_name'),
+                feed_last_name=F('user__last_name'),
+                feed_email=F('user__email'),
+                feed_sort_at=Coalesce('submitted_at', 'created_at'),
+                feed_created_at=F('created_at'),
+            )
+            .values(*FEED_COLUMNS)
+        )
+    first, *rest = branches
+    return first.union(*rest, all=True).order_by('-feed_sort_at')[:limit]
+
+
+def indexed_submission_feed(mentor, limit=20):
+    """recent_submission_feed served from SubmissionIndex (USE_SUBMISSION_INDEX)"""
+    return (
+        SubmissionIndex.objects
+        .filter(mentor=mentor, model_type__in=[model_type for _, model_type, _, _ in FEED_SOURCES])
+        .order_by('-sort_at')
+        .annotate(
+            feed_id=F('source_id'),
+            feed_pillar=F('pillar'),
+            feed_model_type=F('model_type'),
+            feed_title=F('title'),
+            feed_status=F('status'),
+            feed_user_id=F('user_id'),
+            feed_username=F('user__username'),
+            feed_first_name=F('user__first_name'),
+            feed_last_name=F('user__last_name'),
+            feed_email=F('user__email'),
+            feed_sort_at=F('sort_at'),
+            feed_created_at=F('created_at'),
+        )
+        .values(*FEED_COLUMNS)[:limit]
+    )
+
+
+# Submission sources reviewed through get_pillar_submissions:
+# model type -> (pillar, model, title expression, description expression)
+REVIEW_SOURCES = {
+    'hackathon': (
+        'cfc', HackathonSubmission,
+        F('hackathon_name'),
+        Concat(F('mode'), Value(' hackathon participation')),
+    ),
+    'bmc': (
+        'cfc', BMCVideoSubmission,
+        Value('Business Model Canvas Video'),
+        Coalesce(NullIf(F('description'), Value('')), Value('BMC video submission')),
+    ),
+    'internship': (
+        'cfc', InternshipSubmission,
+        Concat(Value('Internship at '), F('company')),
+        F('role'),
+    ),
+    'genai': (
+        'cfc', GenAIProjectSubmission,
+        Value('GenAI Project'),
+        F('problem_statement'),
+    ),
+    'clt': (
+        'clt', CLTSubmission,
+        F('title'),
+        F('description'),
+    ),
+    'linkedin': (
+        'iipc', LinkedInPostVerification,
+        Value('LinkedIn Post Verification'),
+        Concat(Value('Post from '), Cast('post_date', output_field=CharField())),
+    ),
+    'leetcode': (
+        'scd', LeetCodeProfile,
+        Concat(Value('LeetCode Profile - '), F('leetcode_username')),
+        Concat(Value('Total solved: '), Cast('total_solved', output_field=CharField())),
+    ),
+}
+
+PILLAR_MODEL_TYPES = {
+    'cfc': ['hackathon', 'bmc', 'internship', 'genai'],
+    'clt': ['clt'],
+    'iipc': ['linkedin'],
+    'scd': ['leetcode'],
+    'all': list(REVIEW_SOURCES),
+}
+
+REVIEW_PAGE_SIZE = 50
+REVIEW_MAX_PAGE_SIZE = 200
+
+
+def _union(querysets):
+    first, *rest = querysets
+    return first.union(*rest, all=True) if rest else first
+
+
+def _review_ordering(newest_first):
+    fields = ['review_sort_at', 'review_model_type', 'review_id']
+    return [f'-{field}' for field in fields] if newest_first else fields
+
+
+def _review_branches(model_types, user_ids, status_values, search, cursor_key=None, newest_first=True):
+    """
+    One keys-only queryset per model type, ready to UNION ALL
+    Rows are (review_id, review_model_type, review_sort_at); the keyset
+    condition for `cursor_key` is applied per branch because a combined
+    query can't be filtered
+    """
+    branches = []
+    for model_type in model_types:
+        _, model, title, description = REVIEW_SOURCES[model_type]
+        qs = model.objects.filter(user_id__in=user_ids).order_by().annotate(
+            review_id=F('id'),
+            review_model_type=Value(model_type, output_field=CharField()),
+            review_sort_at=Coalesce('submitted_at', 'created_at'),
+        )
+        if status_values:
+            qs = qs.filter(status__in=status_values)
+        if search:
+            qs = qs.annotate(
+                review_name=Concat(F('user__first_name'), Value(' '), F('user__last_name')),
+                review_title=Cast(title, output_field=CharField()),
+                review_description=Cast(description, output_field=CharField()),
+            ).filter(
+                Q(review_name__icontains=search)
+                | Q(user__username__icontains=search)
+                | Q(review_title__icontains=search)
+                | Q(review_description__icontains=search)
+            )
+        if cursor_key:
+            qs = qs.filter(_after_cursor(model_type, cursor_key, newest_first))
+        branches.append(qs.values('review_id', 'review_model_type', 'review_sort_at'))
+    return branches
+
+
+def _after_cursor(model_type, cursor_key, newest_first):
+    """Rows of `model_type` strictly after the cursor in (sort_at, model_type, id) order"""
+    sort_at, cursor_type, cursor_id = cursor_key
+    past = 'lt' if newest_first else 'gt'
+    beyond_sort = Q(**{f'review_sort_at__{past}': sort_at})
+    at_sort = Q(review_sort_at=sort_at)
+
+    if model_type == cursor_type:
+        return beyond_sort | (at_sort & Q(**{f'id__{past}': cursor_id}))
+    type_is_past = model_type < cursor_type if newest_first else model_type > cursor_type
+    return beyond_sort | at_sort if type_is_past else beyond_sort
+
+
+def _encode_review_cursor(key):
+    raw = json.dumps([key['review_sort_at'].isoformat(), key['review_model_type'], key['review_id']])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_review_cursor(cursor):
+    try:
+        sort_at, model_type, submission_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        sort_at = datetime.fromisoformat(sort_at)
+    except (TypeError, ValueError, binascii.Error):
+        raise ValueError('Invalid cursor')
+    if model_type not in REVIEW_SOURCES or not isinstance(submission_id, int):
+        raise ValueError('Invalid cursor')
+    return sort_at, model_type, submission_id
+
+
 # Helper function to check if user is a mentor
 def is_mentor(user):
     """Check if user has mentor privileges"""
@@ -53,10 +259,11 @@ def get_mentor_dashboard(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    # Get mentor's assigned students
-    assigned_students = request.user.mentored_students.all().values_list('user_id', flat=True)
+    # Get mentor's assigned students (kept as a subquery)
+    assigned_students = request.user.mentored_students.values('user_id')
+    total_students = assigned_students.count()
     
-    if not assigned_students:
+    if not total_students:
         return Response({
             'recent_submissions': [],
             'stats': {
@@ -67,87 +274,64 @@ def get_mentor_dashboard(request):
             }
         })
     
-    # Get recent submissions (last 20) from all pillars
-    recent_submissions = []
+    # Get recent submissions (last 20) from all pillars, sorted and limited
+    # in the database: one SubmissionIndex query, or one UNION ALL
+    use_index = getattr(settings, 'USE_SUBMISSION_INDEX', False)
+    if use_index:
+        feed = indexed_submission_feed(request.user, limit=20)
+    else:
+        feed = recent_submission_feed(assigned_students, limit=20)
     
-    # Helper to add submission with common format
-    def add_submission(sub, pillar_type, model_type, title_getter):
-        return {
-            'id': f"{pillar_type}_{model_type}_{sub.id}",
-            'dbId': sub.id,
-            'modelType': model_type,
-            'pillar': pillar_type,
-            'title': title_getter(sub),
+    recent_submissions = []
+    for row in feed:
+        full_name = f"{row['feed_first_name']} {row['feed_last_name']}".strip()
+        recent_submissions.append({
+            'id': f"{row['feed_pillar']}_{row['feed_model_type']}_{row['feed_id']}",
+            'dbId': row['feed_id'],
+            'modelType': row['feed_model_type'],
+            'pillar': row['feed_pillar'],
+            'title': row['feed_title'],
             'student': {
-                'id': sub.user.id,
-                'name': sub.user.get_full_name() or sub.user.username,
-                'email': sub.user.email,
+                'id': row['feed_user_id'],
+                'name': full_name or row['feed_username'],
+                'email': row['feed_email'],
             },
-            'status': sub.status,
-            'submitted_at': sub.submitted_at or sub.created_at,
-            'created_at': sub.created_at,
-        }
-    
-    # Get submissions from each pillar (only assigned students)
-    hackathons = HackathonSubmission.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in hackathons:
-        recent_submissions.append(add_submission(sub, 'cfc', 'hackathon', lambda s: s.hackathon_name))
-    
-    bmc_videos = BMCVideoSubmission.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in bmc_videos:
-        recent_submissions.append(add_submission(sub, 'cfc', 'bmc', lambda s: "BMC Video Submission"))
-    
-    internships = InternshipSubmission.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in internships:
-        recent_submissions.append(add_submission(sub, 'cfc', 'internship', lambda s: f"Internship at {s.company}"))
-    
-    genai = GenAIProjectSubmission.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in genai:
-        recent_submissions.append(add_submission(sub, 'cfc', 'genai', lambda s: "GenAI Project"))
-    
-    clt = CLTSubmission.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in clt:
-        recent_submissions.append(add_submission(sub, 'clt', 'clt', lambda s: s.title))
-    
-    linkedin = LinkedInPostVerification.objects.filter(user_id__in=assigned_students).select_related('user')
-    for sub in linkedin:
-        recent_submissions.append(add_submission(sub, 'iipc', 'linkedin', lambda s: "LinkedIn Post"))
-    
-    # Sort by submission date (most recent first) and limit to 20
-    recent_submissions.sort(key=lambda x: x['submitted_at'], reverse=True)
-    recent_submissions = recent_submissions[:20]
+            'status': row['feed_status'],
+            'submitted_at': row['feed_sort_at'],
+            'created_at': row['feed_created_at'],
+        })
     
-    # Calculate stats
+    # Calculate stats: one conditional aggregate over the index, or one per model
     today = timezone.now().date()
     pending_statuses = ['draft', 'submitted', 'under_review', 'pending']
+    stat_aggregates = {
+        'total': Count('id'),
+        'pending': Count('id', filter=Q(status__in=pending_statuses)),
+        'approved_today': Count('id', filter=Q(status='approved', reviewed_at__date=today)),
+    }
     
-    total_submissions = (
-        hackathons.count() + bmc_videos.count() + internships.count() + 
-        genai.count() + clt.count() + linkedin.count()
-    )
-    
-    pending_reviews = (
-        hackathons.filter(status__in=pending_statuses).count() +
-        bmc_videos.filter(status__in=pending_statuses).count() +
-        internships.filter(status__in=pending_statuses).count() +
-        genai.filter(status__in=pending_statuses).count() +
-        clt.filter(status__in=pending_statuses).count() +
-        linkedin.filter(status__in=pending_statuses).count()
-    )
+    if use_index:
+        sources = [SubmissionIndex.objects.filter(
+            mentor=request.user,
+            model_type__in=[model_type for _, model_type, _, _ in FEED_SOURCES],
+        )]
+    else:
+        sources = [
+            model.objects.filter(user_id__in=assigned_students)
+            for _, _, model, _ in FEED_SOURCES
+        ]
     
-    approved_today = (
-        hackathons.filter(status='approved', reviewed_at__date=today).count() +
-        bmc_videos.filter(status='approved', reviewed_at__date=today).count() +
-        internships.filter(status='approved', reviewed_at__date=today).count() +
-        genai.filter(status='approved', reviewed_at__date=today).count() +
-        clt.filter(status='approved', reviewed_at__date=today).count() +
-        linkedin.filter(status='verified', verified_at__date=today).count()
-    )
+    total_submissions = pending_reviews = approved_today = 0
+    for queryset in sources:
+        counts = queryset.aggregate(**stat_aggregates)
+        total_submissions += counts['total']
+        pending_reviews += counts['pending']
+        approved_today += counts['approved_today']
     
     return Response({
         'recent_submissions': recent_submissions,
         'stats': {
-            'total_students': len(assigned_students),
+            'total_students': total_students,
             'pending_reviews': pending_reviews,
             'approved_today': approved_today,
             'total_submissions': total_submissions
@@ -164,9 +348,11 @@ def get_pillar_submissions(request, pillar):
     Pillars: cfc, clt, iipc, scd, all (sri not implemented yet)
     Query params:
         - status: filter by status (pending, approved, rejected, all)
-        - search: search by student name or title
+        - search: search by student name, title or description
         - year: filter by student year
         - sort: latest or oldest
+        - cursor: next_cursor from the previous page
+        - page_size: submissions per page (default 50, max 200)
     """
     # Check if user is mentor
     if not is_mentor(request.user):
@@ -177,12 +363,17 @@ def get_pillar_submissions(request, pillar):
     
     # Get query parameters
     status_filter = request.GET.get('status', 'all')
-    search_query = request.GET.get('search', '')
+    search_query = request.GET.get('search', '').strip()
     year_filter = request.GET.get('year', 'all')
     sort_order = request.GET.get('sort', 'latest')
     student_id = request.GET.get('student_id', None)  # NEW: Filter by specific student
+    cursor = request.GET.get('cursor') or None
+    try:
+        page_size = min(max(int(request.GET.get('page_size', REVIEW_PAGE_SIZE)), 1), REVIEW_MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        page_size = REVIEW_PAGE_SIZE
     
-    submissions = []
+    empty_page = {'submissions': [], 'total': 0, 'next_cursor': None, 'has_more': False}
     
     # Map status filters
     status_map = {
@@ -193,28 +384,28 @@ def get_pillar_submissions(request, pillar):
     }
     
     status_values = status_map.get(status_filter, None)
+    model_types = PILLAR_MODEL_TYPES.get(pillar)
+    if not model_types:
+        # SRI not implemented yet
+        return Response(empty_page)
     
-    print(f"\n=== BACKEND: Fetching submissions for pillar='{pillar}', status='{status_filter}', student_id='{student_id}' ===")
-    
-    # Get mentor's assigned students
-    assigned_students = request.user.mentored_students.all().values_list('user_id', flat=True)
-    if not assigned_students:
-        print(f"⚠️ Mentor {request.user.username} has no assigned students")
-        return Response({'submissions': [], 'total': 0})
+    # Get mentor's assigned students (kept as a subquery)
+    assigned_students = request.user.mentored_students.values('user_id')
     
     # If student_id is provided, only show that student's submissions
     if student_id:
         try:
             student_id = int(student_id)
-            if student_id not in assigned_students:
-                print(f"⚠️ Student {student_id} is not assigned to mentor {request.user.username}")
-                return Response({'submissions': [], 'total': 0})
+            if not assigned_students.filter(user_id=student_id).exists():
+                return Response(empty_page)
             assigned_students = [student_id]
-            print(f"🎯 Filtering for specific student: {student_id}")
         except (ValueError, TypeError):
             pass
     
-    print(f"👥 Showing submissions for {len(assigned_students)} student(s)")
+    try:
+        cursor_key = _decode_review_cursor(cursor) if cursor else None
+    except ValueError:
+        return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
     
     # Helper function to format submission data
     def format_submission(sub, pillar_type, model_type):
@@ -237,8 +428,6 @@ def get_pillar_submissions(request, pillar):
         else:
             frontend_status = 'pending'
         
-        print(f"   📊 {model_type} #{sub.id}: DB status='{actual_status}' → frontend='{frontend_status}'")
-        
         # Get title based on model type
         title = ''
         description = ''
@@ -314,110 +503,41 @@ def get_pillar_submissions(request, pillar):
             'reviewedAt': getattr(sub, 'reviewed_at', None),
         }
     
-    # Get submissions based on pillar - FIXED: Use if-elif-else for proper isolation
-    # FILTER BY ASSIGNED STUDENTS ONLY
-    if pillar == 'all':
-        # Get ALL submissions from all pillars (only from assigned students)
-        cfc_qs = HackathonSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        bmc_qs = BMCVideoSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        internship_qs = InternshipSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        genai_qs = GenAIProjectSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        
-        if status_values:
-            cfc_qs = cfc_qs.filter(status__in=status_values)
-            bmc_qs = bmc_qs.filter(status__in=status_values)
-            internship_qs = internship_qs.filter(status__in=status_values)
-            genai_qs = genai_qs.filter(status__in=status_values)
-        
-        submissions.extend([format_submission(s, 'cfc', 'hackathon') for s in cfc_qs])
-        submissions.extend([format_submission(s, 'cfc', 'bmc') for s in bmc_qs])
-        submissions.extend([format_submission(s, 'cfc', 'internship') for s in internship_qs])
-        submissions.extend([format_submission(s, 'cfc', 'genai') for s in genai_qs])
-        
-        clt_qs = CLTSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            clt_qs = clt_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'clt', 'clt') for s in clt_qs])
-        
-        iipc_qs = LinkedInPostVerification.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            iipc_qs = iipc_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'iipc', 'linkedin') for s in iipc_qs])
-        
-        scd_qs = LeetCodeProfile.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            scd_qs = scd_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'scd', 'leetcode') for s in scd_qs])
-    
-    elif pillar == 'cfc':
-        # Get ONLY CFC submissions (from assigned students)
-        cfc_qs = HackathonSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        bmc_qs = BMCVideoSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        internship_qs = InternshipSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        genai_qs = GenAIProjectSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        
-        if status_values:
-            cfc_qs = cfc_qs.filter(status__in=status_values)
-            bmc_qs = bmc_qs.filter(status__in=status_values)
-            internship_qs = internship_qs.filter(status__in=status_values)
-            genai_qs = genai_qs.filter(status__in=status_values)
-        
-        submissions.extend([format_submission(s, 'cfc', 'hackathon') for s in cfc_qs])
-        submissions.extend([format_submission(s, 'cfc', 'bmc') for s in bmc_qs])
-        submissions.extend([format_submission(s, 'cfc', 'internship') for s in internship_qs])
-        submissions.extend([format_submission(s, 'cfc', 'genai') for s in genai_qs])
-    
-    elif pillar == 'clt':
-        # Get ONLY CLT submissions (from assigned students)
-        clt_qs = CLTSubmission.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            clt_qs = clt_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'clt', 'clt') for s in clt_qs])
-    
-    elif pillar == 'iipc':
-        # Get ONLY IIPC submissions (from assigned students)
-        iipc_qs = LinkedInPostVerification.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            iipc_qs = iipc_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'iipc', 'linkedin') for s in iipc_qs])
-    
-    elif pillar == 'scd':
-        # Get ONLY SCD submissions (from assigned students)
-        scd_qs = LeetCodeProfile.objects.select_related('user').filter(user_id__in=assigned_students)
-        if status_values:
-            scd_qs = scd_qs.filter(status__in=status_values)
-        submissions.extend([format_submission(s, 'scd', 'leetcode') for s in scd_qs])
-    
-    # SRI not implemented yet
-    
-    # Apply search filter
-    if search_query:
-        search_lower = search_query.lower()
-        submissions = [
-            s for s in submissions 
-            if search_lower in s['student']['name'].lower() 
-            or search_lower in s['title'].lower()
-            or search_lower in s['description'].lower()
-        ]
-    
-    # Sort submissions
-    if sort_order == 'latest':
-        submissions.sort(key=lambda x: x['submittedDate'], reverse=True)
-    else:
-        submissions.sort(key=lambda x: x['submittedDate'])
-    
-    # Debug logging
-    print(f"\n=== BACKEND: Returning {len(submissions)} submissions for pillar '{pillar}' ===")
-    if submissions:
-        pillar_counts = {}
-        for s in submissions:
-            p = s['pillar']
-            pillar_counts[p] = pillar_counts.get(p, 0) + 1
-        print(f"Pillar breakdown: {pillar_counts}")
+    # Filter, search, order and paginate in the database; only the page's
+    # rows are loaded as model instances
+    newest_first = sort_order != 'oldest'
+    branches = _review_branches(model_types, assigned_students, status_values, search_query)
+    total = _union(branches).count()
+    
+    page_keys = list(
+        _union(_review_branches(
+            model_types, assigned_students, status_values, search_query,
+            cursor_key=cursor_key, newest_first=newest_first
+        )).order_by(*_review_ordering(newest_first))[:page_size + 1]
+    )
+    has_more = len(page_keys) > page_size
+    page_keys = page_keys[:page_size]
+    
+    ids_by_type = {}
+    for key in page_keys:
+        ids_by_type.setdefault(key['review_model_type'], []).append(key['review_id'])
+    instances = {}
+    for model_type, ids in ids_by_type.items():
+        pillar_type, model = REVIEW_SOURCES[model_type][:2]
+        for sub in model.objects.select_related('user').filter(id__in=ids):
+            instances[(model_type, sub.id)] = format_submission(sub, pillar_type, model_type)
+    
+    submissions = [
+        instances[(key['review_model_type'], key['review_id'])]
+        for key in page_keys
+        if (key['review_model_type'], key['review_id']) in instances
+    ]
     
     return Response({
         'submissions': submissions,
-        'total': len(submissions)
+        'total': total,
+        'next_cursor': _encode_review_cursor(page_keys[-1]) if has_more else None,
+        'has_more': has_more,
     })
 
 
@@ -675,6 +795,26 @@ def get_submission_detail(request, pillar, submission_type, submission_id):
     return Response(serializer.data)
 
 
+def _grouped_submission_stats(model, user_ids):
+    """
+    Per-student counts for one submission model in a single GROUP BY query
+    Returns {user_id: {count, approved, in_progress, pending, last}}
+    """
+    rows = (
+        model.objects.filter(user_id__in=user_ids)
+        .order_by()
+        .values('user_id')
+        .annotate(
+            count=Count('id'),
+            approved=Count('id', filter=Q(status='approved')),
+            in_progress=Count('id', filter=Q(status__in=['draft', 'submitted', 'under_review'])),
+            pending=Count('id', filter=Q(status='pending')),
+            last=Max('created_at'),
+        )
+    )
+    return {row.pop('user_id'): row for row in rows}
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_mentor_students(request):
@@ -689,32 +829,43 @@ def get_mentor_students(request):
     
     # Get mentor's assigned students
     assigned_students = request.user.mentored_students.all().select_related('user')
+    student_ids = request.user.mentored_students.values('user_id')
+    
+    # Per-student pillar stats: one grouped aggregate per model, keyed by user_id
+    clt_by_user = _grouped_submission_stats(CLTSubmission, student_ids)
+    cfc_by_user = [
+        _grouped_submission_stats(model, student_ids)
+        for model in (HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission)
+    ]
+    iipc_by_user = _grouped_submission_stats(LinkedInPostVerification, student_ids)
+    
+    # Latest LeetCode profile per student
+    leetcode_by_user = {}
+    for leetcode_profile in LeetCodeProfile.objects.filter(user_id__in=student_ids).only(
+        'user_id', 'monthly_problems_count', 'total_solved', 'last_synced', 'created_at'
+    ).order_by('user_id', '-created_at'):
+        leetcode_by_user.setdefault(leetcode_profile.user_id, leetcode_profile)
+    
+    empty = {'count': 0, 'approved': 0, 'in_progress': 0, 'pending': 0, 'last': None}
     
     students_data = []
     for profile in assigned_students:
         student = profile.user
         
         # Get submission stats for each pillar
-        clt_submissions = CLTSubmission.objects.filter(user=student)
+        clt = clt_by_user.get(student.id, empty)
         clt_stats = {
-            'status': 'completed' if clt_submissions.filter(status='approved').exists() 
-                     else 'pending' if clt_submissions.filter(status__in=['draft', 'submitted', 'under_review']).exists()
+            'status': 'completed' if clt['approved']
+                     else 'pending' if clt['in_progress']
                      else 'not-started',
-            'count': clt_submissions.count(),
-            'lastSubmission': clt_submissions.order_by('-created_at').first().created_at if clt_submissions.exists() else None
+            'count': clt['count'],
+            'lastSubmission': clt['last']
         }
         
         # CFC stats (all types combined)
-        hackathons = HackathonSubmission.objects.filter(user=student)
-        bmc_videos = BMCVideoSubmission.objects.filter(user=student)
-        internships = InternshipSubmission.objects.filter(user=student)
-        genai_projects = GenAIProjectSubmission.objects.filter(user=student)
-        
-        cfc_total = hackathons.count() + bmc_videos.count() + internships.count() + genai_projects.count()
-        cfc_approved = (hackathons.filter(status='approved').count() + 
-                       bmc_videos.filter(status='approved').count() +
-                       internships.filter(status='approved').count() +
-                       genai_projects.filter(status='approved').count())
+        cfc = [stats.get(student.id, empty) for stats in cfc_by_user]
+        cfc_total = sum(stats['count'] for stats in cfc)
+        cfc_approved = sum(stats['approved'] for stats in cfc)
         cfc_pending = cfc_total - cfc_approved
         
         cfc_stats = {
@@ -723,30 +874,30 @@ def get_mentor_students(request):
                      else 'not-started',
             'count': cfc_total,
             'lastSubmission': max(
-                [s.created_at for s in list(hackathons) + list(bmc_videos) + list(internships) + list(genai_projects)],
+                [stats['last'] for stats in cfc if stats['last']],
                 default=None
             )
         }
         
         # IIPC stats
-        iipc_posts = LinkedInPostVerification.objects.filter(user=student)
+        iipc = iipc_by_user.get(student.id, empty)
         iipc_stats = {
-            'status': 'completed' if iipc_posts.filter(status='verified').exists()
-                     else 'pending' if iipc_posts.filter(status='pending').exists()
+            'status': 'completed' if iipc['approved']
+                     else 'pending' if iipc['pending']
                      else 'not-started',
-            'count': iipc_posts.count(),
-            'lastSubmission': iipc_posts.order_by('-created_at').first().created_at if iipc_posts.exists() else None
+            'count': iipc['count'],
+            'lastSubmission': iipc['last']
         }
         
         # SCD stats
-        try:
-            leetcode_profile = LeetCodeProfile.objects.get(user=student)
+        leetcode_profile = leetcode_by_user.get(student.id)
+        if leetcode_profile:
             scd_stats = {
                 'status': 'completed' if leetcode_profile.monthly_problems_count >= 10 else 'pending',
                 'count': leetcode_profile.total_solved,
                 'lastSubmission': leetcode_profile.last_synced
             }
-        except LeetCodeProfile.DoesNotExist:
+        else:
             scd_stats = {
                 'status': 'not-started',
                 'count': 0,
@@ -1189,11 +1340,7 @@ def mark_announcement_read(request, announcement_id):
 @permission_classes([IsAuthenticated])
 def get_student_monthly_report(request, student_id):
     """Get monthly report for a specific student (Mentor view)"""
-    from datetime import datetime
-    from apps.clt.models import CLTSubmission
-    from apps.cfc.models import HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission
-    from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
-    from apps.scd.models import LeetCodeProfile
+    from apps.dashboard import monthly_rollup
     
     # Check if user is mentor
     if not is_mentor(request.user):
@@ -1216,12 +1363,8 @@ def get_student_monthly_report(request, student_id):
         year = int(year)
         student = User.objects.get(id=student_id)
         
-        # Create date range
-        start_date = datetime(year, month, 1)
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, month + 1, 1)
+        # Month counts: one aggregate per model, stored rollup for finished months
+        counts = monthly_rollup.month_counts([student.id], year, month)[student.id]
         
         # Monthly task requirements
         MONTHLY_REQUIREMENTS = {
@@ -1232,38 +1375,16 @@ def get_student_monthly_report(request, student_id):
             'scd': 1,
         }
         
-        # Calculate CLT stats
-        clt_submissions = CLTSubmission.objects.filter(
-            user=student,
-            created_at__gte=start_date,
-            created_at__lt=end_date
+        clt_completed = counts['clt']['completed']
+        # Internships are optional, so they do not count towards CFC
+        cfc_completed = sum(
+            counts[source]['completed'] for source in ('hackathons', 'bmc_videos', 'genai_projects')
         )
-        clt_completed = clt_submissions.filter(status='approved').count()
-        
-        # Calculate CFC stats
-        cfc_hackathons = HackathonSubmission.objects.filter(
-            user=student, created_at__gte=start_date, created_at__lt=end_date, status='approved'
-        ).count()
-        cfc_bmc = BMCVideoSubmission.objects.filter(
-            user=student, created_at__gte=start_date, created_at__lt=end_date, status='approved'
-        ).count()
-        cfc_genai = GenAIProjectSubmission.objects.filter(
-            user=student, created_at__gte=start_date, created_at__lt=end_date, status='approved'
-        ).count()
-        cfc_completed = cfc_hackathons + cfc_bmc + cfc_genai
-        
-        # Calculate IIPC stats
-        iipc_posts = LinkedInPostVerification.objects.filter(
-            user=student, created_at__gte=start_date, created_at__lt=end_date, status='approved'
-        ).count()
-        iipc_connections = LinkedInConnectionVerification.objects.filter(
-            user=student, created_at__gte=start_date, created_at__lt=end_date, status='approved'
-        ).count()
-        iipc_completed = iipc_posts + iipc_connections
+        iipc_completed = counts['posts']['completed'] + counts['connections']['completed']
         
         # Calculate SCD stats
         scd_profile = LeetCodeProfile.objects.filter(user=student).first()
-        scd_completed = 1 if (scd_profile and scd_profile.problems_solved >= 10) else 0
+        scd_completed = 1 if (scd_profile and scd_profile.total_solved >= 10) else 0
         
         report_data = {
             'month': month,
@@ -1311,8 +1432,7 @@ def get_student_monthly_report(request, student_id):
 @permission_classes([IsAuthenticated])
 def get_student_available_months(request, student_id):
     """Get available months for a student's monthly reports (Mentor view)"""
-    from datetime import datetime
-    from apps.clt.models import CLTSubmission
+    from apps.dashboard import monthly_rollup
     
     # Check if user is mentor
     if not is_mentor(request.user):
@@ -1324,10 +1444,10 @@ def get_student_available_months(request, student_id):
     try:
         student = User.objects.get(id=student_id)
         
-        # Get all months where student has any submissions
-        submissions = CLTSubmission.objects.filter(user=student).order_by('created_at')
+        # Months with any submission: one UNION of per-model month buckets
+        months_set = monthly_rollup.active_months(student)
         
-        if not submissions.exists():
+        if not months_set:
             # Default to current month if no submissions
             now = datetime.now()
             return Response({
@@ -1338,11 +1458,6 @@ def get_student_available_months(request, student_id):
                 }]
             })
         
-        # Get unique year-month combinations
-        months_set = set()
-        for sub in submissions:
-            months_set.add((sub.created_at.year, sub.created_at.month))
-        
         # Sort and format
         months_sorted = sorted(months_set, reverse=True)
         available_months = [
@@ -1361,3 +1476,73 @@ def get_student_available_months(request, student_id):
             {'error': 'Student not found'},
             status=status.HTTP_404_NOT_FOUND
         )
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def monthly_reports(request):
+    """
+    Monthly report snapshots for a whole roster, streamed as JSON or CSV
+    
+    GET /api/mentor/reports/monthly/?year=2025&month=3[&export=csv]
+        Students assigned to the requesting mentor
+    GET ...&campus=TECH&floor=2
+        A floor (floor wings: their own floor; admins: any floor or campus)
+    
+    Missing snapshots are generated first (finished months only); existing
+    ones are served unchanged.
+    """
+    from django.http import StreamingHttpResponse
+    from apps.dashboard import monthly_snapshots
+    
+    if not is_mentor(request.user):
+        return Response(
+            {"error": "You don't have permission to access this resource"},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    try:
+        year = int(request.GET.get('year', ''))
+        month = int(request.GET.get('month', ''))
+        floor = int(request.GET['floor']) if request.GET.get('floor') else None
+    except ValueError:
+        return Response(
+            {'error': 'year, month and floor must be integers'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if not 1 <= month <= 12:
+        return Response({'error': 'Month must be between 1 and 12'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Not `format`: DRF reserves it for renderer selection
+    export_format = request.GET.get('export', 'json')
+    if export_format not in ('json', 'csv'):
+        return Response({'error': 'export must be json or csv'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    campus = request.GET.get('campus')
+    if campus is None and floor is None:
+        scope = {'mentor_id': request.user.id}
+    else:
+        profile = getattr(request.user, 'profile', None)
+        role = profile.role if profile else None
+        is_admin = request.user.is_staff or request.user.is_superuser or role == 'ADMIN'
+        own_floor = role == 'FLOOR_WING' and (campus, floor) == (profile.campus, profile.floor)
+        if not (is_admin or own_floor):
+            return Response(
+                {"error": "Floor reports are limited to your own floor"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        scope = {'campus': campus, 'floor': floor}
+    
+    try:
+        monthly_snapshots.generate(year, month, **scope)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    queryset = monthly_snapshots.snapshots(year, month, **scope)
+    if export_format == 'csv':
+        response = StreamingHttpResponse(monthly_snapshots.stream_csv(queryset), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="monthly-reports-{year}-{month:02d}.csv"'
+        return response
+    return StreamingHttpResponse(
+        monthly_snapshots.stream_json(queryset, year, month), content_type='application/json'
+    )
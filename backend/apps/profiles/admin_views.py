@@ -2,14 +2,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.utils import timezone
 from apps.profiles.models import UserProfile
 from apps.profiles.permissions import IsAdmin
-from apps.clt.models import CLTSubmission
-from apps.cfc.models import HackathonSubmission, BMCVideoSubmission, InternshipSubmission, GenAIProjectSubmission
-from apps.iipc.models import LinkedInPostVerification, LinkedInConnectionVerification
-from apps.scd.models import LeetCodeProfile
+from apps.analytics_summary import aggregates, cache_versions, readers, student_progress
+from apps.analytics_summary.models import FloorAnalyticsSummary, GlobalAnalyticsSummary
+from apps.analytics_summary.readers import LazyValue, SummaryReader, combined_meta
 
 
 class AdminCampusOverviewView(APIView):
@@ -33,33 +34,52 @@ class AdminCampusOverviewView(APIView):
             floors = []
             campus_name = ''
         
+        # Pre-computed floor summaries; stale or missing floors are counted live
+        summaries = {}
+        if readers.enabled():
+            summaries = {
+                summary.floor: summary
+                for summary in FloorAnalyticsSummary.objects.filter(campus=campus, floor__in=floors)
+            }
+        floor_readers = []
+        
+        # Live counts for every floor at once (grouped by floor), only if a floor needs them
+        headcounts = LazyValue(lambda: aggregates.floor_headcounts(campus, floors))
+        submissions = LazyValue(lambda: aggregates.floor_submission_stats(campus, floors))
+        
+        # First floor wing (by id) of each floor
+        floor_wings = {}
+        for profile in UserProfile.objects.filter(
+            role='FLOOR_WING', campus=campus, floor__in=floors
+        ).select_related('user').order_by('id'):
+            floor_wings.setdefault(profile.floor, profile)
+        
         floor_data = []
         for floor_num in floors:
+            reader = SummaryReader(summaries.get(floor_num))
+            floor_readers.append(reader)
+            
             # Get counts for this floor
-            students_count = UserProfile.objects.filter(
-                role='STUDENT',
-                campus=campus,
-                floor=floor_num
-            ).count()
+            students_count = reader.get(
+                'total_students', lambda: headcounts()[floor_num].get('STUDENT', 0)
+            )
             
-            mentors_count = UserProfile.objects.filter(
-                role='MENTOR',
-                campus=campus,
-                floor=floor_num
-            ).count()
+            mentors_count = reader.get(
+                'total_mentors', lambda: headcounts()[floor_num].get('MENTOR', 0)
+            )
             
-            floor_wing = UserProfile.objects.filter(
-                role='FLOOR_WING',
-                campus=campus,
-                floor=floor_num
-            ).select_related('user').first()
+            floor_wing = floor_wings.get(floor_num)
             
             floor_wing_name = None
             if floor_wing:
                 floor_wing_name = f"{floor_wing.user.first_name} {floor_wing.user.last_name}"
             
-            # Calculate submission stats (placeholder - implement based on your models)
-            submission_stats = self._get_floor_submission_stats(campus, floor_num)
+            # Calculate submission stats
+            submission_stats = reader.get(
+                'submissions',
+                lambda: self._floor_submission_stats(submissions()[floor_num]),
+                column=self._summary_submission_stats,
+            )
             
             # Floor name logic: TECH = Floor X, ARTS = Xst/nd/rd Year
             if campus == 'TECH':
@@ -82,107 +102,37 @@ class AdminCampusOverviewView(APIView):
                 'floor_wing_id': floor_wing.user.id if floor_wing else None,
                 'submissions': submission_stats
             })
+            if readers.enabled():
+                floor_data[-1]['analytics'] = reader.meta()
         
-        return Response({
+        response_data = {
             'campus': campus,
             'campus_name': campus_name,
             'floors': floor_data
-        }, status=status.HTTP_200_OK)
+        }
+        if readers.enabled():
+            response_data['analytics'] = combined_meta(floor_readers)
+        return Response(response_data, status=status.HTTP_200_OK)
     
-    def _get_floor_submission_stats(self, campus, floor):
-        """Get submission statistics for a floor - real implementation"""
-        # Get all students on this floor
-        students = UserProfile.objects.filter(
-            role='STUDENT',
-            campus=campus,
-            floor=floor
-        ).select_related('user')
-        
-        user_ids = [s.user.id for s in students]
-        
-        total = pending = approved = rejected = 0
-        
-        # CLT
-        try:
-            clt_qs = CLTSubmission.objects.filter(user_id__in=user_ids)
-            total += clt_qs.count()
-            pending += clt_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += clt_qs.filter(status='approved').count()
-            rejected += clt_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # CFC - Hackathon
-        try:
-            hack_qs = HackathonSubmission.objects.filter(user_id__in=user_ids)
-            total += hack_qs.count()
-            pending += hack_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += hack_qs.filter(status='approved').count()
-            rejected += hack_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # CFC - BMC
-        try:
-            bmc_qs = BMCVideoSubmission.objects.filter(user_id__in=user_ids)
-            total += bmc_qs.count()
-            pending += bmc_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += bmc_qs.filter(status='approved').count()
-            rejected += bmc_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # CFC - Internship
-        try:
-            intern_qs = InternshipSubmission.objects.filter(user_id__in=user_ids)
-            total += intern_qs.count()
-            pending += intern_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += intern_qs.filter(status='approved').count()
-            rejected += intern_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # CFC - GenAI
-        try:
-            genai_qs = GenAIProjectSubmission.objects.filter(user_id__in=user_ids)
-            total += genai_qs.count()
-            pending += genai_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += genai_qs.filter(status='approved').count()
-            rejected += genai_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # IIPC - LinkedIn Post
-        try:
-            post_qs = LinkedInPostVerification.objects.filter(user_id__in=user_ids)
-            total += post_qs.count()
-            pending += post_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += post_qs.filter(status='approved').count()
-            rejected += post_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # IIPC - LinkedIn Connection
-        try:
-            conn_qs = LinkedInConnectionVerification.objects.filter(user_id__in=user_ids)
-            total += conn_qs.count()
-            pending += conn_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            approved += conn_qs.filter(status='approved').count()
-            rejected += conn_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        # Calculate progress percentage
-        progress_percentage = 0
-        if total > 0:
-            progress_percentage = int((approved / total) * 100)
-        
+    @staticmethod
+    def _summary_submission_stats(summary):
+        """Same shape as _floor_submission_stats, from a FloorAnalyticsSummary"""
+        total = summary.total_submissions
         return {
             'total': total,
-            'pending': pending,
-            'approved': approved,
-            'rejected': rejected,
-            'progress_percentage': progress_percentage
+            'pending': summary.pending_reviews,
+            'approved': summary.approved_submissions,
+            'rejected': summary.rejected_submissions,
+            'progress_percentage': int((summary.approved_submissions / total) * 100) if total else 0
+        }
+    
+    @staticmethod
+    def _floor_submission_stats(counts):
+        """Floor submission counts with the approved share as progress_percentage"""
+        total = counts['total']
+        return {
+            **counts,
+            'progress_percentage': int((counts['approved'] / total) * 100) if total else 0
         }
 
 
@@ -237,12 +187,13 @@ class AdminFloorDetailView(APIView):
                 'assigned_students': student_count
             })
         
-        # Get students
+        # Get students (stored progress rows come with the same query)
         students = UserProfile.objects.filter(
             role='STUDENT',
             campus=campus,
             floor=floor
-        ).select_related('user', 'assigned_mentor')
+        ).select_related('user', 'assigned_mentor', 'user__progress_summary')
+        progress = student_progress.progress_for(students)
         
         student_data = []
         for student_profile in students:
@@ -252,7 +203,7 @@ class AdminFloorDetailView(APIView):
                 mentor_name = f"{mentor.first_name} {mentor.last_name}"
             
             # Get real submission count for this student
-            submission_count = self._get_student_submission_count(student_profile.user)
+            submission_count = progress[student_profile.user_id].total_submissions
             
             student_data.append({
                 'id': student_profile.user.id,
@@ -283,47 +234,6 @@ class AdminFloorDetailView(APIView):
                 'unassigned_students': sum(1 for s in student_data if not s['mentor_id'])
             }
         }, status=status.HTTP_200_OK)
-    
-    def _get_student_submission_count(self, user):
-        """Get total submission count for a student across all pillars"""
-        count = 0
-        
-        try:
-            count += CLTSubmission.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += HackathonSubmission.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += BMCVideoSubmission.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += InternshipSubmission.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += GenAIProjectSubmission.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += LinkedInPostVerification.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        try:
-            count += LinkedInConnectionVerification.objects.filter(user=user).count()
-        except Exception:
-            pass
-        
-        return count
 
 
 class AdminAssignFloorWingView(APIView):
@@ -437,19 +347,15 @@ class AdminStudentDetailView(APIView):
             except Exception as e:
                 print(f"Error getting mentor info: {e}")
             
-            # Get pillar progress
+            # Get pillar progress and submission counts
             pillar_details = {'overall': 0, 'pillars': {}}
-            try:
-                pillar_details = self._get_pillar_progress(profile)
-            except Exception as e:
-                print(f"Error getting pillar progress: {e}")
-            
-            # Get submission counts
             submission_stats = {'total': 0, 'approved': 0, 'pending': 0, 'rejected': 0}
             try:
-                submission_stats = self._get_submission_stats(profile)
+                progress = student_progress.progress_for([profile])[user.id]
+                pillar_details = {'overall': progress.overall_progress, 'pillars': progress.pillars}
+                submission_stats = progress.submission_stats
             except Exception as e:
-                print(f"Error getting submission stats: {e}")
+                print(f"Error getting pillar progress: {e}")
             
             # Get campus name safely
             campus_name = 'N/A'
@@ -493,140 +399,6 @@ class AdminStudentDetailView(APIView):
                 'error': f'Error loading student details: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    def _get_pillar_progress(self, profile):
-        """Calculate pillar progress - real implementation"""
-        user = profile.user
-        pillar_percentages = {}
-        
-        # CFC - 4 tasks (hackathon, BMC, internship, GenAI)
-        try:
-            cfc_completed = (
-                HackathonSubmission.objects.filter(user=user, status='approved').count() +
-                BMCVideoSubmission.objects.filter(user=user, status='approved').count() +
-                InternshipSubmission.objects.filter(user=user, status='approved').count() +
-                GenAIProjectSubmission.objects.filter(user=user, status='approved').count()
-            )
-            pillar_percentages['CFC'] = min(100, int((cfc_completed / 4) * 100))
-        except Exception:
-            pillar_percentages['CFC'] = 0
-        
-        # CLT - 1 certificate
-        try:
-            clt_completed = CLTSubmission.objects.filter(user=user, status='approved').count()
-            pillar_percentages['CLT'] = min(100, clt_completed * 100)
-        except Exception:
-            pillar_percentages['CLT'] = 0
-        
-        # IIPC - 2 tasks (LinkedIn post + connection)
-        try:
-            iipc_completed = (
-                LinkedInPostVerification.objects.filter(user=user, status='approved').count() +
-                LinkedInConnectionVerification.objects.filter(user=user, status='approved').count()
-            )
-            pillar_percentages['IIPC'] = min(100, int((iipc_completed / 2) * 100))
-        except Exception:
-            pillar_percentages['IIPC'] = 0
-        
-        # SCD - 1 LeetCode profile with 10+ problems
-        try:
-            scd_profile = LeetCodeProfile.objects.filter(user=user, total_solved__gte=10).exists()
-            pillar_percentages['SCD'] = 100 if scd_profile else 0
-        except Exception:
-            pillar_percentages['SCD'] = 0
-        
-        # SRI - not implemented yet
-        pillar_percentages['SRI'] = 0
-        
-        # Calculate overall progress
-        overall = int(sum(pillar_percentages.values()) / len(pillar_percentages)) if pillar_percentages else 0
-        
-        return {
-            'overall': overall,
-            'pillars': pillar_percentages
-        }
-    
-    def _get_submission_stats(self, profile):
-        """Get submission statistics - real implementation"""
-        user = profile.user
-        total = approved = pending = rejected = 0
-        
-        try:
-            # CLT
-            clt_qs = CLTSubmission.objects.filter(user=user)
-            total += clt_qs.count()
-            approved += clt_qs.filter(status='approved').count()
-            pending += clt_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += clt_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # CFC - Hackathon
-            hack_qs = HackathonSubmission.objects.filter(user=user)
-            total += hack_qs.count()
-            approved += hack_qs.filter(status='approved').count()
-            pending += hack_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += hack_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # CFC - BMC
-            bmc_qs = BMCVideoSubmission.objects.filter(user=user)
-            total += bmc_qs.count()
-            approved += bmc_qs.filter(status='approved').count()
-            pending += bmc_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += bmc_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # CFC - Internship
-            intern_qs = InternshipSubmission.objects.filter(user=user)
-            total += intern_qs.count()
-            approved += intern_qs.filter(status='approved').count()
-            pending += intern_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += intern_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # CFC - GenAI
-            genai_qs = GenAIProjectSubmission.objects.filter(user=user)
-            total += genai_qs.count()
-            approved += genai_qs.filter(status='approved').count()
-            pending += genai_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += genai_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # IIPC - LinkedIn Post
-            post_qs = LinkedInPostVerification.objects.filter(user=user)
-            total += post_qs.count()
-            approved += post_qs.filter(status='approved').count()
-            pending += post_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += post_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        try:
-            # IIPC - LinkedIn Connection
-            conn_qs = LinkedInConnectionVerification.objects.filter(user=user)
-            total += conn_qs.count()
-            approved += conn_qs.filter(status='approved').count()
-            pending += conn_qs.filter(status__in=['draft', 'submitted', 'under_review']).count()
-            rejected += conn_qs.filter(status='rejected').count()
-        except Exception:
-            pass
-        
-        return {
-            'total': total,
-            'approved': approved,
-            'pending': pending,
-            'rejected': rejected
-        }
-    
     def _get_student_status(self, progress):
         """Determine student status based on progress"""
         if progress >= 80:
@@ -642,110 +414,39 @@ class AdminStatsView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
     
     def get(self, request):
+        # Cached until a submission or profile changes (or the TTL passes)
+        cache_key = cache_versions.key('admin_stats', 'submissions', 'profiles')
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached, status=status.HTTP_200_OK)
+        
         try:
+            # Latest global summary; a stale or missing one is counted live
+            summary = None
+            if readers.enabled():
+                summary = GlobalAnalyticsSummary.objects.order_by('-date').first()
+            reader = SummaryReader(summary)
+            submissions = LazyValue(self._get_submission_stats)
+            
             # Get all students count
-            total_students = UserProfile.objects.filter(role='STUDENT').count()
+            total_students = reader.get(
+                'totalStudents', lambda: UserProfile.objects.filter(role='STUDENT').count(), 'total_students'
+            )
             
             # Get all mentors count
-            total_mentors = UserProfile.objects.filter(role='MENTOR').count()
+            total_mentors = reader.get(
+                'totalMentors', lambda: UserProfile.objects.filter(role='MENTOR').count(), 'total_mentors'
+            )
             
             # Get all floor wings count (total floors with floor wings)
             total_floors = UserProfile.objects.filter(role='FLOOR_WING').values('campus', 'floor').distinct().count()
             
-            # Get submission stats from all pillars - use try/except for each to handle missing models
-            clt_pending = clt_approved = clt_rejected = 0
-            try:
-                clt_pending = CLTSubmission.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                clt_approved = CLTSubmission.objects.filter(status='approved').count()
-                clt_rejected = CLTSubmission.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            # CFC Submissions
-            hackathon_pending = hackathon_approved = hackathon_rejected = 0
-            bmc_pending = bmc_approved = bmc_rejected = 0
-            internship_pending = internship_approved = internship_rejected = 0
-            genai_pending = genai_approved = genai_rejected = 0
-            
-            try:
-                hackathon_pending = HackathonSubmission.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                hackathon_approved = HackathonSubmission.objects.filter(status='approved').count()
-                hackathon_rejected = HackathonSubmission.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            try:
-                bmc_pending = BMCVideoSubmission.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                bmc_approved = BMCVideoSubmission.objects.filter(status='approved').count()
-                bmc_rejected = BMCVideoSubmission.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            try:
-                internship_pending = InternshipSubmission.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                internship_approved = InternshipSubmission.objects.filter(status='approved').count()
-                internship_rejected = InternshipSubmission.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            try:
-                genai_pending = GenAIProjectSubmission.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                genai_approved = GenAIProjectSubmission.objects.filter(status='approved').count()
-                genai_rejected = GenAIProjectSubmission.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            # IIPC Submissions
-            linkedin_post_pending = linkedin_post_approved = linkedin_post_rejected = 0
-            linkedin_conn_pending = linkedin_conn_approved = linkedin_conn_rejected = 0
-            
-            try:
-                linkedin_post_pending = LinkedInPostVerification.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                linkedin_post_approved = LinkedInPostVerification.objects.filter(status='approved').count()
-                linkedin_post_rejected = LinkedInPostVerification.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            try:
-                linkedin_conn_pending = LinkedInConnectionVerification.objects.filter(status__in=['draft', 'submitted', 'under_review']).count()
-                linkedin_conn_approved = LinkedInConnectionVerification.objects.filter(status='approved').count()
-                linkedin_conn_rejected = LinkedInConnectionVerification.objects.filter(status='rejected').count()
-            except Exception:
-                pass
-            
-            # Aggregate totals
-            total_pending = (clt_pending + hackathon_pending + bmc_pending + internship_pending + 
-                           genai_pending + linkedin_post_pending + linkedin_conn_pending)
-            total_approved = (clt_approved + hackathon_approved + bmc_approved + internship_approved + 
-                            genai_approved + linkedin_post_approved + linkedin_conn_approved)
-            total_rejected = (clt_rejected + hackathon_rejected + bmc_rejected + internship_rejected + 
-                            genai_rejected + linkedin_post_rejected + linkedin_conn_rejected)
+            total_pending = reader.get('pendingSubmissions', lambda: submissions()['pending'], 'pending_reviews_count')
+            total_approved = reader.get('approvedSubmissions', lambda: submissions()['approved'], 'approved_submissions')
+            total_rejected = reader.get('rejectedSubmissions', lambda: submissions()['rejected'], 'rejected_submissions')
+            active_users = reader.get('activeUsers', lambda: self._get_active_users(total_students), 'active_users')
             
-            # Simple active users count - students with any submissions
-            active_users = 0
-            try:
-                # Get unique user IDs with any submission activity
-                active_user_ids = set()
-                
-                for submission_qs in [
-                    CLTSubmission.objects.values_list('user_id', flat=True),
-                    HackathonSubmission.objects.values_list('user_id', flat=True),
-                    BMCVideoSubmission.objects.values_list('user_id', flat=True),
-                    InternshipSubmission.objects.values_list('user_id', flat=True),
-                    GenAIProjectSubmission.objects.values_list('user_id', flat=True),
-                    LinkedInPostVerification.objects.values_list('user_id', flat=True),
-                    LinkedInConnectionVerification.objects.values_list('user_id', flat=True),
-                ]:
-                    try:
-                        active_user_ids.update(submission_qs)
-                    except Exception:
-                        pass
-                
-                active_users = len(active_user_ids)
-            except Exception:
-                active_users = total_students  # Fallback
-            
-            return Response({
+            response_data = {
                 'totalStudents': total_students,
                 'totalMentors': total_mentors,
                 'totalFloors': total_floors,
@@ -756,7 +457,11 @@ class AdminStatsView(APIView):
                 'submissionsThisWeek': total_pending + total_approved + total_rejected,
                 'xpGivenThisMonth': 0,
                 'floorPerformanceScore': 0,
-            }, status=status.HTTP_200_OK)
+            }
+            if readers.enabled():
+                response_data['analytics'] = reader.meta()
+            cache.set(cache_key, response_data, settings.ADMIN_STATS_CACHE_TTL)
+            return Response(response_data, status=status.HTTP_200_OK)
             
         except Exception as e:
             import traceback
@@ -777,3 +482,14 @@ class AdminStatsView(APIView):
                 'floorPerformanceScore': 0,
                 'error': str(e)
             }, status=status.HTTP_200_OK)
+    
+    def _get_submission_stats(self):
+        """Pending/approved/rejected counts across every pillar - one aggregate per model"""
+        return aggregates.global_submission_totals(timezone.now().date())
+    
+    def _get_active_users(self, total_students):
+        """Users with any submission (UNION of user ids, counted in the database)"""
+        try:
+            return aggregates.active_user_count()
+        except Exception:
+            return total_students  # Fallback
@@ -7,6 +7,48 @@ from django.db.models import Count, Q, Avg
 from apps.profiles.models import UserProfile
 from apps.profiles.permissions import IsFloorWing
 from apps.profiles.serializers import UserProfileSerializer
+from apps.analytics_summary import readers, student_progress
+from apps.analytics_summary.models import (
+    FloorAnalyticsSummary, MentorAnalyticsSummary, StudentProgressSummary,
+)
+from apps.analytics_summary.readers import SummaryReader, combined_meta
+
+
+def _mentor_summaries(mentors):
+    """MentorAnalyticsSummary per mentor user id (empty when summaries are off)"""
+    if not readers.enabled():
+        return {}
+    return {
+        summary.mentor_id: summary
+        for summary in MentorAnalyticsSummary.objects.filter(mentor__in=[m.user_id for m in mentors])
+    }
+
+
+def _mentor_workload(mentor_profile, students, reader):
+    """Workload fields for one mentor, from its summary or counted live"""
+    def live_assigned_count():
+        return students.filter(assigned_mentor=mentor_profile.user).count()
+    
+    assigned_count = reader.get('assigned_students_count', live_assigned_count)
+    
+    # Live fallback does not track reviews yet
+    pending_reviews = reader.get('pending_reviews', lambda: 0, 'pending_reviews_count')
+    approval_rate = reader.get('approval_rate', lambda: 0)
+    
+    def live_workload_status():
+        if assigned_count == 0:
+            return 'low'
+        elif assigned_count <= 5:
+            return 'balanced'
+        return 'overloaded'
+    
+    return {
+        'assigned_students_count': assigned_count,
+        'pending_reviews': pending_reviews,
+        'approval_rate': approval_rate,
+        'workload_status': reader.get('workload_status', live_workload_status),
+        'last_active': reader.get('last_active', lambda: None),  # Can be implemented with activity tracking
+    }
 
 
 class FloorWingDashboardView(APIView):
@@ -37,65 +79,84 @@ class FloorWingDashboardView(APIView):
             floor=floor
         ).select_related('user')
         
+        # Pre-computed summaries; stale or missing ones are counted live
+        floor_summary = None
+        if readers.enabled():
+            floor_summary = FloorAnalyticsSummary.objects.filter(campus=campus, floor=floor).first()
+        floor_reader = SummaryReader(floor_summary)
+        mentor_summaries = _mentor_summaries(mentors)
+        mentor_readers = []
+        
         # Calculate mentor workload with detailed stats
         mentor_stats = []
         for mentor_profile in mentors:
-            assigned_students = students.filter(assigned_mentor=mentor_profile.user)
-            assigned_count = assigned_students.count()
-            
-            # Get submission stats for this mentor's students
-            # This is a simplified version - expand based on your submission models
-            pending_reviews = 0  # Implement based on submission model
-            approval_rate = 0  # Calculate based on submissions
-            
-            # Determine workload status
-            if assigned_count == 0:
-                workload_status = 'low'
-            elif assigned_count <= 5:
-                workload_status = 'balanced'
-            else:
-                workload_status = 'overloaded'
+            reader = SummaryReader(mentor_summaries.get(mentor_profile.user_id))
+            mentor_readers.append(reader)
+            workload = _mentor_workload(mentor_profile, students, reader)
             
             mentor_stats.append({
                 'id': mentor_profile.user.id,
                 'name': f"{mentor_profile.user.first_name} {mentor_profile.user.last_name}",
                 'username': mentor_profile.user.username,
                 'email': mentor_profile.user.email,
-                'assigned_students': assigned_count,
-                'assigned_students_count': assigned_count,  # For compatibility
-                'pending_reviews': pending_reviews,
-                'approval_rate': approval_rate,
-                'workload_status': workload_status,
-                'last_active': None  # Can be implemented with activity tracking
+                'assigned_students': workload['assigned_students_count'],
+                **workload,  # assigned_students_count kept for compatibility
             })
         
         # Students without mentors
-        unassigned_students = students.filter(assigned_mentor__isnull=True).count()
-        assigned_students_count = students.filter(assigned_mentor__isnull=False).count()
+        unassigned_students = floor_reader.get(
+            'unassigned_students', lambda: students.filter(assigned_mentor__isnull=True).count()
+        )
+        assigned_students_count = floor_reader.get(
+            'assigned_students', lambda: students.filter(assigned_mentor__isnull=False).count()
+        )
         
         # Calculate average floor completion
-        avg_completion = self._calculate_avg_completion(students)
+        avg_completion = floor_reader.get(
+            'avg_floor_completion', lambda: self._calculate_avg_completion(students), 'avg_completion'
+        )
         
         # Calculate pillar statistics
-        pillar_stats = self._get_pillar_stats(campus, floor)
+        pillar_stats = floor_reader.get(
+            'pillar_stats', lambda: self._get_pillar_stats(campus, floor), self._summary_pillar_stats
+        )
         
         # Get pending reviews count
-        pending_reviews_total = 0  # Implement based on submission model
+        pending_reviews_total = floor_reader.get(
+            'pending_mentor_reviews', lambda: 0, 'pending_reviews'  # Live count not implemented yet
+        )
         
-        return Response({
+        total_students = floor_reader.get('total_students', students.count)
+        total_mentors = floor_reader.get('total_mentors', mentors.count)
+        
+        response_data = {
             'campus': campus,
             'campus_name': floor_wing_profile.get_campus_display(),
             'floor': floor,
             'floor_name': floor_wing_profile.get_floor_display(),
-            'total_students': students.count(),
-            'total_mentors': mentors.count(),
+            'total_students': total_students,
+            'total_mentors': total_mentors,
             'assigned_students': assigned_students_count,
             'unassigned_students': unassigned_students,
             'avg_floor_completion': avg_completion,
             'pending_mentor_reviews': pending_reviews_total,
             'mentor_stats': mentor_stats,
             'pillar_stats': pillar_stats
-        }, status=status.HTTP_200_OK)
+        }
+        if readers.enabled():
+            response_data['analytics'] = combined_meta([floor_reader] + mentor_readers)
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    @staticmethod
+    def _summary_pillar_stats(summary):
+        """Pillar completion rates from a FloorAnalyticsSummary (counts are not kept per pillar)"""
+        return {
+            pillar: {
+                'submitted': 0, 'approved': 0, 'pending': 0, 'rejected': 0,
+                'completion_rate': getattr(summary, f'{pillar}_progress'),
+            }
+            for pillar in ['cfc', 'clt', 'sri', 'iipc', 'scd']
+        }
     
     def _calculate_avg_completion(self, students):
         """Calculate average completion rate for all students on floor"""
@@ -132,17 +193,30 @@ class FloorWingStudentsView(APIView):
             role='STUDENT',
             campus=campus,
             floor=floor
-        ).select_related('user', 'assigned_mentor')
+        ).select_related('user', 'assigned_mentor', 'user__progress_summary')
         
         # Apply filters
         if filter_type == 'unassigned':
             students = students.filter(assigned_mentor__isnull=True)
-        elif filter_type == 'at_risk':
-            # Students with low progress - implement based on submission model
-            pass
+        below = None
+        if filter_type == 'at_risk':
+            # Students with low progress
+            below = student_progress.AT_RISK_PROGRESS
+            statuses = [StudentProgressSummary.RISK_BEHIND]
         elif filter_type == 'low_progress':
-            # Students below certain completion threshold
-            pass
+            # Students below the on-track completion threshold
+            below = student_progress.ON_TRACK_PROGRESS
+            statuses = [StudentProgressSummary.RISK_BEHIND, StudentProgressSummary.RISK_AT_RISK]
+        if below is not None:
+            # Narrow on the indexed risk_status; students without a summary
+            # row yet are kept here and checked against computed progress
+            students = students.filter(
+                Q(user__progress_summary__risk_status__in=statuses)
+                | Q(user__progress_summary__isnull=True)
+            )
+        progress = student_progress.progress_for(students)
+        if below is not None:
+            students = [s for s in students if progress[s.user_id].overall_progress < below]
         
         student_data = []
         for student_profile in students:
@@ -153,15 +227,15 @@ class FloorWingStudentsView(APIView):
                 mentor_name = f"{mentor.first_name} {mentor.last_name}"
                 mentor_id = mentor.id
             
-            # Calculate pillar progress for this student
-            pillar_progress = self._get_student_pillar_progress(student_profile)
-            pending_submissions = self._get_pending_submissions(student_profile)
+            # Pillar progress for this student
+            pillar_progress = self._get_student_pillar_progress(progress[student_profile.user_id])
+            pending_submissions = progress[student_profile.user_id].pending_submissions
             
             # Determine status
             completion_rate = pillar_progress.get('overall_completion', 0)
-            if completion_rate >= 80:
+            if completion_rate >= student_progress.ON_TRACK_PROGRESS:
                 student_status = 'on_track'
-            elif completion_rate >= 50:
+            elif completion_rate >= student_progress.AT_RISK_PROGRESS:
                 student_status = 'moderate'
             else:
                 student_status = 'at_risk'
@@ -189,24 +263,18 @@ class FloorWingStudentsView(APIView):
             'filter_applied': filter_type
         }, status=status.HTTP_200_OK)
     
-    def _get_student_pillar_progress(self, student_profile):
-        """Calculate pillar-wise progress for a student"""
-        # Placeholder - implement based on your submission model
+    def _get_student_pillar_progress(self, progress):
+        """Pillar-wise progress from a StudentProgressSummary"""
         return {
-            'overall_completion': 0,
+            'overall_completion': progress.overall_progress,
             'pillars': {
-                'cfc': 0,
-                'clt': 0,
-                'sri': 0,
-                'iipc': 0,
-                'scd': 0
+                'cfc': progress.cfc_progress,
+                'clt': progress.clt_progress,
+                'sri': progress.sri_progress,
+                'iipc': progress.iipc_progress,
+                'scd': progress.scd_progress
             }
         }
-    
-    def _get_pending_submissions(self, student_profile):
-        """Get count of pending submissions for a student"""
-        # Placeholder - implement based on your submission model
-        return 0
 
 
 class FloorWingMentorsView(APIView):
@@ -231,39 +299,29 @@ class FloorWingMentorsView(APIView):
             floor=floor
         ).select_related('user')
         
+        mentor_summaries = _mentor_summaries(mentors)
+        mentor_readers = []
+        
         mentor_data = []
         for mentor_profile in mentors:
-            assigned_students = students.filter(assigned_mentor=mentor_profile.user)
-            assigned_count = assigned_students.count()
-            
-            # Get submission stats for this mentor's students
-            pending_reviews = 0  # Implement based on submission model
-            approval_rate = 0  # Calculate based on submissions
-            
-            # Determine workload status
-            if assigned_count == 0:
-                workload_status = 'low'
-            elif assigned_count <= 5:
-                workload_status = 'balanced'
-            else:
-                workload_status = 'overloaded'
+            reader = SummaryReader(mentor_summaries.get(mentor_profile.user_id))
+            mentor_readers.append(reader)
             
             mentor_data.append({
                 'id': mentor_profile.user.id,
                 'username': mentor_profile.user.username,
                 'name': f"{mentor_profile.user.first_name} {mentor_profile.user.last_name}",
                 'email': mentor_profile.user.email,
-                'assigned_students_count': assigned_count,
-                'pending_reviews': pending_reviews,
-                'approval_rate': approval_rate,
-                'workload_status': workload_status,
-                'last_active': None  # Can be implemented with activity tracking
+                **_mentor_workload(mentor_profile, students, reader),
             })
         
-        return Response({
+        response_data = {
             'mentors': mentor_data,
             'total': len(mentor_data)
-        }, status=status.HTTP_200_OK)
+        }
+        if readers.enabled():
+            response_data['analytics'] = combined_meta(mentor_readers)
+        return Response(response_data, status=status.HTTP_200_OK)
 
 
 class FloorWingAssignStudentView(APIView):
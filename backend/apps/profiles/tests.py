@@ -0,0 +1,252 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.analytics_summary.models import FloorAnalyticsSummary, GlobalAnalyticsSummary, StudentProgressSummary
+from apps.clt.models import CLTSubmission
+from apps.scd.models import LeetCodeProfile
+
+
+def make_user(username, role='STUDENT', campus=None, floor=None, mentor=None):
+    user = User.objects.create(username=username, first_name=username.title())
+    profile = user.profile
+    profile.role, profile.campus, profile.floor, profile.assigned_mentor = role, campus, floor, mentor
+    profile.save()
+    return user
+
+
+class SummaryDashboardTestCase(TestCase):
+    """Two TECH floors with a mentor, students and submissions"""
+
+    def setUp(self):
+        self.mentor = make_user('mentor', 'MENTOR', 'TECH', 1)
+        self.students = [
+            make_user('alice', campus='TECH', floor=1, mentor=self.mentor),
+            make_user('bob', campus='TECH', floor=1),
+            make_user('carol', campus='TECH', floor=2),
+        ]
+        for student, status in zip(self.students, ['approved', 'submitted', 'rejected']):
+            CLTSubmission.objects.create(
+                user=student, title='Course', description='Course', platform='Coursera',
+                completion_date=date.today(), status=status,
+            )
+        call_command('recompute_analytics', stdout=StringIO())
+        self.client = APIClient()
+
+    def login(self, role, campus=None, floor=None):
+        self.client.force_authenticate(make_user(f'{role.lower()}-user', role, campus, floor))
+
+
+@override_settings(USE_ANALYTICS_SUMMARY=True)
+class AdminSummaryReadTests(SummaryDashboardTestCase):
+    """Admin dashboards served from analytics summaries"""
+
+    def setUp(self):
+        super().setUp()
+        self.login('ADMIN')
+
+    def test_stats_from_global_summary(self):
+        GlobalAnalyticsSummary.objects.update(approved_submissions=42)
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(response.data['approvedSubmissions'], 42)
+        self.assertEqual(response.data['totalStudents'], 3)
+        self.assertEqual(response.data['activeUsers'], 3)
+        self.assertEqual(response.data['analytics']['source'], 'summary')
+        self.assertFalse(response.data['analytics']['stale'])
+
+    def test_stale_summary_falls_back_to_live(self):
+        GlobalAnalyticsSummary.objects.update(
+            approved_submissions=42, last_updated=timezone.now() - timedelta(hours=1),
+        )
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(response.data['approvedSubmissions'], 1)
+        self.assertEqual(response.data['analytics']['source'], 'live')
+        self.assertTrue(response.data['analytics']['stale'])
+        self.assertIn('approvedSubmissions', response.data['analytics']['live_fields'])
+
+    def test_campus_overview_mixes_fresh_and_missing_floors(self):
+        FloorAnalyticsSummary.objects.filter(floor=1).update(total_students=99)
+        FloorAnalyticsSummary.objects.filter(floor=2).delete()
+
+        response = self.client.get('/api/profiles/admin/campus/TECH/')
+        floors = {item['floor']: item for item in response.data['floors']}
+        self.assertEqual(floors[1]['total_students'], 99)
+        self.assertEqual(floors[1]['submissions']['approved'], 1)
+        self.assertEqual(floors[1]['analytics']['source'], 'summary')
+        self.assertEqual(floors[2]['total_students'], 1)
+        self.assertEqual(floors[2]['submissions']['rejected'], 1)
+        self.assertEqual(floors[2]['analytics']['source'], 'live')
+        self.assertEqual(response.data['analytics']['source'], 'mixed')
+
+    @override_settings(USE_ANALYTICS_SUMMARY=False)
+    def test_flag_off_stays_live(self):
+        GlobalAnalyticsSummary.objects.update(approved_submissions=42)
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(response.data['approvedSubmissions'], 1)
+        self.assertNotIn('analytics', response.data)
+
+
+@override_settings(USE_ANALYTICS_SUMMARY=True)
+class FloorWingSummaryReadTests(SummaryDashboardTestCase):
+    """Floor wing dashboards served from analytics summaries"""
+
+    def setUp(self):
+        super().setUp()
+        self.login('FLOOR_WING', 'TECH', 1)
+
+    def test_dashboard_from_floor_and_mentor_summaries(self):
+        response = self.client.get('/api/profiles/floor-wing/dashboard/')
+        data = response.data
+        self.assertEqual((data['total_students'], data['assigned_students']), (2, 1))
+        self.assertEqual(data['pending_mentor_reviews'], 1)
+        self.assertEqual(data['pillar_stats']['clt']['completion_rate'], 50.0)
+        mentor = data['mentor_stats'][0]
+        self.assertEqual((mentor['assigned_students'], mentor['approval_rate']), (1, 100.0))
+        self.assertEqual(data['analytics']['source'], 'summary')
+
+    def test_mentors_view_falls_back_per_mentor(self):
+        other = make_user('other-mentor', 'MENTOR', 'TECH', 1)
+        response = self.client.get('/api/profiles/floor-wing/mentors/')
+        mentors = {item['id']: item for item in response.data['mentors']}
+        self.assertEqual(mentors[self.mentor.id]['assigned_students_count'], 1)
+        self.assertEqual(mentors[other.id]['assigned_students_count'], 0)
+        self.assertEqual(response.data['analytics']['source'], 'mixed')
+
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'profiles-tests'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AdminStatsLiveTests(SummaryDashboardTestCase):
+    """Live admin stats: fixed query count, cached per submissions version"""
+
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        self.login('ADMIN')
+
+    def test_live_counts_and_cache_invalidation(self):
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(
+            [response.data[key] for key in ('pendingSubmissions', 'approvedSubmissions', 'rejectedSubmissions', 'activeUsers')],
+            [1, 1, 1, 3],
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(len(queries), 0)
+
+        CLTSubmission.objects.filter(user=self.students[1]).first().delete()
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(response.data['pendingSubmissions'], 0)
+        self.assertEqual(response.data['activeUsers'], 2)
+
+        make_user('dave', campus='TECH', floor=2)
+        response = self.client.get('/api/profiles/admin/stats/')
+        self.assertEqual(response.data['totalStudents'], 4)
+
+    def test_live_query_count_is_constant(self):
+        def count_queries():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get('/api/profiles/admin/stats/')
+            return len(queries)
+
+        baseline = count_queries()
+        for index in range(5):
+            student = make_user(f'extra{index}', campus='TECH', floor=1)
+            CLTSubmission.objects.create(
+                user=student, title='Course', description='Course', platform='Coursera',
+                completion_date=date.today(), status='approved',
+            )
+        self.assertEqual(count_queries(), baseline)
+
+
+class AdminCampusOverviewLiveTests(SummaryDashboardTestCase):
+    """Live campus overview from grouped per-floor queries"""
+
+    def test_grouped_floor_stats(self):
+        self.login('ADMIN')
+        make_user('wing', 'FLOOR_WING', 'TECH', 2)
+        url = '/api/profiles/admin/campus/TECH/'
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            return len(queries), response
+
+        baseline, response = count_queries()
+        floors = {item['floor']: item for item in response.data['floors']}
+        self.assertEqual((floors[1]['total_students'], floors[1]['total_mentors']), (2, 1))
+        self.assertEqual(
+            floors[1]['submissions'],
+            {'total': 2, 'pending': 1, 'approved': 1, 'rejected': 0, 'progress_percentage': 50},
+        )
+        self.assertEqual(floors[2]['submissions']['rejected'], 1)
+        self.assertEqual(floors[2]['floor_wing'], 'Wing ')
+        self.assertEqual(floors[4]['total_students'], 0)
+
+        for floor in (3, 4):
+            student = make_user(f'floor{floor}', campus='TECH', floor=floor)
+            make_user(f'wing{floor}', 'FLOOR_WING', 'TECH', floor)
+            CLTSubmission.objects.create(
+                user=student, title='Course', description='Course', platform='Coursera',
+                completion_date=date.today(), status='approved',
+            )
+        self.assertEqual(count_queries()[0], baseline)
+
+
+class StudentProgressListingTests(SummaryDashboardTestCase):
+    """Student listings read StudentProgressSummary rows"""
+
+    def test_floor_detail_query_count_is_constant(self):
+        self.login('ADMIN')
+        url = '/api/profiles/admin/campus/TECH/floor/1/'
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            return len(queries), response
+
+        baseline, response = count_queries()
+        submissions = {item['name'].strip(): item['submissions'] for item in response.data['students']}
+        self.assertEqual(submissions, {'Alice': 1, 'Bob': 1})
+
+        for index in range(10):
+            make_user(f'extra{index}', campus='TECH', floor=1)
+        self.assertEqual(count_queries()[0], baseline)
+
+    def test_student_detail(self):
+        self.login('ADMIN')
+        LeetCodeProfile.objects.create(user=self.students[0], leetcode_username='alice', total_solved=12)
+        response = self.client.get(f'/api/profiles/admin/student/{self.students[0].id}/')
+        self.assertEqual(response.data['pillar_details']['CLT'], 100)
+        self.assertEqual(response.data['pillar_details']['SCD'], 100)
+        self.assertEqual(response.data['pillar_progress'], 40)
+        self.assertEqual(response.data['submission_stats'], {'total': 1, 'approved': 1, 'pending': 0, 'rejected': 0})
+        self.assertEqual(response.data['status'], 'behind')
+
+    def test_floor_wing_students_filters(self):
+        self.login('FLOOR_WING', 'TECH', 1)
+        StudentProgressSummary.objects.filter(user=self.students[0]).update(
+            overall_progress=90, risk_status=StudentProgressSummary.RISK_ON_TRACK,
+        )
+        response = self.client.get('/api/profiles/floor-wing/students/', {'filter': 'at_risk'})
+        self.assertEqual([item['username'] for item in response.data['students']], ['bob'])
+        self.assertEqual(response.data['students'][0]['pending_submissions'], 1)
+        response = self.client.get('/api/profiles/floor-wing/students/', {'filter': 'low_progress'})
+        self.assertEqual([item['username'] for item in response.data['students']], ['bob'])
+
+    def test_floor_wing_risk_filter_covers_students_without_summary(self):
+        self.login('FLOOR_WING', 'TECH', 1)
+        StudentProgressSummary.objects.filter(user__in=self.students[:2]).delete()
+        response = self.client.get('/api/profiles/floor-wing/students/', {'filter': 'at_risk'})
+        self.assertEqual(sorted(item['username'] for item in response.data['students']), ['alice', 'bob'])
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import LeetCodeProfile, LeetCodeSubmission, ProgressSnapshot
+from .models import LeetCodeProfile, LeetCodeSubmission, ProgressSnapshot, LeetCodeSyncJob
 
 
 class LeetCodeSubmissionInline(admin.TabularInline):
@@ -108,3 +108,13 @@ class ProgressSnapshotAdmin(admin.ModelAdmin):
     list_filter = ['snapshot_date']
     search_fields = ['profile__leetcode_username', 'profile__user__username']
     readonly_fields = ['snapshot_date']
+
+
+@admin.register(LeetCodeSyncJob)
+class LeetCodeSyncJobAdmin(admin.ModelAdmin):
+    """Admin interface for queued profile syncs"""
+    
+    list_display = ['user', 'leetcode_username', 'status', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['user__username', 'leetcode_username']
+    readonly_fields = ['created_at', 'started_at', 'finished_at', 'result', 'error']
@@ -0,0 +1,373 @@
+"""
+LeetCode profile sync jobs
+
+The sync endpoint only enqueues a LeetCodeSyncJob and returns 202; the
+LeetCode round trip and the DB writes run on a worker backend:
+
+    'database'  - jobs wait in the table until `python manage.py process_sync_jobs`
+                  claims them (SELECT ... FOR UPDATE SKIP LOCKED on Postgres)
+    'thread'    - jobs run on a small in-process thread pool after commit
+                  (local development, no extra process)
+    'immediate' - jobs run inline after commit (tests)
+
+Select with settings.SCD_SYNC_BACKEND; a dotted path to a class with a
+`dispatch(job)` method plugs in another queue (e.g. a Celery task).
+
+A job still queued or running SCD_SYNC_STALE_MINUTES after it was queued or
+claimed is treated as lost (restart, crashed worker): `enqueue_sync` fails
+it and queues a fresh one instead of joining it, and `requeue_stale` hands
+it back to the backend.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .leetcode_api import LeetCodeAPI
+from .models import LeetCodeProfile, LeetCodeSubmission, LeetCodeSyncJob, ProgressSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SyncError(Exception):
+    """Sync failed with a message safe to show the student"""
+
+
+class SyncInProgress(Exception):
+    """The user's running sync is for a different LeetCode username"""
+
+    def __init__(self, job):
+        super().__init__(f'A sync for {job.leetcode_username} is already running')
+        self.job = job
+
+
+def sync_profile(user, username):
+    """
+    Fetch a LeetCode profile and store it for `user`
+    Returns the payload the sync endpoint used to return synchronously
+    """
+    # Fetch profile, contest, calendar and submissions in one round trip,
+    # outside the transaction so no connection is held open while waiting
+    full_profile = LeetCodeAPI.fetch_full_profile(username, submissions_limit=20)
+
+    if not full_profile:
+        raise SyncError('Failed to fetch LeetCode profile. Please check the username and try again.')
+
+    profile_data = full_profile['profile']
+    contest_info = full_profile['contest']
+    calendar_data = full_profile['calendar']
+    recent_submissions = full_profile['recent_submissions']
+
+    # Missing sections are non-critical
+    warnings = []
+    if not contest_info:
+        warnings.append('Contest data unavailable - no contest history')
+    if not calendar_data:
+        warnings.append('Calendar data unavailable')
+    if not recent_submissions:
+        warnings.append('Recent submissions unavailable')
+
+    from .serializers import LeetCodeProfileSerializer
+
+    with transaction.atomic():
+        # Get or create profile
+        profile, created = LeetCodeProfile.objects.get_or_create(
+            user=user,
+            leetcode_username=username,
+            defaults={
+                'total_solved': profile_data['total_solved'],
+                'easy_solved': profile_data['easy_solved'],
+                'medium_solved': profile_data['medium_solved'],
+                'hard_solved': profile_data['hard_solved'],
+                'ranking': profile_data['ranking'],
+                'contest_rating': contest_info['rating'] if contest_info else None,
+                'streak': calendar_data['streak'] if calendar_data else 0,
+                'monthly_problems_count': calendar_data['monthly_problems'] if calendar_data else 0,
+                'total_active_days': calendar_data['total_active_days'] if calendar_data else 0,
+                'submission_calendar': calendar_data['submission_calendar'] if calendar_data else {},
+            }
+        )
+
+        # Update existing profile
+        if not created:
+            profile.total_solved = profile_data['total_solved']
+            profile.easy_solved = profile_data['easy_solved']
+            profile.medium_solved = profile_data['medium_solved']
+            profile.hard_solved = profile_data['hard_solved']
+            profile.ranking = profile_data['ranking']
+            if contest_info:
+                profile.contest_rating = contest_info['rating']
+            if calendar_data:
+                profile.streak = calendar_data['streak']
+                profile.monthly_problems_count = calendar_data['monthly_problems']
+                profile.total_active_days = calendar_data['total_active_days']
+                profile.submission_calendar = calendar_data['submission_calendar']
+            profile.save()
+
+        # Check if monthly target is met (minimum 10 problems)
+        monthly_target_met = (calendar_data and calendar_data['monthly_problems'] >= 10) if calendar_data else False
+
+        # If target not met, create notification for mentor
+        if not monthly_target_met and hasattr(user, 'profile') and user.profile.assigned_mentor:
+            from apps.dashboard.models import Notification
+
+            # Check if notification already exists for this month
+            current_month = datetime.now().strftime('%Y-%m')
+            existing_notif = Notification.objects.filter(
+                user=user.profile.assigned_mentor,
+                message__contains=f"monthly target ({current_month})",
+                created_at__month=datetime.now().month,
+                created_at__year=datetime.now().year
+            ).exists()
+
+            if not existing_notif:
+                problems_count = calendar_data['monthly_problems'] if calendar_data else 0
+                student_name = user.get_full_name() or user.username
+                Notification.objects.create(
+                    user=user.profile.assigned_mentor,
+                    message=f"{student_name} has only solved {problems_count}/10 problems this month on LeetCode (monthly target ({current_month}))",
+                    notification_type='warning'
+                )
+
+        # Create progress snapshot
+        ProgressSnapshot.objects.create(
+            profile=profile,
+            total_solved=profile_data['total_solved'],
+            easy_solved=profile_data['easy_solved'],
+            medium_solved=profile_data['medium_solved'],
+            hard_solved=profile_data['hard_solved'],
+            ranking=profile_data['ranking']
+        )
+
+        # Clear old submissions and add new ones
+        if recent_submissions:
+            profile.submissions.all().delete()
+            LeetCodeSubmission.objects.bulk_create([
+                LeetCodeSubmission(profile=profile, **sub_data)
+                for sub_data in recent_submissions
+            ])
+
+    response_data = {
+        'message': 'Profile synced successfully' + (' with warnings' if warnings else ''),
+        'profile': LeetCodeProfileSerializer(profile).data
+    }
+    if warnings:
+        response_data['warnings'] = warnings
+    return response_data
+
+
+def run_job(job_id):
+    """
+    Claim a queued job and run it
+    Returns False when another worker already claimed it
+    """
+    claimed = LeetCodeSyncJob.objects.filter(
+        id=job_id, status=LeetCodeSyncJob.STATUS_QUEUED
+    ).update(status=LeetCodeSyncJob.STATUS_RUNNING, started_at=timezone.now())
+    if not claimed:
+        return False
+
+    job = LeetCodeSyncJob.objects.select_related('user__profile').get(id=job_id)
+    _execute(job)
+    return True
+
+
+def _execute(job):
+    job.attempts += 1
+    try:
+        job.result = sync_profile(job.user, job.leetcode_username)
+        job.status = LeetCodeSyncJob.STATUS_SUCCEEDED
+    except SyncError as e:
+        job.error = str(e)
+        job.status = LeetCodeSyncJob.STATUS_FAILED
+    except Exception as e:
+        logger.exception('LeetCode sync job %s failed', job.id)
+        job.error = f'Failed to sync profile: {str(e)}'
+        job.status = LeetCodeSyncJob.STATUS_FAILED
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'attempts', 'finished_at'])
+
+
+def claim_next():
+    """
+    Atomically take the oldest queued job (database backend workers)
+    SKIP LOCKED lets several workers poll the same table without blocking;
+    the status update is the claim, so backends without it stay correct
+    """
+    with transaction.atomic():
+        job = (
+            LeetCodeSyncJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=LeetCodeSyncJob.STATUS_QUEUED)
+            .order_by('created_at')
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = LeetCodeSyncJob.STATUS_RUNNING
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'started_at'])
+    return job
+
+
+def process_next():
+    """Run the oldest queued job; returns the job or None when the queue is empty"""
+    job = claim_next()
+    if job is not None:
+        _execute(job)
+    return job
+
+
+def stale_after():
+    return timedelta(minutes=getattr(settings, 'SCD_SYNC_STALE_MINUTES', 10))
+
+
+def _stale(cutoff):
+    """Jobs queued or claimed before `cutoff` and still not finished"""
+    return (
+        Q(status=LeetCodeSyncJob.STATUS_QUEUED, created_at__lt=cutoff)
+        | Q(status=LeetCodeSyncJob.STATUS_RUNNING, started_at__lt=cutoff)
+    )
+
+
+def requeue_stale(older_than=None):
+    """
+    Recover jobs whose worker died: running jobs claimed before the cutoff
+    go back to the queue, and every job queued before it is dispatched again
+    (an in-process backend loses its queue on restart). Returns the number
+    of jobs recovered.
+    """
+    cutoff = timezone.now() - (older_than or stale_after())
+    stale = list(LeetCodeSyncJob.objects.filter(_stale(cutoff)))
+    LeetCodeSyncJob.objects.filter(
+        id__in=[job.id for job in stale], status=LeetCodeSyncJob.STATUS_RUNNING,
+    ).update(status=LeetCodeSyncJob.STATUS_QUEUED, started_at=None)
+
+    backend = get_backend()
+    for job in stale:
+        backend.dispatch(job)
+    return len(stale)
+
+
+class DatabaseBackend:
+    """Jobs stay queued in the table until process_sync_jobs claims them"""
+
+    def dispatch(self, job):
+        pass
+
+
+class ThreadBackend:
+    """Run jobs on a bounded in-process pool once the enqueueing commit lands"""
+
+    def __init__(self, max_workers=None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or getattr(settings, 'SCD_SYNC_THREADS', 4),
+            thread_name_prefix='leetcode-sync',
+        )
+
+    def dispatch(self, job):
+        job_id = job.id
+        transaction.on_commit(lambda: self.executor.submit(self._run, job_id))
+
+    @staticmethod
+    def _run(job_id):
+        close_old_connections()
+        try:
+            run_job(job_id)
+        finally:
+            close_old_connections()
+
+
+class ImmediateBackend:
+    """Run jobs inline after commit"""
+
+    def dispatch(self, job):
+        job_id = job.id
+        transaction.on_commit(lambda: run_job(job_id))
+
+
+BACKENDS = {
+    'database': DatabaseBackend,
+    'thread': ThreadBackend,
+    'immediate': ImmediateBackend,
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend():
+    name = getattr(settings, 'SCD_SYNC_BACKEND', 'thread')
+    with _backends_lock:
+        if name not in _backends:
+            backend_class = BACKENDS.get(name) or import_string(name)
+            _backends[name] = backend_class()
+        return _backends[name]
+
+
+def _expire(job):
+    """Fail the job if it is still stale; returns whether it was"""
+    return LeetCodeSyncJob.objects.filter(
+        _stale(timezone.now() - stale_after()), id=job.id,
+    ).update(
+        status=LeetCodeSyncJob.STATUS_FAILED,
+        error='Sync timed out. Please try again.',
+        finished_at=timezone.now(),
+    )
+
+
+def _join(job, username):
+    """
+    The user's active job for `username`: a queued job for another username
+    is switched to this one (the worker reads the username when it claims
+    the job); a running one raises SyncInProgress. Returns None when the
+    job finished in the meantime.
+    """
+    if job.leetcode_username == username:
+        return job
+    retargeted = LeetCodeSyncJob.objects.filter(
+        id=job.id, status=LeetCodeSyncJob.STATUS_QUEUED
+    ).update(leetcode_username=username)
+    if retargeted:
+        job.leetcode_username = username
+        return job
+    job.refresh_from_db()
+    if job.status in LeetCodeSyncJob.ACTIVE_STATUSES:
+        raise SyncInProgress(job)
+    return None
+
+
+def enqueue_sync(user, username):
+    """
+    Queue a sync for `user`, or join the user's queued/running job
+    (a stale one is failed and replaced). Returns (job, created); raises
+    SyncInProgress when the running job fetches a different username
+    """
+    active = LeetCodeSyncJob.objects.filter(
+        user=user, status__in=LeetCodeSyncJob.ACTIVE_STATUSES
+    )
+    job = active.first()
+    if job is not None and _expire(job):
+        job = None
+    if job is not None:
+        joined = _join(job, username)
+        return (joined, False) if joined else enqueue_sync(user, username)
+
+    try:
+        with transaction.atomic():
+            job = LeetCodeSyncJob.objects.create(user=user, leetcode_username=username)
+            get_backend().dispatch(job)
+    except IntegrityError:
+        # A concurrent request won the partial unique constraint
+        job = active.first()
+        if job is None:
+            raise
+        joined = _join(job, username)
+        return (joined, False) if joined else enqueue_sync(user, username)
+    return job, True
@@ -4,18 +4,18 @@ LeetCode API Integration Utility
 This module handles fetching data from LeetCode's GraphQL API.
 """
 
+import json
 import requests
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from apps import http_client
+
 
 class LeetCodeAPI:
     """Handler for LeetCode GraphQL API requests"""
     
     GRAPHQL_URL = "https://leetcode.com/graphql"
-    MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
     
     HEADERS = {
         'Content-Type': 'application/json',
@@ -85,6 +85,121 @@ class LeetCodeAPI:
     }
     """
     
+    # Field selections for the combined profile query
+    MATCHED_USER_FIELDS = """
+            username
+            profile {
+                ranking
+                userAvatar
+                realName
+                aboutMe
+                reputation
+            }
+            submitStats {
+                acSubmissionNum {
+                    difficulty
+                    count
+                }
+            }
+            userCalendar(year: $year) {
+                streak
+                totalActiveDays
+                submissionCalendar
+            }
+    """
+    
+    CONTEST_FIELDS = """
+            attendedContestsCount
+            rating
+            globalRanking
+            totalParticipants
+            topPercentage
+    """
+    
+    # Profile + calendar + contest + recent submissions in one round trip
+    FULL_PROFILE_QUERY = """
+    query getFullProfile($username: String!, $year: Int!, $limit: Int!) {
+        matchedUser(username: $username) {%s}
+        userContestRanking(username: $username) {%s}
+        recentAcSubmissionList(username: $username, limit: $limit) {
+            title
+            titleSlug
+            timestamp
+            statusDisplay
+            lang
+        }
+    }
+    """ % (MATCHED_USER_FIELDS, CONTEST_FIELDS)
+    
+    @staticmethod
+    def _post(query: str, variables: Dict, label: str, username: str) -> Optional[Dict]:
+        """
+        POST a GraphQL query on the shared 'leetcode' session
+        
+        Timeouts, connection errors and 429/5xx are retried by the session's
+        retry policy (settings.OUTBOUND_HTTP). Returns the `data` dict of a
+        200 response (possibly with partial errors), or None on failure
+        """
+        try:
+            response = http_client.post(
+                'leetcode',
+                LeetCodeAPI.GRAPHQL_URL,
+                json={'query': query, 'variables': variables},
+                headers=LeetCodeAPI.HEADERS
+            )
+            
+            if response.status_code == 200:
+                return response.json().get('data') or None
+            
+            print(f"LeetCode API returned status {response.status_code}: {response.text[:200]}")
+            return None
+            
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching {label} for {username}: Max retries exceeded ({str(e)})")
+            return None
+        except Exception as e:
+            print(f"Error fetching {label} for {username}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def fetch_full_profile(username: str, submissions_limit: int = 20) -> Optional[Dict]:
+        """
+        Fetch profile, contest, calendar and recent submissions in a single request
+        
+        Args:
+            username: LeetCode username
+            submissions_limit: Number of recent accepted submissions to include
+            
+        Returns:
+            Dictionary with 'profile', 'contest', 'calendar' and 'recent_submissions'
+            keys, or None if the user could not be fetched. 'contest' and
+            'calendar' are None when LeetCode has no data for them.
+        """
+        data = LeetCodeAPI._post(
+            LeetCodeAPI.FULL_PROFILE_QUERY,
+            {'username': username, 'year': datetime.now().year, 'limit': submissions_limit},
+            'full profile',
+            username
+        )
+        
+        if not data or not data.get('matchedUser'):
+            return None
+        
+        return LeetCodeAPI._parse_full_profile(
+            data['matchedUser'],
+            data.get('userContestRanking'),
+            data.get('recentAcSubmissionList') or []
+        )
+    
+    @staticmethod
+    def _parse_full_profile(matched_user: Dict, contest_data: Optional[Dict], submissions: List[Dict]) -> Dict:
+        return {
+            'profile': LeetCodeAPI._parse_profile_data(matched_user),
+            'contest': LeetCodeAPI._parse_contest_data(contest_data),
+            'calendar': LeetCodeAPI._parse_calendar_data(matched_user.get('userCalendar')),
+            'recent_submissions': LeetCodeAPI._parse_submissions(submissions),
+        }
+    
     @staticmethod
     def fetch_user_profile(username: str) -> Optional[Dict]:
         """
@@ -96,38 +211,15 @@ class LeetCodeAPI:
         Returns:
             Dictionary with user profile data or None if failed
         """
-        for attempt in range(LeetCodeAPI.MAX_RETRIES):
-            try:
-                response = requests.post(
-                    LeetCodeAPI.GRAPHQL_URL,
-                    json={
-                        'query': LeetCodeAPI.USER_PROFILE_QUERY,
-                        'variables': {'username': username}
-                    },
-                    headers=LeetCodeAPI.HEADERS,
-                    timeout=45
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('data') and data['data'].get('matchedUser'):
-                        return LeetCodeAPI._parse_profile_data(data['data']['matchedUser'])
-                else:
-                    print(f"LeetCode API returned status {response.status_code}: {response.text[:200]}")
-                
-                return None
-                
-            except requests.exceptions.Timeout:
-                if attempt < LeetCodeAPI.MAX_RETRIES - 1:
-                    print(f"Timeout fetching profile for {username}, retrying in {LeetCodeAPI.RETRY_DELAY}s... (attempt {attempt + 1}/{LeetCodeAPI.MAX_RETRIES})")
-                    time.sleep(LeetCodeAPI.RETRY_DELAY)
-                    continue
-                else:
-                    print(f"Error fetching LeetCode profile for {username}: Max retries exceeded")
-                    return None
-            except Exception as e:
-                print(f"Error fetching LeetCode profile for {username}: {str(e)}")
-                return None
+        data = LeetCodeAPI._post(
+            LeetCodeAPI.USER_PROFILE_QUERY,
+            {'username': username},
+            'LeetCode profile',
+            username
+        )
+        if data and data.get('matchedUser'):
+            return LeetCodeAPI._parse_profile_data(data['matchedUser'])
+        return None
     
     @staticmethod
     def _parse_profile_data(matched_user: Dict) -> Dict:
@@ -172,6 +264,17 @@ class LeetCodeAPI:
             'reputation': profile.get('reputation')
         }
     
+    @staticmethod
+    def _parse_submissions(submissions: List[Dict]) -> List[Dict]:
+        """Parse recentAcSubmissionList entries into LeetCodeSubmission fields"""
+        return [{
+            'problem_title': sub.get('title'),
+            'problem_slug': sub.get('titleSlug'),
+            'status': sub.get('statusDisplay'),
+            'language': sub.get('lang'),
+            'timestamp': datetime.fromtimestamp(int(sub.get('timestamp', 0)))
+        } for sub in submissions]
+    
     @staticmethod
     def fetch_recent_submissions(username: str, limit: int = 10) -> List[Dict]:
         """
@@ -184,43 +287,26 @@ class LeetCodeAPI:
         Returns:
             List of submission dictionaries
         """
-        for attempt in range(LeetCodeAPI.MAX_RETRIES):
-            try:
-                response = requests.post(
-                    LeetCodeAPI.GRAPHQL_URL,
-                    json={
-                        'query': LeetCodeAPI.RECENT_SUBMISSIONS_QUERY,
-                        'variables': {'username': username, 'limit': limit}
-                    },
-                    headers=LeetCodeAPI.HEADERS,
-                    timeout=45
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    submissions = data.get('data', {}).get('recentAcSubmissionList', [])
-                    
-                    return [{
-                        'problem_title': sub.get('title'),
-                        'problem_slug': sub.get('titleSlug'),
-                        'status': sub.get('statusDisplay'),
-                        'language': sub.get('lang'),
-                        'timestamp': datetime.fromtimestamp(int(sub.get('timestamp', 0)))
-                    } for sub in submissions]
-                
-                return []
-                
-            except requests.exceptions.Timeout:
-                if attempt < LeetCodeAPI.MAX_RETRIES - 1:
-                    print(f"Timeout fetching submissions for {username}, retrying in {LeetCodeAPI.RETRY_DELAY}s... (attempt {attempt + 1}/{LeetCodeAPI.MAX_RETRIES})")
-                    time.sleep(LeetCodeAPI.RETRY_DELAY)
-                    continue
-                else:
-                    print(f"Error fetching recent submissions for {username}: Max retries exceeded")
-                    return []
-            except Exception as e:
-                print(f"Error fetching recent submissions for {username}: {str(e)}")
-                return []
+        data = LeetCodeAPI._post(
+            LeetCodeAPI.RECENT_SUBMISSIONS_QUERY,
+            {'username': username, 'limit': limit},
+            'recent submissions',
+            username
+        )
+        return LeetCodeAPI._parse_submissions((data or {}).get('recentAcSubmissionList') or [])
+    
+    @staticmethod
+    def _parse_contest_data(contest_data: Optional[Dict]) -> Optional[Dict]:
+        """Parse userContestRanking into a clean format"""
+        if not contest_data:
+            return None
+        
+        return {
+            'rating': int(contest_data.get('rating') or 0),
+            'global_ranking': contest_data.get('globalRanking'),
+            'contests_attended': contest_data.get('attendedContestsCount'),
+            'top_percentage': contest_data.get('topPercentage')
+        }
     
     @staticmethod
     def fetch_contest_info(username: str) -> Optional[Dict]:
@@ -233,43 +319,64 @@ class LeetCodeAPI:
         Returns:
             Dictionary with contest info or None if failed
         """
-        for attempt in range(LeetCodeAPI.MAX_RETRIES):
+        data = LeetCodeAPI._post(
+            LeetCodeAPI.CONTEST_INFO_QUERY,
+            {'username': username},
+            'contest info',
+            username
+        )
+        return LeetCodeAPI._parse_contest_data((data or {}).get('userContestRanking'))
+    
+    @staticmethod
+    def _parse_calendar_data(calendar_data: Optional[Dict]) -> Optional[Dict]:
+        """
+        Parse userCalendar: keep the last 12 months of the submission
+        calendar and count this month's problems
+        """
+        if not calendar_data:
+            return None
+        
+        submission_calendar_str = calendar_data.get('submissionCalendar', '{}')
+        
+        # Parse submission calendar JSON string
+        try:
+            submission_calendar = json.loads(submission_calendar_str) if isinstance(submission_calendar_str, str) else submission_calendar_str
+        except:
+            submission_calendar = {}
+        
+        # Convert to proper format and filter last 12 months
+        now = datetime.now()
+        twelve_months_ago = now - timedelta(days=365)
+        twelve_months_ago_timestamp = int(twelve_months_ago.timestamp())
+        
+        # Filter and convert calendar data
+        filtered_calendar = {}
+        for timestamp_str, count in (submission_calendar or {}).items():
             try:
-                response = requests.post(
-                    LeetCodeAPI.GRAPHQL_URL,
-                    json={
-                        'query': LeetCodeAPI.CONTEST_INFO_QUERY,
-                        'variables': {'username': username}
-                    },
-                    headers=LeetCodeAPI.HEADERS,
-                    timeout=45
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    contest_data = data.get('data', {}).get('userContestRanking')
-                    
-                    if contest_data:
-                        return {
-                            'rating': int(contest_data.get('rating', 0)),
-                            'global_ranking': contest_data.get('globalRanking'),
-                            'contests_attended': contest_data.get('attendedContestsCount'),
-                            'top_percentage': contest_data.get('topPercentage')
-                        }
-                
-                return None
-                
-            except requests.exceptions.Timeout:
-                if attempt < LeetCodeAPI.MAX_RETRIES - 1:
-                    print(f"Timeout fetching contest info for {username}, retrying in {LeetCodeAPI.RETRY_DELAY}s... (attempt {attempt + 1}/{LeetCodeAPI.MAX_RETRIES})")
-                    time.sleep(LeetCodeAPI.RETRY_DELAY)
-                    continue
-                else:
-                    print(f"Error fetching contest info for {username}: Max retries exceeded")
-                    return None
-            except Exception as e:
-                print(f"Error fetching contest info for {username}: {str(e)}")
-                return None
+                timestamp = int(timestamp_str)
+                if timestamp >= twelve_months_ago_timestamp:
+                    # Store as string key for JSON compatibility
+                    filtered_calendar[str(timestamp)] = int(count)
+            except (ValueError, TypeError):
+                continue
+        
+        # Calculate current month's problems
+        current_month_start = datetime(now.year, now.month, 1).timestamp()
+        next_month = now.month + 1 if now.month < 12 else 1
+        next_month_year = now.year if now.month < 12 else now.year + 1
+        current_month_end = datetime(next_month_year, next_month, 1).timestamp()
+        
+        monthly_problems = sum(
+            int(count) for timestamp_str, count in filtered_calendar.items()
+            if current_month_start <= int(timestamp_str) < current_month_end
+        )
+        
+        return {
+            'streak': calendar_data.get('streak', 0),
+            'total_active_days': calendar_data.get('totalActiveDays', 0),
+            'monthly_problems': monthly_problems,
+            'submission_calendar': filtered_calendar
+        }
     
     @staticmethod
     def fetch_calendar_data(username: str) -> Optional[Dict]:
@@ -282,81 +389,11 @@ class LeetCodeAPI:
         Returns:
             Dictionary with streak and calendar data or None if failed
         """
-        for attempt in range(LeetCodeAPI.MAX_RETRIES):
-            try:
-                from datetime import datetime
-                current_year = datetime.now().year
-                
-                response = requests.post(
-                    LeetCodeAPI.GRAPHQL_URL,
-                    json={
-                        'query': LeetCodeAPI.USER_CALENDAR_QUERY,
-                        'variables': {'username': username, 'year': current_year}
-                    },
-                    headers=LeetCodeAPI.HEADERS,
-                    timeout=45
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    matched_user = data.get('data', {}).get('matchedUser')
-                    
-                    if matched_user and matched_user.get('userCalendar'):
-                        calendar_data = matched_user['userCalendar']
-                        submission_calendar_str = calendar_data.get('submissionCalendar', '{}')
-                        
-                        # Parse submission calendar JSON string
-                        import json
-                        try:
-                            submission_calendar = json.loads(submission_calendar_str) if isinstance(submission_calendar_str, str) else submission_calendar_str
-                        except:
-                            submission_calendar = {}
-                        
-                        # Convert to proper format and filter last 12 months
-                        from datetime import datetime, timedelta
-                        now = datetime.now()
-                        twelve_months_ago = now - timedelta(days=365)
-                        twelve_months_ago_timestamp = int(twelve_months_ago.timestamp())
-                        
-                        # Filter and convert calendar data
-                        filtered_calendar = {}
-                        for timestamp_str, count in submission_calendar.items():
-                            try:
-                                timestamp = int(timestamp_str)
-                                if timestamp >= twelve_months_ago_timestamp:
-                                    # Store as string key for JSON compatibility
-                                    filtered_calendar[str(timestamp)] = int(count)
-                            except (ValueError, TypeError):
-                                continue
-                        
-                        # Calculate current month's problems
-                        current_month_start = datetime(now.year, now.month, 1).timestamp()
-                        next_month = now.month + 1 if now.month < 12 else 1
-                        next_month_year = now.year if now.month < 12 else now.year + 1
-                        current_month_end = datetime(next_month_year, next_month, 1).timestamp()
-                        
-                        monthly_problems = sum(
-                            int(count) for timestamp_str, count in filtered_calendar.items()
-                            if current_month_start <= int(timestamp_str) < current_month_end
-                        )
-                        
-                        return {
-                            'streak': calendar_data.get('streak', 0),
-                            'total_active_days': calendar_data.get('totalActiveDays', 0),
-                            'monthly_problems': monthly_problems,
-                            'submission_calendar': filtered_calendar
-                        }
-                
-                return None
-                
-            except requests.exceptions.Timeout:
-                if attempt < LeetCodeAPI.MAX_RETRIES - 1:
-                    print(f"Timeout fetching calendar for {username}, retrying in {LeetCodeAPI.RETRY_DELAY}s... (attempt {attempt + 1}/{LeetCodeAPI.MAX_RETRIES})")
-                    time.sleep(LeetCodeAPI.RETRY_DELAY)
-                    continue
-                else:
-                    print(f"Error fetching calendar data for {username}: Max retries exceeded")
-                    return None
-            except Exception as e:
-                print(f"Error fetching calendar data for {username}: {str(e)}")
-                return None
+        data = LeetCodeAPI._post(
+            LeetCodeAPI.USER_CALENDAR_QUERY,
+            {'username': username, 'year': datetime.now().year},
+            'calendar data',
+            username
+        )
+        matched_user = (data or {}).get('matchedUser')
+        return LeetCodeAPI._parse_calendar_data(matched_user.get('userCalendar') if matched_user else None)
@@ -0,0 +1,59 @@
+"""
+Worker for queued LeetCode profile syncs (SCD_SYNC_BACKEND = 'database')
+Run alongside the web process: python manage.py process_sync_jobs
+Run several for more throughput; jobs are claimed with SKIP LOCKED
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.scd import jobs
+
+
+class Command(BaseCommand):
+    help = 'Process queued LeetCode profile sync jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue and exit instead of polling',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait between polls when the queue is empty',
+        )
+        parser.add_argument(
+            '--stale-minutes',
+            type=int,
+            default=getattr(settings, 'SCD_SYNC_STALE_MINUTES', 10),
+            help='Requeue jobs queued or running longer than this (worker crashed mid-sync)',
+        )
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(minutes=options['stale_minutes'])
+        processed = 0
+
+        requeued = jobs.requeue_stale(stale_after)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale job(s)'))
+
+        try:
+            while True:
+                job = jobs.process_next()
+                if job is not None:
+                    processed += 1
+                    self.stdout.write(f'Job {job.id} ({job.leetcode_username}): {job.status}')
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                jobs.requeue_stale(stale_after)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} sync job(s)'))
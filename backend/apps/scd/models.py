@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
@@ -110,3 +111,50 @@ class ProgressSnapshot(models.Model):
     
     def __str__(self):
         return f"{self.profile.leetcode_username} - {self.snapshot_date.date()}"
+
+
+class LeetCodeSyncJob(models.Model):
+    """
+    Queued LeetCode profile sync for a user
+    At most one queued/running job exists per user; see apps/scd/jobs.py
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='leetcode_sync_jobs')
+    leetcode_username = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+
+    result = models.JSONField(null=True, blank=True, help_text="Sync response payload on success")
+    error = models.TextField(blank=True)
+    attempts = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='scd_syncjob_status_idx'),
+        ]
+        constraints = [
+            # Dedupe: repeated clicks join the user's pending job
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(status__in=['queued', 'running']),
+                name='scd_one_active_sync_job_per_user',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.leetcode_username} ({self.status})"
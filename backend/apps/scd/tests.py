@@ -0,0 +1,139 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from . import jobs
+from .leetcode_api import LeetCodeAPI
+from .models import LeetCodeProfile, LeetCodeSyncJob
+
+
+FULL_PROFILE = {
+    'profile': {
+        'total_solved': 42, 'easy_solved': 20, 'medium_solved': 15,
+        'hard_solved': 7, 'ranking': 1000,
+    },
+    'contest': {'rating': 1500},
+    'calendar': {
+        'streak': 3, 'monthly_problems': 12, 'total_active_days': 9,
+        'submission_calendar': {},
+    },
+    'recent_submissions': [],
+}
+
+
+class LeetCodeSyncJobTests(TestCase):
+    """Queued profile sync: POST /api/scd/profiles/sync/ and job polling"""
+
+    def setUp(self):
+        self.user = User.objects.create(username='student')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _sync(self, username='alice'):
+        return self.client.post('/api/scd/profiles/sync/', {'leetcode_username': username})
+
+    @override_settings(SCD_SYNC_BACKEND='database')
+    @mock.patch.object(LeetCodeAPI, 'fetch_full_profile', return_value=FULL_PROFILE)
+    def test_enqueue_dedupes_and_worker_completes(self, fetch):
+        response = self._sync()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], 'queued')
+        self.assertFalse(response.data['deduplicated'])
+        job_id = response.data['job_id']
+
+        # Repeated clicks join the pending job
+        again = self._sync()
+        self.assertEqual(again.data['job_id'], job_id)
+        self.assertTrue(again.data['deduplicated'])
+        fetch.assert_not_called()
+
+        job = jobs.process_next()
+        self.assertEqual(job.id, job_id)
+        self.assertIsNone(jobs.process_next())
+        fetch.assert_called_once_with('alice', submissions_limit=20)
+
+        status_response = self.client.get(f'/api/scd/profiles/sync/{job_id}/')
+        self.assertEqual(status_response.data['status'], 'succeeded')
+        self.assertEqual(status_response.data['result']['profile']['total_solved'], 42)
+        self.assertTrue(LeetCodeProfile.objects.filter(user=self.user, leetcode_username='alice').exists())
+
+        # Finished jobs no longer block a new sync
+        self.assertNotEqual(self._sync().data['job_id'], job_id)
+
+    @override_settings(SCD_SYNC_BACKEND='database')
+    @mock.patch.object(LeetCodeAPI, 'fetch_full_profile', return_value=FULL_PROFILE)
+    def test_dedupe_respects_the_requested_username(self, fetch):
+        job_id = self._sync('alice').data['job_id']
+
+        # Still queued: the job switches to the new username
+        response = self._sync('bob')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['job_id'], job_id)
+        self.assertEqual(response.data['leetcode_username'], 'bob')
+
+        # Running: another username is refused, the same one joins
+        job = jobs.claim_next()
+        conflict = self._sync('carol')
+        self.assertEqual(conflict.status_code, 409)
+        self.assertEqual(conflict.data['job_id'], job_id)
+        self.assertEqual(conflict.data['leetcode_username'], 'bob')
+        self.assertIn('bob', conflict.data['error'])
+        self.assertEqual(self._sync('bob').data['job_id'], job_id)
+
+        jobs._execute(job)
+        fetch.assert_called_once_with('bob', submissions_limit=20)
+
+    @override_settings(SCD_SYNC_BACKEND='immediate')
+    @mock.patch.object(LeetCodeAPI, 'fetch_full_profile', return_value=None)
+    def test_failed_fetch_marks_job_failed(self, fetch):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._sync('ghost')
+        self.assertEqual(response.status_code, 202)
+
+        job = LeetCodeSyncJob.objects.get(id=response.data['job_id'])
+        self.assertEqual(job.status, 'failed')
+        self.assertIn('check the username', job.error)
+        self.assertEqual(
+            self.client.get(f'/api/scd/profiles/sync/{job.id}/').data['error'], job.error
+        )
+
+    @override_settings(SCD_SYNC_BACKEND='database')
+    def test_jobs_are_private_and_stale_jobs_requeue(self):
+        job_id = self._sync().data['job_id']
+
+        other = APIClient()
+        other.force_authenticate(User.objects.create(username='other'))
+        self.assertEqual(other.get(f'/api/scd/profiles/sync/{job_id}/').status_code, 404)
+
+        jobs.claim_next()
+        LeetCodeSyncJob.objects.filter(id=job_id).update(started_at='2000-01-01T00:00:00Z')
+        self.assertEqual(jobs.requeue_stale(), 1)
+        self.assertEqual(LeetCodeSyncJob.objects.get(id=job_id).status, 'queued')
+
+    @override_settings(SCD_SYNC_BACKEND='database')
+    def test_lost_jobs_do_not_block_new_syncs(self):
+        job_id = self._sync().data['job_id']
+        jobs.claim_next()
+        # The worker died mid-run (restart, crashed thread pool)
+        LeetCodeSyncJob.objects.filter(id=job_id).update(
+            created_at='2000-01-01T00:00:00Z', started_at='2000-01-01T00:00:00Z',
+        )
+
+        response = self._sync('bob')
+        self.assertEqual(response.status_code, 202)
+        self.assertNotEqual(response.data['job_id'], job_id)
+        self.assertFalse(response.data['deduplicated'])
+        lost = LeetCodeSyncJob.objects.get(id=job_id)
+        self.assertEqual(lost.status, 'failed')
+        self.assertIn('timed out', lost.error)
+
+    @mock.patch.object(jobs.ImmediateBackend, 'dispatch')
+    @override_settings(SCD_SYNC_BACKEND='immediate')
+    def test_requeue_redispatches_old_queued_jobs(self, dispatch):
+        job = LeetCodeSyncJob.objects.create(user=self.user, leetcode_username='alice')
+        self.assertEqual(jobs.requeue_stale(), 0)
+        LeetCodeSyncJob.objects.filter(id=job.id).update(created_at='2000-01-01T00:00:00Z')
+        self.assertEqual(jobs.requeue_stale(), 1)
+        self.assertEqual(dispatch.call_args.args[0].id, job.id)
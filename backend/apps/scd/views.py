@@ -2,10 +2,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils import timezone
-from django.db import transaction
 
-from .models import LeetCodeProfile, LeetCodeSubmission, ProgressSnapshot
+from .models import LeetCodeProfile, LeetCodeSyncJob
 from .serializers import (
     LeetCodeProfileSerializer,
     LeetCodeProfileCreateSerializer,
@@ -13,7 +14,7 @@ from .serializers import (
     ProgressSnapshotSerializer,
     LeetCodeSyncSerializer
 )
-from .leetcode_api import LeetCodeAPI
+from .jobs import SyncInProgress, enqueue_sync
 
 
 class LeetCodeProfileViewSet(viewsets.ModelViewSet):
@@ -26,7 +27,8 @@ class LeetCodeProfileViewSet(viewsets.ModelViewSet):
     - GET /api/scd/profiles/{id}/ - Get profile details
     - PUT/PATCH /api/scd/profiles/{id}/ - Update profile
     - DELETE /api/scd/profiles/{id}/ - Delete profile
-    - POST /api/scd/profiles/sync/ - Sync data from LeetCode API
+    - POST /api/scd/profiles/sync/ - Queue a sync from LeetCode API (202)
+    - GET /api/scd/profiles/sync/{job_id}/ - Poll a sync job
     - POST /api/scd/profiles/{id}/submit/ - Submit for review
     - GET /api/scd/profiles/stats/ - Get user stats
     """
@@ -60,139 +62,60 @@ class LeetCodeProfileViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def sync(self, request):
         """
-        Sync LeetCode profile data from the API
+        Queue a sync of LeetCode profile data from the API
         
         POST /api/scd/profiles/sync/
         Body: {"leetcode_username": "username"}
+        
+        Returns 202 with the job; poll GET /api/scd/profiles/sync/{job_id}/.
+        A user with a sync already queued or running gets that job back (a
+        queued job switches to the new username); 409 while a sync for a
+        different username is running.
         """
         serializer = LeetCodeSyncSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         username = serializer.validated_data['leetcode_username']
-        
-        # Fetch data from LeetCode API
-        profile_data = LeetCodeAPI.fetch_user_profile(username)
-        
-        if not profile_data:
+        try:
+            job, created = enqueue_sync(request.user, username)
+        except SyncInProgress as e:
             return Response(
-                {'error': 'Failed to fetch LeetCode profile. Please check the username and try again.'},
-                status=status.HTTP_400_BAD_REQUEST
+                self._job_payload(request, e.job, error=str(e)),
+                status=status.HTTP_409_CONFLICT
             )
         
-        # Fetch additional data (non-critical, can timeout)
-        warnings = []
-        
-        contest_info = LeetCodeAPI.fetch_contest_info(username)
-        if not contest_info:
-            warnings.append('Contest data unavailable - LeetCode API timeout or no contest history')
-        
-        calendar_data = LeetCodeAPI.fetch_calendar_data(username)
-        if not calendar_data:
-            warnings.append('Calendar data unavailable - LeetCode API timeout')
+        return Response(
+            self._job_payload(request, job, deduplicated=not created),
+            status=status.HTTP_202_ACCEPTED
+        )
+    
+    @action(detail=False, methods=['get'], url_path=r'sync/(?P<job_id>\d+)')
+    def sync_status(self, request, job_id=None):
+        """
+        Poll a sync job
         
-        try:
-            with transaction.atomic():
-                # Get or create profile
-                profile, created = LeetCodeProfile.objects.get_or_create(
-                    user=request.user,
-                    leetcode_username=username,
-                    defaults={
-                        'total_solved': profile_data['total_solved'],
-                        'easy_solved': profile_data['easy_solved'],
-                        'medium_solved': profile_data['medium_solved'],
-                        'hard_solved': profile_data['hard_solved'],
-                        'ranking': profile_data['ranking'],
-                        'contest_rating': contest_info['rating'] if contest_info else None,
-                        'streak': calendar_data['streak'] if calendar_data else 0,
-                        'monthly_problems_count': calendar_data['monthly_problems'] if calendar_data else 0,
-                        'total_active_days': calendar_data['total_active_days'] if calendar_data else 0,
-                        'submission_calendar': calendar_data['submission_calendar'] if calendar_data else {},
-                    }
-                )
-                
-                # Update existing profile
-                if not created:
-                    profile.total_solved = profile_data['total_solved']
-                    profile.easy_solved = profile_data['easy_solved']
-                    profile.medium_solved = profile_data['medium_solved']
-                    profile.hard_solved = profile_data['hard_solved']
-                    profile.ranking = profile_data['ranking']
-                    if contest_info:
-                        profile.contest_rating = contest_info['rating']
-                    if calendar_data:
-                        profile.streak = calendar_data['streak']
-                        profile.monthly_problems_count = calendar_data['monthly_problems']
-                        profile.total_active_days = calendar_data['total_active_days']
-                        profile.submission_calendar = calendar_data['submission_calendar']
-                    profile.save()
-                
-                # Check if monthly target is met (minimum 10 problems)
-                monthly_target_met = (calendar_data and calendar_data['monthly_problems'] >= 10) if calendar_data else False
-                
-                # If target not met, create notification for mentor
-                if not monthly_target_met and hasattr(request.user, 'profile') and request.user.profile.assigned_mentor:
-                    from apps.dashboard.models import Notification
-                    from datetime import datetime
-                    
-                    # Check if notification already exists for this month
-                    current_month = datetime.now().strftime('%Y-%m')
-                    existing_notif = Notification.objects.filter(
-                        user=request.user.profile.assigned_mentor,
-                        message__contains=f"monthly target ({current_month})",
-                        created_at__month=datetime.now().month,
-                        created_at__year=datetime.now().year
-                    ).exists()
-                    
-                    if not existing_notif:
-                        problems_count = calendar_data['monthly_problems'] if calendar_data else 0
-                        student_name = request.user.get_full_name() or request.user.username
-                        Notification.objects.create(
-                            user=request.user.profile.assigned_mentor,
-                            message=f"{student_name} has only solved {problems_count}/10 problems this month on LeetCode (monthly target ({current_month}))",
-                            notification_type='warning'
-                        )
-                
-                # Create progress snapshot
-                ProgressSnapshot.objects.create(
-                    profile=profile,
-                    total_solved=profile_data['total_solved'],
-                    easy_solved=profile_data['easy_solved'],
-                    medium_solved=profile_data['medium_solved'],
-                    hard_solved=profile_data['hard_solved'],
-                    ranking=profile_data['ranking']
-                )
-                
-                # Fetch and save recent submissions (non-critical)
-                recent_submissions = LeetCodeAPI.fetch_recent_submissions(username, limit=20)
-                if not recent_submissions:
-                    warnings.append('Recent submissions unavailable - LeetCode API timeout')
-                
-                # Clear old submissions and add new ones
-                if recent_submissions:
-                    profile.submissions.all().delete()
-                    for sub_data in recent_submissions:
-                        LeetCodeSubmission.objects.create(
-                            profile=profile,
-                            **sub_data
-                        )
-                
-                # Return updated profile with warnings
-                output_serializer = LeetCodeProfileSerializer(profile)
-                response_data = {
-                    'message': 'Profile synced successfully' + (' with warnings' if warnings else ''),
-                    'profile': output_serializer.data
-                }
-                
-                if warnings:
-                    response_data['warnings'] = warnings
-                
-                return Response(response_data, status=status.HTTP_200_OK)
-                
-        except Exception as e:
-            return Response(
-                {'error': f'Failed to sync profile: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        GET /api/scd/profiles/sync/{job_id}/
+        """
+        job = get_object_or_404(LeetCodeSyncJob, id=job_id, user=request.user)
+        return Response(self._job_payload(request, job), status=status.HTTP_200_OK)
+    
+    def _job_payload(self, request, job, **extra):
+        payload = {
+            'job_id': job.id,
+            'status': job.status,
+            'leetcode_username': job.leetcode_username,
+            'status_url': request.build_absolute_uri(
+                reverse('leetcode-profile-sync-status', kwargs={'job_id': job.id})
+            ),
+            'created_at': job.created_at,
+            'finished_at': job.finished_at,
+            **extra,
+        }
+        if job.status == LeetCodeSyncJob.STATUS_SUCCEEDED:
+            payload['result'] = job.result
+        elif job.status == LeetCodeSyncJob.STATUS_FAILED:
+            payload['error'] = job.error
+        return payload
     
     @action(detail=True, methods=['post'])
     def submit(self, request, pk=None):
@@ -226,6 +226,39 @@ USE_ANALYTICS_SUMMARY = os.getenv('USE_ANALYTICS_SUMMARY', 'False') == 'True'
 # When True: Uses pre-computed analytics summaries (fast, scales to 2000+ students)
 # When False: Uses live aggregation (current behavior, development mode)
 
+ANALYTICS_SUMMARY_MAX_AGE = int(os.getenv('ANALYTICS_SUMMARY_MAX_AGE', 600))
+# Seconds before a summary row counts as stale; stale rows are recomputed live per request
+
+USE_ANALYTICS_DELTAS = os.getenv('USE_ANALYTICS_DELTAS', 'False') == 'True'
+# When True: Submission/profile changes log counter deltas; `compact_analytics` folds them into the summaries
+# When False: Summaries only change when `recompute_analytics` runs (current behavior)
+
+ANALYTICS_DRIFT_THRESHOLD = float(os.getenv('ANALYTICS_DRIFT_THRESHOLD', 0.05))
+# Share of summaries `recompute_analytics --validate` may find out of tolerance
+# before the run and /health/ report drift (validation logs from the last 24h)
+
+ADMIN_STATS_CACHE_TTL = int(os.getenv('ADMIN_STATS_CACHE_TTL', 30))
+# Seconds the admin stats response stays cached; any submission or profile change
+# invalidates it earlier by bumping its cache version (no-op while caching is off)
+
+DASHBOARD_STATS_CACHE_TTL = int(os.getenv('DASHBOARD_STATS_CACHE_TTL', 6 * 60 * 60))
+DASHBOARD_STATS_LOCAL_CACHE_TTL = int(os.getenv('DASHBOARD_STATS_LOCAL_CACHE_TTL', 5 * 60))
+# Seconds a student's dashboard stats stay cached; their submissions, reviews, profile
+# and name changes invalidate it earlier by bumping a per-user cache version. Bumps only
+# reach other workers through Redis, so the LocMemCache fallback uses the LOCAL TTL
+
+GAMIFICATION_OVERVIEW_CACHE_TTL = int(os.getenv('GAMIFICATION_OVERVIEW_CACHE_TTL', 10 * 60))
+# Seconds a student's gamification overview stays cached; score, wallet, streak,
+# episode progress, leaderboard and season changes invalidate it earlier (cache versions)
+
+GAMIFICATION_SEASON_MEMO_TTL = int(os.getenv('GAMIFICATION_SEASON_MEMO_TTL', 60))
+# Seconds a worker reuses its in-memory active season; season changes invalidate it earlier
+# in every worker with a shared cache (Redis), but only in the saving worker with LocMemCache
+
+GAMIFICATION_BATCH_STATS_TTL = int(os.getenv('GAMIFICATION_BATCH_STATS_TTL', 5 * 60))
+# Seconds the per-season completion distribution (batch stats, percentiles) is reused;
+# students' own progress is always read live and located in it by binary search
+
 # Notification Optimization
 USE_NOTIFICATION_CACHE = os.getenv('USE_NOTIFICATION_CACHE', 'False') == 'True'
 # When True: Caches notification counts for 30 seconds
@@ -236,16 +269,68 @@ USE_CLOUD_STORAGE = os.getenv('USE_CLOUD_STORAGE', 'False') == 'True'
 # When True: Uses AWS S3 or cloud storage (production)
 # When False: Uses local filesystem (current behavior, development)
 
+# Cross-Pillar Submission Index
+USE_SUBMISSION_INDEX = os.getenv('USE_SUBMISSION_INDEX', 'False') == 'True'
+# When True: Submission saves keep the SubmissionIndex table in sync and the mentor dashboard
+#            reads it (run backfill_submission_index after turning it on)
+# When False: Queries the submission models directly and skips index writes (current behavior)
+
+# Gamification Episode Progress
+GAMIFICATION_LAZY_EPISODE_PROGRESS = os.getenv('GAMIFICATION_LAZY_EPISODE_PROGRESS', 'False') == 'True'
+# When True: A student's EpisodeProgress rows are created on their first gamification access
+# When False: New episodes create rows for every student up front in chunked bulk inserts (current behavior)
+
 # Background Tasks
 USE_ASYNC_TASKS = os.getenv('USE_ASYNC_TASKS', 'False') == 'True'
 # When True: Uses Celery/Redis for background tasks (production)
 # When False: Tasks run synchronously (current behavior, development)
 
+# LeetCode Profile Sync Jobs (apps/scd/jobs.py)
+SCD_SYNC_BACKEND = os.getenv('SCD_SYNC_BACKEND', 'thread' if DEBUG else 'database')
+SCD_SYNC_THREADS = int(os.getenv('SCD_SYNC_THREADS', 4))
+# 'thread': Runs queued syncs on an in-process pool (DEBUG default; a restart loses the pool's queue)
+# 'database': Queued syncs wait for `python manage.py process_sync_jobs` workers (production default)
+
+SCD_SYNC_STALE_MINUTES = int(os.getenv('SCD_SYNC_STALE_MINUTES', 10))
+# Jobs queued or running longer than this count as lost: a new sync request replaces them
+# and process_sync_jobs hands them to the backend again
+
 # Database Query Logging (Debug only)
 LOG_QUERY_TIMES = DEBUG and os.getenv('LOG_QUERY_TIMES', 'False') == 'True'
 # When True: Logs slow queries to console (helpful for optimization)
 # When False: No query logging (default)
 
+# ============================================================================
+# OUTBOUND HTTP (shared keep-alive pools for third-party APIs)
+# ============================================================================
+# Used by apps/http_client.py. Each upstream (leetcode, github, youtube,
+# hackathons, linkedin) gets one pooled session; UPSTREAMS overrides defaults.
+OUTBOUND_HTTP = {
+    'POOL_CONNECTIONS': int(os.getenv('HTTP_POOL_CONNECTIONS', 10)),
+    'POOL_MAXSIZE': int(os.getenv('HTTP_POOL_MAXSIZE', 10)),
+    'TIMEOUT': (
+        float(os.getenv('HTTP_CONNECT_TIMEOUT', 5)),
+        float(os.getenv('HTTP_READ_TIMEOUT', 10)),
+    ),
+    'MAX_RETRIES': int(os.getenv('HTTP_MAX_RETRIES', 2)),
+    'BACKOFF_FACTOR': float(os.getenv('HTTP_BACKOFF_FACTOR', 0.5)),
+    'UPSTREAMS': {
+        # GraphQL reads are POSTs, so they are safe to retry
+        'leetcode': {
+            'TIMEOUT': (5, 45),
+            'RETRY_METHODS': ('GET', 'POST'),
+        },
+        # ConcurrentStreakSync: one session shared by every run and worker. Retries
+        # happen in the sync (through its rate limiter), not in the adapter
+        'leetcode_sync': {
+            'POOL_CONNECTIONS': 1,
+            'POOL_MAXSIZE': int(os.getenv('LEETCODE_SYNC_POOL_MAXSIZE', 16)),
+            'TIMEOUT': (5, 10),
+            'MAX_RETRIES': 0,
+        },
+    },
+}
+
 # ============================================================================
 # CACHING CONFIGURATION (LOCAL SAFE, REDIS READY)
 # ============================================================================
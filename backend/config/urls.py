@@ -11,7 +11,7 @@ from rest_framework_simplejwt.views import TokenObtainPairView as BaseTokenObtai
 from apps.jwt_serializers import EmailTokenObtainPairSerializer
 from apps.users_views import UserProfileView
 from apps.setup_view import setup_database
-from apps.health_check_views import health_check as app_health_check, readiness_check, liveness_check
+from apps.health_check_views import health_check as app_health_check, readiness_check, liveness_check, upstream_metrics
 from apps.debug_views import list_urls
 from config.health import health_check as render_health_check
 from apps.fix_passwords_view import fix_user_password
@@ -68,6 +68,7 @@ urlpatterns = [
     path('health/', app_health_check, name='health_check'),
     path('health/ready/', readiness_check, name='readiness_check'),
     path('health/live/', liveness_check, name='liveness_check'),
+    path('health/upstreams/', upstream_metrics, name='upstream_metrics'),
     # Debug: list loaded URL patterns
     path('api/debug/urls/', list_urls, name='debug_urls'),
     
@@ -2,7 +2,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-import requests
+from apps import http_client
 from datetime import datetime
 
 
@@ -43,7 +43,8 @@ class HackathonListView(APIView):
         
         # Try MLH (Major League Hacking) - They have a public events page
         try:
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://mlh.io/seasons/2025/events',
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -97,7 +98,8 @@ class HackathonListView(APIView):
         
         # Try DevPost - Scrape their hackathons page
         try:
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://devpost.com/hackathons',
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -154,7 +156,8 @@ class HackathonListView(APIView):
         
         # Try Unstop with proper headers
         try:
-            response = requests.get(
+            response = http_client.get(
+                'hackathons',
                 'https://unstop.com/hackathons',
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
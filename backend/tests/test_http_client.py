@@ -0,0 +1,69 @@
+"""
+Outbound HTTP Client Tests
+==========================
+Tests for the shared keep-alive sessions in apps/http_client.py.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase, override_settings
+
+from apps import http_client
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive server that fails the first /flaky request with a 503"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status_code = 200
+        if self.path == '/flaky' and not self.server.flaked:
+            self.server.flaked = True
+            status_code = 503
+
+        self.send_response(status_code)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(OUTBOUND_HTTP={'BACKOFF_FACTOR': 0, 'UPSTREAMS': {'stub': {'POOL_MAXSIZE': 2}}})
+class HttpClientTests(SimpleTestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.flaked = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        http_client.close_all()
+
+    def tearDown(self):
+        http_client.close_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_upstream_config_overrides_defaults(self):
+        config = http_client.get_config('stub')
+        self.assertEqual(config['POOL_MAXSIZE'], 2)
+        self.assertEqual(config['BACKOFF_FACTOR'], 0)
+        self.assertEqual(config['TIMEOUT'], http_client.DEFAULTS['TIMEOUT'])
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            self.assertEqual(http_client.get('stub', f'{self.base_url}/ok').status_code, 200)
+
+        stats = http_client.metrics()['stub']
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['reuse_ratio'], 0.8)
+        self.assertEqual(sum(stats['latency_histogram'].values()), 5)
+
+    def test_retries_server_errors(self):
+        response = http_client.get('stub', f'{self.base_url}/flaky')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.server.flaked)
@@ -0,0 +1,264 @@
+"""
+Mentor View Tests
+=================
+Tests for the cross-pillar mentor APIs in apps/mentor_views.py.
+"""
+
+import csv
+import json
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.cfc.models import HackathonSubmission, InternshipSubmission
+from apps.clt.models import CLTSubmission
+from apps.dashboard.models import MonthlyReportSnapshot
+from apps.iipc.models import LinkedInPostVerification
+from apps.scd.models import LeetCodeProfile
+
+
+class MentorViewTestCase(TestCase):
+    """Mentor with a configurable number of assigned students"""
+
+    def setUp(self):
+        self.mentor = User.objects.create(username='mentor')
+        self.mentor.profile.role = 'MENTOR'
+        self.mentor.profile.save()
+        self.client = APIClient()
+        self.client.force_authenticate(self.mentor)
+        self.students = []
+
+    def add_students(self, count):
+        today = date.today()
+        for _ in range(count):
+            index = len(self.students)
+            student = User.objects.create(
+                username=f'student{index}', first_name='Student', last_name=str(index)
+            )
+            student.profile.assigned_mentor = self.mentor
+            student.profile.save()
+            self.students.append(student)
+
+            HackathonSubmission.objects.create(
+                user=student, hackathon_name=f'Hack {index}', mode='online',
+                registration_date=today, participation_date=today, status='submitted',
+                submitted_at=timezone.now() - timedelta(minutes=index),
+            )
+            CLTSubmission.objects.create(
+                user=student, title=f'Course {index}', description='Course',
+                platform='Coursera', completion_date=today, status='approved',
+                reviewed_at=timezone.now(),
+            )
+            LinkedInPostVerification.objects.create(
+                user=student, post_url='https://linkedin.com/posts/1', post_date=today,
+                character_count=100, hashtag_count=3, status='pending',
+            )
+
+
+class MentorDashboardTests(MentorViewTestCase):
+    """GET /api/mentor/dashboard/"""
+
+    url = '/api/mentor/dashboard/'
+
+    def test_feed_and_stats(self):
+        self.add_students(3)
+        InternshipSubmission.objects.create(
+            user=self.students[0], company='Acme', role='Intern',
+            mode='remote', duration='3 months',
+        )
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        stats = response.data['stats']
+        self.assertEqual(stats['total_students'], 3)
+        self.assertEqual(stats['approved_today'], 3)
+
+        feed = response.data['recent_submissions']
+        self.assertEqual(len(feed), stats['total_submissions'])
+        sort_keys = [item['submitted_at'] for item in feed]
+        self.assertEqual(sort_keys, sorted(sort_keys, reverse=True))
+
+        hackathon = next(item for item in feed if item['modelType'] == 'hackathon'
+                         and item['student']['id'] == self.students[0].id)
+        self.assertEqual(hackathon['title'], 'Hack 0')
+        self.assertEqual(hackathon['student']['name'], 'Student 0')
+        self.assertEqual(hackathon['id'], f"cfc_hackathon_{hackathon['dbId']}")
+        internship = next(item for item in feed if item['modelType'] == 'internship')
+        self.assertEqual(internship['title'], 'Internship at Acme')
+
+    def test_feed_is_limited_in_database(self):
+        self.add_students(10)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['recent_submissions']), 20)
+        self.assertEqual(response.data['stats']['total_submissions'], 30)
+
+    def test_query_count_is_constant(self):
+        self.add_students(2)
+        with self.assertNumQueries(8):
+            self.client.get(self.url)
+
+        self.add_students(20)
+        with self.assertNumQueries(8):
+            self.client.get(self.url)
+
+
+
+class PillarSubmissionsTests(MentorViewTestCase):
+    """GET /api/mentor/pillar/<pillar>/submissions/"""
+
+    def setUp(self):
+        super().setUp()
+        self.add_students(5)
+
+    def walk(self, pillar='all', **params):
+        pages, cursor = [], None
+        while True:
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(f'/api/mentor/pillar/{pillar}/submissions/', params)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            cursor = response.data['next_cursor']
+            if not cursor:
+                return pages
+
+    def test_cursor_pagination_covers_every_row_once(self):
+        # Identical timestamps force the (model type, id) tie-breakers
+        CLTSubmission.objects.update(submitted_at=timezone.now())
+
+        for sort in ('latest', 'oldest'):
+            pages = self.walk(page_size=4, sort=sort)
+            ids = [item['id'] for page in pages for item in page['submissions']]
+            self.assertEqual(len(ids), 15)
+            self.assertEqual(len(set(ids)), 15)
+            self.assertTrue(all(len(page['submissions']) <= 4 for page in pages))
+            self.assertEqual(pages[0]['total'], 15)
+            self.assertFalse(pages[-1]['has_more'])
+
+    def test_status_search_and_pillar_filters(self):
+        pages = self.walk(pillar='clt', status='approved', search='course 3')
+        self.assertEqual(
+            [item['title'] for item in pages[0]['submissions']], ['Course 3']
+        )
+
+        pages = self.walk(search='student 2')
+        self.assertEqual(pages[0]['total'], 3)
+
+        pages = self.walk(pillar='cfc', search='online hackathon')
+        self.assertEqual(pages[0]['total'], 5)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/mentor/pillar/all/submissions/', {'cursor': 'nope'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_page_query_count_is_bounded(self):
+        self.add_students(20)
+        # total, page keys, then one query per model type on the page (clt, linkedin)
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                '/api/mentor/pillar/all/submissions/', {'page_size': 10}
+            )
+        self.assertEqual(len(response.data['submissions']), 10)
+
+
+class MentorStudentsTests(MentorViewTestCase):
+    """GET /api/mentor/students/"""
+
+    url = '/api/mentor/students/'
+
+    def test_per_student_pillar_stats(self):
+        self.add_students(2)
+        LinkedInPostVerification.objects.filter(user=self.students[1]).update(status='approved')
+        LeetCodeProfile.objects.create(
+            user=self.students[0], leetcode_username='coder', total_solved=50,
+            monthly_problems_count=12,
+        )
+
+        response = self.client.get(self.url)
+        students = {item['username']: item['submissions'] for item in response.data['students']}
+
+        first = students['student0']
+        self.assertEqual(first['clt'], {
+            'status': 'completed', 'count': 1,
+            'lastSubmission': CLTSubmission.objects.get(user=self.students[0]).created_at,
+        })
+        self.assertEqual(first['cfc']['status'], 'pending')
+        self.assertEqual(first['cfc']['count'], 1)
+        self.assertEqual(first['iipc']['status'], 'pending')
+        self.assertEqual(first['scd']['status'], 'completed')
+        self.assertEqual(first['scd']['count'], 50)
+        self.assertEqual(students['student1']['iipc']['status'], 'completed')
+        self.assertEqual(students['student1']['scd']['status'], 'not-started')
+
+    def test_query_count_is_constant(self):
+        self.add_students(2)
+        with self.assertNumQueries(8):
+            self.client.get(self.url)
+
+        self.add_students(30)
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['total'], 32)
+
+
+class MonthlyReportExportTests(MentorViewTestCase):
+    """GET /api/mentor/reports/monthly/ and the per-student report views"""
+
+    url = '/api/mentor/reports/monthly/'
+
+    def setUp(self):
+        super().setUp()
+        self.add_students(3)
+        for model in (HackathonSubmission, CLTSubmission, LinkedInPostVerification):
+            model.objects.update(created_at=timezone.make_aware(datetime(2025, 3, 10)))
+
+    def stream(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_json_export_generates_snapshots_once(self):
+        response = self.client.get(self.url, {'year': 2025, 'month': 3})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(self.stream(response))
+        self.assertEqual(len(data['reports']), 3)
+        self.assertEqual(data['reports'][0]['pillars']['clt']['status'], 'completed')
+        self.assertEqual(data['reports'][0]['mentor_id'], self.mentor.id)
+        self.assertEqual(MonthlyReportSnapshot.objects.count(), 3)
+
+        # Snapshots are immutable: later changes do not rewrite them
+        CLTSubmission.objects.filter(user=self.students[0]).delete()
+        data = json.loads(self.stream(self.client.get(self.url, {'year': 2025, 'month': 3})))
+        self.assertEqual(data['reports'][0]['pillars']['clt']['completed'], 1)
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {'year': 2025, 'month': 3, 'export': 'csv'})
+        rows = list(csv.DictReader(self.stream(response).splitlines()))
+        self.assertEqual([row['username'] for row in rows], ['student0', 'student1', 'student2'])
+        self.assertEqual(rows[0]['cfc_total'], '1')
+        self.assertEqual(rows[0]['iipc_pending'], '1')
+
+    def test_scope_and_month_checks(self):
+        now = timezone.now()
+        response = self.client.get(self.url, {'year': now.year, 'month': now.month})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(self.url, {'year': 2025, 'month': 3, 'campus': 'TECH', 'floor': 1})
+        self.assertEqual(response.status_code, 403)
+
+    def test_student_report_and_months(self):
+        LeetCodeProfile.objects.create(user=self.students[0], leetcode_username='coder', total_solved=12)
+        response = self.client.get(
+            f'/api/mentor/student/{self.students[0].id}/monthly-report/', {'year': 2025, 'month': 3}
+        )
+        self.assertEqual(response.data['pillars']['clt']['completed'], 1)
+        self.assertEqual(response.data['pillars']['scd']['completed'], 1)
+
+        # The LeetCode profile was created this month
+        now = timezone.now()
+        response = self.client.get(f'/api/mentor/student/{self.students[0].id}/available-months/')
+        self.assertEqual(
+            [(item['year'], item['month']) for item in response.data['months']],
+            [(now.year, now.month), (2025, 3)],
+        )
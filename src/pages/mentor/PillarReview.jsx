@@ -41,6 +41,9 @@ function PillarReview() {
     const [activePillar, setActivePillar] = useState('all');
     const [selectedSubmission, setSelectedSubmission] = useState(null);
     const [submissions, setSubmissions] = useState([]);
+    const [totalSubmissions, setTotalSubmissions] = useState(0);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const [stats, setStats] = useState({ total: 0, pending: 0, approved: 0, rejected: 0 });
     const [mentorComment, setMentorComment] = useState('');
     const [isLoading, setIsLoading] = useState(true);
@@ -61,6 +64,7 @@ function PillarReview() {
             setIsLoading(true);
             setError(null);
             setSubmissions([]); // Clear submissions immediately when pillar changes
+            setNextCursor(null);
             
             try {
                 console.log(`Fetching data for pillar: ${activePillar}`);
@@ -70,18 +74,12 @@ function PillarReview() {
                 if (!isMounted) return;
                 setStats(statsData);
 
-                // Fetch submissions with filters
-                const filters = {
-                    status: statusFilter,
-                    search: searchQuery,
-                    year: yearFilter,
-                    sort: sortOrder
-                };
-                const submissionsData = await getPillarSubmissions(activePillar, filters);
+                // Fetch the first page of submissions with filters
+                const submissionsData = await getPillarSubmissions(activePillar, getFilters());
                 console.log(`Fetched ${submissionsData.submissions?.length || 0} submissions for pillar: ${activePillar}`);
                 
                 if (!isMounted) return;
-                setSubmissions(submissionsData.submissions || []);
+                showFirstPage(submissionsData);
             } catch (err) {
                 console.error('Error fetching data:', err);
                 if (!isMounted) return;
@@ -102,6 +100,36 @@ function PillarReview() {
         };
     }, [activePillar, statusFilter, searchQuery, yearFilter, sortOrder]);
 
+    const getFilters = () => ({
+        status: statusFilter,
+        search: searchQuery,
+        year: yearFilter,
+        sort: sortOrder
+    });
+
+    const showFirstPage = (submissionsData) => {
+        setSubmissions(submissionsData.submissions || []);
+        setTotalSubmissions(submissionsData.total || 0);
+        setNextCursor(submissionsData.has_more ? submissionsData.next_cursor : null);
+    };
+
+    // Append the next page; search, filters and sort stay on the server
+    const handleLoadMore = async () => {
+        if (!nextCursor || isLoadingMore) return;
+
+        setIsLoadingMore(true);
+        try {
+            const submissionsData = await getPillarSubmissions(activePillar, { ...getFilters(), cursor: nextCursor });
+            setSubmissions(prev => [...prev, ...(submissionsData.submissions || [])]);
+            setNextCursor(submissionsData.has_more ? submissionsData.next_cursor : null);
+        } catch (error) {
+            console.error('Error loading more submissions:', error);
+            alert('Failed to load more submissions: ' + error.message);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
     const getActivePillar = () => {
         return PILLARS.find(p => p.id === activePillar) || PILLARS[0];
     };
@@ -175,9 +203,8 @@ function PillarReview() {
             });
 
             // Refresh submissions
-            const filters = { status: statusFilter, search: searchQuery, year: yearFilter, sort: sortOrder };
-            const submissionsData = await getPillarSubmissions(activePillar, filters);
-            setSubmissions(submissionsData.submissions || []);
+            const submissionsData = await getPillarSubmissions(activePillar, getFilters());
+            showFirstPage(submissionsData);
 
             // Refresh stats
             const statsData = await getPillarStats(activePillar);
@@ -216,9 +243,8 @@ function PillarReview() {
             });
 
             // Refresh submissions
-            const filters = { status: statusFilter, search: searchQuery, year: yearFilter, sort: sortOrder };
-            const submissionsData = await getPillarSubmissions(activePillar, filters);
-            setSubmissions(submissionsData.submissions || []);
+            const submissionsData = await getPillarSubmissions(activePillar, getFilters());
+            showFirstPage(submissionsData);
 
             // Refresh stats
             const statsData = await getPillarStats(activePillar);
@@ -458,7 +484,7 @@ function PillarReview() {
                 </div>
 
                 <div className="filter-bar__results">
-                    Showing {filteredSubmissions.length} submission{filteredSubmissions.length !== 1 ? 's' : ''}
+                    Showing {filteredSubmissions.length} of {totalSubmissions} submission{totalSubmissions !== 1 ? 's' : ''}
                 </div>
             </div>
 
@@ -518,6 +544,7 @@ function PillarReview() {
                     </div>
                 ) : (
                     /* Submission Cards - STRICT: Only renders when filteredSubmissions.length > 0 */
+                    <>
                     <div className="submissions-grid">
                         {filteredSubmissions.map((submission) => {
                             const statusConfig = getStatusConfig(submission.status);
@@ -594,6 +621,18 @@ function PillarReview() {
                             );
                         })}
                     </div>
+                    {nextCursor && (
+                        <div className="load-more">
+                            <button
+                                className="load-more__button"
+                                onClick={handleLoadMore}
+                                disabled={isLoadingMore}
+                            >
+                                {isLoadingMore ? 'Loading...' : 'Load More'}
+                            </button>
+                        </div>
+                    )}
+                    </>
                 )}
             </div>
 
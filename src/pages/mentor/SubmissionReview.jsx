@@ -41,6 +41,9 @@ function SubmissionReview({ selectedStudent }) {
     const [reviewStatus, setReviewStatus] = useState(null); // 'loading', 'success', 'error'
     const [reviewMessage, setReviewMessage] = useState('');
     const [submissions, setSubmissions] = useState([]);
+    const [totalSubmissions, setTotalSubmissions] = useState(0);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [loading, setLoading] = useState(true);
     const [showMonthlyReport, setShowMonthlyReport] = useState(false);
     
@@ -90,6 +93,7 @@ function SubmissionReview({ selectedStudent }) {
         try {
             setLoading(true);
             setSubmissions([]); // Clear previous submissions
+            setNextCursor(null);
             
             console.log('🔍 Fetching submissions for student:', selectedStudent);
             console.log('  - Full student object:', JSON.stringify(selectedStudent, null, 2));
@@ -108,6 +112,8 @@ function SubmissionReview({ selectedStudent }) {
                 status: 'all',
                 student_id: studentId
             });
+            setTotalSubmissions(data.total || 0);
+            setNextCursor(data.has_more ? data.next_cursor : null);
             
             console.log('📥 API Response:', data);
             console.log('📋 Submissions count:', data.submissions?.length || 0);
@@ -129,6 +135,26 @@ function SubmissionReview({ selectedStudent }) {
         }
     };
 
+    // Append the student's next page of submissions
+    const loadMoreSubmissions = async () => {
+        if (!nextCursor || loadingMore) return;
+
+        try {
+            setLoadingMore(true);
+            const data = await getPillarSubmissions(selectedPillar, {
+                status: 'all',
+                student_id: selectedStudent.id,
+                cursor: nextCursor
+            });
+            setSubmissions(prev => [...prev, ...(data.submissions || [])]);
+            setNextCursor(data.has_more ? data.next_cursor : null);
+        } catch (error) {
+            console.error('❌ Error loading more submissions:', error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     // Use only real submissions - no mock data fallback
     const displaySubmissions = submissions;
     
@@ -344,7 +370,7 @@ function SubmissionReview({ selectedStudent }) {
                         </div>
                         <div className="profile-stats-grid">
                             <div className="profile-stat-item">
-                                <div className="stat-value">{displaySubmissions.length}</div>
+                                <div className="stat-value">{totalSubmissions}</div>
                                 <div className="stat-label">Total Submissions</div>
                             </div>
                             <div className="profile-stat-item pending">
@@ -833,6 +859,14 @@ function SubmissionReview({ selectedStudent }) {
                 )}
             </motion.div>
             )}
+
+            {!selectedSubmission && !loading && nextCursor && (
+                <div className="load-more">
+                    <Button onClick={loadMoreSubmissions} disabled={loadingMore}>
+                        {loadingMore ? 'Loading...' : 'Load More Submissions'}
+                    </Button>
+                </div>
+            )}
             </>
             )}
         </div>
@@ -6,7 +6,7 @@ export const getMentorStudents = async () => {
     return response.data;
 };
 
-// Get pillar submissions for review
+// Get one page of pillar submissions for review (pass next_cursor as params.cursor for the next)
 export const getPillarSubmissions = async (pillar, params = {}) => {
     const response = await api.get(`/mentor/pillar/${pillar}/submissions/`, { params });
     return response.data;
@@ -40,8 +40,8 @@ const handleResponse = async (response) => {
 /**
  * Get all submissions for a specific pillar
  * @param {string} pillar - Pillar ID (cfc, clt, sri, iipc, scd, all)
- * @param {object} filters - Filter options
- * @returns {Promise<object>} Submissions and total count
+ * @param {object} filters - Filter options (status, search, year, sort, student_id, cursor, pageSize)
+ * @returns {Promise<object>} One page of submissions, total count and next_cursor
  */
 export const getPillarSubmissions = async (pillar, filters = {}) => {
     const params = new URLSearchParams();
@@ -61,6 +61,12 @@ export const getPillarSubmissions = async (pillar, filters = {}) => {
     if (filters.student_id) {
         params.append('student_id', filters.student_id);
     }
+    if (filters.cursor) {
+        params.append('cursor', filters.cursor);
+    }
+    if (filters.pageSize) {
+        params.append('page_size', filters.pageSize);
+    }
 
     const url = `${API_BASE_URL}/mentor/pillar/${pillar}/submissions/?${params.toString()}`;
     
@@ -79,15 +79,41 @@ export const deleteLeetCodeProfile = async (profileId) => {
   return response.data;
 };
 
+const SYNC_POLL_INTERVAL_MS = 1500;
+const SYNC_POLL_TIMEOUT_MS = 3 * 60 * 1000;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
 /**
  * Sync LeetCode profile data from LeetCode API
+ * The backend queues the sync (202 + job id); this polls the job until it
+ * finishes and resolves with the sync result ({ message, profile, warnings })
  * @param {string} leetcodeUsername - LeetCode username to sync
  */
 export const syncLeetCodeProfile = async (leetcodeUsername) => {
   const response = await scdAxios.post('/profiles/sync/', {
     leetcode_username: leetcodeUsername
   });
-  return response.data;
+
+  const deadline = Date.now() + SYNC_POLL_TIMEOUT_MS;
+  let job = response.data;
+  while (job.status === 'queued' || job.status === 'running') {
+    if (Date.now() > deadline) {
+      throw Object.assign(new Error('Sync timed out'), {
+        response: { status: 504, data: { error: 'Sync is taking longer than expected. Please check back shortly.' } }
+      });
+    }
+    await sleep(SYNC_POLL_INTERVAL_MS);
+    job = (await scdAxios.get(`/profiles/sync/${job.job_id}/`)).data;
+  }
+
+  if (job.status === 'failed') {
+    // Same shape as an axios error so callers can read err.response.data.error
+    throw Object.assign(new Error(job.error), {
+      response: { status: 400, data: { error: job.error } }
+    });
+  }
+  return job.result;
 };
 
 /**